@@ -5,8 +5,8 @@ Contains all API endpoint modules
 """
 
 from flask import Blueprint
-from app.api.internships import get_internships
-from app.api.recommendations import get_candidate_recommendations, get_internship_recommendations
+from app.api.internships import get_internships, get_internship_facets
+from app.api.recommendations import get_candidate_recommendations, get_internship_recommendations, get_batch_recommendations
 from app.api.auth import signup, login, logout, check_login_status
 from app.api.profiles import create_or_update_profile, get_profile_by_username, get_profile_by_candidate_id
 from app.api.cities import list_cities
@@ -18,9 +18,14 @@ api_bp = Blueprint('api', __name__, url_prefix='/api')
 # Register internship routes
 @api_bp.route('/internships', methods=['GET'])
 def internships_endpoint():
-    """Get all internships"""
+    """Get a page of internships (filters, cursor pagination)"""
     return get_internships()
 
+@api_bp.route('/internships/facets', methods=['GET'])
+def internship_facets_endpoint():
+    """Get distinct sectors, locations and skills"""
+    return get_internship_facets()
+
 # Register cities route
 @api_bp.route('/cities', methods=['GET'])
 def cities_endpoint():
@@ -28,6 +33,11 @@ def cities_endpoint():
     return list_cities()
 
 # Register recommendation routes
+@api_bp.route('/recommendations/batch', methods=['POST'])
+def batch_recommendations_endpoint():
+    """Stream recommendations for many candidates (NDJSON)"""
+    return get_batch_recommendations()
+
 @api_bp.route('/recommendations/<candidate_id>', methods=['GET'])
 def candidate_recommendations_endpoint(candidate_id):
     """Get recommendations for a candidate"""
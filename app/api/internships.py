@@ -4,38 +4,191 @@ Internships API endpoints
 Direct implementation to replace legacy imports
 """
 
-from flask import jsonify
-from app.core.database import db_manager
+import base64
+import json
+import re
+
+from flask import request
+from app.core.catalog import CATALOG
+from app.core.database import db_manager, PROJECTIONS, projection
 from app.utils.logger import app_logger
-from app.utils.response_helpers import success_response, error_response
+from app.utils.response_helpers import APIResponse, success_response, error_response
+try:
+    from backend.distance_matrix import resolve_city, locations_within
+except Exception as _e:
+    resolve_city = None
+    locations_within = None
+    app_logger.error(f"Failed to import city distances: {__name__}: {_e}")
+
+# Page size bounds and the largest radius (km) of the city filter
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+MAX_RADIUS_KM = 500
+
+_FIELD_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class _BadRequest(ValueError):
+    pass
+
+
+def encode_cursor(internship_id):
+    """Opaque cursor pointing just after internship_id."""
+    raw = json.dumps([internship_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        (internship_id,) = json.loads(raw)
+    except Exception:
+        raise _BadRequest("Invalid cursor")
+    if not isinstance(internship_id, str):
+        raise _BadRequest("Invalid cursor")
+    return internship_id
+
+
+def _fields_projection(fields):
+    """Projection for ?fields=: a named projection (scoring, card, full) or a comma-separated list."""
+    fields = (fields or "card").strip()
+    if fields in PROJECTIONS["internships"]:
+        selected = projection("internships", fields)
+    else:
+        names = [f.strip() for f in fields.split(",") if f.strip()]
+        if not names or not all(_FIELD_NAME.match(f) for f in names):
+            raise _BadRequest("Field 'fields' must be scoring, card, full or a comma-separated list of field names")
+        selected = {f: 1 for f in names}
+    if selected is not None:
+        # The pagination key is always returned
+        selected["internship_id"] = 1
+    return selected
+
+
+def _values_containing(values, term):
+    term = term.strip().lower()
+    return [v for v in values if term in v.lower()]
+
+
+def _locations_near(locations, city, radius):
+    """Catalog location strings within radius km of city, resolved as a known city."""
+    target = resolve_city(city) if resolve_city is not None else None
+    if target is None:
+        return []
+    # k-d tree candidates, re-measured exactly
+    return locations_within(target, locations, radius)
+
+
+def build_internship_query(args, facets):
+    """MongoDB filter for the listing's query parameters, or None if nothing can match.
+
+    sector, city and skill are resolved against the catalog's distinct values
+    into $in lists, so each filter is an index lookup on (field,
+    internship_id). city is free text matched as a substring ("Mum",
+    "Remote"); only with radius is it resolved to a known city and expanded
+    to the locations within that many km. q (title, organization or skill substring) is the
+    only filter that needs a scan.
+    """
+    conditions = []
+    sector = (args.get("sector") or "").strip()
+    if sector:
+        matches = [v for v in facets["sectors"] if v.lower() == sector.lower()]
+        if not matches:
+            return None
+        conditions.append({"sector": {"$in": matches}})
+
+    city = (args.get("city") or "").strip()
+    radius = args.get("radius")
+    if radius not in (None, ""):
+        try:
+            radius = float(radius)
+        except ValueError:
+            raise _BadRequest("Field 'radius' must be a number of kilometres")
+        if not city or not 0 <= radius <= MAX_RADIUS_KM:
+            raise _BadRequest(f"Field 'radius' needs a city and must be between 0 and {MAX_RADIUS_KM}")
+    if city:
+        if radius in (None, ""):
+            matches = _values_containing(facets["locations"], city)
+        else:
+            matches = _locations_near(facets["locations"], city, radius)
+        if not matches:
+            return None
+        conditions.append({"location": {"$in": matches}})
+
+    # Every skill must be present (as a case-insensitive substring of a required skill)
+    for term in [t for value in args.getlist("skill") for t in value.split(",") if t.strip()]:
+        matches = _values_containing(facets["skills"], term)
+        if not matches:
+            return None
+        conditions.append({"skills_required": {"$in": matches}})
+
+    q = (args.get("q") or "").strip()
+    if q:
+        pattern = {"$regex": re.escape(q), "$options": "i"}
+        alternatives = [{"title": pattern}, {"organization": pattern}]
+        skills = _values_containing(facets["skills"], q)
+        if skills:
+            alternatives.append({"skills_required": {"$in": skills}})
+        conditions.append({"$or": alternatives})
+
+    if not conditions:
+        return {}
+    return conditions[0] if len(conditions) == 1 else {"$and": conditions}
+
 
 def get_internships():
-    """Get all internships"""
+    """One page of internships, ordered by internship_id.
+
+    Query parameters: limit, cursor (from meta.pagination.next_cursor),
+    fields, sector, city, radius (km), skill (repeatable) and q.
+    """
+    args = request.args
     try:
-        # Try MongoDB first
+        try:
+            limit = int(args.get("limit", DEFAULT_PAGE_SIZE))
+        except ValueError:
+            raise _BadRequest("Field 'limit' must be an integer")
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise _BadRequest(f"Field 'limit' must be between 1 and {MAX_PAGE_SIZE}")
+        fields = _fields_projection(args.get("fields"))
+        snapshot = CATALOG.get()
+        facets = snapshot.facets if snapshot is not None else {"sectors": [], "locations": [], "skills": []}
+        query = build_internship_query(args, facets)
+        after = decode_cursor(args["cursor"]) if args.get("cursor") else None
+    except _BadRequest as e:
+        return error_response(str(e), 400)
+
+    try:
+        if query is None:
+            return APIResponse.cursor_paginated([], limit=limit)
         db = db_manager.get_db()
-        if db is not None:
-            try:
-                internships = list(db.internships.find({}))
-                # Convert ObjectId to string for JSON serialization
-                for internship in internships:
-                    if '_id' in internship:
-                        internship['_id'] = str(internship['_id'])
-                
-                app_logger.info(f"Retrieved {len(internships)} internships from MongoDB")
-                return success_response({"internships": internships})
-            except Exception as e:
-                app_logger.warning(f"MongoDB query failed: {e}")
-        
-        # Strict Atlas mode: do not read JSON files
-        app_logger.error("No internships data found in MongoDB")
-        return error_response("No internships data available", 404)
-            
+        if db is None:
+            return error_response("Database unavailable", 503)
+        if after is not None:
+            query = {"$and": [query, {"internship_id": {"$gt": after}}]} if query else {"internship_id": {"$gt": after}}
+        # One extra row tells whether another page exists
+        internships = list(db.internships.find(query, fields).sort("internship_id", 1).limit(limit + 1))
+        has_next = len(internships) > limit
+        internships = internships[:limit]
+        for internship in internships:
+            if '_id' in internship:
+                internship['_id'] = str(internship['_id'])
+        next_cursor = encode_cursor(internships[-1].get("internship_id")) if has_next else None
+        return APIResponse.cursor_paginated(internships, limit=limit, next_cursor=next_cursor)
+
     except Exception as e:
         app_logger.error(f"Error retrieving internships: {e}")
         return error_response("Failed to retrieve internships", 500)
 
 
+def get_internship_facets():
+    """Distinct sectors, locations and skills of the catalog, for filter inputs and suggestions"""
+    snapshot = CATALOG.get()
+    if snapshot is None:
+        return error_response("No internships data available", 404)
+    return success_response(snapshot.facets)
+
+
 def get_internship_by_id(internship_id):
     """Get specific internship by ID"""
     try:
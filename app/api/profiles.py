@@ -5,6 +5,7 @@ Handles user profile creation, updating, and retrieval
 """
 
 from flask import request, jsonify, session
+from app.core.cache import RESULT_CACHE
 from app.core.database import db_manager
 from app.utils.logger import app_logger
 from app.utils.response_helpers import success_response, error_response
@@ -81,6 +82,7 @@ def create_or_update_profile():
                     upsert=True
                 )
                 app_logger.info(f"Upserted profile for {username} in MongoDB")
+                RESULT_CACHE.invalidate_candidate(candidate_id)
             except Exception as e:
                 app_logger.warning(f"Failed to save profile to MongoDB: {e}")
         
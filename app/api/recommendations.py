@@ -4,17 +4,35 @@ Recommendations API endpoints
 Direct implementation to replace legacy imports
 """
 
-from flask import jsonify
-from app.core.database import db_manager
+import json
+
+from flask import Response, jsonify, request, stream_with_context
+from app.core.cache import RESULT_CACHE
+from app.core.catalog import CATALOG
+from app.core.database import db_manager, internships_repo, profiles_repo
 from app.utils.logger import app_logger
 from app.utils.response_helpers import success_response, error_response
 try:
     # Prefer the improved ML logic
     from backend.ml_model import get_recommendations as ml_get_recommendations
+    from backend.ml_model import iter_recommendations_batch
+    from backend.internship_index import get_internship_index
+    from backend.skill_matrix import warm_up as warm_skill_matrix
+    from backend.similar_internships import SIMILAR_TABLE
 except Exception as _e:
     ml_get_recommendations = None
+    iter_recommendations_batch = None
+    get_internship_index = None
+    warm_skill_matrix = None
+    SIMILAR_TABLE = None
     app_logger.error(f"Failed to import ML recommender: {__name__}: {_e}")
 
+# Batch endpoint limits: ids per request, profiles per query/scoring pass, results per candidate
+BATCH_MAX_CANDIDATES = 10000
+BATCH_PROFILE_CHUNK = 500
+BATCH_MAX_TOP_N = 50
+
+
 def get_candidate_recommendations(candidate_id):
     """Get recommendations for a specific candidate"""
     try:
@@ -23,28 +41,29 @@ def get_candidate_recommendations(candidate_id):
         if not candidate:
             return error_response("Candidate not found", 404)
         
-        # Load internships
-        internships = load_all_internships()
+        # Load internships from the catalog snapshot
+        snapshot = CATALOG.get()
+        internships = snapshot.internships if snapshot is not None else ()
         if not internships:
             return error_response("No internships available", 404)
         
         # Generate recommendations using improved ML logic
         recommendations = []
         if ml_get_recommendations is not None:
-            ml_recs = ml_get_recommendations(candidate, internships, top_n=10)
-            # Enrich with skills/description for UI compatibility
-            by_id = {i.get("internship_id"): i for i in internships}
-            for r in ml_recs:
-                base = by_id.get(r.get("internship_id"), {})
-                enriched = {
-                    **r,
-                    "skills_required": base.get("skills_required", r.get("skills_required", [])),
-                    "description": base.get("description", r.get("description", "")),
-                }
-                recommendations.append(enriched)
+            # Repeat views of an unchanged profile and catalog reuse the cached
+            # ranking; descriptions are not part of the catalog version, so they
+            # are always looked up fresh
+            cache_key = RESULT_CACHE.key(candidate_id, candidate, snapshot.version, top_n=10)
+            # Shared index, rebuilt only when the catalog version changes
+            index = get_internship_index(internships, version=snapshot.version)
+            ml_recs = RESULT_CACHE.get(cache_key)
+            if ml_recs is None:
+                ml_recs = ml_get_recommendations(candidate, internships, top_n=10, index=index)
+                RESULT_CACHE.put(cache_key, ml_recs)
+            recommendations = _enrich(index, ml_recs)
         else:
             # Fallback to simple overlap if ML import failed
-            recommendations = generate_recommendations(candidate, internships)
+            recommendations = _enrich(None, generate_recommendations(candidate, internships))
         
         return success_response({
             "candidate": candidate.get("name"),
@@ -60,47 +79,34 @@ def get_candidate_recommendations(candidate_id):
 def get_internship_recommendations(internship_id):
     """Get similar internships for a given internship"""
     try:
-        # Load all internships
-        internships = load_all_internships()
+        # Load all internships from the catalog snapshot
+        snapshot = CATALOG.get()
+        internships = snapshot.internships if snapshot is not None else ()
         if not internships:
             return error_response("No internships available", 404)
         
         # Find the base internship
-        base_internship = next((i for i in internships if i.get("internship_id") == internship_id), None)
+        index = get_internship_index(internships, version=snapshot.version) if get_internship_index is not None else None
+        if index is not None:
+            base_internship = index.get(internship_id)
+        else:
+            base_internship = next((i for i in internships if i.get("internship_id") == internship_id), None)
         if not base_internship:
             return error_response("Internship not found", 404)
         
-        # Generate similar internship recommendations using ML by creating a pseudo-candidate
+        # Similar internships are precomputed per catalog version (pseudo-candidate
+        # built from the posting, weights tilted towards skill/sector). The table
+        # is built on first use: a miss schedules the build or catch-up and the
+        # posting is scored directly in the meantime
         recommendations = []
         if ml_get_recommendations is not None:
-            pseudo_candidate = {
-                "skills_possessed": base_internship.get("skills_required", []),
-                "sector_interests": [str(base_internship.get("sector", "")).lower()] if base_internship.get("sector") else [],
-                "location_preference": base_internship.get("location", ""),
-                # keep other fields empty; ML handles missing gracefully
-            }
-            pool = [i for i in internships if i.get("internship_id") != internship_id]
-            # Slightly tilt weights towards skill/sector for "similarity" use-case
-            ml_recs = ml_get_recommendations(
-                pseudo_candidate,
-                pool,
-                top_n=10,
-                skill_weight=0.6,
-                loc_weight=0.15,
-                sector_weight=0.2,
-                misc_weight=0.05,
-            )
-            # Enrich with skills/description for UI compatibility
-            by_id = {i.get("internship_id"): i for i in pool}
-            for r in ml_recs:
-                base = by_id.get(r.get("internship_id"), {})
-                recommendations.append({
-                    **r,
-                    "skills_required": base.get("skills_required", r.get("skills_required", [])),
-                    "description": base.get("description", r.get("description", "")),
-                })
+            ml_recs = SIMILAR_TABLE.get(internship_id, version=snapshot.version)
+            if ml_recs is None:
+                SIMILAR_TABLE.schedule(lambda: index)
+                ml_recs = SIMILAR_TABLE.neighbors(index, internship_id)
+            recommendations = _enrich(index, ml_recs)
         else:
-            recommendations = generate_similar_internships(base_internship, internships)
+            recommendations = _enrich(None, generate_similar_internships(base_internship, internships))
         
         return success_response({
             "base_internship": base_internship.get("title"),
@@ -112,49 +118,160 @@ def get_internship_recommendations(internship_id):
         return error_response("Failed to generate recommendations", 500)
 
 
-def load_candidate_by_id(candidate_id):
-    """Load candidate profile by ID"""
+def get_batch_recommendations():
+    """Stream recommendations for many candidates as NDJSON.
+
+    Body: {"candidate_ids": [...], "top_n": 10}. One line per requested id, in
+    order: {"candidate_id", "recommendations"} or {"candidate_id", "error"}.
+    Profiles are loaded BATCH_PROFILE_CHUNK at a time and scored together
+    against the shared index; cached rankings are reused and new ones cached,
+    and every ranking is then enriched with current descriptions.
+    """
+    data = request.get_json(silent=True) or {}
+    candidate_ids = data.get("candidate_ids")
+    if not isinstance(candidate_ids, list) or not all(isinstance(c, str) for c in candidate_ids):
+        return error_response("Field 'candidate_ids' must be a list of candidate IDs", 400)
+    if len(candidate_ids) > BATCH_MAX_CANDIDATES:
+        return error_response(f"At most {BATCH_MAX_CANDIDATES} candidates per request", 400)
     try:
-        # Try MongoDB first
-        db = db_manager.get_db()
-        if db is not None:
+        top_n = int(data.get("top_n", 10))
+    except (TypeError, ValueError):
+        return error_response("Field 'top_n' must be an integer", 400)
+    if not 1 <= top_n <= BATCH_MAX_TOP_N:
+        return error_response(f"Field 'top_n' must be between 1 and {BATCH_MAX_TOP_N}", 400)
+    if iter_recommendations_batch is None:
+        return error_response("Recommendation engine unavailable", 503)
+
+    snapshot = CATALOG.get()
+    if snapshot is None or not snapshot.internships:
+        return error_response("No internships available", 404)
+    db = db_manager.get_db()
+    if db is None:
+        return error_response("Database unavailable", 503)
+    index = get_internship_index(snapshot.internships, version=snapshot.version)
+
+    def generate():
+        for start in range(0, len(candidate_ids), BATCH_PROFILE_CHUNK):
+            chunk = candidate_ids[start:start + BATCH_PROFILE_CHUNK]
             try:
-                candidate = db.profiles.find_one({"candidate_id": candidate_id})
-                if candidate:
-                    if '_id' in candidate:
-                        candidate['_id'] = str(candidate['_id'])
-                    return candidate
+                profiles = profiles_repo.get_many(chunk, fields="scoring")
             except Exception as e:
-                app_logger.warning(f"MongoDB query failed: {e}")
-        
-        # Strict Atlas mode: do not read JSON files
-        return None
+                app_logger.error(f"Batch profile lookup failed: {e}")
+                for candidate_id in chunk:
+                    yield _ndjson({"candidate_id": candidate_id, "error": "Failed to load profile"})
+                continue
+
+            results, keys, pending = {}, {}, []
+            for candidate_id in dict.fromkeys(chunk):
+                profile = profiles.get(candidate_id)
+                if profile is None:
+                    continue
+                keys[candidate_id] = RESULT_CACHE.key(candidate_id, profile, snapshot.version, top_n=top_n)
+                cached = RESULT_CACHE.get(keys[candidate_id])
+                if cached is None:
+                    pending.append(candidate_id)
+                else:
+                    results[candidate_id] = cached
+            ranked = list(iter_recommendations_batch(
+                [profiles[c] for c in pending], None, top_n=top_n, index=index,
+            ))
+            for candidate_id, ml_recs in zip(pending, ranked):
+                results[candidate_id] = ml_recs
+                RESULT_CACHE.put(keys[candidate_id], ml_recs)
+            # One description query for every result in the chunk, cached or not
+            details = _fetch_details(r.get("internship_id") for recs in results.values() for r in recs)
+            results = {c: _enrich(index, recs, details) for c, recs in results.items()}
+
+            for candidate_id in chunk:
+                if candidate_id in results:
+                    yield _ndjson({"candidate_id": candidate_id, "recommendations": results[candidate_id]})
+                else:
+                    yield _ndjson({"candidate_id": candidate_id, "error": "Candidate not found"})
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
+def _ndjson(obj):
+    return json.dumps(obj, default=str) + "\n"
+
+
+def _fetch_details(internship_ids):
+    """{internship_id: card document} for the given results; {} if the lookup fails."""
+    try:
+        return internships_repo.get_many(internship_ids, fields="card")
+    except Exception as e:
+        app_logger.warning(f"Failed to load internship details: {e}")
+        return {}
+
+
+def _enrich(index, ml_recs, details=None):
+    """Add skills/description for UI compatibility.
+
+    The catalog snapshot only holds scoring fields, so descriptions are
+    fetched for just these results (or taken from prefetched details).
+    """
+    if details is None:
+        details = _fetch_details(r.get("internship_id") for r in ml_recs)
+    enriched = []
+    for r in ml_recs:
+        base = (index.get(r.get("internship_id")) if index is not None else None) or {}
+        detail = details.get(r.get("internship_id")) or {}
+        enriched.append({
+            **r,
+            "skills_required": base.get("skills_required", r.get("skills_required", [])),
+            "description": detail.get("description", r.get("description", "")),
+        })
+    return enriched
+
+
+def _on_catalog_change(snapshot):
+    # Rankings for an old catalog can never be hit again; free them right away
+    # (the similar-internships table catches up on its next lookup)
+    RESULT_CACHE.clear()
+
+
+CATALOG.subscribe(_on_catalog_change)
+
+
+def warm_recommendation_caches():
+    """Build the internship index and skill match matrix before the first request.
+
+    Internship skills are added to the matrix while the index builds; profile
+    skills are added here so candidate lookups are id lookups from the start.
+    The similar-internships table is left to its first lookup.
+    """
+    if get_internship_index is None:
+        return
+    try:
+        snapshot = CATALOG.get()
+        if snapshot is not None and snapshot.internships:
+            get_internship_index(snapshot.internships, version=snapshot.version)
+        db = db_manager.get_db()
+        if db is not None:
+            warm_skill_matrix(db.profiles.distinct("skills_possessed"))
+        app_logger.info("Recommendation caches warmed")
+    except Exception as e:
+        app_logger.warning(f"Failed to warm recommendation caches: {e}")
+
+
+def load_candidate_by_id(candidate_id):
+    """Load the scoring fields of a candidate profile by ID"""
+    try:
+        # Strict Atlas mode: MongoDB only, no JSON files
+        return profiles_repo.get(candidate_id, fields="scoring")
     except Exception as e:
         app_logger.error(f"Error loading candidate {candidate_id}: {e}")
         return None
 
 
 def load_all_internships():
-    """Load all internships"""
+    """Load all internships (read-only tuple from the catalog snapshot)"""
     try:
-        # Try MongoDB first
-        db = db_manager.get_db()
-        if db is not None:
-            try:
-                internships = list(db.internships.find({}))
-                # Convert ObjectId to string for JSON serialization
-                for internship in internships:
-                    if '_id' in internship:
-                        internship['_id'] = str(internship['_id'])
-                return internships
-            except Exception as e:
-                app_logger.warning(f"MongoDB query failed: {e}")
-        
-        # Strict Atlas mode: do not read JSON files
-        return []
+        # Strict Atlas mode: the snapshot is loaded from MongoDB only
+        return CATALOG.internships()
     except Exception as e:
         app_logger.error(f"Error loading internships: {e}")
-        return []
+        return ()
 
 
 def generate_recommendations(candidate, internships):
@@ -16,6 +16,10 @@ class Config:
     MONGODB_POOL_SIZE = int(os.getenv('MONGODB_POOL_SIZE', 10))
     # Atlas-only toggle (no JSON fallbacks)
     DISABLE_JSON_FALLBACK = os.getenv('DISABLE_JSON_FALLBACK', 'False').lower() == 'true'
+    # Create missing indexes from backend/indexes.py when connecting (else run scripts/ensure_indexes.py)
+    ENSURE_INDEXES_ON_STARTUP = os.getenv('ENSURE_INDEXES_ON_STARTUP', 'True').lower() == 'true'
+    # Seconds database calls fail fast after the cluster is seen down, before one probe is let through
+    DB_CIRCUIT_RESET_SECONDS = float(os.getenv('DB_CIRCUIT_RESET_SECONDS', 30))
     
     # Flask
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
@@ -46,6 +50,9 @@ class Config:
     
     # Performance
     CACHE_TIMEOUT = int(os.getenv('CACHE_TIMEOUT', 300))
+    # Recommendation result cache: entries kept in memory, or a redis:// URL
+    RESULT_CACHE_SIZE = int(os.getenv('RESULT_CACHE_SIZE', 2048))
+    RESULT_CACHE_URL = os.getenv('RESULT_CACHE_URL', '')
     API_RATE_LIMIT = int(os.getenv('API_RATE_LIMIT', 100))
     
     # Logging
@@ -0,0 +1,162 @@
+# app/core/cache.py
+"""
+Recommendation result cache.
+
+Rankings are cached under (candidate_id, hash of the scoring-relevant profile
+fields, catalog version, weights, top_n), so a changed profile or catalog can
+never be served a stale ranking. Entries for a candidate are also dropped
+when their profile is saved, and the whole cache when the catalog changes,
+so dead entries do not wait for LRU eviction.
+
+Storage is pluggable: an in-process LRU by default, or any Redis-compatible
+server when RESULT_CACHE_URL is set (requires the optional `redis` package;
+entries are stored as JSON). Either way entries expire after CACHE_TIMEOUT
+seconds.
+"""
+
+import hashlib
+import json
+import time
+
+from app.utils.logger import app_logger
+from backend.match_cache import LRUCache
+
+# Try to import config, fallback to environment variables
+try:
+    from app.config import get_config
+    _config = get_config()
+    RESULT_CACHE_SIZE = _config.RESULT_CACHE_SIZE
+    RESULT_CACHE_URL = _config.RESULT_CACHE_URL
+    CACHE_TIMEOUT = _config.CACHE_TIMEOUT
+except Exception:
+    import os
+    RESULT_CACHE_SIZE = int(os.getenv('RESULT_CACHE_SIZE', 2048))
+    RESULT_CACHE_URL = os.getenv('RESULT_CACHE_URL', '')
+    CACHE_TIMEOUT = int(os.getenv('CACHE_TIMEOUT', 300))
+
+# Profile fields that feed score_candidate
+SCORING_FIELDS = (
+    "skills_possessed", "sector_interests", "location_preference",
+    "field_of_study", "education_level", "first_generation", "no_experience",
+)
+
+KEY_PREFIX = "rec:"
+
+
+class MemoryBackend:
+    """In-process LRU backend (the default, and the stand-in for Redis)."""
+
+    def __init__(self, maxsize=RESULT_CACHE_SIZE, ttl=CACHE_TIMEOUT, clock=time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._lru = LRUCache(maxsize)
+
+    def get(self, key):
+        entry = self._lru.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            self._lru.discard(key)
+            return None
+        return value
+
+    def set(self, key, value, ttl=None):
+        self._lru.put(key, (self._clock() + (ttl or self.ttl), value))
+
+    def delete_prefix(self, prefix):
+        self._lru.remove_where(lambda key: key.startswith(prefix))
+
+    def stats(self):
+        return self._lru.stats()
+
+
+class RedisBackend:
+    """Backend for any Redis-compatible server; values are stored as JSON."""
+
+    def __init__(self, url, ttl=CACHE_TIMEOUT):
+        import redis  # optional dependency
+
+        self.ttl = ttl
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key):
+        raw = self._client.get(key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key, value, ttl=None):
+        self._client.set(key, json.dumps(value, default=str), ex=ttl or self.ttl)
+
+    def delete_prefix(self, prefix):
+        keys = list(self._client.scan_iter(match=prefix + "*", count=500))
+        if keys:
+            self._client.delete(*keys)
+
+    def stats(self):
+        return {"backend": "redis"}
+
+
+def make_backend(url=RESULT_CACHE_URL):
+    """Redis backend for a redis:// or rediss:// URL, else the in-memory LRU."""
+    if url:
+        try:
+            return RedisBackend(url)
+        except Exception as e:
+            app_logger.warning(f"Result cache backend unavailable ({e}); using in-memory cache")
+    return MemoryBackend()
+
+
+def profile_hash(candidate) -> str:
+    """Digest of the candidate fields that affect scoring."""
+    fields = [candidate.get(f) for f in SCORING_FIELDS]
+    return hashlib.blake2b(repr(fields).encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+class RecommendationCache:
+    """Ranked results keyed by profile hash, catalog version, weights and top_n."""
+
+    def __init__(self, backend=None):
+        self.backend = backend if backend is not None else make_backend()
+
+    @staticmethod
+    def key(candidate_id, candidate, version, weights=None, top_n=10):
+        digest = hashlib.blake2b(
+            repr((profile_hash(candidate), version, sorted((weights or {}).items()), top_n)).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+        return f"{KEY_PREFIX}{candidate_id}:{digest}"
+
+    def get(self, key):
+        """Cached result or None; backend errors count as misses."""
+        try:
+            return self.backend.get(key)
+        except Exception as e:
+            app_logger.warning(f"Result cache read failed: {e}")
+            return None
+
+    def put(self, key, value):
+        try:
+            self.backend.set(key, value)
+        except Exception as e:
+            app_logger.warning(f"Result cache write failed: {e}")
+
+    def invalidate_candidate(self, candidate_id):
+        """Drop every cached ranking of one candidate (call after saving their profile)."""
+        self._delete_prefix(f"{KEY_PREFIX}{candidate_id}:")
+
+    def clear(self):
+        """Drop every cached ranking (call when the catalog changes)."""
+        self._delete_prefix(KEY_PREFIX)
+
+    def _delete_prefix(self, prefix):
+        try:
+            self.backend.delete_prefix(prefix)
+        except Exception as e:
+            app_logger.warning(f"Result cache invalidation failed: {e}")
+
+    def stats(self):
+        return self.backend.stats()
+
+
+# Process-wide result cache
+RESULT_CACHE = RecommendationCache()
@@ -0,0 +1,246 @@
+# app/core/catalog.py
+"""
+Process-level snapshot of the internship catalog.
+
+Recommendation requests read an immutable CatalogSnapshot instead of scanning
+db.internships on every call. A background watcher keeps it fresh: it follows
+a MongoDB change stream when the deployment supports one (replica sets, Atlas)
+and otherwise polls a cheap version token (document count, newest _id and
+newest updated_at). Whatever the watcher misses is caught by a TTL of
+Config.CACHE_TIMEOUT seconds, after which the watcher reloads.
+
+Readers never wait on a reload while a snapshot exists and the watcher runs.
+Without a watcher (tests, scripts) an expired or invalidated snapshot is
+reloaded by the first reader; concurrent readers wait for that one reload
+and share its result.
+"""
+
+import threading
+import time
+from functools import cached_property
+
+from pymongo import errors
+
+from app.core.database import db_manager, projection
+from app.utils.logger import db_logger
+
+try:
+    from backend.internship_index import catalog_fingerprint
+except Exception:
+    catalog_fingerprint = None
+
+# Try to import config, fallback to environment variables
+try:
+    from app.config import get_config
+    CACHE_TIMEOUT = get_config().CACHE_TIMEOUT
+except Exception:
+    import os
+    CACHE_TIMEOUT = int(os.getenv('CACHE_TIMEOUT', 300))
+
+# Seconds between version polls when change streams are unavailable
+POLL_INTERVAL = 5
+
+
+class CatalogSnapshot:
+    """One immutable load of db.internships.
+
+    ``version`` changes only when the scoring-relevant content changes, so it
+    can be passed straight to get_internship_index.
+    """
+
+    def __init__(self, internships, version, token=None):
+        self.internships = tuple(internships)
+        self.version = version
+        self.token = token
+        self.loaded_at = time.monotonic()
+
+    def __len__(self):
+        return len(self.internships)
+
+    def age(self) -> float:
+        return time.monotonic() - self.loaded_at
+
+    @cached_property
+    def facets(self) -> dict:
+        """Distinct sector, location and skill values, sorted; the vocabularies of the listing filters."""
+        sectors, locations, skills = set(), set(), set()
+        for internship in self.internships:
+            if isinstance(internship.get("sector"), str):
+                sectors.add(internship["sector"])
+            if isinstance(internship.get("location"), str):
+                locations.add(internship["location"])
+            skills.update(s for s in internship.get("skills_required") or () if isinstance(s, str))
+        return {"sectors": sorted(sectors), "locations": sorted(locations), "skills": sorted(skills)}
+
+
+def _load_internships(db):
+    # Scoring fields only; descriptions are fetched per result when rendering
+    internships = list(db.internships.find({}, projection("internships", "scoring")))
+    # Convert ObjectId to string for JSON serialization
+    for internship in internships:
+        if '_id' in internship:
+            internship['_id'] = str(internship['_id'])
+    return internships
+
+
+def _version_token(db):
+    """Cheap fingerprint of the collection state used by the poller."""
+    newest = db.internships.find_one({}, {"_id": 1}, sort=[("_id", -1)])
+    updated = db.internships.find_one(
+        {"updated_at": {"$exists": True}}, {"updated_at": 1}, sort=[("updated_at", -1)]
+    )
+    return (
+        db.internships.estimated_document_count(),
+        newest.get("_id") if newest else None,
+        updated.get("updated_at") if updated else None,
+    )
+
+
+class CatalogCache:
+    """Holds the current CatalogSnapshot and refreshes it on change or expiry."""
+
+    def __init__(self, ttl=CACHE_TIMEOUT, poll_interval=POLL_INTERVAL, get_db=db_manager.get_db):
+        self.ttl = ttl
+        self.poll_interval = poll_interval
+        self._get_db = get_db
+        self._snapshot = None
+        self._stale = False
+        self._invalidations = 0
+        self._lock = threading.Lock()
+        self._watcher = None
+        self._stop = threading.Event()
+        self._listeners = []
+
+    def _is_fresh(self, snapshot) -> bool:
+        return snapshot is not None and not self._stale and snapshot.age() < self.ttl
+
+    def _watching(self) -> bool:
+        return self._watcher is not None and self._watcher.is_alive() and not self._stop.is_set()
+
+    def get(self):
+        """Current snapshot.
+
+        Loaded on the caller's thread only when there is none yet, or when it
+        is invalidated/expired and no watcher is running to reload it. If a
+        reload fails the previous snapshot keeps being served; None only when
+        nothing could ever be loaded.
+        """
+        snapshot = self._snapshot
+        if self._is_fresh(snapshot) or (snapshot is not None and self._watching()):
+            return snapshot
+        return self._reload_if_stale() or snapshot
+
+    def _reload_if_stale(self):
+        with self._lock:
+            # Another reader may have reloaded while we waited for the lock
+            if self._is_fresh(self._snapshot):
+                return self._snapshot
+            return self._refresh_locked()
+
+    def internships(self):
+        """The snapshot's internships, or an empty tuple."""
+        snapshot = self.get()
+        return snapshot.internships if snapshot is not None else ()
+
+    def subscribe(self, callback):
+        """Call callback(snapshot) whenever a reload publishes a new version."""
+        self._listeners.append(callback)
+
+    def invalidate(self):
+        """Mark the snapshot stale; the watcher, or else the next get(), reloads it."""
+        self._invalidations += 1
+        self._stale = True
+
+    def refresh(self):
+        """Reload from MongoDB and publish a new snapshot; returns it, or None on failure."""
+        with self._lock:
+            return self._refresh_locked()
+
+    def _refresh_locked(self):
+        # Readers keep seeing the old snapshot as stale until the new one is published
+        seen = self._invalidations
+        try:
+            db = self._get_db()
+            if db is None:
+                return None
+            token = _version_token(db)
+            internships = _load_internships(db)
+        except Exception as e:
+            self._stale = True
+            db_logger.warning(f"[Catalog] Reload failed: {e}")
+            return None
+        version = catalog_fingerprint(internships) if catalog_fingerprint is not None else token
+        previous = self._snapshot
+        snapshot = self._snapshot = CatalogSnapshot(internships, version, token)
+        # An invalidate() that arrived during the load still needs its own reload
+        self._stale = self._invalidations != seen
+        db_logger.info(f"[Catalog] Loaded {len(internships)} internships (version {version})")
+        # Listeners run on the reloading thread; only version changes are announced
+        self._notify(previous, snapshot)
+        return snapshot
+
+    def _notify(self, previous, snapshot):
+        if previous is not None and previous.version != snapshot.version:
+            for callback in list(self._listeners):
+                try:
+                    callback(snapshot)
+                except Exception as e:
+                    db_logger.warning(f"[Catalog] Change listener failed: {e}")
+
+    # ----------------- Background watcher -----------------
+    def start_watcher(self):
+        """Start the daemon thread that refreshes the snapshot on catalog changes."""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(target=self._watch, name="catalog-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watcher(self):
+        self._stop.set()
+
+    def _watch(self):
+        while not self._stop.is_set():
+            db = self._get_db()
+            if db is None:
+                self._stop.wait(self.poll_interval)
+                continue
+            try:
+                self._follow_change_stream(db)
+            except errors.OperationFailure:
+                # Standalone servers have no change streams
+                db_logger.info("[Catalog] Change streams unavailable, polling for catalog changes")
+                self._poll(db)
+            except Exception as e:
+                db_logger.warning(f"[Catalog] Change stream interrupted: {e}")
+                self._stop.wait(self.poll_interval)
+
+    def _follow_change_stream(self, db):
+        with db.internships.watch(max_await_time_ms=1000) as stream:
+            # Anything written before the stream opened is picked up here
+            self.refresh()
+            while not self._stop.is_set() and stream.alive:
+                if stream.try_next() is None:
+                    # Quiet stream: still honour invalidate() and the TTL
+                    if not self._is_fresh(self._snapshot):
+                        self.refresh()
+                    continue
+                # Drain the burst, then reload once
+                while stream.try_next() is not None:
+                    pass
+                self.refresh()
+
+    def _poll(self, db):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                token = _version_token(db)
+            except Exception as e:
+                db_logger.warning(f"[Catalog] Version poll failed: {e}")
+                continue
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.token != token or not self._is_fresh(snapshot):
+                self.refresh()
+
+
+# Process-wide catalog cache
+CATALOG = CatalogCache()
@@ -18,6 +18,7 @@ try:
     DB_NAME = config.DB_NAME
     DATA_DIR = config.DATA_DIR
     POOL_SIZE = config.MONGODB_POOL_SIZE
+    ENSURE_INDEXES_ON_STARTUP = getattr(config, 'ENSURE_INDEXES_ON_STARTUP', True)
 except ImportError:
     import os
     MONGO_URI = os.getenv('MONGO_URI', 'mongodb://localhost:27017/')
@@ -25,6 +26,7 @@ except ImportError:
     BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
     DATA_DIR = os.path.join(BASE_DIR, "data")
     POOL_SIZE = int(os.getenv('MONGODB_POOL_SIZE', 10))
+    ENSURE_INDEXES_ON_STARTUP = os.getenv('ENSURE_INDEXES_ON_STARTUP', 'True').lower() == 'true'
 
 try:
     from app.utils.logger import db_logger
@@ -36,6 +38,11 @@ except ImportError:
     log_error = print
     log_warning = print
 
+from app.core.cache import SCORING_FIELDS as PROFILE_SCORING_FIELDS
+from backend.bulk_sync import sync_collection
+from backend.db_health import ConnectionHealth
+from backend.indexes import ensure_indexes, log_report
+
 class DatabaseManager:
     """Singleton database manager with connection pooling and health checks."""
     
@@ -51,45 +58,67 @@ class DatabaseManager:
     
     def _initialize(self):
         """Initialize database connection."""
+        if getattr(self, '_health', None) is None:
+            self._health = ConnectionHealth()
         try:
             self._client = MongoClient(
                 MONGO_URI,
                 maxPoolSize=POOL_SIZE,
                 serverSelectionTimeoutMS=5000,
                 socketTimeoutMS=10000,
-                connectTimeoutMS=10000
+                connectTimeoutMS=10000,
+                event_listeners=[self._health]
             )
             self._db = self._client[DB_NAME]
             
             # Test connection
             self._client.admin.command('ping')
+            self._health.record_success()
             log(f"Successfully connected to MongoDB: {DB_NAME}")
+            if ENSURE_INDEXES_ON_STARTUP:
+                self._ensure_indexes()
             
-        except errors.ServerSelectionTimeoutError:
+        except errors.ServerSelectionTimeoutError as e:
             log_error("MongoDB connection timeout. Is MongoDB running?")
-            self._client = None
-            self._db = None
+            self._discard_client(e)
         except Exception as e:
             log_error(f"MongoDB connection failed: {e}")
-            self._client = None
-            self._db = None
+            self._discard_client(e)
+    
+    def _ensure_indexes(self):
+        """Apply the declarative index specs once per connection."""
+        try:
+            log_report(ensure_indexes(self._db), info=log, warning=log_warning)
+        except Exception as e:
+            log_warning(f"Index setup failed: {e}")
+    
+    def _discard_client(self, error):
+        """Drop a client that could not connect and open the circuit breaker."""
+        if self._client is not None:
+            self._client.close()
+        self._client = None
+        self._db = None
+        self._health.record_failure(error)
     
     def get_db(self):
-        """Get database instance with health check."""
+        """Get database instance, or None while the circuit breaker is open."""
+        if not self._health.available():
+            return None
         if self._db is None:
             self._initialize()
         return self._db
     
     def health_check(self):
-        """Check database health."""
-        try:
-            if self._client is None:
-                return False
-            self._client.admin.command('ping')
-            return True
-        except Exception as e:
-            log_error(f"Database health check failed: {e}")
-            return False
+        """Check database health from the driver's heartbeats (no round trip).
+
+        A pure read: unlike get_db() it never connects and never takes the
+        circuit breaker's half-open probe.
+        """
+        return self._db is not None and self._health.state() == "closed"
+    
+    def circuit_state(self):
+        """Circuit breaker state: closed, open, half-open or unknown."""
+        return self._health.state()
     
     def close_connection(self):
         """Close database connection."""
@@ -129,18 +158,11 @@ def load_data(collection_name, use_cache=True):
     
     try:
         # Try MongoDB first
-        if db_manager.health_check():
-            db = get_database()
+        # None while the circuit breaker is open: fail fast
+        db = get_database()
+        if db is not None:
             collection = db[collection_name]
             
-            # Add basic indexing for common queries
-            if collection_name == "profiles":
-                collection.create_index("candidate_id")
-                collection.create_index("name")
-            elif collection_name == "internships":
-                collection.create_index("internship_id")
-                collection.create_index("skills_required")
-            
             data = list(collection.find())
             log(f"[DB] Fetched '{collection_name}' from MongoDB ({len(data)} records) in {time.time() - start_time:.3f}s")
             return convert_object_ids(data)
@@ -159,29 +181,17 @@ def save_data(collection_name, data):
     
     # Save to MongoDB
     try:
-        if db_manager.health_check():
-            db = get_database()
+        # None while the circuit breaker is open: fail fast
+        db = get_database()
+        if db is not None:
             collection = db[collection_name]
             
-            # Clear and insert new data
-            collection.delete_many({})
-            if data:
-                # Convert string IDs back to ObjectId for MongoDB
-                mongo_data = []
-                for item in data:
-                    mongo_item = item.copy()
-                    if '_id' in mongo_item and isinstance(mongo_item['_id'], str):
-                        try:
-                            mongo_item['_id'] = ObjectId(mongo_item['_id'])
-                        except:
-                            # Remove invalid ObjectId
-                            del mongo_item['_id']
-                    mongo_data.append(mongo_item)
-                
-                collection.insert_many(mongo_data)
+            # Write only what changed, keyed on the collection's natural id
+            counts = sync_collection(collection, data or [])
             
             mongo_success = True
-            log(f"[DB] Saved '{collection_name}' to MongoDB ({len(data)} records) in {time.time() - start_time:.3f}s")
+            log(f"[DB] Saved '{collection_name}' to MongoDB ({len(data)} records: {counts['upserts']} upserted, "
+                f"{counts['deletes']} deleted, {counts['unchanged']} unchanged) in {time.time() - start_time:.3f}s")
             
     except Exception as e:
         log_error(f"[DB] MongoDB save failed for '{collection_name}': {e}")
@@ -191,4 +201,70 @@ def save_data(collection_name, data):
     if not mongo_success and not json_success:
         raise Exception(f"Failed to save data to both MongoDB and JSON for collection: {collection_name}")
     
-    return {"mongodb": mongo_success, "json": json_success}
\ No newline at end of file
+    return {"mongodb": mongo_success, "json": json_success}
+
+# ----------------- Projection-aware repositories -----------------
+# Fields the recommender reads from a posting
+INTERNSHIP_SCORING_FIELDS = (
+    "internship_id", "id", "title", "organization", "location", "sector",
+    "skills_required", "is_beginner_friendly",
+)
+
+# Named field sets per collection; None fetches the whole document
+PROJECTIONS = {
+    "internships": {
+        "scoring": INTERNSHIP_SCORING_FIELDS,
+        # What a result card shows: scoring fields plus the (long) description
+        "card": INTERNSHIP_SCORING_FIELDS + ("description",),
+        "full": None,
+    },
+    "profiles": {
+        "scoring": ("candidate_id", "name", "username") + PROFILE_SCORING_FIELDS,
+        "card": ("candidate_id", "name", "username", "education_level", "field_of_study", "location_preference"),
+        "full": None,
+    },
+}
+
+
+def projection(collection_name, name="full"):
+    """MongoDB projection for a named field set (None for "full")."""
+    fields = PROJECTIONS[collection_name][name]
+    return None if fields is None else {field: 1 for field in fields}
+
+
+class Repository:
+    """Reads one collection with named projections; ObjectIds come back as strings."""
+
+    def __init__(self, collection_name, id_field):
+        self.collection_name = collection_name
+        self.id_field = id_field
+
+    def _collection(self):
+        db = db_manager.get_db()
+        return db[self.collection_name] if db is not None else None
+
+    def find(self, query=None, fields="full"):
+        collection = self._collection()
+        if collection is None:
+            return []
+        return convert_object_ids(list(collection.find(query or {}, projection(self.collection_name, fields))))
+
+    def find_one(self, query, fields="full"):
+        collection = self._collection()
+        if collection is None:
+            return None
+        return convert_object_ids(collection.find_one(query, projection(self.collection_name, fields)))
+
+    def get(self, doc_id, fields="full"):
+        return self.find_one({self.id_field: doc_id}, fields)
+
+    def get_many(self, ids, fields="full"):
+        """{id: document} for the ids that exist, in one query."""
+        ids = list(dict.fromkeys(i for i in ids if i is not None))
+        if not ids:
+            return {}
+        return {doc.get(self.id_field): doc for doc in self.find({self.id_field: {"$in": ids}}, fields)}
+
+
+internships_repo = Repository("internships", "internship_id")
+profiles_repo = Repository("profiles", "candidate_id")
@@ -8,6 +8,7 @@ from flask import Flask
 from flask_cors import CORS
 from flask import request
 import os
+import threading
 
 # Import configuration
 from app.config import get_config
@@ -67,6 +68,14 @@ def create_app(config_name=None):
     # Register legacy routes for backward compatibility (simplified)
     register_legacy_routes(app)
     
+    # Keep the internship catalog snapshot in sync with MongoDB
+    from app.core.catalog import CATALOG
+    CATALOG.start_watcher()
+    
+    # Precompute the recommendation index/skill matrix without blocking startup
+    from app.api.recommendations import warm_recommendation_caches
+    threading.Thread(target=warm_recommendation_caches, name="warm-recommendations", daemon=True).start()
+    
     # Health check endpoint
     @app.route('/health')
     def health_check():
@@ -76,20 +85,33 @@ def create_app(config_name=None):
         # Test new API endpoints
         api_status = "healthy"
         try:
-            # Test if we can load internships
+            # Test if we can load a page of internships
             from app.api.internships import get_internships
             result = get_internships()
-            if result[1] != 200:
+            status_code = result[1] if isinstance(result, tuple) else result.status_code
+            if status_code != 200:
                 api_status = "error"
         except Exception as e:
             app_logger.warning(f"API endpoint test failed: {e}")
             api_status = "error"
         
+        # Missing indexes slow queries down but do not make the service unhealthy
+        indexes = "unknown"
+        if db_healthy:
+            try:
+                from backend.indexes import verify_indexes
+                missing = verify_indexes(db_manager.get_db())
+                indexes = {"status": "ok"} if not missing else {"status": "missing", "missing": missing}
+            except Exception as e:
+                app_logger.warning(f"Index verification failed: {e}")
+        
         status = "healthy" if db_healthy and api_status == "healthy" else "unhealthy"
         return {
             "status": status,
             "database": "connected" if db_healthy else "disconnected", 
+            "database_circuit": db_manager.circuit_state(),
             "api_endpoints": api_status,
+            "indexes": indexes,
             "version": "1.0.0"
         }, 200 if status == "healthy" else 503
     
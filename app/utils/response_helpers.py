@@ -42,6 +42,18 @@ class APIResponse:
         }
         return APIResponse.success(data=data, message=message, meta=meta)
     
+    @staticmethod
+    def cursor_paginated(data, limit=20, next_cursor=None, message="Success"):
+        """Create a keyset-paginated response; pass next_cursor back to get the following page."""
+        meta = {
+            "pagination": {
+                "limit": limit,
+                "next_cursor": next_cursor,
+                "has_next": next_cursor is not None
+            }
+        }
+        return APIResponse.success(data=data, message=message, meta=meta)
+    
     @staticmethod
     def error(message="An error occurred", status_code=400, errors=None, error_code=None):
         """Create an error response."""
@@ -0,0 +1,162 @@
+# backend/bulk_sync.py
+"""
+Diff-based replacement of a collection's contents.
+
+save_data(collection, data) means "the collection now holds exactly data".
+Instead of delete_many({}) + insert_many (O(collection) writes and a window
+with an empty collection) we read the current documents, compare them with
+data by their natural id, and send one unordered bulk_write with:
+
+- ReplaceOne(upsert=True) for new or changed documents,
+- DeleteMany for documents that are no longer in data.
+
+Unchanged documents are not written. Documents without a natural id are
+matched by _id, and inserted when they have neither. A submitted _id is kept
+when its document is inserted. Stored documents sharing a natural id with
+another one (left over from before the unique indexes) are deleted, keeping
+the one whose _id was submitted, else the first. A document submitted with
+a stored _id but a new natural id is replaced by _id rather than upserted
+under its new key (which would collide on _id) and deleted under its old one.
+
+Reads are O(collection) on purpose: deciding what changed needs every stored
+body, and these collections are small enough that a full read is far cheaper
+than the writes it saves.
+"""
+
+from bson import ObjectId
+from pymongo import DeleteMany, InsertOne, ReplaceOne
+
+# Natural id of each collection (unique indexes in backend/indexes.py)
+NATURAL_KEYS = {
+    "profiles": "candidate_id",
+    "internships": "internship_id",
+    "login_info": "username",
+    "skills_synonyms": "alias",
+}
+
+
+def _plain(value):
+    """Value with ObjectIds as strings, for comparing stored and submitted documents."""
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    if isinstance(value, ObjectId):
+        return str(value)
+    return value
+
+
+def _identity(doc, key):
+    value = doc.get(key) if key else None
+    if value is not None:
+        return (key, value)
+    if doc.get("_id") is not None:
+        return ("_id", str(doc["_id"]))
+    return None
+
+
+def _body(doc):
+    return {k: v for k, v in doc.items() if k != "_id"}
+
+
+def _object_id(value):
+    if isinstance(value, str) and ObjectId.is_valid(value):
+        return ObjectId(value)
+    return value
+
+
+def plan_sync(existing, data, key):
+    """Bulk operations turning the existing documents into data.
+
+    Returns (operations, counts) where counts has "upserts", "deletes" and
+    "unchanged".
+    """
+    stored_by_ident = {}
+    for doc in existing:
+        ident = _identity(doc, key)
+        if ident is not None:
+            stored_by_ident.setdefault(ident, []).append(doc)
+
+    wanted = {}
+    inserts = []
+    for doc in data:
+        ident = _identity(doc, key)
+        if ident is None:
+            inserts.append(InsertOne(dict(doc)))
+        else:
+            # Later duplicates win, as they would after a full rewrite
+            wanted[ident] = doc
+
+    # A submitted document whose _id is stored under another natural id was
+    # renamed: it is replaced in place by _id, and never deleted by its old key
+    stored_ids = {str(d["_id"]): d["_id"] for docs in stored_by_ident.values() for d in docs if d.get("_id") is not None}
+    renamed = {
+        str(doc["_id"]) for ident, doc in wanted.items()
+        if ident[0] != "_id" and ident not in stored_by_ident
+        and doc.get("_id") is not None and str(doc["_id"]) in stored_ids
+    }
+
+    # One stored document per identity; the other copies of a kept identity
+    # are deleted by _id (removed identities are deleted by key, copies and all)
+    current, duplicates = {}, []
+    for ident, docs in stored_by_ident.items():
+        others = [d for d in docs if str(d["_id"]) not in renamed]
+        if ident in wanted:
+            submitted = wanted[ident].get("_id")
+            keep = next((d for d in others if submitted is not None and str(d["_id"]) == str(submitted)),
+                        (others or docs)[0])
+            current[ident] = keep
+            duplicates.extend(d["_id"] for d in others if d is not keep)
+        elif len(others) < len(docs):
+            # The identity is gone but one of its documents was renamed
+            duplicates.extend(d["_id"] for d in others)
+        else:
+            current[ident] = docs[0]
+
+    operations = list(inserts)
+    unchanged = 0
+    for ident, doc in wanted.items():
+        stored = current.get(ident)
+        if stored is not None and _plain(_body(stored)) == _plain(_body(doc)):
+            unchanged += 1
+            continue
+        field, value = ident
+        body = _body(doc)
+        if field == "_id":
+            value = stored["_id"] if stored is not None else _object_id(doc["_id"])
+        elif stored is None and str(doc.get("_id")) in renamed:
+            field, value = "_id", stored_ids[str(doc["_id"])]
+        elif stored is None and doc.get("_id") is not None:
+            body = {"_id": _object_id(doc["_id"]), **body}
+        elif len(stored_by_ident.get(ident, ())) > 1:
+            # Its duplicates are deleted in the same unordered batch
+            field, value = "_id", stored["_id"]
+        operations.append(ReplaceOne({field: value}, body, upsert=True))
+
+    removed_keys = [value for (field, value) in current if field != "_id" and (field, value) not in wanted]
+    removed_ids = [current[ident]["_id"] for ident in current if ident[0] == "_id" and ident not in wanted]
+    removed_ids += duplicates
+    counts = {
+        "upserts": len(operations),
+        "deletes": len(removed_keys) + len(removed_ids),
+        "unchanged": unchanged,
+    }
+    if removed_keys:
+        operations.append(DeleteMany({key: {"$in": removed_keys}}))
+    if removed_ids:
+        operations.append(DeleteMany({"_id": {"$in": removed_ids}}))
+
+    return operations, counts
+
+
+def sync_collection(collection, data, key=None):
+    """Make collection hold exactly data with one unordered bulk_write; returns plan_sync's counts.
+
+    Reads the whole collection to diff against (see the module docstring).
+    """
+    if key is None:
+        key = NATURAL_KEYS.get(collection.name)
+    operations, counts = plan_sync(collection.find({}), data, key)
+    if operations:
+        collection.bulk_write(operations, ordered=False)
+    return counts
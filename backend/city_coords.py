@@ -1,6015 +1,161 @@
 """
 Static coordinates for Indian cities and display names.
 
-This file is generated by scripts/build_city_coords.py from data/cities.in.json
+The data lives in backend/city_coords.bin, generated by
+scripts/build_city_coords.py from data/cities.in.json: packed float64
+latitude/longitude arrays followed by newline-joined string tables (keys,
+display names, "alias<TAB>key" lines). The file is memory-mapped on first
+use; CITY_COORDINATES, DISPLAY_NAMES and ALIAS_KEYS are read-only mapping
+views over it, so importing this module costs almost nothing and the
+coordinate pages are shared between worker processes.
 """
 
-CITY_COORDINATES: dict[str, tuple[float, float]] = {
-    'mumbai': (19.072830, 72.882610),
-    'delhi': (28.651950, 77.231490),
-    'bengaluru': (12.971940, 77.593690),
-    'hyderabad': (17.384050, 78.456360),
-    'ahmedabad': (23.025790, 72.587270),
-    'chennai': (13.087840, 80.278470),
-    'kolkata': (22.562630, 88.363040),
-    'surat': (21.195940, 72.830230),
-    'pune': (18.519570, 73.855350),
-    'jaipur': (26.919620, 75.787810),
-    'kanpur': (26.465230, 80.349750),
-    'navi mumbai': (19.036810, 73.015820),
-    'lucknow': (26.839280, 80.923130),
-    'nagpur': (21.146310, 79.084910),
-    'coimbatore': (11.005550, 76.966120),
-    'indore': (22.717920, 75.833300),
-    'thāne': (19.197040, 72.963550),
-    'vadodara': (22.299410, 73.208120),
-    'bhopal': (23.254690, 77.402890),
-    'rasapūdipalem': (17.733080, 83.316220),
-    'pimpri-chinchwad': (18.618670, 73.803750),
-    'patna': (25.594080, 85.135630),
-    'kallakurichi': (11.733790, 78.959250),
-    'ludhiana': (30.912040, 75.853790),
-    'nashik': (19.997270, 73.790960),
-    'madurai': (9.919000, 78.119530),
-    'tirunelveli': (8.727420, 77.683800),
-    'agra': (27.183330, 78.016670),
-    'faridabad': (28.411240, 77.313160),
-    'rājkot': (22.291610, 70.793220),
-    'najafgarh': (28.609220, 76.979820),
-    'jamshedpur': (22.802780, 86.185450),
-    'gorakhpur': (29.447680, 75.672060),
-    'pimpri': (18.622920, 73.806960),
-    'kalyān': (19.243700, 73.135540),
-    'dombivali': (19.216670, 73.083330),
-    'meerut': (28.980020, 77.706360),
-    'virār': (19.455910, 72.811360),
-    'nowrangapur': (19.231140, 82.548260),
-    'srinagar': (34.085650, 74.805550),
-    'ghāziābād': (28.665350, 77.439150),
-    'dhanbad': (23.797590, 86.429920),
-    'aurangabad': (19.877570, 75.342260),
-    'varanasi': (25.316680, 83.010410),
-    'amritsar': (31.622340, 74.875340),
-    'vijayawada': (16.507450, 80.646600),
-    'ranchi': (23.343160, 85.309400),
-    'jabalpur': (23.166970, 79.950060),
-    'prayagraj': (25.444780, 81.843220),
-    'visakhapatnam': (17.680090, 83.201610),
-    'jodhpur': (26.268410, 73.005940),
-    'gwalior': (26.229830, 78.173370),
-    'teni': (10.011150, 77.477720),
-    'howrah': (22.576880, 88.318570),
-    'raipur': (21.233330, 81.633330),
-    'tiruchirappalli': (10.815500, 78.696510),
-    'kota': (25.182540, 75.839070),
-    'shivaji nagar': (18.530170, 73.852630),
-    'sholapur': (17.671520, 75.910440),
-    'chandigarh': (30.736290, 76.788400),
-    'tiruppur': (11.115410, 77.354560),
-    'guwahati': (26.184400, 91.745800),
-    'hubballi': (15.347760, 75.133780),
-    'mysuru': (12.297910, 76.639250),
-    'salem': (11.653760, 78.155380),
-    'gurugram': (28.460100, 77.026350),
-    'bhubaneswar': (20.272410, 85.833850),
-    'bhiwandi': (19.300230, 73.058810),
-    'jalandhar': (31.325560, 75.579170),
-    'rohini': (28.743220, 77.067780),
-    'kanayannur': (9.966670, 76.266670),
-    'bhayandar': (19.301570, 72.851070),
-    'narela': (28.852670, 77.092880),
-    'thiruvananthapuram': (8.485500, 76.949240),
-    'alīgarh': (27.881450, 78.074640),
-    'bareilly': (28.366780, 79.431670),
-    'morādābād': (28.838930, 78.776840),
-    'warangal': (18.000000, 79.583330),
-    'guntur': (16.299740, 80.457290),
-    'puducherry': (11.933810, 79.829790),
-    'amravati': (20.933330, 77.750000),
-    'bikaner': (28.017620, 73.314950),
-    'kochi': (9.939880, 76.260220),
-    'bhilai': (21.209190, 81.428500),
-    'cuttack': (20.464970, 85.879270),
-    'borivli': (19.234960, 72.859760),
-    'bhavnagar': (21.762870, 72.153310),
-    'sāngli': (16.854380, 74.564170),
-    'jamnagar': (22.472920, 70.066730),
-    'jammu': (32.735280, 74.861670),
-    'bokāro': (23.669340, 86.151610),
-    'nanded': (19.160230, 77.314970),
-    'kozhikode': (11.248020, 75.780400),
-    'kolhāpur': (16.695630, 74.231670),
-    'nellore': (14.449920, 79.986970),
-    'kalaburagi': (17.335830, 76.837570),
-    'ajmer': (26.452100, 74.638670),
-    'dehra dūn': (30.324430, 78.033920),
-    'erode': (11.342800, 77.727410),
-    'durgapur': (23.515830, 87.308010),
-    'ulhasnagar': (19.216670, 73.150000),
-    'siliguri': (26.710040, 88.428510),
-    'ujjain': (23.182390, 75.776430),
-    'bilimora': (20.769570, 72.961340),
-    'karol bāgh': (28.651360, 77.190720),
-    'āsansol': (23.683330, 86.983330),
-    'mangaluru': (12.917230, 74.856030),
-    'belagavi': (15.852120, 74.504470),
-    'sahāranpur': (29.967900, 77.545220),
-    'vellore': (12.918400, 79.132550),
-    'bhātpāra': (22.866430, 88.401130),
-    'malegaon': (20.549660, 74.534620),
-    'gaya': (24.796860, 85.003850),
-    'ambattur': (13.098180, 80.161520),
-    'jalgaon': (21.002920, 75.566020),
-    'kurnool': (15.828870, 78.036020),
-    'rāmgundam': (18.800840, 79.452060),
-    'udaipur': (24.585840, 73.713460),
-    'maheshtala': (22.508620, 88.253220),
-    'patiāla': (30.336250, 76.392200),
-    'shyamnagar': (22.833330, 88.366670),
-    'davangere': (14.466930, 75.926940),
-    'akola': (20.709570, 76.998100),
-    'rajpur sonarpur': (22.438200, 88.432050),
-    'korba': (22.345800, 82.696330),
-    'jhānsi': (25.458870, 78.579940),
-    'thoothukudi': (8.767350, 78.134250),
-    'ballari': (15.142050, 76.923980),
-    'bhāgalpur': (25.244460, 86.971830),
-    'agartala': (23.836050, 91.279390),
-    'kākināda': (16.960360, 82.238090),
-    'latur': (18.397210, 76.567840),
-    'pānihāti': (22.690890, 88.374040),
-    'rajamahendravaram': (17.005170, 81.777840),
-    'dhule': (20.901300, 74.777370),
-    'rohtak': (28.894470, 76.589170),
-    'ahilyanagar': (19.094570, 74.738430),
-    'kollam': (8.881130, 76.584690),
-    'bilāspur': (22.080050, 82.155430),
-    'bhilwara': (25.347070, 74.640810),
-    'brahmapur': (19.311510, 84.792900),
-    'muzaffarpur': (26.122590, 85.390550),
-    'punāsa': (22.235070, 76.393350),
-    'muzaffarnagar': (29.470910, 77.703320),
-    'avadi': (13.114700, 80.109810),
-    'kadapa': (14.479950, 78.823460),
-    'kukatpally': (17.484860, 78.413760),
-    'kāmārhāti': (22.671110, 88.374720),
-    'mathura': (27.503500, 77.672150),
-    'chānda': (19.950760, 79.295230),
-    'vijayapura': (16.824420, 75.715370),
-    'shivamogga': (13.931570, 75.567910),
-    'alwar': (27.562460, 76.625000),
-    'shāhjānpur': (27.881650, 79.909180),
-    'jūnāgadh': (21.519660, 70.459810),
-    'new delhi': (28.621370, 77.214800),
-    'thrissur': (10.516670, 76.216670),
-    'nizāmābād': (18.671540, 78.098800),
-    'tumkūr': (13.341360, 77.102200),
-    'parbhani': (19.268550, 76.770810),
-    'hisar': (29.153940, 75.722940),
-    'fīrozābād': (27.150920, 78.397810),
-    'kulti': (23.731660, 86.843720),
-    'karnāl': (29.691970, 76.984480),
-    'barddhamān': (23.255720, 87.856910),
-    'gundupālaiyam': (11.940960, 79.802940),
-    'bārāsat': (22.721540, 88.481980),
-    'mulugu': (18.191000, 79.943000),
-    'bihār sharīf': (25.200840, 85.523890),
-    'bāli': (22.648590, 88.341150),
-    'rāmpur': (28.810140, 79.026990),
-    'darbhanga': (26.152160, 85.897070),
-    'panipat': (29.387470, 76.968250),
-    'tirupati': (13.635510, 79.419890),
-    'greater noida': (28.496150, 77.536010),
-    'noida': (28.580000, 77.330000),
-    'aizawl': (23.728940, 92.717910),
-    'gandhinagar': (23.216670, 72.683330),
-    'dindigul': (10.368960, 77.980360),
-    'thanjavur': (10.785230, 79.139090),
-    'karīmnagar': (18.439150, 79.128560),
-    'dewas': (22.965850, 76.055260),
-    'sonīpat': (28.994780, 77.019370),
-    'ichalkaranji': (16.691170, 74.460540),
-    'bathinda': (30.207470, 74.938930),
-    'jālna': (19.841020, 75.886360),
-    'kirāri sulemānnagar': (28.697360, 77.064800),
-    'satna': (24.577260, 80.827190),
-    'purnia': (25.778950, 87.474220),
-    'imphal': (24.808050, 93.944200),
-    'saugor': (23.838770, 78.738740),
-    'kushinagar': (26.741340, 83.886890),
-    'rourkela': (22.224960, 84.864140),
-    'durg': (21.191470, 81.276190),
-    'anantapur': (14.677840, 77.608130),
-    'ratlām': (23.330330, 75.040320),
-    'rānipet': (12.924710, 79.333310),
-    'lal bahadur nagar': (17.347690, 78.557570),
-    'arrah': (25.556290, 84.663350),
-    'baranagar': (22.641320, 88.377270),
-    'gajuwaka': (17.700000, 83.216670),
-    'etāwah': (26.776150, 79.021330),
-    'ambarnath': (19.200000, 73.166670),
-    'naihāti': (22.893960, 88.415210),
-    'bharatpur': (27.217310, 77.490090),
-    'begusarai': (25.418530, 86.133890),
-    'tiruvottiyūr': (13.158230, 80.301810),
-    'gāndhīdhām': (23.083330, 70.133330),
-    'mau': (25.941670, 83.561110),
-    'sīkar': (27.612060, 75.139960),
-    'ramagundam': (18.755000, 79.474000),
-    'hāpur': (28.729850, 77.780680),
-    'farrukhābād': (27.391340, 79.579300),
-    'alappuzha': (9.490040, 76.326400),
-    'katihar': (25.538520, 87.570440),
-    'sri ganganagar': (29.920090, 73.874960),
-    'rewa': (24.532560, 81.292340),
-    'uluberiya': (22.475600, 88.098980),
-    'sivakasi': (9.449990, 77.797970),
-    'karur': (10.957710, 78.080950),
-    'rāichūr': (16.205460, 77.355670),
-    'pallāvaram': (12.967960, 80.150250),
-    'ooty': (11.413400, 76.695210),
-    'pāli': (25.772760, 73.323350),
-    'hosūr': (12.736470, 77.832640),
-    'vizianagaram': (18.116920, 83.411480),
-    'shrīrāmpur': (22.752780, 88.342220),
-    'quthbullapur': (17.501070, 78.458180),
-    'nadiād': (22.693850, 72.861570),
-    'nāgercoil': (8.178990, 77.432270),
-    'karāwalnagar': (28.727120, 77.270470),
-    'mango': (22.827500, 86.216390),
-    'gosāba': (22.165470, 88.800700),
-    'murwāra': (23.837760, 80.394050),
-    'kanchipuram': (12.835150, 79.700060),
-    'singrauli': (24.199730, 82.675350),
-    'mirzāpur': (25.144900, 82.565340),
-    'kharagpur': (22.339710, 87.325010),
-    'eluru': (16.713110, 81.104370),
-    'rāniganj': (17.428410, 78.493610),
-    'yamuna nagar': (30.127960, 77.283710),
-    'raurkela industrial township': (22.199940, 84.861760),
-    'bidar': (17.908020, 77.515240),
-    'munger': (25.374590, 86.474550),
-    'nandyāl': (15.477990, 78.483600),
-    'panchkula': (30.694610, 76.850400),
-    'burhānpur': (21.308680, 76.230260),
-    'morvi': (22.817310, 70.837700),
-    'anand': (22.552510, 72.955200),
-    'ongole': (15.503570, 80.044540),
-    'hosapete': (15.269540, 76.387100),
-    'nāngloi jāt': (28.679570, 77.067990),
-    'secunderabad': (17.504270, 78.542630),
-    'deoghar': (24.489830, 86.699020),
-    'chāpra': (25.780310, 84.747090),
-    'khandwa': (21.824270, 76.350860),
-    'puri': (19.798250, 85.824940),
-    'morena': (26.498920, 77.995340),
-    'gyānpur': (25.332680, 82.466370),
-    'bulandshahr': (28.403920, 77.857730),
-    'bhind': (26.566710, 78.787280),
-    'bhālswa jahangirpur': (28.735580, 77.166820),
-    'khammam': (17.247670, 80.143680),
-    'sambhal': (28.584980, 78.569590),
-    'bhiwāni': (28.793040, 76.139680),
-    'panvel': (18.988780, 73.110130),
-    'ambāla': (30.360990, 76.797820),
-    'kumarapalayam': (11.444950, 77.711020),
-    'machilīpatnam': (16.187470, 81.138880),
-    'mahesāna': (23.598640, 72.384720),
-    'mahbūbnagar': (16.743850, 77.985970),
-    'sambalpur': (21.465270, 83.975730),
-    'bhusawal': (21.043650, 75.785060),
-    'raebareli': (26.230900, 81.233150),
-    'haridwar': (29.947910, 78.160250),
-    'phusro': (23.756440, 86.005100),
-    'adoni': (15.627880, 77.274950),
-    'sūjāngarh': (27.700000, 74.466670),
-    'sirsa': (29.534890, 75.028980),
-    'dinapur nizamat': (25.638470, 85.051180),
-    'bahraigh': (27.574290, 81.594740),
-    'kāraikkudi': (10.066150, 78.767840),
-    'sultan pur majra': (28.689660, 77.076480),
-    'guna': (24.646910, 77.311300),
-    'chandannagar': (22.862250, 88.367960),
-    'baharampur': (24.104730, 88.251550),
-    'shahuwadi': (16.909930, 73.946540),
-    'madanapalle': (13.550300, 78.502880),
-    'shivpuri': (25.423780, 77.662230),
-    'surendranagar': (22.727060, 71.648560),
-    'neyveli': (11.608770, 79.499400),
-    'silchar': (24.827330, 92.797870),
-    'proddatūr': (14.750200, 78.548130),
-    'hugli': (22.908770, 88.396740),
-    'hashtsāl': (28.634060, 77.057710),
-    'amroha': (28.903140, 78.469840),
-    'chhindwāra': (22.056970, 78.939580),
-    'tambaram': (12.924600, 80.127070),
-    'bhetia': (22.793210, 86.140980),
-    'pathānkot': (32.274840, 75.652870),
-    'badlapur': (19.155160, 73.265530),
-    'cuddalore': (11.756170, 79.766930),
-    'shimla': (31.104420, 77.166620),
-    'gadag-betageri': (15.416700, 75.616700),
-    'gadag': (15.429770, 75.629710),
-    'verāval': (20.907700, 70.367860),
-    'navsari': (20.942370, 72.924670),
-    'bahadurgarh': (28.692870, 76.935550),
-    'haldia': (22.060460, 88.109750),
-    'rāiganj': (25.612810, 88.124490),
-    'malda': (25.004470, 88.145730),
-    'jaunpur': (25.753560, 82.686890),
-    'deoli': (28.502540, 77.231170),
-    'bharūch': (21.694820, 72.980500),
-    'hoshiārpur': (31.537230, 75.912690),
-    'jīnd': (29.315770, 76.315020),
-    'kumbakonam': (10.962090, 79.391240),
-    'mohali': (30.679950, 76.722110),
-    'fatehpur': (25.927740, 80.812660),
-    'tonk': (26.166380, 75.788240),
-    'udupi': (13.334670, 74.746170),
-    'thenali': (16.242530, 80.639820),
-    'loni': (28.751430, 77.290230),
-    'sītāpur': (27.561920, 80.682650),
-    'alandur': (13.002500, 80.206110),
-    'bhadrāvati': (13.848460, 75.705020),
-    'vapi': (20.371750, 72.904930),
-    'moga': (30.813830, 75.168780),
-    'rāj-nāndgaon': (21.096870, 81.028900),
-    'robertsonpet': (12.956290, 78.275390),
-    'unnāo': (26.547060, 80.487810),
-    'budaun': (28.038110, 79.126680),
-    'madhyamgram': (22.689440, 88.445940),
-    'chittoor': (13.210550, 79.095600),
-    'jāmuria': (23.704680, 87.078720),
-    'jaigaon': (26.847660, 89.375580),
-    'batāla': (31.809210, 75.202940),
-    'orai': (25.990230, 79.453340),
-    'saharsa': (25.874980, 86.596110),
-    'vidisha': (23.526040, 77.810920),
-    'hanumāngarh': (29.581820, 74.329380),
-    'thānesar': (29.973230, 76.832140),
-    'hassan': (13.007150, 76.096200),
-    'kishangarh': (26.590060, 74.853970),
-    'dalūpura': (28.605700, 77.319010),
-    'rudrapur': (28.980000, 79.400000),
-    'nalgonda': (17.054390, 79.267070),
-    'hazāribāgh': (23.992410, 85.361620),
-    'medinīpur': (22.421140, 87.322570),
-    'bālurghāt': (25.220990, 88.777320),
-    'fyzābād': (26.775490, 82.150180),
-    'dinapore': (25.637050, 85.047940),
-    'porbandar': (21.642190, 69.609290),
-    'bānda': (25.477580, 80.334910),
-    'hindupur': (13.828070, 77.491430),
-    'beāwar': (26.101190, 74.320280),
-    'anantnag': (33.730680, 75.154180),
-    'serilingampalle': (17.493130, 78.301960),
-    'raigarh': (21.897640, 83.396600),
-    'malkajgiri': (17.447810, 78.526330),
-    'shāntipur': (23.247230, 88.433020),
-    'bhuj': (23.253970, 69.669280),
-    'bārākpur': (22.766020, 88.363360),
-    'hājīpur': (25.685440, 85.209810),
-    'sasarām': (24.949420, 84.016450),
-    'bhimavaram': (16.540780, 81.523220),
-    'beed': (18.989210, 75.756340),
-    'burāri': (28.755700, 77.199410),
-    'krishnanagar': (23.405760, 88.490730),
-    'chitradurga': (14.222620, 76.400380),
-    'dibrugarh': (27.479890, 94.908370),
-    'abohar': (30.144530, 74.195520),
-    'tiruvannamalai': (12.226620, 79.074610),
-    'kaithal': (29.801530, 76.399590),
-    'balasore': (21.492660, 86.933480),
-    'godhra': (22.775470, 73.614880),
-    'shillong': (25.568920, 91.883130),
-    'rewāri': (28.199000, 76.618300),
-    'chhatarpur': (24.917700, 79.588710),
-    'mandsaur': (24.071840, 75.069860),
-    'chas': (23.635560, 86.167120),
-    'pālanpur': (24.171280, 72.438270),
-    'lakhīmpur': (27.948220, 80.779350),
-    'valsād': (20.610130, 72.934280),
-    'damoh': (23.833120, 79.441900),
-    'haldwani': (29.222540, 79.528600),
-    'hābra': (22.842020, 88.656060),
-    'kolār': (13.137680, 78.129990),
-    'srikakulam': (18.298900, 83.897510),
-    'mandya': (12.522300, 76.897460),
-    'madhurampur dehri': (24.968990, 84.196400),
-    'kānchrāpāra': (22.959980, 88.428490),
-    'dimāpur': (25.911740, 93.721700),
-    'māler kotla': (30.530900, 75.879490),
-    'siwān': (26.220960, 84.356090),
-    'kalol': (23.246560, 72.495080),
-    'bānkura': (23.232410, 87.071600),
-    'pātan': (23.850700, 72.129630),
-    'gondā city': (27.131810, 81.953320),
-    'dhaulpur': (26.692860, 77.879680),
-    'gondiā': (21.460260, 80.192050),
-    'palakkad': (10.773190, 76.653660),
-    'bettiah': (26.802290, 84.503110),
-    'palwal': (28.144690, 77.325460),
-    'pīlibhīt': (28.631240, 79.804360),
-    'rajapalayam': (9.452960, 77.553350),
-    'botad': (22.169170, 71.666710),
-    'deoria': (26.501670, 83.779360),
-    'nimach': (24.459490, 74.866250),
-    'khardah': (22.718610, 88.378060),
-    'yavatmāl': (20.393240, 78.132010),
-    'hālīsahar': (22.932180, 88.418590),
-    'khanna': (30.705470, 76.221960),
-    'titāgarh': (22.742520, 88.373260),
-    'mustafābād': (28.719740, 77.267810),
-    'hāthras': (27.595510, 78.052010),
-    'jorhat': (26.757510, 94.203060),
-    'lalitpur': (24.690070, 78.419150),
-    'guntakal': (15.171120, 77.362440),
-    'pithampur': (22.601970, 75.696490),
-    'mothīhāri': (26.648620, 84.916560),
-    'kanhangad': (12.308140, 75.106320),
-    'jagdalpur': (19.081360, 82.021310),
-    'jagādhri': (30.167190, 77.303670),
-    'dārjiling': (27.033330, 88.266670),
-    'kurichchi': (10.960850, 76.973790),
-    'dam dam': (22.633410, 88.422860),
-    'hardoī': (27.394910, 80.131650),
-    'puruliya': (23.330620, 86.363030),
-    'dharmavaram': (14.414350, 77.720350),
-    'gokalpur': (28.702900, 77.289610),
-    'bhadreswar': (22.824490, 88.338410),
-    'nagaon': (26.350000, 92.666670),
-    'vejalpur': (22.690210, 73.562990),
-    'chikmagalūr': (13.322310, 75.774000),
-    'bhadrak': (21.054470, 86.515600),
-    'sawai madhopur': (26.023010, 76.344080),
-    'ambikāpur': (23.118920, 83.195370),
-    'mandoli': (28.702750, 77.309950),
-    'satara': (17.685890, 73.993330),
-    'chūru': (28.304150, 74.967180),
-    'gangāpur': (26.472490, 76.717440),
-    'madhavaram': (13.148190, 80.231400),
-    'dohad': (22.832830, 74.259860),
-    'barshi': (18.234540, 75.692750),
-    'ādilābād': (19.672030, 78.535900),
-    'jhunjhunūn': (28.125590, 75.397970),
-    'jetpur': (21.754820, 70.623470),
-    'uppal kalan': (17.405770, 78.559110),
-    'gudivāda': (16.435470, 80.995550),
-    'bārān': (25.100000, 76.516670),
-    'narmadapuram': (22.747470, 77.727360),
-    'amreli': (21.599830, 71.211690),
-    'pudukkottai': (10.381280, 78.821410),
-    'narasaraopet': (16.234880, 80.049270),
-    'rishra': (22.723940, 88.345630),
-    'baripāda': (21.934580, 86.728520),
-    'muktsar': (30.474260, 74.516600),
-    'azamgarh': (26.068320, 83.183580),
-    'barnāla': (30.374510, 75.548700),
-    'yelahanka': (13.100730, 77.596320),
-    'chittorgarh': (24.889630, 74.624030),
-    'tinsukia': (27.489050, 95.359920),
-    'khargone': (21.822920, 75.613940),
-    'baidyabāti': (22.784980, 88.325860),
-    'bastī': (26.788170, 82.716170),
-    'gangavati': (15.431300, 76.529330),
-    'ambur': (12.791630, 78.716440),
-    'giridih': (24.186220, 86.308750),
-    'wardha': (20.739330, 78.597840),
-    'chanduasi': (28.451780, 78.782770),
-    'bagaha': (27.099180, 84.090030),
-    'achalpur': (21.256650, 77.510060),
-    'gondal': (21.960740, 70.802550),
-    'dharashiv': (18.181580, 76.038890),
-    'port blair': (11.666130, 92.746350),
-    'bagalkot': (16.186730, 75.696140),
-    'suriāpet': (17.140540, 79.620450),
-    'bangaon': (23.045530, 88.830840),
-    'ashoknagar kalyangarh': (22.864160, 88.637010),
-    'deesa': (24.256120, 72.179280),
-    'navadwīp': (23.406700, 88.368610),
-    'nandurbar': (21.366710, 74.240510),
-    'sultānpur': (26.257880, 82.072690),
-    'delhi cantonment': (28.600000, 77.133330),
-    'firozpur': (30.925740, 74.613110),
-    'sehore': (23.200000, 77.083330),
-    'bānsbāria': (22.953870, 88.400980),
-    'tadpatri': (14.908320, 78.010310),
-    'tādepallegūdem': (16.814670, 81.527170),
-    'jalpāiguri': (26.516670, 88.733330),
-    'mangalagiri': (16.430830, 80.568150),
-    'ranebennur': (14.622390, 75.629510),
-    'khurja': (28.253820, 77.855350),
-    'kishanganj': (26.102240, 87.955340),
-    'ponnāni': (10.766950, 75.925230),
-    'hindaun': (26.734110, 77.035190),
-    'jamālpur': (25.312580, 86.488880),
-    'nāgaur': (27.202010, 73.733940),
-    'ambala sadar': (30.335440, 76.862650),
-    'bhiwadi': (28.210240, 76.860560),
-    'būndi': (25.438550, 75.637350),
-    'miryalaguda': (16.872200, 79.562470),
-    'soyībug': (34.076770, 74.705700),
-    'jagtiāl': (18.794730, 78.916610),
-    'roorkee': (29.866320, 77.891180),
-    'udgīr': (18.392580, 77.117560),
-    'nagda': (23.458340, 75.417590),
-    'betūl': (21.900560, 77.902290),
-    'jahānābād': (25.213680, 84.987100),
-    'kashipur': (29.213990, 78.956930),
-    'ghazīpur': (25.583330, 83.585260),
-    'amaravati': (16.514000, 80.516000),
-    'nagapattinam': (10.763770, 79.843130),
-    'buxar': (25.575480, 83.980430),
-    'mormugao': (15.389140, 73.814910),
-    'seoni': (22.085030, 79.550370),
-    'hinganghāt': (20.548750, 78.839780),
-    'dhamtari': (20.707180, 81.548740),
-    'chilakalūrupet': (16.089870, 80.167050),
-    'malappuram': (11.041990, 76.081540),
-    'bānswāra': (23.541090, 74.442500),
-    'chirmiri': (23.190730, 82.353140),
-    'itārsi': (22.614770, 77.762220),
-    'vasco da gama': (15.395850, 73.815680),
-    'gangtok': (27.325740, 88.612160),
-    'datia': (25.673120, 78.459080),
-    'phagwāra': (31.224520, 75.773870),
-    'airoli': (19.150960, 72.996250),
-    'luckeesarai': (25.176500, 86.094700),
-    'shikohābād': (27.108000, 78.586610),
-    'kāsganj': (27.808820, 78.645790),
-    'khambhāt': (22.317440, 72.619160),
-    'kohima': (25.674670, 94.110990),
-    'pandharpur': (17.679240, 75.330980),
-    'kapurthala town': (31.380110, 75.381050),
-    'mahuva': (21.090070, 71.769040),
-    'silvassa': (20.273860, 72.996730),
-    'balāngīr': (20.704190, 83.490290),
-    'mughal sarāi': (25.283070, 83.119680),
-    'nawāda': (24.886700, 85.543640),
-    'bhilai charoda': (21.223050, 81.456090),
-    'shāmli': (29.449700, 77.309590),
-    'jharsuguda': (21.855310, 84.006980),
-    'sādatpur gujran': (28.728340, 77.248170),
-    'chalisgaon': (20.457810, 75.015960),
-    'villupuram': (11.939750, 79.492440),
-    'amalner': (21.039830, 75.058870),
-    'tellicherry': (11.748110, 75.492900),
-    'manjeri': (11.120180, 76.119960),
-    'birgaon': (21.307580, 81.627930),
-    'bārmer': (25.745720, 71.392110),
-    'pūth kalān': (28.711600, 77.078870),
-    'kuniyamuttūr': (10.963760, 76.952540),
-    'sardārshahr': (28.440620, 74.491000),
-    'sānand': (22.992270, 72.381770),
-    'sāhibganj': (25.244250, 87.634810),
-    'paramagudi': (9.546330, 78.590700),
-    'zerakpur': (30.656220, 76.820930),
-    'tiruchengode': (11.380160, 77.894440),
-    'closepet': (12.721810, 77.281490),
-    'emmiganūr': (15.772030, 77.483450),
-    'vaniyambadi': (12.681620, 78.620140),
-    'kovilpatti': (9.171670, 77.869890),
-    'parli vaijnāth': (18.850570, 76.531630),
-    'mainpuri': (27.228570, 79.028820),
-    'khāmgaon': (20.707380, 76.568270),
-    'makrāna': (27.043610, 74.724450),
-    'allinagaram': (10.027370, 77.478150),
-    'gudiyatham': (12.946010, 78.873770),
-    'dhār': (22.593730, 75.297740),
-    'baraut': (29.101990, 77.263340),
-    'kalyani': (22.975700, 88.433700),
-    'doddaballapura': (13.294520, 77.537770),
-    'chīrāla': (15.823850, 80.352190),
-    'akot': (21.096300, 77.058800),
-    'gharroli': (28.616700, 77.332070),
-    'rajpura': (30.478560, 76.592840),
-    'ballarpur': (19.846960, 79.345780),
-    'kot kapūra': (30.580610, 74.826090),
-    'bhandāra': (21.168170, 79.648850),
-    'molārband': (28.502950, 77.314420),
-    'rayachoti': (14.057230, 78.750560),
-    'kadayanallur': (9.072770, 77.341520),
-    'valparai': (10.326910, 76.951160),
-    'pollachi': (10.658250, 77.008500),
-    'kāvali': (14.916300, 79.994490),
-    'roha': (18.436870, 73.119640),
-    'mancherial': (18.870740, 79.428630),
-    'avaniyāpuram': (9.881790, 78.112550),
-    'murādnagar': (28.780690, 77.498650),
-    'ankleshwar': (21.632360, 72.990010),
-    'kadiri': (14.111680, 78.159820),
-    'shahdol': (23.293560, 81.361900),
-    'mahobā': (25.290500, 79.875330),
-    'rāmgarh': (23.630300, 85.521560),
-    'contai': (21.779850, 87.748920),
-    'sangrūr': (30.245060, 75.844880),
-    'nirmal': (19.096850, 78.344070),
-    'deoband': (29.695050, 77.679640),
-    'neyyāttinkara': (8.398540, 77.085860),
-    'tāndā': (26.549530, 82.658410),
-    'jhumri telaiya': (24.434900, 85.529510),
-    'aruppukkottai': (9.509600, 78.095880),
-    'farīdkot': (30.673990, 74.755790),
-    'madgaon': (15.275010, 73.957860),
-    'velampālaiyam': (11.137640, 77.310640),
-    'jamūī': (24.926060, 86.225310),
-    'anjār': (23.113160, 70.026710),
-    'paralakhemundi': (18.776190, 84.095040),
-    'jharia': (23.740790, 86.414560),
-    'kāraikāl': (10.916670, 79.833330),
-    'kāmthi': (21.216150, 79.197300),
-    'hānsi': (29.102390, 75.962530),
-    'mayiladuthurai': (11.103540, 79.655000),
-    'anakapalle': (17.691340, 83.003950),
-    'maduravoyal': (13.067500, 80.163200),
-    'sārni': (22.103170, 78.171590),
-    'dausa': (26.890000, 76.335840),
-    'parādīp garh': (20.316410, 86.608500),
-    'hingoli': (19.714640, 77.142380),
-    'bāruni': (25.475090, 85.968130),
-    'jeypore': (18.856300, 82.571600),
-    'bijnor': (29.373000, 78.136360),
-    'dhoraji': (21.733590, 70.450040),
-    'vīrappanchathiram': (11.353140, 77.712530),
-    'bālāghāt': (21.815600, 80.188450),
-    'udhampur': (32.924310, 75.135730),
-    'najībābād': (29.611940, 78.342740),
-    'idaiyarpālaiyam': (11.039370, 76.923690),
-    'harihar': (14.512880, 75.807160),
-    'chilla soroda bāngar': (28.595720, 77.301890),
-    'sirsilla': (18.388650, 78.810480),
-    'karauli': (26.498310, 77.027550),
-    'mānsa': (29.988440, 75.401670),
-    'jangipur': (24.470010, 88.076590),
-    'gobindgarh': (30.670890, 76.301920),
-    'saunda': (23.664530, 85.326940),
-    'maraimalainagar': (12.797820, 80.025020),
-    'ashoknagar': (24.575780, 77.731230),
-    'phulwari sharif': (25.577650, 85.072460),
-    'mhow': (22.558900, 75.765430),
-    'malout': (30.211210, 74.481800),
-    'kadi': (23.299080, 72.333620),
-    'vijalpor': (20.922120, 72.909450),
-    'palakollu': (16.516700, 81.730000),
-    'himatnagar': (23.598930, 72.966020),
-    'dholka': (22.727320, 72.441280),
-    'kotkapura': (30.581900, 74.832980),
-    'bargarh': (21.333480, 83.619050),
-    'kharghar': (19.049790, 73.070240),
-    'kairāna': (29.395410, 77.205400),
-    'brajarajnagar': (21.816670, 83.916670),
-    'kāmāreddi': (18.320010, 78.341770),
-    'palwancha': (17.581520, 80.676510),
-    'manmād': (20.253340, 74.437550),
-    'srikalahasti': (13.755140, 79.701430),
-    'kottagūdem': (17.551060, 80.617790),
-    'nawābganj': (26.931290, 81.198410),
-    'gokak': (16.169010, 74.823930),
-    'tīkamgarh': (24.743270, 78.830610),
-    'arakkonam': (13.084490, 79.670530),
-    'arāria': (26.149340, 87.513230),
-    'koch bihār': (26.325390, 89.445080),
-    'kharakvasla': (18.439970, 73.775450),
-    'bhadohi': (25.395260, 82.570300),
-    'kātoya': (23.645580, 88.132580),
-    'medininagar': (24.039710, 84.065800),
-    'wāshīm': (20.111280, 77.133000),
-    'bagbera': (22.759480, 86.190490),
-    'savarkundla': (21.337260, 71.303500),
-    'basoda': (23.851530, 77.936520),
-    'tanuku': (16.754380, 81.681430),
-    'gurdaspur': (32.039330, 75.403180),
-    'edattala': (10.056390, 76.384510),
-    'bodhan': (18.662080, 77.885810),
-    'balrāmpur': (27.429490, 82.185450),
-    'bāramūla': (34.209000, 74.342850),
-    'karwar': (14.813610, 74.129720),
-    'dhuliān': (24.681270, 87.953500),
-    'rabkavi-banhatti': (16.470000, 75.120000),
-    'mawāna': (29.102880, 77.921990),
-    'shirpur': (21.348210, 74.880350),
-    'budge budge': (22.482750, 88.181760),
-    'kundla': (21.342220, 71.306330),
-    'visnagar': (23.698550, 72.552100),
-    'kannauj': (27.055240, 79.918800),
-    'khajoori khas': (28.709580, 77.258700),
-    'neelankarai': (12.949500, 80.259200),
-    'nagīna': (29.444330, 78.436460),
-    'badagara': (11.597760, 75.581420),
-    'fazilka': (30.402070, 74.028360),
-    'ratnagiri': (16.991540, 73.310220),
-    'keshod': (21.303280, 70.248610),
-    'konnagar': (22.705080, 88.344460),
-    'chintamani': (13.400510, 78.051720),
-    'pammal': (12.975000, 80.134720),
-    'sindhnūr': (15.769830, 76.755810),
-    'madhubani': (26.353670, 86.071690),
-    'bodināyakkanūr': (10.011710, 77.349760),
-    'khadki': (18.563500, 73.852050),
-    'dhrāngadhra': (22.991670, 71.467930),
-    'tezpur': (26.633330, 92.800000),
-    'srivilliputhur': (9.512720, 77.633690),
-    'benipur': (26.055090, 86.145570),
-    'pāloncha': (17.601840, 80.705090),
-    'jaora': (23.637830, 75.127110),
-    'tura': (25.514210, 90.202390),
-    'gūdūr': (14.150930, 79.852100),
-    'narnaul': (28.044440, 76.108330),
-    'balotra': (25.832420, 72.240000),
-    'kharar': (30.746320, 76.646890),
-    'yadgir': (16.770070, 77.137550),
-    'harda': (22.344140, 77.095360),
-    'pilkhua': (28.712710, 77.656000),
-    'ambājogāi': (18.733120, 76.386160),
-    'kāpas herd': (28.526140, 77.083960),
-    'bela': (25.920580, 81.996290),
-    'rabkavi': (16.475670, 75.110600),
-    'bawāna': (28.798200, 77.034310),
-    'shāhābād': (27.643100, 79.940200),
-    'virudhachalam': (11.514970, 79.328240),
-    'chāndpur': (29.134890, 78.271870),
-    'kāsipālaiyam': (11.319840, 77.709710),
-    'sikandarābād': (28.452260, 77.700040),
-    'virudunagar': (9.585090, 77.957870),
-    'pattukkottai': (10.423580, 79.319490),
-    'pusad': (19.912740, 77.578380),
-    'tindivanam': (12.234000, 79.655510),
-    'chopda': (21.245780, 75.299460),
-    'taliparamba': (12.041610, 75.359270),
-    'sangāreddi': (17.624770, 78.086690),
-    'pālghar': (19.696930, 72.765430),
-    'dharapuram': (10.738280, 77.532230),
-    'payyanur': (12.093500, 75.202490),
-    'sheopur': (25.664720, 76.696160),
-    'channapatna': (12.651430, 77.206720),
-    'koyilandy': (11.438100, 75.693060),
-    'farīdpur': (28.209970, 79.541490),
-    'barauni': (25.470900, 85.976000),
-    'krishnagiri': (12.519210, 78.213820),
-    'sopur': (34.286710, 74.472280),
-    'rāyagada': (19.171320, 83.414280),
-    'zahirābād': (17.681380, 77.607430),
-    'khopoli': (18.785620, 73.345890),
-    'ratangarh': (28.081370, 74.618540),
-    'mārkāpur': (15.735340, 79.268480),
-    'kalamassery': (10.061400, 76.326310),
-    'bolpur': (23.662780, 87.696950),
-    'panjim': (15.495740, 73.826240),
-    'rānāghāt': (23.176230, 88.566670),
-    'fatehābād': (29.515250, 75.455540),
-    'bāpatla': (15.904220, 80.467430),
-    'beypore': (11.171510, 75.806110),
-    'koppal': (15.345220, 76.154780),
-    'badvel': (14.745100, 79.062880),
-    'dādri': (28.552570, 77.554030),
-    'thenkasi': (8.960030, 77.315250),
-    'suratgarh': (29.321500, 73.899790),
-    'auraiya': (26.465170, 79.509180),
-    'palani': (10.450340, 77.520900),
-    'nallūr': (11.100300, 77.391360),
-    'chamrajnagar': (11.923120, 76.939490),
-    'mīthepur': (28.497400, 77.318560),
-    'māngrol': (21.122680, 70.114840),
-    'basavakalyan': (17.874450, 76.949720),
-    'pul pehlad': (28.499380, 77.291040),
-    'chāībāsa': (22.550380, 85.802490),
-    'tripunittura': (9.942830, 76.333310),
-    'shājāpur': (23.426370, 76.277750),
-    'mettupalayam': (11.299710, 76.934850),
-    'sunām': (30.128830, 75.799430),
-    'bhawānipatna': (19.907170, 83.166970),
-    'ziauddin pur': (28.708730, 77.276540),
-    'jamkhandi': (16.504610, 75.291460),
-    'basmat': (19.328720, 77.157460),
-    'taj pul': (28.494820, 77.305870),
-    'kayamkulam': (9.181730, 76.500930),
-    'dharmapuri': (12.127700, 78.157940),
-    'bīsalpur': (28.292530, 79.804720),
-    'attili': (16.700000, 81.600000),
-    'cumbum': (9.736470, 77.284700),
-    'munnar': (10.088180, 77.062390),
-    'panipat taraf makhdum zadgan': (29.416070, 76.988310),
-    'nābha': (30.375770, 76.152920),
-    'bihāt': (25.425340, 86.020830),
-    'samāstipur': (25.862220, 85.779530),
-    'kāranja': (20.482730, 77.488570),
-    'sītāmarhi': (26.593570, 85.490600),
-    'rājsamand': (25.071450, 73.879800),
-    'malkāpur': (20.885550, 76.199320),
-    'modāsa': (23.462530, 73.298570),
-    'jaisalmer': (26.917630, 70.903870),
-    'buldāna': (20.529330, 76.184570),
-    'dhenkānāl': (20.657440, 85.596930),
-    'urun-islāmpur': (17.050000, 74.266670),
-    'gopālganj': (26.467340, 84.440410),
-    'bongaigaon': (26.477030, 90.558150),
-    'sangamner': (19.567840, 74.211540),
-    'hāveri': (14.793540, 75.404480),
-    'mannargudi': (10.666260, 79.450640),
-    'jhālāwār': (24.596330, 76.164990),
-    'tarn taran': (31.451910, 74.927770),
-    'siddipet': (18.104830, 78.848580),
-    'bellampalli': (19.055770, 79.493000),
-    'barbil': (22.101940, 85.377520),
-    'koratla': (18.821540, 78.711860),
-    'rishīkesh': (30.107780, 78.292550),
-    'goyerkāta': (26.699840, 89.025650),
-    'mandamarri': (18.965060, 79.474750),
-    'puliyankudi': (9.174890, 77.397990),
-    'palāsa': (18.772570, 84.410120),
-    'gohāna': (29.137770, 76.702470),
-    'pulivendla': (14.421390, 78.225020),
-    'chengalpattu': (12.691840, 79.976610),
-    'wadgaon kolhati': (19.843070, 75.236000),
-    'lādnūn': (27.653120, 74.399930),
-    'supaul': (26.115270, 86.595090),
-    'gangārāmpur': (25.401380, 88.529780),
-    'ramanathapuram': (9.371580, 78.830770),
-    'jagraon': (30.787830, 75.473910),
-    'sinnar': (19.845050, 73.998660),
-    'kopargaon': (19.882390, 74.476050),
-    'alīpur duār': (26.483500, 89.522860),
-    'tandur': (17.248490, 77.576980),
-    'khatauli': (29.278440, 77.733020),
-    'vīrarāghavapuram': (13.073060, 80.107780),
-    'siuri': (23.908060, 87.527730),
-    'bīna': (24.171610, 78.187550),
-    'pālitāna': (21.525190, 71.823090),
-    'chaumu': (27.169550, 75.722260),
-    'hālol': (22.503210, 73.472420),
-    'kodār': (16.998500, 79.965600),
-    'bāngarda chhota': (22.743540, 75.814480),
-    'tādepalle': (16.483330, 80.600000),
-    'tirupattur': (12.492390, 78.568040),
-    'chinnachowk': (14.475160, 78.835400),
-    'bishnupur': (23.073800, 87.319910),
-    'āmūr': (18.792840, 78.276660),
-    'baheri': (28.774160, 79.497400),
-    'nawalgarh': (27.851610, 75.273840),
-    'ānaiyūr': (9.961520, 78.111800),
-    'kunnamkulam': (10.646670, 76.066950),
-    'rāghogarh': (24.443180, 77.197680),
-    'tohāna': (29.713320, 75.904410),
-    'jatani': (20.159750, 85.707420),
-    'arni': (12.667710, 79.285290),
-    'chik ballāpur': (13.435120, 77.727870),
-    'dhubri': (26.018560, 89.985640),
-    'borsad': (22.407880, 72.898170),
-    'gadwāl': (16.235040, 77.795560),
-    'pidugurālla': (16.479260, 79.886320),
-    'sheikhpura': (25.139940, 85.840960),
-    'sirsi': (14.620720, 74.835540),
-    'nipāni': (16.399000, 74.382850),
-    'kannur': (11.867520, 75.357630),
-    'bāri': (26.646610, 77.616340),
-    'nokha': (27.561550, 73.471410),
-    'vinukonda': (16.053100, 79.739640),
-    'renukūt': (24.216410, 83.035800),
-    'nagari': (13.321390, 79.585570),
-    'chidambaram': (11.399330, 79.691440),
-    'dabwāli': (29.949060, 74.738320),
-    'sibsāgar': (26.984270, 94.637840),
-    'narwāna': (29.599030, 76.119270),
-    'okha': (22.467560, 69.070020),
-    'kuchāman': (27.147450, 74.856550),
-    'nīmbāhera': (24.621660, 74.679990),
-    'siddhapur': (23.917830, 72.372120),
-    'diphu': (25.843410, 93.431160),
-    'attur': (11.594140, 78.601430),
-    'rāyadrug': (14.699710, 76.852410),
-    'rāth': (25.594740, 79.566600),
-    'cheruvannur': (11.190330, 75.828330),
-    'vriddhāchalam': (11.518300, 79.324110),
-    'bārh': (25.483390, 85.709280),
-    'shāhāda': (21.545380, 74.471060),
-    'dabra': (25.885720, 78.332210),
-    'udumalaippettai': (10.588060, 77.247790),
-    'tiptūr': (13.256300, 76.477680),
-    'sahaswān': (28.072270, 78.750820),
-    'wanparti': (16.367380, 78.068890),
-    'sirhind': (30.643210, 76.384210),
-    'bārdoli': (21.122970, 73.111510),
-    'mokameh': (25.396620, 85.921900),
-    'arāmbāgh': (22.883330, 87.783330),
-    'poonamalle': (13.048880, 80.114880),
-    'keonjhargarh': (21.631800, 85.596860),
-    'panruti': (11.776620, 79.552690),
-    'ilkal': (15.959230, 76.113510),
-    'kīratpur': (29.506710, 78.206130),
-    'vrindāvan': (27.581050, 77.696620),
-    'kodungallūr': (10.232630, 76.195130),
-    'nedumangād': (8.602670, 77.001390),
-    'narsimhapur': (22.949360, 79.183570),
-    'ponnur': (16.071140, 80.549440),
-    'kathua': (32.369410, 75.525390),
-    'north lakhimpur': (27.235170, 94.103570),
-    'masaurhi buzurg': (25.354170, 85.031950),
-    'nerkunram': (13.061940, 80.209440),
-    'shegaon': (20.793200, 76.699210),
-    'mandideep': (23.081660, 77.533280),
-    'pāchora': (20.667270, 75.353050),
-    'gobichettipalayam': (11.454960, 77.442200),
-    'gangoh': (29.780040, 77.263460),
-    'itanagar': (27.086940, 93.609870),
-    'jaitpur': (28.506470, 77.329760),
-    'narasapur': (16.434250, 81.698450),
-    'dhone': (15.395200, 77.871500),
-    'rājgarh': (28.642010, 75.386120),
-    'ullal': (12.805690, 74.860580),
-    'panna': (24.720940, 80.187720),
-    'gola gokarannāth': (28.078370, 80.470540),
-    'gohad': (26.432780, 78.442050),
-    'wani': (20.055070, 78.953130),
-    'thiruvarur': (10.772690, 79.636800),
-    'upleta': (21.740150, 70.282560),
-    'nūzvīd': (16.788540, 80.845930),
-    'lonavla': (18.752750, 73.405750),
-    'una': (20.823180, 71.037950),
-    'sillod': (20.303030, 75.652840),
-    'sīra': (13.741550, 76.904300),
-    'chikhli': (20.350460, 76.257740),
-    'jhārgrām': (22.453840, 86.994970),
-    'kagaznāgār': (19.331590, 79.466050),
-    'bhātāpāra': (21.735000, 81.947110),
-    'kāsībugga': (18.759270, 84.416130),
-    'hasanpur': (28.722490, 78.284360),
-    'lohārdagā': (23.433050, 84.679920),
-    'jahāngīrābād': (28.405490, 78.105880),
-    'sherkot': (29.327040, 78.574290),
-    'kātrās': (23.797520, 86.298340),
-    'mācherla': (16.476350, 79.435330),
-    'naksalbāri': (26.682700, 88.220010),
-    'sankarankovil': (9.170480, 77.541070),
-    'mulbāgal': (13.163520, 78.393460),
-    'kandukūr': (15.215420, 79.903900),
-    'tiruvalla': (9.381600, 76.574890),
-    'roshanpura': (28.600570, 76.989180),
-    'ponnūru': (16.065470, 80.552030),
-    'kollegāl': (12.154490, 77.110510),
-    'mukandpur': (28.739440, 77.183150),
-    'unjha': (23.803660, 72.391010),
-    'chhibrāmau': (27.148720, 79.500780),
-    'tilhar': (27.962820, 79.738270),
-    'lunglei': (22.892470, 92.742180),
-    'hoskote': (13.070700, 77.798140),
-    'byasanagar': (20.955690, 86.126430),
-    'bada barabīl': (22.111860, 85.386840),
-    'sāmalkot': (17.056750, 82.176390),
-    'karīmganj': (24.869190, 92.355430),
-    'bobbili': (18.573660, 83.359250),
-    'mettur': (11.787960, 77.800800),
-    'sattenapalle': (16.393810, 80.152210),
-    'tirūrangādi': (11.043160, 75.923370),
-    'tennala': (10.993420, 75.935040),
-    'chakradharpur': (22.676110, 85.628920),
-    'sendhwa': (21.685620, 75.096220),
-    'talegaon dābhāde': (18.735020, 73.675610),
-    'hiriyūr': (13.944550, 76.617230),
-    'anjangaon': (21.165160, 77.309100),
-    'charkhi dādri': (28.591660, 76.271610),
-    'ujhāni': (28.003110, 79.008210),
-    'bankra': (22.602910, 88.277510),
-    'dabhoi': (22.183330, 73.433330),
-    'teghra': (25.490430, 85.940010),
-    'obra': (24.418630, 82.987970),
-    'tiruvallur': (13.143760, 79.908890),
-    'mandapeta': (16.862540, 81.929210),
-    'tirur': (10.913680, 75.921180),
-    'ropar': (30.968960, 76.526950),
-    'nāmakkal': (11.221260, 78.165240),
-    'arcot': (12.905690, 79.318970),
-    'lāharpur': (27.708270, 80.902560),
-    'viramgām': (23.125640, 72.050140),
-    'islāmpur': (26.265410, 88.189820),
-    'karād': (17.289370, 74.181830),
-    'yanam': (16.733080, 82.213640),
-    'ābu road': (24.480120, 72.781860),
-    'raxaul': (26.979820, 84.850650),
-    'moonniyur': (11.059720, 75.903110),
-    'barwāni': (22.032320, 74.899820),
-    'kottayam': (9.586920, 76.521320),
-    'tiruttangal': (9.483330, 77.833330),
-    'petlād': (22.476810, 72.799950),
-    'jālaun': (26.145100, 79.336600),
-    'periya semūr': (11.360880, 77.689520),
-    'madhupur': (24.274190, 86.639290),
-    'dhūri': (30.368460, 75.867910),
-    'challakere': (14.318000, 76.651650),
-    'etāwa': (24.183510, 78.202890),
-    'chiplūn': (17.533390, 73.509350),
-    'mandlā': (22.598790, 80.371150),
-    'bhīmunipatnam': (17.890170, 83.452030),
-    'mawlai-mawïong': (25.623220, 91.881750),
-    'kavanur': (12.996230, 80.075140),
-    'pithāpuram': (17.116800, 82.252840),
-    'kāndi': (23.959460, 88.040180),
-    'idappadi': (11.586240, 77.838910),
-    'sāhibābād daulotpur': (28.747050, 77.114650),
-    'punganūru': (13.366720, 78.571860),
-    'ghātāl': (22.662440, 87.733990),
-    'jāfarābād': (28.678730, 77.271160),
-    'sāgar': (14.164980, 75.029010),
-    'sihor': (21.711340, 71.961790),
-    'mūndka': (28.680120, 77.029750),
-    'deglur': (18.548290, 77.576950),
-    'madhepura': (25.921270, 86.792710),
-    'bārāmati': (18.151740, 74.577670),
-    'mahāsamund': (21.107430, 82.094800),
-    'sidhi': (24.403800, 81.879540),
-    'kāsaragod': (12.498380, 74.989590),
-    'garhchiroli': (20.180610, 80.005220),
-    'puttūr': (13.441890, 79.553140),
-    'jalor': (25.345580, 72.615590),
-    'samāna': (30.153950, 76.198510),
-    'rāzampeta': (14.195440, 79.158960),
-    'wāri': (21.153130, 79.007600),
-    'palmaner': (13.200000, 78.747250),
-    'deolāli': (19.944040, 73.834410),
-    'kanakapura': (12.546540, 77.420050),
-    'wokha': (26.097170, 94.258170),
-    'umred': (20.853960, 79.324660),
-    'kālna': (23.219440, 88.362950),
-    'pallichal': (8.449760, 77.025730),
-    'tāndoni': (10.926110, 78.094100),
-    'pārvatipuram': (18.783920, 83.425690),
-    'kotharia': (22.234360, 70.819030),
-    'ottapalam': (10.773500, 76.377580),
-    'dīdwāna': (27.400960, 74.575370),
-    'begampur': (28.726550, 77.066890),
-    'gaddi annaram': (17.366870, 78.524200),
-    'dumraon': (25.552650, 84.151490),
-    'nerupperichchal': (11.161050, 77.373980),
-    'jaggaiahpet': (16.891550, 80.095510),
-    'rampur hat': (24.177370, 87.782750),
-    'khanapuram haveli': (17.262390, 80.168090),
-    'goālpāra': (26.176680, 90.626340),
-    'tuni': (17.359050, 82.546070),
-    'laxmangarh': (27.822940, 75.027540),
-    'shāhpur': (16.696050, 76.842200),
-    'bhongīr': (17.515440, 78.885630),
-    'ullagaram': (12.979000, 80.197030),
-    'sri dūngargarh': (28.096170, 74.008680),
-    'ayodhya': (26.799090, 82.204700),
-    'mubarakpur': (26.088660, 83.290880),
-    'amalāpuram': (16.578680, 82.006090),
-    'arsikere': (13.314460, 76.257040),
-    'phaltan': (17.991130, 74.431770),
-    'ashta': (23.017540, 76.722080),
-    'sandīla': (27.069890, 80.514970),
-    'vikārābād': (17.338100, 77.904410),
-    'baruipur': (22.365440, 88.432500),
-    'choudwar': (20.539170, 85.915120),
-    'sultānganj': (25.238310, 86.735590),
-    'mandi dabwāli': (29.966330, 74.700250),
-    'konch': (25.994510, 79.151270),
-    'bāprola': (28.641330, 77.014150),
-    'venkatagiri': (13.960050, 79.580320),
-    'dabhel': (20.409530, 72.883390),
-    'biswān': (27.495810, 80.996180),
-    'siruguppa': (15.630000, 76.892170),
-    'kosi': (27.794490, 77.436800),
-    'sironj': (24.103130, 77.690550),
-    'jangaon': (17.726020, 79.152360),
-    'daudnagar': (25.034730, 84.400950),
-    'ramapuram': (13.031790, 80.182430),
-    'dandeli': (15.266670, 74.616670),
-    'mudhol': (16.333540, 75.283050),
-    'thodupuzha': (9.893940, 76.722160),
-    'devakottai': (9.947040, 78.823300),
-    'arwal': (25.242810, 84.665710),
-    'kāliyāganj': (25.634420, 88.326650),
-    'nasīrābād': (26.304730, 74.733640),
-    'khagaul': (25.578980, 85.045640),
-    'changanācheri': (9.442030, 76.536040),
-    'shorāpur': (16.521000, 76.757380),
-    'māndvi': (22.832820, 69.352370),
-    'rajgangpur': (22.200000, 84.583000),
-    'ozar': (20.094730, 73.928160),
-    'peranāmpattu': (12.934300, 78.718900),
-    'gumlā': (23.042680, 84.544290),
-    'rāmnagar': (29.392500, 79.128300),
-    'vazhakkala': (10.012390, 76.326330),
-    'shujālpur': (23.406730, 76.709800),
-    'tirumangalam': (9.823070, 77.983810),
-    'sidlaghatta': (13.388960, 77.864440),
-    'khurai': (24.043720, 78.330140),
-    'hilsa': (25.316420, 85.282340),
-    'rampura phul': (30.275630, 75.242530),
-    'fatwa': (25.509580, 85.305040),
-    'tūndla': (27.214600, 78.236830),
-    'mannārakkāt': (10.992230, 76.464180),
-    'metpalle': (18.847240, 78.625630),
-    'naya gaon': (30.775150, 76.793080),
-    'repalle': (16.018400, 80.829580),
-    'hunsūr': (12.303590, 76.292750),
-    'nanjangūd': (12.117640, 76.683970),
-    'forbesganj': (26.302530, 87.265560),
-    'nithari': (28.704890, 77.052850),
-    'sunabeda': (18.728400, 82.829320),
-    'gajraula': (28.845700, 78.239600),
-    'vīrapāndi': (11.062470, 77.350760),
-    'dāhānu': (19.967780, 72.712630),
-    'rasipuram': (11.460090, 78.186350),
-    'sālūr': (18.517160, 83.205480),
-    'bhabhua': (25.040490, 83.607490),
-    'hodal': (27.891960, 77.367440),
-    'bhadrāchalam': (17.668460, 80.888870),
-    'aonla': (28.274020, 79.165210),
-    'tirupparangunram': (9.881510, 78.073060),
-    'chatrā': (24.206450, 84.870850),
-    'khagaria': (25.502200, 86.467080),
-    'dhāmpur': (29.308830, 78.510830),
-    'nagarukhra city': (22.939380, 88.637760),
-    'phalodi': (27.131020, 72.368260),
-    'gangākher': (18.969620, 76.749460),
-    'sardhana': (29.145510, 77.614330),
-    'nohar': (29.182920, 74.770640),
-    'yeola': (20.042400, 74.489440),
-    'bhaisa': (19.112850, 77.963360),
-    'perintalmanna': (10.977240, 76.225410),
-    'jugsālai': (22.776680, 86.183510),
-    'perambalur': (11.233330, 78.883330),
-    'badūria': (22.744310, 88.786550),
-    'gudalur': (11.520730, 76.481410),
-    'kizhake chālakudi': (10.300670, 76.337630),
-    'narkatiāganj': (27.103830, 84.461850),
-    'peddāpuram': (17.077010, 82.138360),
-    'majalgaon': (19.155130, 76.209920),
-    'daund': (18.465150, 74.583750),
-    'kapadvanj': (23.023020, 73.071130),
-    'kotputli': (27.702070, 76.199110),
-    'dyāne': (20.567430, 74.528450),
-    'bail-hongal': (15.813700, 74.858950),
-    'biaora': (23.920500, 76.910740),
-    'naugachhia': (25.388070, 87.099060),
-    'kānūru': (16.498530, 80.691410),
-    'dehu road': (18.682110, 73.731610),
-    'pipariā': (22.757030, 78.354990),
-    'barpeta': (26.322930, 91.006320),
-    'gooty': (15.118360, 77.637760),
-    'tamlūk': (22.300830, 87.925930),
-    'vengara': (11.050830, 75.978060),
-    'jaisingpur': (16.776390, 74.553610),
-    'nangal': (31.389660, 76.375740),
-    'jasdan': (22.037090, 71.207940),
-    'godda': (24.827000, 87.212500),
-    'bikramganj': (25.210730, 84.255080),
-    'morār': (26.226400, 78.224820),
-    'jhajjar': (28.606300, 76.656500),
-    'nihtaur': (29.324160, 78.387240),
-    'mahnar bazar': (25.609620, 85.480760),
-    'vite': (17.273430, 74.537920),
-    'gumia': (23.797500, 85.825230),
-    'anakaputhur': (12.982800, 80.126400),
-    'tānālūr': (10.951540, 75.909610),
-    'bhīnmāl': (24.999440, 72.271410),
-    'sadasivpet': (17.619250, 77.952630),
-    'bakhtiarpur': (25.455980, 85.532900),
-    'jalandhar cantonment': (31.294210, 75.619740),
-    'athani': (16.726130, 75.064210),
-    'warud': (21.471010, 78.269650),
-    'wānkāner': (22.611980, 70.943790),
-    'churāchāndpur': (24.333530, 93.669990),
-    'dūngarpur': (23.843060, 73.714660),
-    'chhaya': (21.628780, 69.633860),
-    'dumka': (24.267780, 87.248550),
-    'gādarwāra': (22.923500, 78.784900),
-    'pithorāgarh': (29.583490, 80.209470),
-    'ballia': (25.421390, 86.314450),
-    'bihtā': (25.558850, 84.871410),
-    'atraulī': (28.029640, 78.285710),
-    'walajapet': (12.925100, 79.366260),
-    'koraput': (18.811990, 82.710480),
-    'umarkhed': (19.601440, 77.688780),
-    'kunnamangalam': (11.304590, 75.877720),
-    'valasaravakkam': (13.043940, 80.172510),
-    'alangad': (10.101920, 76.291040),
-    'alengād': (10.119010, 76.302260),
-    'punalūr': (9.019560, 76.922610),
-    'vikramasingapuram': (8.714770, 77.390320),
-    'vattiyūrkāvu': (8.524690, 76.988860),
-    'padrauna': (26.904030, 83.980870),
-    'ambāh': (26.704230, 78.226780),
-    'komalapuram': (9.541890, 76.342360),
-    'mattanur': (11.930180, 75.571520),
-    'harpanahalli': (14.787660, 75.988630),
-    'kendrāparha': (20.501660, 86.422270),
-    'tighri': (28.512250, 77.240830),
-    'pallikal': (11.137230, 75.925750),
-    'selu': (19.455120, 76.440730),
-    'medak': (18.045310, 78.260780),
-    'patancheru': (17.533340, 78.264500),
-    'dondaicha': (21.323600, 74.568040),
-    'jāmner': (20.809490, 75.777680),
-    'burla': (21.509760, 83.872590),
-    'porur': (13.035650, 80.158210),
-    'nellikkuppam': (11.775540, 79.670160),
-    'padra': (22.239800, 73.084510),
-    'kawardha': (22.008530, 81.231480),
-    'gulāothi': (28.589380, 77.793180),
-    'joda': (22.017000, 85.422000),
-    'seohāra': (29.209040, 78.588370),
-    'warora': (20.228850, 79.002770),
-    'mānvi': (15.991260, 77.050340),
-    'kurseong': (26.882510, 88.277290),
-    'manglaur': (29.790940, 77.878360),
-    'nilambūr': (11.272710, 76.225710),
-    'ganj dundwāra': (27.733080, 78.941190),
-    'nānpāra': (27.864590, 81.500360),
-    'khordha': (20.182680, 85.616290),
-    'atarra': (25.286180, 80.571550),
-    'barbigha': (25.216700, 85.733300),
-    'merta': (26.648590, 74.034140),
-    'jammalamadugu': (14.846770, 78.383140),
-    'garhwa': (24.160020, 83.807550),
-    'nawanshahr': (31.124500, 76.116130),
-    'rānāvāv': (21.687340, 69.744850),
-    'bānka': (24.880910, 86.922570),
-    'thoubāl': (24.638810, 93.996390),
-    'mahmudābād': (27.291910, 81.117750),
-    'milavittan': (8.819280, 78.090870),
-    'pakur': (24.639250, 87.842390),
-    'cherthala': (9.684440, 76.335580),
-    'nāyudupet': (13.907420, 79.894650),
-    'farrukhnagar': (17.077870, 78.203390),
-    'rāmpura': (30.256000, 75.241160),
-    'chirakkal': (11.912570, 75.361020),
-    'chirkunda': (23.747710, 86.788040),
-    'coonoor': (11.349790, 76.793750),
-    'pāndhurnā': (21.595560, 78.526280),
-    'shertallai': (9.685810, 76.339960),
-    'kodur': (11.015280, 76.070090),
-    'giddarbāha': (30.199530, 74.666270),
-    'meddappakkam': (12.916610, 80.193850),
-    'nandikotkūr': (15.856680, 78.265690),
-    'khalīlābād': (26.772680, 83.071790),
-    'chittaranjan': (23.856810, 86.903240),
-    'pāthardih': (23.665800, 86.431660),
-    'chāmpa': (22.035320, 82.642340),
-    'mehkar': (20.150500, 76.568410),
-    'dhanpuri': (23.185420, 81.555130),
-    'sundergarh': (22.116670, 84.033330),
-    'dīg': (27.471880, 77.325640),
-    'tumsar': (21.383330, 79.733330),
-    'rameswaram': (9.288500, 79.312710),
-    'bangarapet': (12.991160, 78.178040),
-    'vishāram': (12.918080, 79.277560),
-    'thiruthani': (13.175940, 79.616370),
-    'digras': (20.103500, 77.718460),
-    'maradu': (9.936530, 76.323820),
-    'bāndīkūi': (27.050870, 76.573250),
-    'dowleswaram': (16.947610, 81.779870),
-    'bālāpur': (20.666120, 76.773860),
-    'tondalam': (11.501370, 76.349830),
-    'jawaharnagar': (17.510010, 78.565620),
-    'homnābād': (17.770740, 77.125190),
-    'memāri': (23.176470, 88.097490),
-    'nāndūra': (20.834170, 76.459240),
-    'kottangara': (8.924120, 76.646730),
-    'angul': (20.840890, 85.101920),
-    'kōttakkal': (11.000890, 76.006180),
-    'libāspur': (28.750890, 77.146470),
-    'dalli rājhara': (20.585730, 81.075010),
-    'kālpi': (26.116670, 79.733330),
-    'jintūr': (19.611860, 76.687400),
-    'daman': (20.414310, 72.832360),
-    'anekal': (12.711100, 77.695570),
-    'akkarampalle': (13.650000, 79.420000),
-    'nidadavole': (16.905720, 81.672220),
-    'raisen': (23.330330, 77.781100),
-    'gūduvāncheri': (12.845190, 80.060550),
-    'varangaon': (21.017670, 75.910420),
-    'sihorā': (23.487100, 80.104040),
-    'chidawa': (28.239370, 75.640350),
-    'ahmadpur': (18.706220, 76.937310),
-    'olavanna': (11.218360, 75.832480),
-    'gobārdānga': (22.877400, 88.754790),
-    'melmadai': (9.926380, 78.150280),
-    'saint thomas mount': (13.003340, 80.196140),
-    'yellandu': (17.590640, 80.321460),
-    'hāflong': (25.164780, 93.017440),
-    'polavaram': (17.247540, 81.643720),
-    'bodupāl': (17.418770, 78.584270),
-    'rāmachandrapuram': (16.836360, 82.028710),
-    'panachikkad': (9.529740, 76.540620),
-    'shōranūr': (10.761810, 76.270780),
-    'pallikaranai': (12.937700, 80.215300),
-    'kāndhla': (29.321040, 77.271010),
-    'barwāla': (29.367470, 75.908090),
-    'nilithi': (28.652010, 77.056440),
-    'jambusar': (22.052360, 72.800740),
-    'varkala': (8.733300, 76.716700),
-    'kātol': (21.273880, 78.585800),
-    'kopali': (22.837180, 86.191610),
-    'sainthia': (23.948260, 87.680450),
-    'choornikkara': (10.087880, 76.341100),
-    'perungudi': (12.960950, 80.240940),
-    'kamal pur majra burari': (28.746670, 77.193480),
-    'jīwanpur': (28.714480, 77.284890),
-    'barhiya': (25.288140, 86.020550),
-    'sojat': (25.924930, 73.666330),
-    'kālimpong': (27.070590, 88.475290),
-    'periyakulam': (10.122680, 77.543720),
-    'simdega': (22.615230, 84.502080),
-    'bishrāmpur': (24.252990, 83.925020),
-    'kottuvalli': (10.111190, 76.246340),
-    'bairāgnia': (26.740630, 85.273230),
-    'diglipur': (13.266670, 93.000000),
-    'panipat taraf ansar': (29.412230, 76.954700),
-    'ranjangaon s': (19.844040, 75.214820),
-    'kakkodi': (11.319730, 75.801460),
-    'mahbūbābād': (17.597280, 80.002070),
-    'perumbaikad': (9.618270, 76.531270),
-    'ārvi': (20.995850, 78.229140),
-    'parāsia': (22.191300, 78.759040),
-    'sivaganga': (9.847010, 78.483580),
-    'limbdi': (22.565070, 71.810760),
-    'chavara': (8.967270, 76.541880),
-    'dahegām': (23.169030, 72.821610),
-    'jaspur': (29.279190, 78.827980),
-    'thān': (22.574220, 71.199420),
-    'bāola': (22.828440, 72.363640),
-    'khekra': (28.865860, 77.284100),
-    'bhupalpally': (18.428660, 79.863850),
-    'dīnhāta': (26.135260, 89.461290),
-    'aland': (17.564250, 76.568540),
-    'kumbalangy': (9.879770, 76.283530),
-    'naini tāl': (29.397430, 79.446860),
-    'idar': (23.841450, 73.000680),
-    'chinnamanūr': (9.839990, 77.381090),
-    'bhawāni mandi': (24.415820, 75.835520),
-    'kyathampalle': (19.667810, 78.528900),
-    'sikandra rao': (27.688590, 78.379850),
-    'palladam': (10.991750, 77.286330),
-    'rāzām': (18.449090, 83.659570),
-    'jājpur': (20.848520, 86.337290),
-    'jora': (26.342090, 77.809200),
-    'canning': (22.313990, 88.665080),
-    'khairābād': (27.526980, 80.754610),
-    'pratāpgarh': (24.032150, 74.781620),
-    'dhāka': (26.674790, 85.166980),
-    'kannad': (20.256840, 75.137860),
-    'nāthdwāra': (24.938050, 73.823920),
-    'abdu rahiman nagar': (11.069830, 75.938790),
-    'golāghāt': (26.511670, 93.959510),
-    'kekri': (25.971320, 75.149920),
-    'barauli': (26.381090, 84.586480),
-    'mahē': (11.701720, 75.534740),
-    'diamond harbour': (22.192680, 88.189510),
-    'sūrampatti': (11.327260, 77.711220),
-    'bāghpat': (28.944850, 77.218650),
-    'bar bigha': (25.218550, 85.733200),
-    'nārāyanpet': (16.747990, 77.495400),
-    'khambhāliya': (22.206850, 69.650310),
-    'bilāra': (26.180670, 73.705500),
-    'trikonavattam': (8.889870, 76.665880),
-    'rājgīr': (25.028280, 85.420790),
-    'kudappanakkunnu': (8.551420, 76.960790),
-    'paithan': (19.475060, 75.385580),
-    'kodīnar': (20.793930, 70.702160),
-    'pīleru': (13.655840, 78.938540),
-    'pirāyiri': (10.765230, 76.631780),
-    'rāmganj mandi': (24.646480, 75.943250),
-    'vaijāpur': (19.926720, 74.727500),
-    'kannamangalam': (11.075430, 75.985220),
-    'saundatti': (15.766150, 75.117780),
-    'jaggayyapeta': (16.893800, 80.098070),
-    'peddapalli': (18.613570, 79.374420),
-    'dhupgāri': (26.589040, 89.007320),
-    'triprangod': (10.842250, 75.948560),
-    'chākan': (18.760590, 73.863510),
-    'bharthana': (26.752310, 79.221800),
-    'patti': (31.280920, 74.858490),
-    'jalārpet': (12.570250, 78.573180),
-    'vadgaon': (20.375890, 78.112580),
-    'tālcher': (20.949270, 85.233540),
-    'thottada': (11.838510, 75.420800),
-    'kalliyoor': (8.431280, 77.012850),
-    'arantāngi': (10.172350, 78.991180),
-    'athiyannur': (8.393000, 77.063710),
-    'icchannūr': (11.361480, 75.778190),
-    'sherghāti': (24.559500, 84.791620),
-    'bhādra': (29.102980, 75.171380),
-    'jhajha': (24.771070, 86.378880),
-    'ghātsīla': (22.585310, 86.476820),
-    'dharmanagar': (24.366670, 92.166670),
-    'kayalpattinam': (8.571430, 78.119920),
-    'nowgong': (25.061360, 79.441250),
-    'savanūr': (14.973350, 75.337240),
-    'nailā': (22.020740, 82.566600),
-    'nannambra': (10.992110, 75.907990),
-    'manapparai': (10.607720, 78.425820),
-    'boyampālaiyam': (11.148750, 77.353680),
-    'kallakkurichchi': (11.740400, 78.959000),
-    'kulathummal': (8.507300, 77.081450),
-    'ettumānūr': (9.668980, 76.559240),
-    'ghātampur': (26.152720, 80.168030),
-    'channarāyapatna': (12.906420, 76.387750),
-    'akivīdu': (16.582250, 81.381120),
-    'kovvūr': (17.016200, 81.729340),
-    'vellakkovil': (10.946270, 77.712420),
-    'sabalgarh': (26.249180, 77.407860),
-    'bhālki': (18.043480, 77.206000),
-    'kāttipparutti': (10.873850, 76.053480),
-    'murtajāpur': (20.732990, 77.366940),
-    'peringathur': (11.713700, 75.585990),
-    'solan': (30.909080, 77.108690),
-    'nādāpuram': (11.684650, 75.654930),
-    'gursahāiganj': (27.115180, 79.731740),
-    'maihar': (24.265940, 80.760630),
-    'bantvāl': (12.890500, 75.034890),
-    'pallipalayam': (11.365230, 77.762350),
-    'mapusa': (15.591540, 73.808980),
-    'tāki': (22.588670, 88.932530),
-    'akalkot': (17.525320, 76.206110),
-    'maner': (25.646020, 84.872910),
-    'mālūr': (13.003220, 77.937980),
-    'bakhri': (25.598890, 86.260740),
-    'mayyanād': (8.837260, 76.645050),
-    'mappilaiurani': (8.835900, 78.135180),
-    'melur': (10.032410, 78.339300),
-    'hāsimāra': (26.746900, 89.353850),
-    'sathupalli': (17.249680, 80.868990),
-    'pūranpur': (28.512830, 80.148290),
-    'aklūj': (17.892410, 75.021380),
-    'bānsi': (27.177490, 82.934420),
-    'vadavalli': (11.024720, 76.897300),
-    'thakurdwara': (29.192030, 78.861450),
-    'amudālavalasa': (18.410250, 83.902950),
-    'vyāra': (21.110790, 73.393650),
-    'bhavāni': (11.445530, 77.682150),
-    'samālkha': (29.235520, 77.012730),
-    'lakkanahalli': (12.112020, 78.153840),
-    'porsa': (26.674440, 78.370810),
-    'kadungalūr': (10.094800, 76.321060),
-    'kālappatti': (11.079370, 77.037090),
-    'anandpur': (21.214110, 86.124920),
-    'chaklāsi': (22.653200, 72.944970),
-    'rādhanpur': (23.832380, 71.604700),
-    'murshidābād': (24.183900, 88.271710),
-    'manakunnam': (9.885700, 76.373280),
-    'bhachāu': (23.298580, 70.342790),
-    'jalālābād': (30.606220, 74.257270),
-    'kurinjippādi': (11.550280, 79.590660),
-    'sedam': (17.178590, 77.289980),
-    'vādāsinor': (22.956770, 73.335050),
-    'kampli': (15.406260, 76.600130),
-    'kāro': (23.785160, 85.978300),
-    'tirkadavūr': (8.923980, 76.591010),
-    'jogbani': (26.399050, 87.265250),
-    'mūkondapalli': (12.751420, 77.801690),
-    'sirohi': (24.888380, 72.847940),
-    'aroor': (9.869400, 76.304980),
-    'othukkungal': (11.028300, 76.029030),
-    'ghosī': (26.105870, 83.539300),
-    'pehowa': (29.978970, 76.582490),
-    'kārakkād': (10.588040, 76.038840),
-    'nūrpur': (29.149560, 78.408400),
-    'revelganj': (25.789760, 84.635960),
-    'betamcherla': (15.451440, 78.147970),
-    'belpahar': (21.821800, 83.845800),
-    'chīka': (30.048910, 76.343000),
-    'paravūr tekkumbhāgam': (8.794700, 76.667980),
-    'tuvāgudi': (10.747250, 78.821330),
-    'dwārka': (22.239440, 68.967780),
-    'kotamangalam': (10.064350, 76.628430),
-    'kātpādi': (12.969510, 79.145520),
-    'sagauli': (26.763900, 84.743410),
-    'rāhuri': (19.390690, 74.649790),
-    'sanāwad': (22.173910, 76.069930),
-    'kondapalle': (16.619890, 80.542440),
-    'vetapālem': (15.785020, 80.306630),
-    'sangariā': (29.798860, 74.466830),
-    'jalesar': (27.473150, 78.303100),
-    'nattakam': (9.545330, 76.514140),
-    'paliā kalān': (28.432050, 80.581370),
-    'bayāna': (26.907910, 77.289850),
-    'rājula': (21.038540, 71.443450),
-    'bodh gaya': (24.698080, 84.986900),
-    'keru': (26.192470, 73.044300),
-    'kollancode': (8.289030, 77.107990),
-    'kilakarai': (9.231830, 78.785450),
-    'kumhāri': (21.266670, 81.516670),
-    'chikodi': (16.428980, 74.585910),
-    'khairtal': (27.804260, 76.638610),
-    'pathanāmthitta': (9.266670, 76.783330),
-    'chōrōd': (11.627730, 75.591470),
-    'nandigāma': (16.771700, 80.285960),
-    'indi': (17.177350, 75.952600),
-    'kondli': (28.611670, 77.326670),
-    'nildoh': (21.110750, 78.989150),
-    'kabnur': (16.701660, 74.439520),
-    'malavalli': (12.385560, 77.060450),
-    'sūlūru': (13.700000, 80.016670),
-    'kāman': (27.657910, 77.269080),
-    'chetwayi': (10.528850, 76.047930),
-    'nongthymmai': (25.563700, 91.906400),
-    'shahbazpur': (26.305110, 87.288650),
-    'wādi': (17.051830, 76.990480),
-    'tirupati nma': (13.632290, 79.485680),
-    'gauribidanur': (13.610720, 77.517380),
-    'tāsgaon': (17.037000, 74.601710),
-    'agar': (23.711770, 76.015710),
-    'rajakilpakkam': (12.919440, 80.169720),
-    'gharonda neemka bangar': (28.616440, 77.288000),
-    'dibai': (28.208490, 78.261730),
-    'robertsganj': (24.688600, 83.067840),
-    'pen': (18.737340, 73.096030),
-    'tarikere': (13.709540, 75.813820),
-    'maudaha': (25.683120, 80.114190),
-    'sathyamangalam': (11.505260, 77.238260),
-    'gharaunda': (29.536920, 76.971420),
-    'cheyyar': (12.660520, 79.543080),
-    'sonepur': (25.696080, 85.166690),
-    'niwai': (26.360730, 75.918360),
-    'gogri jamālpur': (25.411170, 86.659250),
-    'bilāsipāra': (26.232850, 90.234100),
-    'nangli sakrawat': (28.621690, 76.992300),
-    'satānā': (20.594830, 74.203010),
-    'rāwatbhāta': (24.929810, 75.592090),
-    'ellenabad': (29.452820, 74.661220),
-    'wānādongri': (21.093800, 78.972730),
-    'parola': (20.880980, 75.119370),
-    'pāthri': (19.258800, 76.434120),
-    'bopal': (23.033410, 72.467230),
-    'chettipālaiyam': (11.166690, 77.335020),
-    'talattala': (8.873820, 76.671580),
-    'jhālrapātan': (24.542050, 76.172420),
-    'zira': (30.968530, 74.991060),
-    'leh': (34.165040, 77.584020),
-    'kānker': (20.271930, 81.491770),
-    'sārangpur': (23.566510, 76.473060),
-    'sandūr': (15.086130, 76.546920),
-    'bāngarmau': (26.891200, 80.211490),
-    'kanigiri u': (15.406370, 79.507020),
-    'jaito': (30.451260, 74.891890),
-    'dongargarh': (21.188930, 80.754590),
-    'phulbāni': (20.481010, 84.230630),
-    'malayinkeezhu': (8.490200, 77.037400),
-    'attingal': (8.696090, 76.815070),
-    'perunkalattu': (12.918230, 80.082450),
-    'morsi': (21.340300, 78.012580),
-    'pilibangan': (29.449640, 74.100930),
-    'nelamangala': (13.099780, 77.393640),
-    'sindgi': (16.918830, 76.233680),
-    'vettūr': (8.717420, 76.725820),
-    'bhadgaon': (20.669050, 75.229370),
-    'ratia': (29.690290, 75.576880),
-    'sirūr': (18.827600, 74.374750),
-    'lālganj': (25.868940, 85.173940),
-    'tinnanūr': (13.114480, 80.027130),
-    'sumerpur': (25.154300, 73.081570),
-    'bandipura': (34.417280, 74.643080),
-    'bābarpur': (28.687470, 77.285580),
-    'pujali': (22.467870, 88.145240),
-    'garhmuktesar': (28.787320, 78.102140),
-    'bahādurganj': (26.261720, 87.824430),
-    'nakodar': (31.125860, 75.475080),
-    'lūnāvāda': (23.128410, 73.610430),
-    'vazhayur': (11.217290, 75.899870),
-    'hojāi': (26.002810, 92.856050),
-    'akbarpur': (26.429530, 82.534310),
-    'pīpār': (26.384410, 73.543940),
-    'lanka': (25.929070, 92.948560),
-    'tuensang': (26.267040, 94.824150),
-    'vuyyūru': (16.363070, 80.844060),
-    'lakshmeshwar': (15.126890, 75.469350),
-    'kumta': (14.428530, 74.418900),
-    'yāval': (21.167720, 75.697620),
-    'tilda newra': (21.553240, 81.801870),
-    'kattivākkam': (13.216670, 80.316670),
-    'peringottupulam': (11.026820, 76.098700),
-    'sohna': (28.247370, 77.065440),
-    'patāmundai': (20.578060, 86.560630),
-    'kodaikānāl': (10.239250, 77.489320),
-    'ichchāpuram': (19.113930, 84.687210),
-    'daryāpur': (20.924890, 77.326440),
-    'chunār': (25.127760, 82.882100),
-    'amīnpur': (17.524200, 78.322730),
-    'mungeli': (22.065660, 81.685430),
-    'barnagar': (23.048900, 75.378040),
-    'pūrna': (19.181700, 77.025660),
-    'khunti': (23.076020, 85.278180),
-    'nargund': (15.722990, 75.386660),
-    'parappur': (11.012130, 75.994710),
-    'neem ka thana': (27.739760, 75.786520),
-    'vilappil': (8.522180, 77.040010),
-    'nilanga': (18.116750, 76.752790),
-    'naharlagun': (27.104670, 93.695180),
-    'boisar': (19.803620, 72.755980),
-    'ausa': (18.247280, 76.499300),
-    'sadābād': (27.438180, 78.037580),
-    'bindki': (26.036130, 80.576170),
-    'mahālingpur': (16.388800, 75.108730),
-    'rāvu': (22.637270, 75.814740),
-    'mālpura': (26.283800, 75.364580),
-    'wai': (17.952760, 73.890580),
-    'bramhapuri': (20.611070, 79.861030),
-    'shikaripura': (14.269800, 75.356430),
-    'shirdi': (19.766160, 74.477380),
-    'neduva': (11.056690, 75.866850),
-    'venganoor': (8.396380, 77.003310),
-    'ramanattukara': (11.178020, 75.868920),
-    'mokokchūng': (26.324800, 94.518340),
-    'pinjaur': (30.798730, 76.918220),
-    'mādāyi': (12.034270, 75.237790),
-    'partūr': (19.599250, 76.215410),
-    'dīndārpur': (28.598130, 76.991610),
-    'talakkād': (10.884590, 75.930910),
-    'krishnarājāsāgara': (12.439760, 76.382760),
-    'jhābua': (22.767720, 74.590870),
-    'madipakkam': (12.962260, 80.198640),
-    'karāla': (28.735480, 77.035220),
-    'gariadhar': (21.538890, 71.577370),
-    'kakrāla': (27.892690, 79.194500),
-    'bīdāsar': (27.835980, 74.317760),
-    'lahār': (26.194010, 78.941370),
-    'ambasamudram': (8.710680, 77.451900),
-    'kaipamangalam': (10.334960, 76.139240),
-    'medchal': (17.629720, 78.481390),
-    'ganaur': (29.130200, 77.018320),
-    'sholinganallur': (12.889960, 80.231270),
-    'kovūr': (14.500500, 79.985180),
-    'tuljāpur': (18.008040, 76.070110),
-    'barpeta road': (26.502840, 90.969370),
-    'uravakonda': (14.943480, 77.254940),
-    'babīna': (25.239470, 78.470280),
-    'rafiganj': (24.817570, 84.634450),
-    'umarga': (17.838410, 76.623310),
-    'igatpuri': (19.695220, 73.562600),
-    'perumanna': (11.252900, 75.890590),
-    'budhāna': (29.288050, 77.475340),
-    'lingsugūr': (16.158760, 76.521740),
-    'rājpīpla': (21.866670, 73.500000),
-    'dharangaon': (21.011870, 75.274070),
-    'mahemdāvād': (22.823590, 72.755510),
-    'karamsad': (22.542430, 72.903920),
-    'sūrandai': (8.975740, 77.419230),
-    'manali': (13.166670, 80.266670),
-    'wāris alīganj': (25.017200, 85.640470),
-    'pulgaon': (20.722040, 78.320560),
-    'usilampatti': (9.969360, 77.786210),
-    'puzhathi': (11.901120, 75.389240),
-    'perunād': (8.948990, 76.642740),
-    'kāramadai': (11.240580, 76.960090),
-    'giddalūr': (15.374390, 78.926090),
-    'atmakūr': (15.881090, 78.587040),
-    'pāppinisshēri': (11.956550, 75.340340),
-    'vijāpur': (23.562300, 72.748480),
-    'rāwatsār': (29.267240, 74.402880),
-    'dubrājpur': (23.790200, 87.376480),
-    'karumattampatti': (11.109330, 77.182000),
-    'māranchēri': (10.740510, 75.970960),
-    'podaturpet': (13.281690, 79.485380),
-    'peruvallur': (11.104830, 75.932690),
-    'rairangpur': (22.266750, 86.173850),
-    'sīrkāzhi': (11.237250, 79.735850),
-    'kichha': (28.911540, 79.520090),
-    'hebbagodi': (12.826320, 77.680850),
-    'chēmanchēri': (11.404820, 75.723630),
-    'erāttupetta': (9.687470, 76.778910),
-    'rāmdurg': (15.945790, 75.297850),
-    'jāmadoba': (23.716670, 86.400000),
-    'safidon': (29.405960, 76.670420),
-    'bolārum': (17.556060, 78.348240),
-    'bareli': (23.004450, 78.230100),
-    'erāmala': (11.685910, 75.591040),
-    'shikārpūr': (28.280720, 78.014110),
-    'sankeshwar': (16.256490, 74.481950),
-    'karjat': (18.910700, 73.323540),
-    'bakhtiyārpur': (25.461790, 85.531790),
-    'bagasra': (21.487190, 70.955160),
-    'villiappally': (11.624950, 75.628750),
-    'aymanam': (9.606840, 76.500550),
-    'angamāli': (10.190550, 76.387890),
-    'villianur': (11.913930, 79.755680),
-    'manipal': (13.350000, 74.783330),
-    'lālsot': (26.559510, 76.329150),
-    'mehidpur': (23.488790, 75.658000),
-    'soyāgaon': (20.552500, 74.506870),
-    'sāngola': (17.439480, 75.193790),
-    'vedaraniyam': (10.372080, 79.850950),
-    'kuruvattūr': (11.336090, 75.835110),
-    'muddebihāl': (16.337820, 76.131730),
-    'navāpur': (21.161570, 73.793990),
-    'khāchrod': (23.423220, 75.281850),
-    'yanamalakuduru': (16.485310, 80.667460),
-    'malajkhand': (22.051580, 80.715660),
-    'vapi ina': (20.360060, 72.931060),
-    'kunigal': (13.023190, 77.025180),
-    'kadūr': (13.552850, 76.011640),
-    'chelambra': (11.150860, 75.871920),
-    'hamīrpur': (25.955300, 80.148420),
-    'risod': (19.976710, 76.787990),
-    'kokrajhar': (26.401070, 90.272860),
-    'kālka': (30.839820, 76.940650),
-    'kāgal': (16.577020, 74.315440),
-    'pārassāla': (8.338690, 77.154220),
-    'titlāgarh': (20.289610, 83.152330),
-    'begamganj': (23.599170, 78.340640),
-    'nagalapuram': (13.388360, 79.796230),
-    'jāmkhed': (18.735190, 75.313430),
-    'elampalloor': (8.955830, 76.673880),
-    'jayamkondacholapuram': (11.212660, 79.363690),
-    'tudiyalūr': (11.081590, 76.944640),
-    'ālankōd': (10.746030, 76.034810),
-    'shāhpura': (27.391200, 75.959560),
-    'elayavur': (11.889180, 75.412400),
-    'guledagudda': (16.050250, 75.789970),
-    'iramallūr': (10.061900, 76.571680),
-    'piro': (25.332180, 84.404540),
-    'guskhara': (23.492760, 87.734840),
-    'umreth': (22.698810, 73.115610),
-    'narsīpatnam': (17.667090, 82.612450),
-    'bahjoi': (28.395020, 78.626590),
-    'dharmābād': (18.891160, 77.849400),
-    'chockli': (11.727450, 75.555090),
-    'vemalwāda': (18.465230, 78.868940),
-    'colgong': (25.263280, 87.232640),
-    'bāsudebpur': (21.119740, 86.728960),
-    'rājākhera': (26.898020, 78.171000),
-    'hailākāndi': (24.683940, 92.560970),
-    'jagatsinghapur': (20.255700, 86.171120),
-    'gevrai': (19.263720, 75.750070),
-    'madikeri': (12.426020, 75.738200),
-    'kopāganj': (26.019230, 83.566300),
-    'thāna bhawan': (29.586050, 77.418110),
-    'pūndri': (29.760960, 76.560340),
-    'vagholi': (18.582300, 73.983010),
-    'birmitrapur': (22.400000, 84.766670),
-    'chaksu': (26.605100, 75.948140),
-    'darsi': (15.769780, 79.679390),
-    'zaidpur': (26.830930, 81.329290),
-    'remuna': (21.527980, 86.871560),
-    'puthenvelikara': (10.185110, 76.245370),
-    'āmli': (20.283330, 73.016670),
-    'anūpgarh': (29.191110, 73.208610),
-    'salāya': (22.310380, 69.603760),
-    'idangansālai': (11.627210, 77.988980),
-    'kosamba': (21.462020, 72.958420),
-    'basavana bāgevādi': (16.572780, 75.972520),
-    'muhammadābād': (25.619070, 83.755760),
-    'lakhyabad': (23.666670, 86.666670),
-    'aya nagar': (28.472020, 77.132700),
-    'umaria': (23.524730, 80.837160),
-    'chanderi': (24.713120, 78.138090),
-    'ajānūr': (12.336140, 75.092970),
-    'manendragarh': (23.213370, 82.202320),
-    'bhādāsar': (28.314570, 74.289520),
-    'srvanampatti': (11.076430, 77.004490),
-    'patrātu': (23.665050, 85.303530),
-    'bhokar': (19.219330, 77.669620),
-    'sānchor': (24.753610, 71.772800),
-    'kurumbapet': (11.939830, 79.771270),
-    'kaimganj': (27.554410, 79.335250),
-    'bāmaur': (26.338950, 78.101040),
-    'jānjgīr': (22.009220, 82.577800),
-    'egra': (21.899470, 87.537940),
-    'bihārīganj': (25.734150, 86.988370),
-    'mushābani': (22.511350, 86.457130),
-    'dighwāra': (25.744340, 85.010030),
-    'ngūr': (23.537980, 93.373200),
-    'garhākota': (23.779100, 79.143210),
-    'vengola kizhakkumbāgam': (10.063740, 76.476060),
-    'mamun': (32.282410, 75.698310),
-    'nānjikkottai': (10.729250, 79.142450),
-    'bijuri': (23.252360, 82.116730),
-    'ghugus': (19.938100, 79.111920),
-    'tārānagar': (28.668600, 75.032070),
-    'nepānagar': (21.453800, 76.393350),
-    'bādepalli': (16.754900, 78.144270),
-    'nautanwa': (27.427520, 83.417890),
-    'pīrzādagūda': (17.394550, 78.590470),
-    'hisua': (24.833600, 85.417290),
-    'shamshabad': (17.251860, 78.418350),
-    'vallabh vidyanagar': (22.533330, 72.900000),
-    'erraguntla': (14.638530, 78.539740),
-    'edappāl': (10.783390, 76.007890),
-    'manuguru': (17.930230, 80.826710),
-    'soro': (21.278510, 86.688330),
-    'ulliyeri': (11.452470, 75.766620),
-    'saoner': (21.385100, 78.921550),
-    'muttayyāpuram': (8.749800, 78.131120),
-    'manwath': (19.301330, 76.497350),
-    'dhandhuka': (22.381850, 71.986640),
-    'jūjūvādi': (12.767940, 77.791840),
-    'hatta': (24.134060, 79.601190),
-    'jagdīspur': (25.468110, 84.419390),
-    'almora': (29.597130, 79.659110),
-    'thuraiyur': (11.148050, 78.599110),
-    'saknepalli': (18.928620, 79.457120),
-    'anta': (25.150000, 76.300000),
-    'gajendragarh': (15.736280, 75.969760),
-    'narsinghgarh': (23.707580, 77.093190),
-    'kalyandurg': (14.545190, 77.105520),
-    'chittūr': (10.699670, 76.747100),
-    'madhapar': (23.237560, 69.699460),
-    'chhabra': (24.664720, 76.843790),
-    'manamadurai': (9.673180, 78.470960),
-    'tiruchchendur': (8.497250, 78.119060),
-    'bisauli': (28.307720, 78.936780),
-    'kangayam': (11.005990, 77.560900),
-    'mannanchōri': (9.572200, 76.352450),
-    'kakching': (24.498200, 93.981260),
-    'turaiyūr': (11.149680, 78.598700),
-    'bijaynagar': (25.929760, 74.649160),
-    'ferokh': (11.179890, 75.841410),
-    'dhāmnod': (22.209280, 75.470570),
-    'jora khurd': (26.489270, 77.975780),
-    'pāvugada': (14.099530, 77.280180),
-    'thenhippalam': (11.132320, 75.882240),
-    'halvad': (23.015160, 71.180290),
-    'mīrpeta': (17.320980, 78.530460),
-    'zamānia': (25.419610, 83.557860),
-    'bhatkal': (13.985340, 74.555310),
-    'makhdumpur': (25.065670, 84.972470),
-    'shafi pur ranhola': (28.657290, 77.040010),
-    'jāridih': (23.765710, 85.938640),
-    'rasrā': (25.857600, 83.854870),
-    'sādpalli': (17.209950, 80.836420),
-    'sattur': (9.355920, 77.924570),
-    'maur': (30.083330, 75.250000),
-    'chhota gobindpur': (22.745880, 86.258860),
-    'sāsvad': (18.343510, 74.031020),
-    'vilavoorkkal': (8.480930, 77.022040),
-    'kotma': (23.203830, 81.979040),
-    'kottaikuppam': (11.961260, 79.839230),
-    'khaira': (19.786730, 72.761610),
-    'tālīkota': (16.473110, 76.310850),
-    'puzhal': (13.164750, 80.203850),
-    'kalpatta': (11.608710, 76.083430),
-    'ambad': (19.613010, 75.789060),
-    'sijua': (23.776170, 86.330280),
-    'rāhatgarh': (23.789680, 78.394730),
-    'vandavāsi': (12.504290, 79.605560),
-    'tirumuruganpūndi': (11.164930, 77.308380),
-    'thanneermukkom': (9.663370, 76.380730),
-    'parūr': (10.147700, 76.230000),
-    'gomoh': (23.873550, 86.151600),
-    'elūr': (10.066670, 76.283330),
-    'chemmumiahpet': (14.462890, 78.811910),
-    'jalālpur': (26.311620, 82.738590),
-    'sri mādhopur': (27.465990, 75.597360),
-    'lumding railway colony': (25.749030, 93.169980),
-    'ahmedgarh': (30.677310, 75.826330),
-    'chītāpur': (17.123570, 77.082400),
-    'jhanjhārpur': (26.264670, 86.279930),
-    'nāspur': (18.845770, 79.461650),
-    'singānallūr': (10.998980, 77.032380),
-    'unchagao': (16.697460, 74.273250),
-    'bagru': (26.810670, 75.547020),
-    'cheriyamundam': (10.947640, 75.956430),
-    'allapuram': (12.895090, 79.127860),
-    'rosera': (25.754940, 86.031550),
-    'podili': (15.606390, 79.614890),
-    'shrīgonda': (18.615270, 74.698950),
-    'kalliyasshēri': (11.975490, 75.364530),
-    'kannānendal': (9.964870, 78.141590),
-    'pāndharkawada': (20.021080, 78.546280),
-    'mankāchar': (25.533470, 89.863730),
-    'katirur': (11.784910, 75.530150),
-    'erandol': (20.922060, 75.326410),
-    'adirampattinam': (10.340590, 79.379050),
-    'kūrāli': (30.834240, 76.576770),
-    'jagdīshpur': (26.749670, 80.545100),
-    'ponneri': (13.338680, 80.194870),
-    'shamsābād': (27.017180, 78.123580),
-    'malakanagiri': (18.364280, 81.888000),
-    'mangrūl pīr': (20.313790, 77.341780),
-    'narsampet': (17.927860, 79.892270),
-    'berasia': (23.631340, 77.433510),
-    'bādāmi': (15.914950, 75.676830),
-    'pasān': (22.844120, 82.198230),
-    'kondagaon': (19.590830, 81.664000),
-    'kalakkādu': (8.513800, 77.549440),
-    'puthuppariyāram': (10.813140, 76.628690),
-    'vilāngudi': (9.945780, 78.093520),
-    'rūdarpur': (26.444670, 83.613020),
-    'sholinghur': (13.118100, 79.420250),
-    'mānāvadar': (21.498130, 70.137750),
-    'purāini': (25.142570, 86.979670),
-    'deūlgaon rāja': (20.017570, 76.037550),
-    'dharmadam': (11.775380, 75.464590),
-    'madurāntakam': (12.511670, 79.884850),
-    'kizhuvalam-koonthalloor': (8.662510, 76.809660),
-    'dharamsala': (32.220060, 76.320130),
-    'pedana': (16.255820, 81.143780),
-    'kaij': (18.713640, 76.067180),
-    'kallamchavadi': (12.953060, 80.130830),
-    'un': (23.887450, 71.769750),
-    'vadanappally': (10.469050, 76.081290),
-    'irimbiliyam': (10.862420, 76.092180),
-    'mūdbidri': (13.066530, 74.995250),
-    'pallappatti': (10.720570, 77.879510),
-    'cheranellūr': (10.054280, 76.289600),
-    'mahārāganj': (27.144560, 83.562140),
-    'nāgāvaram': (17.488620, 78.602080),
-    'tarakeswar': (22.886050, 88.013630),
-    'tifrā': (22.063120, 82.131290),
-    'siraspur': (28.758150, 77.130870),
-    'kundapura': (13.631260, 74.690200),
-    'uran': (18.878130, 72.939240),
-    'kasba': (25.856430, 87.538360),
-    'karjan': (22.046710, 73.118140),
-    'muvattupuzha': (9.979850, 76.573810),
-    'manāwar': (22.235660, 75.089170),
-    'pihānī': (27.619870, 80.203430),
-    'madukkarai': (10.905680, 76.963440),
-    'amlai': (23.198380, 81.580640),
-    'dhāruhera': (28.205530, 76.796910),
-    'sarkhej': (22.982970, 72.501960),
-    'banmankhi bazar': (25.887610, 87.193560),
-    'rehli': (23.637220, 79.062750),
-    'tāramangalam': (11.694030, 77.970350),
-    'amla': (21.924850, 78.127860),
-    'tirukkoyilur': (11.966200, 79.202590),
-    'musiri': (10.952990, 78.444270),
-    'hīrākud': (21.525020, 83.872750),
-    'khair': (27.941950, 77.842430),
-    'rajauli': (24.644860, 85.500280),
-    'kakkalapalle': (14.641520, 77.566840),
-    'cherukavu': (11.173070, 75.908580),
-    'seoni mālwa': (22.450460, 77.466500),
-    'oddanchathiram': (10.480130, 77.749770),
-    'fatehpur sīkri': (27.093700, 77.660030),
-    'azhiyūr': (11.693480, 75.560130),
-    'byādgi': (14.673250, 75.486800),
-    'birpara': (26.704210, 89.145470),
-    'cherpulassery': (10.876550, 76.309320),
-    'multai': (21.774630, 78.257560),
-    'holenarasipura': (12.786350, 76.243310),
-    'talāja': (21.352700, 72.035240),
-    'marhaura': (25.973490, 84.867960),
-    'kareli': (22.915330, 79.063780),
-    'bhongaon': (27.255150, 79.181180),
-    'baddi': (30.957830, 76.791360),
-    'pānakkudi': (8.322000, 77.577110),
-    'gadhada': (21.969570, 71.578280),
-    'pūlakkōd': (11.309750, 75.949950),
-    'mukeriān': (31.953940, 75.617160),
-    'ariyānkuppam': (11.895320, 79.807090),
-    'karumālūr': (10.132900, 76.279920),
-    'kottārakara': (9.003590, 76.773830),
-    'mavoor': (11.266670, 75.916670),
-    'pilāni': (28.367250, 75.603520),
-    'devarkonda': (16.691860, 78.920730),
-    'mīnād': (8.850310, 76.695160),
-    'nedumbassery': (10.156460, 76.401670),
-    'rājūra': (19.779470, 79.364590),
-    'bilāri': (28.621460, 78.803610),
-    'mūvattupula': (9.984930, 76.577280),
-    'adūr': (9.155950, 76.731920),
-    'walwadi': (20.920850, 74.761110),
-    'puthuppally': (9.557520, 76.574830),
-    'rāisinghnagar': (29.535830, 73.449170),
-    'mīrānpur katra': (28.029630, 79.667780),
-    'kidarakulam': (8.566880, 76.991290),
-    'kuttuparamba': (11.827750, 75.565900),
-    'ārangaon': (19.026810, 74.714870),
-    'pakridayal': (26.562710, 85.045200),
-    'dhanera': (24.509670, 72.023430),
-    'chengamanād': (10.154090, 76.341590),
-    'lākheri': (25.672370, 76.176920),
-    'kalavoor': (9.570460, 76.327560),
-    'behror': (27.888320, 76.281080),
-    'reddipālaiyam': (13.107780, 80.120560),
-    'zunheboto': (25.966670, 94.516670),
-    'rajaori': (33.375260, 74.309200),
-    'sankagiri': (11.475990, 77.866370),
-    'mharal bk': (19.245880, 73.177100),
-    'maināguri': (26.562630, 88.820400),
-    'nedumpana': (8.907960, 76.692980),
-    'puttankulam': (8.813800, 76.717910),
-    'sāgwāra': (23.679510, 74.020130),
-    'nāgar karnūl': (16.482100, 78.324710),
-    'ibrāhīmpatnam': (16.583030, 80.514320),
-    'vadakku valliyūr': (8.382860, 77.612210),
-    'jāmtāra': (23.963000, 86.802850),
-    'khedbrahma': (24.029900, 73.046320),
-    'tirukkalikkunram': (12.607990, 80.055500),
-    'talakkolattur': (11.353660, 75.757980),
-    'pālkonda': (18.603740, 83.755680),
-    'cheruthazham': (12.080970, 75.262720),
-    'dhāri': (21.328550, 71.026450),
-    'amballūr': (10.434310, 76.263410),
-    'koovappady': (10.155250, 76.485440),
-    'chendamangalam': (10.163220, 76.234560),
-    'jewar': (28.122000, 77.557340),
-    'nawāpāra': (20.971730, 81.858840),
-    'tarsadi': (21.469960, 72.952100),
-    'ner': (20.489710, 77.866320),
-    'vijayapuram': (9.591230, 76.561240),
-    'husainābād': (24.528490, 84.000000),
-    'udaipurwati': (27.730110, 75.471610),
-    'jandiāla gurū': (31.561980, 75.027700),
-    'bachhraon': (28.926940, 78.234560),
-    'irinjālakuda': (10.342380, 76.211240),
-    'renwāl': (27.157670, 75.358080),
-    'kumbalam': (9.906300, 76.311270),
-    'basni': (27.172320, 73.645190),
-    'morigaon': (26.249080, 92.347640),
-    'madhugiri': (13.660350, 77.212390),
-    'urakam': (11.051240, 75.988330),
-    'islāmnagar': (28.328960, 78.725240),
-    'ariyalūr': (11.138490, 79.075560),
-    'ponmana': (9.007980, 76.520230),
-    'mahendragarh': (28.269350, 76.152530),
-    'mudalgi': (16.336850, 74.967680),
-    'nakrekal': (17.162590, 79.427540),
-    'unamaucheri': (12.860800, 80.106590),
-    'gorai': (19.250000, 72.783330),
-    'uttamapālaiyam': (9.807010, 77.327180),
-    'khandela': (27.604990, 75.502000),
-    'sirsāganj': (27.057150, 78.686610),
-    'chodavaram': (17.828840, 82.935260),
-    'umarkot': (19.665290, 82.206290),
-    'hupari': (16.616670, 74.404420),
-    'suār': (29.028410, 79.056540),
-    'devadurga': (16.423140, 76.935770),
-    'manoharpur': (27.297690, 75.949500),
-    'nāhan': (30.560290, 77.294260),
-    'lādwa': (29.993500, 77.045630),
-    'gil': (30.846920, 75.863620),
-    'gunupur': (19.080400, 83.808790),
-    'avinashi': (11.192970, 77.268650),
-    'kotagiri': (11.420720, 76.860350),
-    'sikka': (22.432180, 69.841580),
-    'panipat taraf rajputan': (29.360890, 76.942580),
-    'kondotty': (11.142300, 75.965700),
-    'rusera': (25.753550, 86.025970),
-    'desāīganj': (20.623540, 79.964540),
-    'maddūr': (12.582830, 77.042940),
-    'nongstoin': (25.517040, 91.264840),
-    'rāikot': (30.650000, 75.600000),
-    'dinapur cantonment': (25.636160, 85.020260),
-    'jhālod': (23.100970, 74.155360),
-    'karera': (25.458150, 78.135830),
-    'murlīganj': (25.896900, 86.995770),
-    'soron': (27.890550, 78.746210),
-    'mukher': (18.706360, 77.367950),
-    'vandiyūr': (9.909170, 78.160880),
-    'alandi': (18.677560, 73.898680),
-    'pattāmbi': (10.800050, 76.184080),
-    'tekkali': (18.605700, 84.235460),
-    'duliajan': (27.360350, 95.318060),
-    'duliajan oil town': (27.357800, 95.314070),
-    'kāraippudūr': (11.056740, 77.306130),
-    'ambikāpuram': (10.793850, 76.653030),
-    'sūryampālaiyam': (11.404450, 77.712270),
-    'motipur': (26.252670, 85.160760),
-    'ālangulam': (8.864040, 77.499370),
-    'addanki': (15.810610, 79.973380),
-    'bemetāra': (21.715560, 81.534230),
-    'milak': (28.610310, 79.169970),
-    'losal': (27.400000, 74.916670),
-    'alirajpur': (22.303930, 74.355680),
-    'pārdi': (20.508700, 72.945690),
-    'kinwat': (19.625570, 78.198700),
-    'lālgola': (24.422440, 88.252380),
-    'utraula': (27.319330, 82.418720),
-    'baikunthpur': (23.262060, 82.560510),
-    'jowai': (25.435960, 92.191320),
-    'ochira': (9.134780, 76.511690),
-    'rāpar': (23.572670, 70.647180),
-    'jammu cantonment': (32.704380, 74.861140),
-    'bānswāda': (18.377250, 77.880070),
-    'hosadurga': (13.796310, 76.284080),
-    'ramanayyapeta': (16.945160, 82.238500),
-    'mīnjūr': (13.279510, 80.258150),
-    'sonāmukhi': (23.305210, 87.413360),
-    'kukshi': (22.206770, 74.757880),
-    'kansad': (21.074660, 72.878880),
-    'kālāvad': (22.207890, 70.383430),
-    'jashpur nagar': (22.887830, 84.138640),
-    'māvelikara': (9.259290, 76.556420),
-    'dhanaura': (28.959120, 78.256290),
-    'jalgaon jamod': (21.051940, 76.534640),
-    'pallipuram': (9.755020, 76.357240),
-    'sujānpur': (32.316250, 75.607410),
-    'annigeri': (15.425130, 75.433500),
-    'piravam': (9.866670, 76.500000),
-    'ganderbal': (34.226190, 74.774780),
-    'uliyazhathura': (8.581650, 76.922420),
-    'mandi': (31.711940, 76.932730),
-    'atholi': (11.388530, 75.759700),
-    'shiggaon': (14.990530, 75.224990),
-    'pandua': (23.074920, 88.286370),
-    'pūnch': (33.770330, 74.092540),
-    'kottaikādu': (12.255560, 79.982260),
-    'hāngal': (14.764650, 75.124600),
-    'jhadeshwar': (21.713610, 73.032310),
-    'polūr': (12.512170, 79.124050),
-    'sheohar': (26.513930, 85.293410),
-    'perumbavoor': (10.106950, 76.473660),
-    'gundlupēt': (11.810040, 76.690270),
-    'sachīn': (21.087180, 72.881530),
-    'koynanagar': (17.400000, 73.766670),
-    'gotegaon': (23.028880, 79.482330),
-    'kalwākurti': (16.663960, 78.491430),
-    'sheoganj': (25.139150, 73.067840),
-    'devanahalli': (13.246550, 77.711830),
-    'āron': (24.381090, 77.417390),
-    'hadagalli': (15.020480, 75.931850),
-    'patran': (29.957700, 76.048600),
-    'tharād': (24.395970, 71.625770),
-    'panāgar': (23.285390, 79.995090),
-    'dāsna': (28.677360, 77.522520),
-    'kulittalai': (10.934870, 78.412510),
-    'sulur': (11.024270, 77.125650),
-    'rangia': (26.449310, 91.613560),
-    'bāmor kalān': (24.892980, 78.151050),
-    'umargām': (20.197180, 72.750350),
-    'nalbāri': (26.439370, 91.440410),
-    'pallikunnu': (11.889930, 75.356520),
-    'trittāla': (10.803030, 76.128850),
-    'vadnagar': (23.785930, 72.638930),
-    'jaswantnagar': (26.882710, 78.902560),
-    'afzalgarh': (29.393700, 78.673930),
-    'mahna': (30.227980, 74.993650),
-    'mathur': (13.170970, 80.247590),
-    'tehri': (30.390860, 78.480300),
-    'māgadi': (12.957060, 77.223740),
-    'pūvātūparamba': (11.271000, 75.889450),
-    'bāspalli': (17.539090, 78.363550),
-    'mahād': (18.083330, 73.416670),
-    'ezhupunna': (9.821100, 76.299820),
-    'sānkrāil': (22.549970, 88.225150),
-    'wārāseonī': (21.761840, 80.043010),
-    'beldānga': (23.934280, 88.260180),
-    'jilādiguda': (17.332000, 78.525530),
-    'sausar': (21.655760, 78.796690),
-    'moothakunnam': (10.189950, 76.200790),
-    'pathirappally': (9.535390, 76.322050),
-    'hadgāon': (19.495520, 77.658630),
-    'chandrapura': (23.748770, 86.119550),
-    'rājaldesar': (28.028490, 74.474420),
-    'pachor': (23.709820, 76.733870),
-    'sādri': (25.185550, 73.452880),
-    'mīrānpur': (29.290260, 77.949390),
-    'azhoor': (8.644150, 76.798970),
-    'kullattūr': (12.941940, 80.194720),
-    'balussheri': (11.447380, 75.829440),
-    'kālānwāli': (29.835730, 74.971700),
-    'kadodara': (21.161600, 72.962300),
-    'chakapara': (22.632220, 88.348610),
-    'nanminda': (11.423250, 75.823080),
-    'kattumannarkoil': (11.276310, 79.557840),
-    'kalamb': (19.044370, 73.955540),
-    'āndippatti': (9.997970, 77.620970),
-    'arumuganeri': (8.568800, 78.090910),
-    'elamanchili': (17.549070, 82.857490),
-    'adichānallūr': (8.880490, 76.715580),
-    'laitumkhrah': (25.570670, 91.897710),
-    'gulābpura': (25.904480, 74.660250),
-    'pāthardi': (19.172790, 75.174250),
-    'kundarkhi': (28.683040, 78.785590),
-    'ukhrul': (25.119570, 94.364170),
-    'gadhinglaj': (16.222910, 74.350100),
-    'bilgrām': (27.175090, 80.032010),
-    'ali': (28.516100, 77.309930),
-    'bidhūna': (26.801720, 79.508290),
-    'bhelai': (22.309300, 82.609530),
-    'ayakudi': (10.449920, 77.551980),
-    'vettanād': (8.605870, 76.942350),
-    'āsandh': (29.521190, 76.605520),
-    'perumpāvūr': (10.115440, 76.476110),
-    'chanpatia': (26.944420, 84.537700),
-    'afzalpur': (17.199860, 76.360180),
-    'gobindpur': (22.633930, 86.071620),
-    'tikkotti': (11.483330, 75.616670),
-    'gingee': (12.252820, 79.417270),
-    'rāver': (21.247570, 76.035090),
-    'bāgepalli': (13.783380, 77.796670),
-    'kotdwāra': (29.746120, 78.522190),
-    'payakaraopeta': (17.367840, 82.568260),
-    'bhawanipur': (26.453520, 87.027440),
-    'elamkunnapuzha': (10.026740, 76.222290),
-    'ettumanoor': (9.670000, 76.570000),
-    'lātehār': (23.744230, 84.499840),
-    'chengam': (12.308890, 78.791370),
-    'kumārapuram': (9.270780, 76.432570),
-    'margherita': (27.284820, 95.667960),
-    'kulasēkarapuram': (9.091200, 76.530340),
-    'sāmba': (32.562450, 75.119930),
-    'pirthīpur': (25.208370, 78.751580),
-    'vepagunta': (17.778440, 83.215770),
-    'vadipatti': (10.084810, 77.961130),
-    'shenkottai': (8.977410, 77.246330),
-    'edacchēri': (11.681780, 75.624800),
-    'banmankhi': (25.888570, 87.194210),
-    'srīnivāspur': (13.339140, 78.211750),
-    'palavakkam': (12.953500, 80.257200),
-    'chāndur': (19.734440, 79.171670),
-    'indāpur': (18.300000, 73.250000),
-    'varappuzha': (10.075890, 76.271520),
-    'kemrī': (28.806730, 79.204800),
-    'alattūr': (10.650000, 76.533330),
-    'krishnāpuram': (9.152120, 76.523380),
-    'kartārpur': (31.442680, 75.498470),
-    'māmidālapādu': (15.854090, 78.014810),
-    'karhal': (27.000890, 78.939350),
-    'lar': (26.203940, 83.969060),
-    'kūdligi': (14.905000, 76.385270),
-    'alīganj': (27.493580, 79.171270),
-    'baloda bāzār': (21.656780, 82.160620),
-    'manihāri': (25.338910, 87.619980),
-    'kottur': (10.536460, 76.980340),
-    'faizpur': (21.167660, 75.860060),
-    'manāsa': (24.477640, 75.140950),
-    'sankarapatti': (10.047700, 78.747190),
-    'songadh': (21.169660, 73.563570),
-    'pauri': (30.152860, 78.777100),
-    'shāhganj': (26.049650, 82.684230),
-    'dhrol': (22.567000, 70.417690),
-    'pallippatti': (11.939900, 78.401610),
-    'barwāh': (22.253940, 76.038530),
-    'mauganj': (24.667210, 81.873390),
-    'bablāi': (30.357290, 76.879000),
-    'terdāl': (16.493790, 75.046670),
-    'nādbai': (27.222880, 77.195690),
-    'kallidaikurichi': (8.685910, 77.465920),
-    'taloda': (21.561280, 74.212380),
-    'murugampālaiyam': (11.080630, 77.323810),
-    'mon': (26.735830, 95.058410),
-    'kheri': (27.903540, 80.797540),
-    'bilsi': (28.129410, 78.910900),
-    'basi': (30.588130, 76.844980),
-    'āyanchēri': (11.626090, 75.674270),
-    'kottūru': (14.824420, 76.220050),
-    'anjad': (22.041710, 75.055190),
-    'chinnalapatti': (10.284810, 77.923320),
-    'narasannapeta': (18.414280, 84.044630),
-    'ongallur-ii': (10.789740, 76.218980),
-    'mirganj': (26.373450, 84.334890),
-    'aklera': (24.412880, 76.567190),
-    'kūdlu': (12.529790, 74.978810),
-    'tekkalakote': (15.534440, 76.877030),
-    'mungaoli': (24.408370, 78.095880),
-    'budhlāda': (29.927990, 75.562050),
-    'anuppānadi': (9.903960, 78.143260),
-    'reengus': (27.363600, 75.568380),
-    'sutrāpāra': (20.843520, 70.483180),
-    'kodoli': (17.670230, 74.034690),
-    'phulera': (26.874010, 75.241710),
-    'renigunta': (13.651430, 79.512560),
-    'khoni': (19.317340, 73.059730),
-    'areraj': (26.550300, 84.680100),
-    'muttanampālaiyam': (11.084530, 77.396900),
-    'junnar': (19.208150, 73.875200),
-    'mehsi': (26.355740, 85.092510),
-    'mangaldai': (26.442120, 92.030470),
-    'naduvannūr': (11.487720, 75.775110),
-    'krishnarājpet': (12.666210, 76.487700),
-    'tirāwari': (29.801470, 76.928250),
-    'mannachanallur': (10.909880, 78.699270),
-    'periyanayakkanpalaiyam': (11.152550, 76.951590),
-    'kuttikkāttūr': (11.262580, 75.879600),
-    'jaynagar majilpur': (22.175200, 88.420080),
-    'kailāras': (26.304980, 77.616000),
-    'chīpurupalle': (18.311420, 83.568460),
-    'iringal': (11.559290, 75.616630),
-    'jamjodhpur': (21.902190, 70.035700),
-    'chumukedima': (25.824830, 93.775920),
-    'thodiyoor': (9.077970, 76.577720),
-    'nalhāti': (24.297040, 87.828990),
-    'jāmul': (21.250000, 81.400000),
-    'kāladi': (10.819420, 76.006400),
-    'muhamma': (9.608860, 76.360830),
-    'ponmundam': (10.953560, 75.946800),
-    'mulamthuruthy': (9.900320, 76.387010),
-    'gokarna': (14.550000, 74.316670),
-    'ganguwa': (29.113430, 75.695780),
-    'koregaon': (18.645730, 74.059090),
-    'kāndla': (23.033330, 70.216670),
-    'erannoli': (11.769130, 75.517660),
-    'kārkala': (13.214280, 74.992340),
-    'dārwha': (20.310170, 77.772570),
-    'chhota udepur': (22.304010, 74.015800),
-    'avanigadda': (16.021480, 80.918080),
-    'mussoorie': (30.454980, 78.070680),
-    'kuttippuram': (10.842460, 76.030770),
-    'jaleshwar': (21.801760, 87.222500),
-    'jais': (26.264900, 81.548550),
-    'kallam': (18.575060, 76.021860),
-    'pawāyan': (28.066260, 80.103050),
-    'irugūr': (11.017820, 77.062850),
-    'jevargi': (17.013940, 76.773170),
-    'mechcheri': (11.834120, 77.943870),
-    'silao': (25.083580, 85.428040),
-    'khajuraho group of monuments': (24.848090, 79.933510),
-    'silapathar': (27.594410, 94.724020),
-    'dākor': (22.752680, 73.149670),
-    'wadgaon': (16.835530, 74.313380),
-    'deori khās': (23.390170, 79.016300),
-    'jandiāla': (31.159300, 75.617550),
-    'balakrishnapuram': (10.359090, 78.002610),
-    'panayāttur vadakkumbhāgam': (8.954570, 76.618500),
-    'pāsighāt': (28.066310, 95.326780),
-    'kheda': (22.752180, 72.685330),
-    'nagar': (27.423970, 77.099220),
-    'viswanatham': (9.429520, 77.800320),
-    'kamalāpuram': (15.304420, 76.476490),
-    'poranki': (16.477710, 80.707550),
-    'parangipettai': (11.491170, 79.760530),
-    'andipalayam': (11.092460, 77.312250),
-    'adampur': (29.280260, 75.468180),
-    'kakkanad': (10.016360, 76.341680),
-    'talikkulam': (10.440360, 76.094830),
-    'colonelganj': (27.134320, 81.698680),
-    'mehndāwal': (26.975790, 83.109950),
-    'koelwār': (25.580550, 84.797510),
-    'harūr': (12.052670, 78.480230),
-    'bannūr': (12.332950, 76.862010),
-    'mūl': (20.069870, 79.678260),
-    'kuttampuzha': (10.150330, 76.735440),
-    'karuva': (8.950030, 76.598610),
-    'dorāha': (30.799530, 76.023550),
-    'koothanallur': (10.719900, 79.515700),
-    'khātegaon': (22.595730, 76.913300),
-    'nīlēshwar': (12.259530, 75.135200),
-    'edaicode': (8.382510, 77.198340),
-    'kadakkavoor': (8.679210, 76.767140),
-    'haludbani': (22.751230, 86.209900),
-    'chāndor': (20.330600, 74.244670),
-    'sundarnagar': (31.535230, 76.905000),
-    'karungappalli': (9.104220, 76.537010),
-    'amarpur': (25.039670, 86.902470),
-    'gadkhol': (21.643810, 73.012110),
-    'banganapalle': (15.317710, 78.226690),
-    'anūpshahr': (28.357480, 78.269140),
-    'chitaguppa': (17.697370, 77.215250),
-    'bābra': (21.845770, 71.305440),
-    'kithor': (28.866840, 77.938610),
-    'kallūr vadakummuri': (10.253170, 76.328150),
-    'machhlīshahr': (25.685640, 82.411060),
-    'bagha purana': (30.688090, 75.098380),
-    'bhānder': (25.735810, 78.745550),
-    'azhikkōd': (11.919850, 75.335490),
-    'uttiramerūr': (12.614330, 79.757480),
-    'dasūya': (31.816790, 75.653100),
-    'gursarāi': (25.616770, 79.180530),
-    'pāonta sāhib': (30.436660, 77.624620),
-    'tirorā': (21.404090, 79.926170),
-    'rājgurunagar': (18.866670, 73.900000),
-    'pottaneri nallakavundanpatti': (11.803880, 77.856730),
-    'kamaruddinnagar': (28.676950, 77.053720),
-    'gauripur': (26.083340, 89.961180),
-    'rānia': (29.524540, 74.836890),
-    'mugalivakkam': (13.020540, 80.165280),
-    'thazhecode': (11.322580, 75.975790),
-    'saiha': (22.491830, 92.981430),
-    'chinna salem': (11.634220, 78.874120),
-    'vayalār': (9.711580, 76.338880),
-    'ahraura': (25.015790, 83.032940),
-    'rampachodavaram': (17.440880, 81.775580),
-    'shrīrangapattana': (12.422640, 76.684390),
-    'kharkhauda': (28.878700, 76.910690),
-    'kantai': (26.214210, 85.297490),
-    'kanigiri': (15.405550, 79.506940),
-    'chengannūr': (9.315750, 76.615130),
-    'sohāgpur': (22.700550, 78.195220),
-    'chandauli': (25.258030, 83.268250),
-    'velur': (11.108250, 78.001130),
-    'paramathi velur': (11.191600, 77.956300),
-    'naubatpur': (25.498560, 84.960840),
-    'sāndi': (27.288670, 79.951900),
-    'padam': (33.466590, 76.884880),
-    'marayur': (10.276410, 77.162050),
-    'kolasib': (24.223880, 92.678690),
-    'shiraguppi': (16.618750, 74.709070),
-    'ābu': (24.593650, 72.717560),
-    'sadulshahar': (29.908700, 74.175670),
-    'borāwar': (27.023660, 74.675790),
-    'marutharōd': (10.775100, 76.699480),
-    'gajwel': (17.848160, 78.682910),
-    'devarshola': (11.543660, 76.440370),
-    'kunda': (25.717020, 81.513960),
-    'sakleshpur': (12.941190, 75.784670),
-    'perundurai': (11.275640, 77.587940),
-    'mundargi': (15.206770, 75.883900),
-    'māchhīwāra': (30.915570, 76.200160),
-    'nainpur': (22.429960, 80.105610),
-    'tarāna': (23.333830, 76.042530),
-    'keirao bitra': (24.711050, 93.974610),
-    'kānth': (29.059390, 78.629510),
-    'charkhāri': (25.403040, 79.748770),
-    'kushtagi': (15.756230, 76.191120),
-    'churi': (23.654910, 85.012810),
-    'vellalūr': (10.977470, 77.026010),
-    'srīperumbūdūr': (12.967630, 79.941970),
-    'muthutala': (10.835440, 76.159580),
-    'mahwa': (27.045940, 76.931520),
-    'kandahār': (18.873120, 77.192310),
-    'fālna': (25.267430, 73.239330),
-    'avilala': (13.611060, 79.420800),
-    'ghoti budrukh': (19.716410, 73.628210),
-    'safīpur': (26.737830, 80.343500),
-    'brāhmana periya agrahāram': (11.369040, 77.706330),
-    'thirunavaya': (10.874590, 75.985460),
-    'anklesvar ina': (21.616750, 73.027590),
-    'kalamnūri': (19.673860, 77.311490),
-    'kabrāi': (25.402810, 79.999700),
-    'ilaiyankudi': (9.625120, 78.624340),
-    'talwāra': (31.937600, 75.886570),
-    'fīrozpur jhirka': (27.788530, 76.944960),
-    'tijāra': (27.934110, 76.855410),
-    'pūnāhāna': (27.863710, 77.204320),
-    'tattānkuttai': (11.435180, 77.723690),
-    'phillaur': (31.018870, 75.791110),
-    'pākāla': (13.449030, 79.114930),
-    'hinjilicut': (19.481660, 84.744890),
-    'damua': (22.192910, 78.467030),
-    'ezhudesam': (8.265120, 77.142120),
-    'andol': (17.814580, 78.077130),
-    'shāmgarh': (24.188170, 75.639030),
-    'ratanpur': (22.286600, 82.168230),
-    'kodarma': (24.467530, 85.593970),
-    'keshorai pātan': (25.292750, 75.939480),
-    'navalgund': (15.558770, 75.353050),
-    'bholav': (21.719740, 73.010980),
-    'williamnagar': (25.495500, 90.616800),
-    'bijbehara': (33.793780, 75.107000),
-    'gorantla': (13.984110, 77.772240),
-    'dātāganj': (28.025300, 79.408190),
-    'tiruppuvanam': (9.825640, 78.257950),
-    'beohāri': (24.024230, 81.378310),
-    'pantheeramkavu': (11.230520, 75.851780),
-    'chharra': (27.924700, 78.401020),
-    'hudkeshwar buzurg': (21.082350, 79.127360),
-    'pindwāra': (24.797490, 73.055050),
-    'singāpur': (17.469820, 78.125740),
-    'sahaspur': (29.121250, 78.622730),
-    'ugrākheri': (29.378000, 77.009340),
-    'kānt': (27.810490, 79.791850),
-    'bhokardan': (20.258300, 75.769970),
-    'maheshwar': (22.175920, 75.587150),
-    'thiruthuraipoondi': (10.528190, 79.632680),
-    'meenambakkam': (12.984560, 80.174700),
-    'chiknāyakanhalli': (13.416090, 76.620630),
-    'mahārājgani': (26.110170, 84.503650),
-    'ayanavelikulangara vadakku': (9.042980, 76.522970),
-    'kaithoon': (25.124070, 75.972180),
-    'denkanikota': (12.530100, 77.788870),
-    'chekkiād': (11.717330, 75.641900),
-    'mayāng imphāl': (24.609980, 93.888730),
-    'haliyal': (15.328640, 74.756380),
-    'vilankurichi': (11.071470, 77.017290),
-    'rajākheri': (23.859310, 78.785200),
-    'sitārganj': (28.929300, 79.704360),
-    'nāndgaon': (20.306800, 74.655010),
-    'siuliban': (23.748600, 86.784770),
-    'dharampur': (20.536930, 73.173680),
-    'sikandarpur': (26.043270, 84.052980),
-    'srīsailain': (16.072170, 78.868160),
-    'barki saria': (24.175940, 85.889380),
-    'loha': (18.944840, 77.115530),
-    'mhaswad': (17.633590, 74.787730),
-    'alot': (23.763360, 75.556620),
-    'suryaraopeta': (16.999610, 82.223170),
-    'aluva': (10.107640, 76.351580),
-    'hastināpur': (29.160420, 78.007620),
-    'sōmēshvara': (12.803510, 74.864720),
-    'pacode': (8.335200, 77.213610),
-    'pāppākurichchi': (10.813660, 78.748130),
-    'morinda': (30.790140, 76.498830),
-    'diu': (20.714050, 70.982240),
-    'nabīnagar': (24.606810, 84.126240),
-    'dīnānagar': (32.136640, 75.472910),
-    'kaikalapettai': (13.021940, 80.120560),
-    'bāzpur': (29.152990, 79.108140),
-    'karumāndi chellipālaiyam': (11.301910, 77.586030),
-    'dalsingh sarai': (25.667950, 85.836360),
-    'makronia': (23.847650, 78.799030),
-    'sāvantvādi': (15.904130, 73.821910),
-    'longowal': (30.198460, 75.681900),
-    'vīrakeralam': (11.007720, 76.912620),
-    'reoti': (25.850910, 84.377800),
-    'pādiyanallūr': (13.200370, 80.176060),
-    'nāsriganj': (25.051400, 84.328390),
-    'fatehganj west': (28.466200, 79.306570),
-    'sadalgi': (16.558700, 74.532110),
-    'nasrullāhganj': (22.683700, 77.270690),
-    'sarjamda': (22.747590, 86.225730),
-    'narakal': (10.038330, 76.222100),
-    'lalgudi': (10.874190, 78.819350),
-    'ulundurpet': (11.690990, 79.287300),
-    'malakpur kohi rangpur': (28.540290, 77.120750),
-    'nivāri': (25.349110, 78.799740),
-    'vypīn': (9.966670, 76.250000),
-    'muluppilagadu': (11.797880, 75.451110),
-    'alwaye': (10.106490, 76.354840),
-    'tisaiyanvilai': (8.337020, 77.867760),
-    'srīkandamangalam': (9.659410, 76.363350),
-    'kutiatodu': (9.800000, 76.333330),
-    'pipri': (20.786130, 78.593600),
-    'natham': (10.227760, 78.229690),
-    'unnamalaikadai': (8.299570, 77.240620),
-    'penugonda': (16.653630, 81.745500),
-    'balod': (20.730810, 81.205780),
-    'mariāni': (26.657250, 94.315290),
-    'qadian': (31.821980, 75.376630),
-    'painkulam': (8.260230, 77.173960),
-    'prāntij': (23.436050, 72.844790),
-    'kulgam': (33.644560, 75.019230),
-    'chinnūr': (18.857790, 79.795600),
-    'katheru': (17.037950, 81.775970),
-    'mairwa': (26.232180, 84.163490),
-    'todaraisingh': (26.024010, 75.481820),
-    'pokaran': (26.920070, 71.916310),
-    'kūmher': (27.316570, 77.370790),
-    'sreekaryam': (8.548840, 76.917160),
-    'pānchla': (22.536650, 88.137850),
-    'mudkhed': (19.156570, 77.503040),
-    'shivpur charcha': (23.328880, 82.528090),
-    'jhīnjhak': (26.560930, 79.734230),
-    'pethāpur': (23.263070, 72.673860),
-    'malpe': (13.349620, 74.703940),
-    'birūr': (13.597230, 75.971670),
-    'māndal': (25.441260, 74.569790),
-    'shīshgarh': (28.729280, 79.314690),
-    'kuchera': (26.987470, 73.971080),
-    'pattiyūrgrāmam': (9.177440, 76.501150),
-    'sevilimedu': (12.808260, 79.686360),
-    'pawni': (20.792290, 79.636440),
-    'mānesar': (28.353110, 76.940360),
-    'chhātāpur': (26.219650, 87.004790),
-    'tūnēri': (11.696990, 75.634910),
-    'urmar': (31.681370, 75.635490),
-    'lonar': (19.985330, 76.520460),
-    'pugalūr': (11.074010, 78.020950),
-    'rāmtek': (21.395620, 79.327250),
-    'monoharpur': (22.108330, 88.078890),
-    'injambakkam': (12.916200, 80.248800),
-    'mandāwa': (28.055410, 75.148340),
-    'mahārājpur': (25.019390, 79.731890),
-    'soygaon': (20.596060, 75.617650),
-    'kalānaur': (28.828230, 76.395500),
-    'chitrakoot dham': (25.214730, 80.916450),
-    'ron': (15.699350, 75.734080),
-    'vengattūr': (13.099880, 79.932070),
-    'nāyanakulam': (9.961150, 78.137150),
-    'bewar': (27.218690, 79.297610),
-    'marampilly': (10.113830, 76.441840),
-    'od': (22.621040, 73.117250),
-    'tapa': (30.297940, 75.369360),
-    'vaikam': (9.748580, 76.396370),
-    'kērkandi': (11.367830, 76.745760),
-    'colachel': (8.179380, 77.258180),
-    'bissāu': (28.247370, 75.076660),
-    'karmāla': (18.407700, 75.193860),
-    'tharangambadi': (11.027640, 79.854250),
-    'hinakallu': (12.330420, 76.602130),
-    'thiruvankulam': (9.946790, 76.366620),
-    'tiruverumbūr': (10.793660, 78.768980),
-    'kudachi': (16.627840, 74.854080),
-    'seondha': (26.154220, 78.781200),
-    'kurduvādi': (18.093390, 75.415670),
-    'mattigiri': (12.697950, 77.808320),
-    'polasara': (19.693860, 84.814010),
-    'iroopara': (8.607470, 76.914940),
-    'narasingapuram': (11.603790, 78.577820),
-    'nakūr': (29.919640, 77.304380),
-    'palwal rural': (28.145550, 77.351320),
-    'pallikonda': (12.905180, 78.942700),
-    'asifābād': (19.358510, 79.284150),
-    'indargarh': (25.910900, 78.561930),
-    'sivagiri': (9.344610, 77.429110),
-    'vadakkanandal': (11.781700, 78.835400),
-    'ancharakandy': (11.884100, 75.485010),
-    'trikarpūr south': (12.116490, 75.185170),
-    'hukeri': (16.230820, 74.602440),
-    'todabhim': (26.916670, 76.816670),
-    'pehlādpur bāngar': (28.750580, 77.081000),
-    'dooru verinag': (33.559400, 75.232220),
-    'tiruchanur': (13.607270, 79.448640),
-    'kanhān': (21.228990, 79.239800),
-    'gopavaram': (14.784120, 78.572900),
-    'vattalkundu': (10.160690, 77.758830),
-    'dhamanagar': (20.916700, 86.450000),
-    'saidpur': (25.537490, 83.223780),
-    'tittagudi': (11.407170, 79.122160),
-    'phulpur': (25.548950, 82.089500),
-    'kunnatnād': (10.042920, 76.424060),
-    'jharoda mazra burāri': (28.730140, 77.209110),
-    'karanjiā': (21.762590, 85.973190),
-    'balarāmpur': (23.097140, 86.222920),
-    'aramboli': (8.249620, 77.521610),
-    'ubaidullāhganj': (22.998340, 77.586210),
-    'chitarpur': (23.572830, 85.653550),
-    'naraingarh': (30.477980, 77.128040),
-    'sāmbhar': (26.908060, 75.191370),
-    'vellūr': (8.626170, 76.830530),
-    'fatehnagar': (24.814940, 74.095040),
-    'raghunathpur': (23.538780, 86.673500),
-    'pariyāpuram': (11.016670, 75.866670),
-    'kasrāwad': (22.127450, 75.611010),
-    'lāthi': (21.723100, 71.388430),
-    'dugda': (23.745160, 86.171750),
-    'khirkiya': (22.167320, 76.861370),
-    'mudgal': (16.011910, 76.442030),
-    'curchorem': (15.263490, 74.108750),
-    'chorwād': (21.029470, 70.233020),
-    'madhira': (16.923290, 80.363080),
-    'kādiganpalli': (12.523180, 78.208600),
-    'akaltara': (22.024630, 82.426410),
-    'etmadpur': (27.235410, 78.198290),
-    'katghora': (22.502470, 82.542790),
-    'ponda': (15.403410, 74.015190),
-    'lohāra': (20.389830, 78.090270),
-    'mātābhānga': (26.341970, 89.215550),
-    'jaitāran': (26.204460, 73.936760),
-    'tāoru': (28.211730, 76.949840),
-    'lehragaga': (29.942650, 75.801440),
-    'jāmai': (22.196440, 78.591910),
-    'sholavandan': (10.021600, 77.960870),
-    'nāgod': (24.569240, 80.588090),
-    'khairāgarh': (21.418590, 80.979420),
-    'kurikuppi': (15.217580, 76.648730),
-    'ariyallur': (11.083280, 75.849040),
-    'pukhrāyān': (26.223750, 79.837390),
-    'rāman': (29.950450, 74.978520),
-    'bankāpur': (14.922950, 75.262210),
-    'godoli': (17.671780, 74.012890),
-    'baswa': (27.149550, 76.583450),
-    'rājmahal': (25.053030, 87.830480),
-    'nambol': (24.695570, 93.819740),
-    'tulsīpur': (27.533700, 82.416530),
-    'bikram': (25.447080, 84.862610),
-    'belūr': (13.165580, 75.865190),
-    'sānehwāl': (30.841340, 75.985470),
-    'sisauli': (30.142970, 77.259590),
-    'kanniyākumāri': (8.090080, 77.538410),
-    'senapparetti': (10.962510, 78.113240),
-    'naraura': (28.201470, 78.387230),
-    'kailāshahar': (24.331990, 92.003910),
-    'triparappu': (8.394790, 77.265880),
-    'deogarh': (21.538270, 84.733370),
-    'rātu': (23.420450, 85.214590),
-    'puthencruz': (9.977340, 76.410470),
-    'kurandvād': (16.683170, 74.588920),
-    'timurni': (22.371150, 77.227400),
-    'pachgaon': (16.660240, 74.227350),
-    'rahata': (19.716640, 74.481090),
-    'bhawānīgarh': (30.266850, 76.038540),
-    'suket': (24.646090, 76.041700),
-    'panniyannūr': (11.748590, 75.575580),
-    'ādanāttutekkumuri kizhakku': (9.079090, 76.513670),
-    'ankola': (14.660490, 74.304700),
-    'mariāhu': (25.604040, 82.603790),
-    'kilapavoor': (8.908620, 77.431120),
-    'rāmavarappādu': (16.520860, 80.680780),
-    'purwā': (26.457560, 80.774030),
-    'attimarappatti': (8.739880, 78.105340),
-    'dasnapur': (19.653990, 78.512130),
-    'badāmibāgh': (34.073810, 74.852760),
-    'lingiādīh': (22.077480, 82.176050),
-    'sahāwar': (27.796030, 78.833730),
-    'bhuban': (20.881970, 85.833340),
-    'nilakottai': (10.165000, 77.850240),
-    'sidhaulī': (27.282020, 80.834500),
-    'palavansathu': (12.893060, 79.134450),
-    'adra': (23.496680, 86.683630),
-    'sarapāka': (17.691290, 80.869980),
-    'bhānvad': (21.930530, 69.780810),
-    'someshwar': (13.491120, 75.066460),
-    'nārāinpur': (19.717940, 81.244370),
-    'nāmagiripettai': (11.455130, 78.268180),
-    'nāwa': (27.019500, 75.002260),
-    'peravurani': (10.290350, 79.201560),
-    'kathhāra': (23.763820, 85.884680),
-    'kathlāl': (22.898200, 72.992820),
-    'siwāna': (25.651540, 72.422430),
-    'kizhuparamba': (11.252610, 76.024370),
-    'palai': (9.713060, 76.683310),
-    'chhanerā': (21.960970, 76.694940),
-    'marakkanam': (12.192140, 79.941930),
-    'chhatrapur': (19.355740, 84.983590),
-    'bhinga': (27.702830, 81.934300),
-    'lauri': (25.139620, 80.001120),
-    'nalambūr': (13.086670, 80.170280),
-    'kuppam': (12.749310, 78.341890),
-    'kīl bhuvanagiri': (11.442160, 79.647630),
-    'saktī': (22.026620, 82.960910),
-    'karuvanthuruthy': (11.172070, 75.822600),
-    'kollivāyal': (11.499840, 76.481520),
-    'sancoale': (15.377940, 73.903520),
-    'polichalur': (12.989130, 80.141770),
-    'bhābhar': (24.071650, 71.597450),
-    'nowrozabad': (23.352190, 80.980600),
-    'laungowāl': (30.193930, 75.680890),
-    'chāchaura': (24.175830, 76.999570),
-    'ghulewadi': (19.603100, 74.193560),
-    'chandrakona': (22.733330, 87.516670),
-    'sangod': (24.927070, 76.286490),
-    'kherālu': (23.885340, 72.618690),
-    'farakka': (24.816670, 87.900000),
-    'mulavukad': (10.013600, 76.263060),
-    'mangalvedha': (17.510460, 75.447130),
-    'māniyūr': (11.552210, 75.650260),
-    'kantābānji': (20.467090, 82.920420),
-    'chalthan': (21.154210, 72.961410),
-    'jainagar': (26.590480, 86.137910),
-    'kopawor': (34.528560, 74.263960),
-    'sakri': (20.991040, 74.314750),
-    'dattāpur': (20.780750, 78.140700),
-    'umarsera': (20.371390, 78.123430),
-    'napāsar': (27.960590, 73.559130),
-    'shendurjana': (21.524880, 78.283500),
-    'pātūr': (20.460930, 76.937250),
-    'digboi': (27.393210, 95.618390),
-    'jirapur': (24.021400, 76.376400),
-    'kalleribhāgam': (9.053960, 76.558020),
-    'muthupet': (10.395050, 79.493530),
-    'dum duma': (27.568840, 95.556640),
-    'pāmpur': (34.015150, 74.918950),
-    'munderi': (11.930280, 75.445460),
-    'sūrajgarh': (28.310050, 75.732710),
-    'kadayal': (8.408340, 77.265750),
-    'kundli': (28.869130, 77.120610),
-    'bālāchor': (31.060620, 76.301660),
-    'pushkar': (26.490220, 74.552110),
-    'doda': (33.149160, 75.547460),
-    'karanpur': (29.840420, 73.455190),
-    'samthar': (25.843480, 78.906830),
-    'banat': (29.463550, 77.354780),
-    'dhekiajuli': (26.703670, 92.478080),
-    'māndalgarh': (25.194070, 75.072150),
-    'barāra': (30.214650, 77.040250),
-    'tammampatti': (11.441260, 78.488700),
-    'chamba': (32.555310, 76.126470),
-    'murādābād pahāri': (28.564560, 77.151260),
-    'mahādula': (21.252570, 79.081060),
-    'bānsdīh': (25.883770, 84.218270),
-    'srisailam project rfc township': (16.073310, 78.874120),
-    'bacheli': (18.684350, 81.268610),
-    'āsika': (19.611140, 84.659980),
-    'guruvāyūr': (10.594300, 76.041100),
-    'lālru': (30.491700, 76.798690),
-    'virugambakkam': (13.046320, 80.191310),
-    'chotila': (22.423470, 71.196410),
-    'vāsudevanallūr': (9.241710, 77.411770),
-    'kuju': (23.725360, 85.510230),
-    'padmanābhapuram': (8.244620, 77.325810),
-    'mandāwar': (29.486550, 78.127320),
-    'paippad': (9.424620, 76.584810),
-    'mahgawān': (26.494710, 78.615930),
-    'kondasamudram': (12.945520, 78.878780),
-    'bedi': (22.501430, 70.043630),
-    'tekāri': (24.942530, 84.842650),
-    'dindori': (22.941410, 81.079750),
-    'channagiri': (14.023990, 75.925770),
-    'kuzhithurai': (8.317920, 77.191920),
-    'kodamthuruth': (9.800620, 76.301530),
-    'ghātanji': (20.141830, 78.313330),
-    'naduvattam': (10.879950, 76.002000),
-    'chhāta': (27.723740, 77.508100),
-    'sanaur': (30.301820, 76.457860),
-    'reethapuram': (8.184300, 77.248050),
-    'kottappally': (11.612660, 75.661360),
-    'serchhīp': (23.293120, 92.846790),
-    'pudupattanam': (12.508550, 80.149760),
-    'telhāra': (21.026940, 76.838890),
-    'narkher': (21.472310, 78.534150),
-    'ajnāla': (31.844730, 74.762950),
-    'anthiyur': (11.575060, 77.590430),
-    'bisālgarh': (23.675950, 91.283250),
-    'dhulagari': (22.582130, 88.171000),
-    'talala': (21.054730, 70.529030),
-    'būndu': (23.160950, 85.590070),
-    'teliamura': (23.841740, 91.630300),
-    'devgadh bāriya': (22.705170, 73.908820),
-    'patharia': (23.899210, 79.193930),
-    'patnāgarh': (20.708330, 83.132630),
-    'kiraoli': (27.137680, 77.785160),
-    'bhānpura': (24.513000, 75.746900),
-    'perinjanam': (10.313280, 76.148470),
-    'anklav': (22.377380, 73.000720),
-    'abrama': (20.858650, 72.906480),
-    'bagulā': (23.336640, 88.641090),
-    'gunnaur': (28.239950, 78.439940),
-    'pālakkodu': (12.306960, 78.070220),
-    'sindi': (20.742380, 78.587100),
-    'chelora': (11.894940, 75.439590),
-    'rajpur': (21.940220, 75.136080),
-    'nāravārikuppam': (13.191330, 80.184730),
-    'marthandam': (8.308120, 77.221440),
-    'vinnamāla': (13.907380, 79.908550),
-    'sarauli': (28.494040, 79.091770),
-    'badnāwar': (23.021810, 75.232680),
-    'banga': (31.188740, 75.994950),
-    'heli mandi': (28.344940, 76.756940),
-    'chincholi': (17.465080, 77.418740),
-    'hungund': (16.062130, 76.058600),
-    'thaikkattussery': (9.771470, 76.343850),
-    'bangawan': (23.192590, 82.127200),
-    'kapasan': (24.889400, 74.316670),
-    'sālamedu': (11.908760, 79.491880),
-    'barpāli': (21.190050, 83.587210),
-    'gormi': (26.600290, 78.511880),
-    'begūn': (24.983330, 75.000000),
-    'lawngtlai': (22.532540, 92.899020),
-    'nandri': (26.311570, 73.100870),
-    'dhing': (26.467930, 92.473360),
-    'vadakarai kīl pidāgai': (9.040080, 77.274130),
-    'clement town': (30.263610, 78.008620),
-    'kaikalūr': (16.551540, 81.214000),
-    'akhnūr': (32.895500, 74.734860),
-    'alībāg': (18.648130, 72.875790),
-    'kāpren': (25.405290, 76.074310),
-    'muthukulam': (9.216800, 76.459200),
-    'bhadauni': (24.875440, 85.533690),
-    'alīpur': (28.798620, 77.133140),
-    'achampet': (16.398200, 78.637580),
-    'ghorabandha': (22.772400, 86.271090),
-    'koduvayur': (10.686740, 76.658790),
-    'sāmalāpuram': (11.072380, 77.197960),
-    'chākia': (26.415980, 85.046650),
-    'jining': (28.216330, 94.853890),
-    'bhanjanagar': (19.927190, 84.582010),
-    'vadāli': (23.942320, 73.037840),
-    'koppana agrahara': (12.855070, 77.667070),
-    'madattukkulam': (10.558690, 77.365970),
-    'gurmatkāl': (16.867730, 77.390880),
-    'dhāriwāl': (31.956160, 75.323860),
-    'patuvilāyi': (11.865610, 75.523270),
-    'talwandi sābo': (29.983790, 75.082030),
-    'dayal pur': (28.717530, 77.265080),
-    'jahāzpur': (25.619940, 75.276090),
-    'sāvda': (21.150540, 75.889380),
-    'vadakakarai': (10.166400, 76.201790),
-    'viratnagar': (27.435380, 76.182970),
-    'belsand': (26.443650, 85.400760),
-    'sāmpla': (28.777180, 76.771650),
-    'vasind': (19.408440, 73.262850),
-    'kishtwār': (33.313460, 75.767260),
-    'attibele': (12.778090, 77.772590),
-    'achhnera': (27.178260, 77.756740),
-    'bhikkiwind uttār': (31.349430, 74.702710),
-    'chillupār': (26.282210, 83.506400),
-    'tilpat': (28.465130, 77.332850),
-    'bijāwar': (24.623510, 79.489940),
-    'nellimarla': (18.156190, 83.447270),
-    'maham': (28.969120, 76.294950),
-    'maniar': (25.985460, 84.172330),
-    'yellāpur': (14.963700, 74.709290),
-    'keevallur': (11.897030, 75.530990),
-    'nangli': (31.686330, 74.887470),
-    'nīmāj': (26.149950, 74.000940),
-    'baud': (20.837730, 84.326180),
-    'tufānganj': (26.316880, 89.665490),
-    'korochi': (16.719170, 74.445100),
-    'pataudi': (28.325470, 76.778580),
-    'dhārūr': (18.820170, 76.109370),
-    'pariyāram': (12.058760, 75.324760),
-    'french rocks': (12.500940, 76.674160),
-    'ahīwāra': (21.357990, 81.417940),
-    'bāda': (26.064790, 75.021550),
-    'sarwar': (26.242520, 75.128750),
-    'edavilangu': (10.240260, 76.171000),
-    'jhālu': (29.336090, 78.226080),
-    'killannur': (10.599180, 76.218010),
-    'mundra': (22.839180, 69.721900),
-    'byndoor': (13.866670, 74.633330),
-    'chāpar': (26.272660, 90.445560),
-    'kondalampatti': (11.634530, 78.123690),
-    'bawāni khera': (28.949190, 76.031080),
-    'ālampālaiyam': (11.363530, 77.767730),
-    'umbri': (20.713730, 77.026390),
-    'wellington': (11.365520, 76.784420),
-    'hārij': (23.693560, 71.907000),
-    'raipur domana': (32.798440, 74.782650),
-    'settūr': (9.405640, 77.478410),
-    'waluj buzurg': (19.796320, 75.226480),
-    'penukonda': (14.082860, 77.594730),
-    'kotivakkam': (12.970160, 80.257690),
-    'kataiya': (26.568070, 84.083300),
-    'surajpur': (23.213470, 82.868360),
-    'nirmāli': (26.313970, 86.585370),
-    'puliyankannu': (12.939220, 79.307870),
-    'morwa': (22.904690, 73.839120),
-    'pāttyam': (11.792960, 75.564100),
-    'kaimori': (23.384650, 79.744200),
-    'pudussery west': (10.788020, 76.727880),
-    'mau aimma': (25.695150, 81.923360),
-    'chinnavādampatti': (11.061490, 76.983770),
-    'fālākāta': (26.519630, 89.204230),
-    'sūleswaranpatti': (10.638850, 77.008430),
-    'dhaurahra': (27.998140, 81.089750),
-    'maksi': (23.259990, 76.145670),
-    'annur': (11.236160, 77.105140),
-    'pulwama': (33.874050, 74.899550),
-    'sirumugai': (11.321370, 77.005210),
-    'singānuram': (18.822180, 79.501710),
-    'dergaon': (26.700000, 93.966670),
-    'cheppad': (9.234580, 76.473260),
-    'khowai': (24.079640, 91.599720),
-    'govardhan': (27.496580, 77.462630),
-    'saraipali': (21.315300, 83.006290),
-    'paravai': (9.964530, 78.066700),
-    'khalāri': (23.650630, 85.007440),
-    'rāya': (27.556070, 77.789720),
-    'sawar': (25.755740, 75.222920),
-    'pāmūru': (15.096330, 79.411740),
-    'powai': (19.116400, 72.904710),
-    'belonia': (23.251780, 91.454070),
-    'takhatpur': (22.129150, 81.869590),
-    'sullya': (12.561000, 75.387410),
-    'bhusawar': (27.038950, 77.048490),
-    'chunchupally': (17.523330, 80.604050),
-    'charthāwal': (29.546870, 77.594380),
-    'siswā bāzār': (27.146520, 83.758030),
-    'bīrpur': (26.508230, 87.011940),
-    'kandalloor': (9.175600, 76.471290),
-    'dhanaula': (30.282160, 75.573410),
-    'l.a.sagaram': (13.903410, 79.890550),
-    'sarigam ina': (20.288450, 72.850290),
-    'kanjiramkulam': (8.359830, 77.052530),
-    'anūppur': (23.103440, 81.690830),
-    'moirāng': (24.497500, 93.777910),
-    'nattappettai': (12.818710, 79.749250),
-    'bokajān': (26.021310, 93.779450),
-    'rānikhet': (29.640820, 79.432290),
-    'sirka': (23.645610, 85.433330),
-    'boriavi': (22.611240, 72.932830),
-    'aurād': (18.253970, 77.417610),
-    'sankaraperi': (8.838680, 78.105130),
-    'kulu': (31.958350, 77.108230),
-    'kalinjur': (12.953400, 79.133730),
-    'chetput': (12.463990, 79.348400),
-    'kolavallúr': (11.750700, 75.619880),
-    'sonāri': (27.024620, 95.016290),
-    'deoraniān': (28.629890, 79.476480),
-    'kolāras': (25.219280, 77.611670),
-    'chinna āndānkovil': (10.951100, 78.068100),
-    'raval': (21.919080, 69.481790),
-    'kannānkurichchi': (11.696910, 78.179410),
-    'kattanam': (9.176140, 76.563250),
-    'ghatkesar': (17.450810, 78.683660),
-    'borgaon': (20.722720, 78.603920),
-    'sendamangalam': (11.281110, 78.234160),
-    'chhāpar': (27.819000, 74.439360),
-    'udangudi': (8.429180, 78.029680),
-    'tirumeshi': (13.053390, 80.059980),
-    'kerūr': (16.013840, 75.546310),
-    'verukulambu': (8.295310, 77.293870),
-    'jhinjhāna': (29.521180, 77.224700),
-    'kumbhrāj': (24.373380, 77.048410),
-    'bareja': (22.848630, 72.591370),
-    'vadakku viravanallur': (8.697860, 77.519160),
-    'mokēri': (11.777590, 75.573090),
-    'samrāla': (30.836010, 76.193240),
-    'jūnāgarh': (19.859930, 82.933850),
-    'nalco': (20.865440, 85.182830),
-    'badi': (23.036670, 78.084170),
-    'charipara': (23.809140, 91.248050),
-    'resubelpara': (25.904040, 90.607470),
-    'kalmeshwar': (21.232190, 78.919880),
-    'jharoda kalān': (28.652640, 76.952080),
-    'lāwar khās': (29.110910, 77.777670),
-    'srīrāmnagar': (17.266520, 78.255440),
-    'pattan': (34.161250, 74.556340),
-    'mulakumūd': (8.268090, 77.285990),
-    'bāgbahra': (21.046060, 82.386400),
-    'vīsāvadar': (21.339540, 70.749660),
-    'pināhat': (26.884870, 78.376470),
-    'pennādam': (11.403890, 79.241560),
-    'nainwa': (25.771450, 75.849780),
-    'jānsath': (29.325020, 77.850440),
-    'santrampur': (23.190190, 73.895260),
-    'richha': (28.694670, 79.522840),
-    'bhāyāvadar': (21.855230, 70.247910),
-    'aistala': (23.180000, 88.580000),
-    'methukummal': (8.307460, 77.152050),
-    'gannavaram': (16.540920, 80.802130),
-    'amarpātan': (24.313710, 80.977030),
-    'sojītra': (22.538840, 72.719840),
-    'singur': (22.809170, 88.229440),
-    'singarāyakonda': (15.230460, 80.027940),
-    'punnayūr': (10.652070, 75.995120),
-    'konnūr': (16.201380, 74.748860),
-    'weir': (27.018600, 77.176360),
-    'narwar': (25.643900, 77.912900),
-    'wazīrganj': (28.211450, 79.056650),
-    'kakdwip': (21.879140, 88.191300),
-    'tamenglong': (25.016400, 93.485450),
-    'jalochi': (18.156620, 74.607080),
-    'maholi': (27.663680, 80.473710),
-    'kaimur': (24.054410, 80.613600),
-    'bilhaur': (26.843450, 80.063880),
-    'mangalam': (13.657540, 79.462580),
-    'raja pur khurd': (28.635170, 77.033030),
-    'khānāpur': (15.639690, 74.508470),
-    'tiruppālai': (9.977920, 78.132940),
-    'nimāparha': (20.057560, 86.004360),
-    'burhar': (23.214940, 81.532040),
-    'devadanapatti': (10.146730, 77.643900),
-    'laksar': (29.758700, 78.041480),
-    'vakkam': (8.684470, 76.767550),
-}
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Mapping
+
+import numpy as np
+
+ARTIFACT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "city_coords.bin")
+MAGIC = b"PMCITY01"
+# magic, city count, then byte lengths of the keys, display and alias tables
+HEADER = struct.Struct("<8sIIII")
+
+
+class CityData:
+    """Decoded city artifact: coordinate arrays (degrees) plus string tables."""
+
+    def __init__(self, lat, lon, keys, display, aliases):
+        self.lat = lat
+        self.lon = lon
+        self.keys = keys
+        self.display = display
+        self.aliases = aliases
+        self.index = {key: i for i, key in enumerate(keys)}
+
+
+def _split(blob: bytes) -> list:
+    return blob.decode("utf-8").split("\n") if blob else []
+
+
+def read_artifact(path: str = ARTIFACT_PATH) -> CityData:
+    """Memory-map a city artifact written by write_artifact."""
+    with open(path, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, n, keys_len, display_len, aliases_len = HEADER.unpack_from(buf, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a city coordinates artifact")
+    offset = HEADER.size
+    lat = np.frombuffer(buf, dtype="<f8", count=n, offset=offset)
+    lon = np.frombuffer(buf, dtype="<f8", count=n, offset=offset + 8 * n)
+    offset += 16 * n
+    keys = _split(buf[offset:offset + keys_len])
+    offset += keys_len
+    display = _split(buf[offset:offset + display_len])
+    offset += display_len
+    aliases = dict(line.split("\t", 1) for line in _split(buf[offset:offset + aliases_len]))
+    if len(keys) != n or len(display) != n:
+        raise ValueError(f"{path} is corrupt: expected {n} cities")
+    return CityData(lat, lon, keys, display, aliases)
+
+
+def write_artifact(path: str, rows: list, alias_keys: dict) -> None:
+    """Write rows ({'key', 'city', 'lat', 'lon'}) and alias -> key pairs to path."""
+    keys = "\n".join(r["key"] for r in rows).encode("utf-8")
+    display = "\n".join(r["city"] for r in rows).encode("utf-8")
+    aliases = "\n".join(f"{a}\t{k}" for a, k in alias_keys.items()).encode("utf-8")
+    lat = np.array([r["lat"] for r in rows], dtype="<f8")
+    lon = np.array([r["lon"] for r in rows], dtype="<f8")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(rows), len(keys), len(display), len(aliases)))
+        f.write(lat.tobytes())
+        f.write(lon.tobytes())
+        f.write(keys)
+        f.write(display)
+        f.write(aliases)
+
+
+_data = None
+_data_lock = threading.Lock()
+
+
+def _get_data() -> CityData:
+    global _data
+    if _data is None:
+        with _data_lock:
+            if _data is None:
+                _data = read_artifact()
+    return _data
+
+
+class _CityCoordinates(Mapping):
+    """Read-only view: city key -> (lat, lon), in artifact order."""
+
+    def __getitem__(self, key):
+        data = _get_data()
+        i = data.index[key]
+        return (float(data.lat[i]), float(data.lon[i]))
+
+    def get(self, key, default=None):
+        data = _get_data()
+        i = data.index.get(key)
+        return default if i is None else (float(data.lat[i]), float(data.lon[i]))
+
+    def __contains__(self, key):
+        return key in _get_data().index
+
+    def __iter__(self):
+        return iter(_get_data().keys)
+
+    def __len__(self):
+        return len(_get_data().keys)
+
+    def arrays(self):
+        """(lat, lon) float64 arrays in degrees, in iteration order (read-only)."""
+        data = _get_data()
+        return data.lat, data.lon
+
+
+class _DisplayNames(Mapping):
+    """Read-only view: city key -> original display name."""
+
+    def __getitem__(self, key):
+        data = _get_data()
+        return data.display[data.index[key]]
+
+    def __contains__(self, key):
+        return key in _get_data().index
+
+    def __iter__(self):
+        return iter(_get_data().keys)
+
+    def __len__(self):
+        return len(_get_data().keys)
+
+    def values(self):
+        return list(_get_data().display)
+
+
+class _AliasKeys(Mapping):
+    """Read-only view: normalized alias -> city key."""
+
+    def __getitem__(self, alias):
+        return _get_data().aliases[alias]
+
+    def __iter__(self):
+        return iter(_get_data().aliases)
+
+    def __len__(self):
+        return len(_get_data().aliases)
+
+
+CITY_COORDINATES: Mapping = _CityCoordinates()
+DISPLAY_NAMES: Mapping = _DisplayNames()
+ALIAS_KEYS: Mapping = _AliasKeys()
 
-DISPLAY_NAMES: dict[str, str] = {
-    'mumbai': 'Mumbai',
-    'delhi': 'Delhi',
-    'bengaluru': 'Bengaluru',
-    'hyderabad': 'Hyderabad',
-    'ahmedabad': 'Ahmedabad',
-    'chennai': 'Chennai',
-    'kolkata': 'Kolkata',
-    'surat': 'Surat',
-    'pune': 'Pune',
-    'jaipur': 'Jaipur',
-    'kanpur': 'Kanpur',
-    'navi mumbai': 'Navi Mumbai',
-    'lucknow': 'Lucknow',
-    'nagpur': 'Nagpur',
-    'coimbatore': 'Coimbatore',
-    'indore': 'Indore',
-    'thāne': 'Thāne',
-    'vadodara': 'Vadodara',
-    'bhopal': 'Bhopal',
-    'rasapūdipalem': 'Rasapūdipalem',
-    'pimpri-chinchwad': 'Pimpri-Chinchwad',
-    'patna': 'Patna',
-    'kallakurichi': 'Kallakurichi',
-    'ludhiana': 'Ludhiana',
-    'nashik': 'Nashik',
-    'madurai': 'Madurai',
-    'tirunelveli': 'Tirunelveli',
-    'agra': 'Agra',
-    'faridabad': 'Faridabad',
-    'rājkot': 'Rājkot',
-    'najafgarh': 'Najafgarh',
-    'jamshedpur': 'Jamshedpur',
-    'gorakhpur': 'Gorakhpur',
-    'pimpri': 'Pimpri',
-    'kalyān': 'Kalyān',
-    'dombivali': 'Dombivali',
-    'meerut': 'Meerut',
-    'virār': 'Virār',
-    'nowrangapur': 'Nowrangapur',
-    'srinagar': 'Srinagar',
-    'ghāziābād': 'Ghāziābād',
-    'dhanbad': 'Dhanbad',
-    'aurangabad': 'Aurangabad',
-    'varanasi': 'Varanasi',
-    'amritsar': 'Amritsar',
-    'vijayawada': 'Vijayawada',
-    'ranchi': 'Ranchi',
-    'jabalpur': 'Jabalpur',
-    'prayagraj': 'Prayagraj',
-    'visakhapatnam': 'Visakhapatnam',
-    'jodhpur': 'Jodhpur',
-    'gwalior': 'Gwalior',
-    'teni': 'Teni',
-    'howrah': 'Howrah',
-    'raipur': 'Raipur',
-    'tiruchirappalli': 'Tiruchirappalli',
-    'kota': 'Kota',
-    'shivaji nagar': 'Shivaji Nagar',
-    'sholapur': 'Sholapur',
-    'chandigarh': 'Chandigarh',
-    'tiruppur': 'Tiruppur',
-    'guwahati': 'Guwahati',
-    'hubballi': 'Hubballi',
-    'mysuru': 'Mysuru',
-    'salem': 'Salem',
-    'gurugram': 'Gurugram',
-    'bhubaneswar': 'Bhubaneswar',
-    'bhiwandi': 'Bhiwandi',
-    'jalandhar': 'Jalandhar',
-    'rohini': 'Rohini',
-    'kanayannur': 'Kanayannur',
-    'bhayandar': 'Bhayandar',
-    'narela': 'Narela',
-    'thiruvananthapuram': 'Thiruvananthapuram',
-    'alīgarh': 'Alīgarh',
-    'bareilly': 'Bareilly',
-    'morādābād': 'Morādābād',
-    'warangal': 'Warangal',
-    'guntur': 'Guntur',
-    'puducherry': 'Puducherry',
-    'amravati': 'Amravati',
-    'bikaner': 'Bikaner',
-    'kochi': 'Kochi',
-    'bhilai': 'Bhilai',
-    'cuttack': 'Cuttack',
-    'borivli': 'Borivli',
-    'bhavnagar': 'Bhavnagar',
-    'sāngli': 'Sāngli',
-    'jamnagar': 'Jamnagar',
-    'jammu': 'Jammu',
-    'bokāro': 'Bokāro',
-    'nanded': 'Nanded',
-    'kozhikode': 'Kozhikode',
-    'kolhāpur': 'Kolhāpur',
-    'nellore': 'Nellore',
-    'kalaburagi': 'Kalaburagi',
-    'ajmer': 'Ajmer',
-    'dehra dūn': 'Dehra Dūn',
-    'erode': 'Erode',
-    'durgapur': 'Durgapur',
-    'ulhasnagar': 'Ulhasnagar',
-    'siliguri': 'Siliguri',
-    'ujjain': 'Ujjain',
-    'bilimora': 'Bilimora',
-    'karol bāgh': 'Karol Bāgh',
-    'āsansol': 'Āsansol',
-    'mangaluru': 'Mangaluru',
-    'belagavi': 'Belagavi',
-    'sahāranpur': 'Sahāranpur',
-    'vellore': 'Vellore',
-    'bhātpāra': 'Bhātpāra',
-    'malegaon': 'Malegaon',
-    'gaya': 'Gaya',
-    'ambattur': 'Ambattur',
-    'jalgaon': 'Jalgaon',
-    'kurnool': 'Kurnool',
-    'rāmgundam': 'Rāmgundam',
-    'udaipur': 'Udaipur',
-    'maheshtala': 'Maheshtala',
-    'patiāla': 'Patiāla',
-    'shyamnagar': 'Shyamnagar',
-    'davangere': 'Davangere',
-    'akola': 'Akola',
-    'rajpur sonarpur': 'Rajpur Sonarpur',
-    'korba': 'Korba',
-    'jhānsi': 'Jhānsi',
-    'thoothukudi': 'Thoothukudi',
-    'ballari': 'Ballari',
-    'bhāgalpur': 'Bhāgalpur',
-    'agartala': 'Agartala',
-    'kākināda': 'Kākināda',
-    'latur': 'Latur',
-    'pānihāti': 'Pānihāti',
-    'rajamahendravaram': 'Rajamahendravaram',
-    'dhule': 'Dhule',
-    'rohtak': 'Rohtak',
-    'ahilyanagar': 'Ahilyanagar',
-    'kollam': 'Kollam',
-    'bilāspur': 'Bilāspur',
-    'bhilwara': 'Bhilwara',
-    'brahmapur': 'Brahmapur',
-    'muzaffarpur': 'Muzaffarpur',
-    'punāsa': 'Punāsa',
-    'muzaffarnagar': 'Muzaffarnagar',
-    'avadi': 'Avadi',
-    'kadapa': 'Kadapa',
-    'kukatpally': 'Kukatpally',
-    'kāmārhāti': 'Kāmārhāti',
-    'mathura': 'Mathura',
-    'chānda': 'Chānda',
-    'vijayapura': 'Vijayapura',
-    'shivamogga': 'Shivamogga',
-    'alwar': 'Alwar',
-    'shāhjānpur': 'Shāhjānpur',
-    'jūnāgadh': 'Jūnāgadh',
-    'new delhi': 'New Delhi',
-    'thrissur': 'Thrissur',
-    'nizāmābād': 'Nizāmābād',
-    'tumkūr': 'Tumkūr',
-    'parbhani': 'Parbhani',
-    'hisar': 'Hisar',
-    'fīrozābād': 'Fīrozābād',
-    'kulti': 'Kulti',
-    'karnāl': 'Karnāl',
-    'barddhamān': 'Barddhamān',
-    'gundupālaiyam': 'Gundupālaiyam',
-    'bārāsat': 'Bārāsat',
-    'mulugu': 'Mulugu',
-    'bihār sharīf': 'Bihār Sharīf',
-    'bāli': 'Bāli',
-    'rāmpur': 'Rāmpur',
-    'darbhanga': 'Darbhanga',
-    'panipat': 'Panipat',
-    'tirupati': 'Tirupati',
-    'greater noida': 'Greater Noida',
-    'noida': 'Noida',
-    'aizawl': 'Aizawl',
-    'gandhinagar': 'Gandhinagar',
-    'dindigul': 'Dindigul',
-    'thanjavur': 'Thanjavur',
-    'karīmnagar': 'Karīmnagar',
-    'dewas': 'Dewas',
-    'sonīpat': 'Sonīpat',
-    'ichalkaranji': 'Ichalkaranji',
-    'bathinda': 'Bathinda',
-    'jālna': 'Jālna',
-    'kirāri sulemānnagar': 'Kirāri Sulemānnagar',
-    'satna': 'Satna',
-    'purnia': 'Purnia',
-    'imphal': 'Imphal',
-    'saugor': 'Saugor',
-    'kushinagar': 'Kushinagar',
-    'rourkela': 'Rourkela',
-    'durg': 'Durg',
-    'anantapur': 'Anantapur',
-    'ratlām': 'Ratlām',
-    'rānipet': 'Rānipet',
-    'lal bahadur nagar': 'Lal Bahadur Nagar',
-    'arrah': 'Arrah',
-    'baranagar': 'Baranagar',
-    'gajuwaka': 'Gajuwaka',
-    'etāwah': 'Etāwah',
-    'ambarnath': 'Ambarnath',
-    'naihāti': 'Naihāti',
-    'bharatpur': 'Bharatpur',
-    'begusarai': 'Begusarai',
-    'tiruvottiyūr': 'Tiruvottiyūr',
-    'gāndhīdhām': 'Gāndhīdhām',
-    'mau': 'Mau',
-    'sīkar': 'Sīkar',
-    'ramagundam': 'Ramagundam',
-    'hāpur': 'Hāpur',
-    'farrukhābād': 'Farrukhābād',
-    'alappuzha': 'Alappuzha',
-    'katihar': 'Katihar',
-    'sri ganganagar': 'Sri Ganganagar',
-    'rewa': 'Rewa',
-    'uluberiya': 'Uluberiya',
-    'sivakasi': 'Sivakasi',
-    'karur': 'Karur',
-    'rāichūr': 'Rāichūr',
-    'pallāvaram': 'Pallāvaram',
-    'ooty': 'Ooty',
-    'pāli': 'Pāli',
-    'hosūr': 'Hosūr',
-    'vizianagaram': 'Vizianagaram',
-    'shrīrāmpur': 'Shrīrāmpur',
-    'quthbullapur': 'Quthbullapur',
-    'nadiād': 'Nadiād',
-    'nāgercoil': 'Nāgercoil',
-    'karāwalnagar': 'Karāwalnagar',
-    'mango': 'Mango',
-    'gosāba': 'Gosāba',
-    'murwāra': 'Murwāra',
-    'kanchipuram': 'Kanchipuram',
-    'singrauli': 'Singrauli',
-    'mirzāpur': 'Mirzāpur',
-    'kharagpur': 'Kharagpur',
-    'eluru': 'Eluru',
-    'rāniganj': 'Rāniganj',
-    'yamuna nagar': 'Yamuna Nagar',
-    'raurkela industrial township': 'Raurkela Industrial Township',
-    'bidar': 'Bidar',
-    'munger': 'Munger',
-    'nandyāl': 'Nandyāl',
-    'panchkula': 'Panchkula',
-    'burhānpur': 'Burhānpur',
-    'morvi': 'Morvi',
-    'anand': 'Anand',
-    'ongole': 'Ongole',
-    'hosapete': 'Hosapete',
-    'nāngloi jāt': 'Nāngloi Jāt',
-    'secunderabad': 'Secunderabad',
-    'deoghar': 'Deoghar',
-    'chāpra': 'Chāpra',
-    'khandwa': 'Khandwa',
-    'puri': 'Puri',
-    'morena': 'Morena',
-    'gyānpur': 'Gyānpur',
-    'bulandshahr': 'Bulandshahr',
-    'bhind': 'Bhind',
-    'bhālswa jahangirpur': 'Bhālswa Jahangirpur',
-    'khammam': 'Khammam',
-    'sambhal': 'Sambhal',
-    'bhiwāni': 'Bhiwāni',
-    'panvel': 'Panvel',
-    'ambāla': 'Ambāla',
-    'kumarapalayam': 'Kumarapalayam',
-    'machilīpatnam': 'Machilīpatnam',
-    'mahesāna': 'Mahesāna',
-    'mahbūbnagar': 'Mahbūbnagar',
-    'sambalpur': 'Sambalpur',
-    'bhusawal': 'Bhusawal',
-    'raebareli': 'Raebareli',
-    'haridwar': 'Haridwar',
-    'phusro': 'Phusro',
-    'adoni': 'Adoni',
-    'sūjāngarh': 'Sūjāngarh',
-    'sirsa': 'Sirsa',
-    'dinapur nizamat': 'Dinapur Nizamat',
-    'bahraigh': 'Bahraigh',
-    'kāraikkudi': 'Kāraikkudi',
-    'sultan pur majra': 'Sultan Pur Majra',
-    'guna': 'Guna',
-    'chandannagar': 'Chandannagar',
-    'baharampur': 'Baharampur',
-    'shahuwadi': 'Shahuwadi',
-    'madanapalle': 'Madanapalle',
-    'shivpuri': 'Shivpuri',
-    'surendranagar': 'Surendranagar',
-    'neyveli': 'Neyveli',
-    'silchar': 'Silchar',
-    'proddatūr': 'Proddatūr',
-    'hugli': 'Hugli',
-    'hashtsāl': 'Hashtsāl',
-    'amroha': 'Amroha',
-    'chhindwāra': 'Chhindwāra',
-    'tambaram': 'Tambaram',
-    'bhetia': 'Bhetia',
-    'pathānkot': 'Pathānkot',
-    'badlapur': 'Badlapur',
-    'cuddalore': 'Cuddalore',
-    'shimla': 'Shimla',
-    'gadag-betageri': 'Gadag-Betageri',
-    'gadag': 'Gadag',
-    'verāval': 'Verāval',
-    'navsari': 'Navsari',
-    'bahadurgarh': 'Bahadurgarh',
-    'haldia': 'Haldia',
-    'rāiganj': 'Rāiganj',
-    'malda': 'Malda',
-    'jaunpur': 'Jaunpur',
-    'deoli': 'Deoli',
-    'bharūch': 'Bharūch',
-    'hoshiārpur': 'Hoshiārpur',
-    'jīnd': 'Jīnd',
-    'kumbakonam': 'Kumbakonam',
-    'mohali': 'Mohali',
-    'fatehpur': 'Fatehpur',
-    'tonk': 'Tonk',
-    'udupi': 'Udupi',
-    'thenali': 'Thenali',
-    'loni': 'Loni',
-    'sītāpur': 'Sītāpur',
-    'alandur': 'Alandur',
-    'bhadrāvati': 'Bhadrāvati',
-    'vapi': 'Vapi',
-    'moga': 'Moga',
-    'rāj-nāndgaon': 'Rāj-Nāndgaon',
-    'robertsonpet': 'Robertsonpet',
-    'unnāo': 'Unnāo',
-    'budaun': 'Budaun',
-    'madhyamgram': 'Madhyamgram',
-    'chittoor': 'Chittoor',
-    'jāmuria': 'Jāmuria',
-    'jaigaon': 'Jaigaon',
-    'batāla': 'Batāla',
-    'orai': 'Orai',
-    'saharsa': 'Saharsa',
-    'vidisha': 'Vidisha',
-    'hanumāngarh': 'Hanumāngarh',
-    'thānesar': 'Thānesar',
-    'hassan': 'Hassan',
-    'kishangarh': 'Kishangarh',
-    'dalūpura': 'Dalūpura',
-    'rudrapur': 'Rudrapur',
-    'nalgonda': 'Nalgonda',
-    'hazāribāgh': 'Hazāribāgh',
-    'medinīpur': 'Medinīpur',
-    'bālurghāt': 'Bālurghāt',
-    'fyzābād': 'Fyzābād',
-    'dinapore': 'Dinapore',
-    'porbandar': 'Porbandar',
-    'bānda': 'Bānda',
-    'hindupur': 'Hindupur',
-    'beāwar': 'Beāwar',
-    'anantnag': 'Anantnag',
-    'serilingampalle': 'Serilingampalle',
-    'raigarh': 'Raigarh',
-    'malkajgiri': 'Malkajgiri',
-    'shāntipur': 'Shāntipur',
-    'bhuj': 'Bhuj',
-    'bārākpur': 'Bārākpur',
-    'hājīpur': 'Hājīpur',
-    'sasarām': 'Sasarām',
-    'bhimavaram': 'Bhimavaram',
-    'beed': 'Beed',
-    'burāri': 'Burāri',
-    'krishnanagar': 'Krishnanagar',
-    'chitradurga': 'Chitradurga',
-    'dibrugarh': 'Dibrugarh',
-    'abohar': 'Abohar',
-    'tiruvannamalai': 'Tiruvannamalai',
-    'kaithal': 'Kaithal',
-    'balasore': 'Balasore',
-    'godhra': 'Godhra',
-    'shillong': 'Shillong',
-    'rewāri': 'Rewāri',
-    'chhatarpur': 'Chhatarpur',
-    'mandsaur': 'Mandsaur',
-    'chas': 'Chas',
-    'pālanpur': 'Pālanpur',
-    'lakhīmpur': 'Lakhīmpur',
-    'valsād': 'Valsād',
-    'damoh': 'Damoh',
-    'haldwani': 'Haldwani',
-    'hābra': 'Hābra',
-    'kolār': 'Kolār',
-    'srikakulam': 'Srikakulam',
-    'mandya': 'Mandya',
-    'madhurampur dehri': 'Madhurampur Dehri',
-    'kānchrāpāra': 'Kānchrāpāra',
-    'dimāpur': 'Dimāpur',
-    'māler kotla': 'Māler Kotla',
-    'siwān': 'Siwān',
-    'kalol': 'Kalol',
-    'bānkura': 'Bānkura',
-    'pātan': 'Pātan',
-    'gondā city': 'Gondā City',
-    'dhaulpur': 'Dhaulpur',
-    'gondiā': 'Gondiā',
-    'palakkad': 'Palakkad',
-    'bettiah': 'Bettiah',
-    'palwal': 'Palwal',
-    'pīlibhīt': 'Pīlibhīt',
-    'rajapalayam': 'Rajapalayam',
-    'botad': 'Botad',
-    'deoria': 'Deoria',
-    'nimach': 'Nimach',
-    'khardah': 'Khardah',
-    'yavatmāl': 'Yavatmāl',
-    'hālīsahar': 'Hālīsahar',
-    'khanna': 'Khanna',
-    'titāgarh': 'Titāgarh',
-    'mustafābād': 'Mustafābād',
-    'hāthras': 'Hāthras',
-    'jorhat': 'Jorhat',
-    'lalitpur': 'Lalitpur',
-    'guntakal': 'Guntakal',
-    'pithampur': 'Pithampur',
-    'mothīhāri': 'Mothīhāri',
-    'kanhangad': 'Kanhangad',
-    'jagdalpur': 'Jagdalpur',
-    'jagādhri': 'Jagādhri',
-    'dārjiling': 'Dārjiling',
-    'kurichchi': 'Kurichchi',
-    'dam dam': 'Dam Dam',
-    'hardoī': 'Hardoī',
-    'puruliya': 'Puruliya',
-    'dharmavaram': 'Dharmavaram',
-    'gokalpur': 'Gokalpur',
-    'bhadreswar': 'Bhadreswar',
-    'nagaon': 'Nagaon',
-    'vejalpur': 'Vejalpur',
-    'chikmagalūr': 'Chikmagalūr',
-    'bhadrak': 'Bhadrak',
-    'sawai madhopur': 'Sawai Madhopur',
-    'ambikāpur': 'Ambikāpur',
-    'mandoli': 'Mandoli',
-    'satara': 'Satara',
-    'chūru': 'Chūru',
-    'gangāpur': 'Gangāpur',
-    'madhavaram': 'Madhavaram',
-    'dohad': 'Dohad',
-    'barshi': 'Barshi',
-    'ādilābād': 'Ādilābād',
-    'jhunjhunūn': 'Jhunjhunūn',
-    'jetpur': 'Jetpur',
-    'uppal kalan': 'Uppal Kalan',
-    'gudivāda': 'Gudivāda',
-    'bārān': 'Bārān',
-    'narmadapuram': 'Narmadapuram',
-    'amreli': 'Amreli',
-    'pudukkottai': 'Pudukkottai',
-    'narasaraopet': 'Narasaraopet',
-    'rishra': 'Rishra',
-    'baripāda': 'Baripāda',
-    'muktsar': 'Muktsar',
-    'azamgarh': 'Azamgarh',
-    'barnāla': 'Barnāla',
-    'yelahanka': 'Yelahanka',
-    'chittorgarh': 'Chittorgarh',
-    'tinsukia': 'Tinsukia',
-    'khargone': 'Khargone',
-    'baidyabāti': 'Baidyabāti',
-    'bastī': 'Bastī',
-    'gangavati': 'Gangavati',
-    'ambur': 'Ambur',
-    'giridih': 'Giridih',
-    'wardha': 'Wardha',
-    'chanduasi': 'Chanduasi',
-    'bagaha': 'Bagaha',
-    'achalpur': 'Achalpur',
-    'gondal': 'Gondal',
-    'dharashiv': 'Dharashiv',
-    'port blair': 'Port Blair',
-    'bagalkot': 'Bagalkot',
-    'suriāpet': 'Suriāpet',
-    'bangaon': 'Bangaon',
-    'ashoknagar kalyangarh': 'Ashoknagar Kalyangarh',
-    'deesa': 'Deesa',
-    'navadwīp': 'Navadwīp',
-    'nandurbar': 'Nandurbar',
-    'sultānpur': 'Sultānpur',
-    'delhi cantonment': 'Delhi Cantonment',
-    'firozpur': 'Firozpur',
-    'sehore': 'Sehore',
-    'bānsbāria': 'Bānsbāria',
-    'tadpatri': 'Tadpatri',
-    'tādepallegūdem': 'Tādepallegūdem',
-    'jalpāiguri': 'Jalpāiguri',
-    'mangalagiri': 'Mangalagiri',
-    'ranebennur': 'Ranebennur',
-    'khurja': 'Khurja',
-    'kishanganj': 'Kishanganj',
-    'ponnāni': 'Ponnāni',
-    'hindaun': 'Hindaun',
-    'jamālpur': 'Jamālpur',
-    'nāgaur': 'Nāgaur',
-    'ambala sadar': 'Ambala Sadar',
-    'bhiwadi': 'Bhiwadi',
-    'būndi': 'Būndi',
-    'miryalaguda': 'Miryalaguda',
-    'soyībug': 'Soyībug',
-    'jagtiāl': 'Jagtiāl',
-    'roorkee': 'Roorkee',
-    'udgīr': 'Udgīr',
-    'nagda': 'Nagda',
-    'betūl': 'Betūl',
-    'jahānābād': 'Jahānābād',
-    'kashipur': 'Kashipur',
-    'ghazīpur': 'Ghazīpur',
-    'amaravati': 'Amaravati',
-    'nagapattinam': 'Nagapattinam',
-    'buxar': 'Buxar',
-    'mormugao': 'Mormugao',
-    'seoni': 'Seoni',
-    'hinganghāt': 'Hinganghāt',
-    'dhamtari': 'Dhamtari',
-    'chilakalūrupet': 'Chilakalūrupet',
-    'malappuram': 'Malappuram',
-    'bānswāra': 'Bānswāra',
-    'chirmiri': 'Chirmiri',
-    'itārsi': 'Itārsi',
-    'vasco da gama': 'Vasco da Gama',
-    'gangtok': 'Gangtok',
-    'datia': 'Datia',
-    'phagwāra': 'Phagwāra',
-    'airoli': 'Airoli',
-    'luckeesarai': 'Luckeesarai',
-    'shikohābād': 'Shikohābād',
-    'kāsganj': 'Kāsganj',
-    'khambhāt': 'Khambhāt',
-    'kohima': 'Kohima',
-    'pandharpur': 'Pandharpur',
-    'kapurthala town': 'Kapurthala Town',
-    'mahuva': 'Mahuva',
-    'silvassa': 'Silvassa',
-    'balāngīr': 'Balāngīr',
-    'mughal sarāi': 'Mughal Sarāi',
-    'nawāda': 'Nawāda',
-    'bhilai charoda': 'Bhilai Charoda',
-    'shāmli': 'Shāmli',
-    'jharsuguda': 'Jharsuguda',
-    'sādatpur gujran': 'Sādatpur Gujran',
-    'chalisgaon': 'Chalisgaon',
-    'villupuram': 'Villupuram',
-    'amalner': 'Amalner',
-    'tellicherry': 'Tellicherry',
-    'manjeri': 'Manjeri',
-    'birgaon': 'Birgaon',
-    'bārmer': 'Bārmer',
-    'pūth kalān': 'Pūth Kalān',
-    'kuniyamuttūr': 'Kuniyamuttūr',
-    'sardārshahr': 'Sardārshahr',
-    'sānand': 'Sānand',
-    'sāhibganj': 'Sāhibganj',
-    'paramagudi': 'Paramagudi',
-    'zerakpur': 'Zerakpur',
-    'tiruchengode': 'Tiruchengode',
-    'closepet': 'Closepet',
-    'emmiganūr': 'Emmiganūr',
-    'vaniyambadi': 'Vaniyambadi',
-    'kovilpatti': 'Kovilpatti',
-    'parli vaijnāth': 'Parli Vaijnāth',
-    'mainpuri': 'Mainpuri',
-    'khāmgaon': 'Khāmgaon',
-    'makrāna': 'Makrāna',
-    'allinagaram': 'Allinagaram',
-    'gudiyatham': 'Gudiyatham',
-    'dhār': 'Dhār',
-    'baraut': 'Baraut',
-    'kalyani': 'Kalyani',
-    'doddaballapura': 'Doddaballapura',
-    'chīrāla': 'Chīrāla',
-    'akot': 'Akot',
-    'gharroli': 'Gharroli',
-    'rajpura': 'Rajpura',
-    'ballarpur': 'Ballarpur',
-    'kot kapūra': 'Kot Kapūra',
-    'bhandāra': 'Bhandāra',
-    'molārband': 'Molārband',
-    'rayachoti': 'Rayachoti',
-    'kadayanallur': 'Kadayanallur',
-    'valparai': 'Valparai',
-    'pollachi': 'Pollachi',
-    'kāvali': 'Kāvali',
-    'roha': 'Roha',
-    'mancherial': 'Mancherial',
-    'avaniyāpuram': 'Avaniyāpuram',
-    'murādnagar': 'Murādnagar',
-    'ankleshwar': 'Ankleshwar',
-    'kadiri': 'Kadiri',
-    'shahdol': 'Shahdol',
-    'mahobā': 'Mahobā',
-    'rāmgarh': 'Rāmgarh',
-    'contai': 'Contai',
-    'sangrūr': 'Sangrūr',
-    'nirmal': 'Nirmal',
-    'deoband': 'Deoband',
-    'neyyāttinkara': 'Neyyāttinkara',
-    'tāndā': 'Tāndā',
-    'jhumri telaiya': 'Jhumri Telaiya',
-    'aruppukkottai': 'Aruppukkottai',
-    'farīdkot': 'Farīdkot',
-    'madgaon': 'Madgaon',
-    'velampālaiyam': 'Velampālaiyam',
-    'jamūī': 'Jamūī',
-    'anjār': 'Anjār',
-    'paralakhemundi': 'Paralakhemundi',
-    'jharia': 'Jharia',
-    'kāraikāl': 'Kāraikāl',
-    'kāmthi': 'Kāmthi',
-    'hānsi': 'Hānsi',
-    'mayiladuthurai': 'Mayiladuthurai',
-    'anakapalle': 'Anakapalle',
-    'maduravoyal': 'Maduravoyal',
-    'sārni': 'Sārni',
-    'dausa': 'Dausa',
-    'parādīp garh': 'Parādīp Garh',
-    'hingoli': 'Hingoli',
-    'bāruni': 'Bāruni',
-    'jeypore': 'Jeypore',
-    'bijnor': 'Bijnor',
-    'dhoraji': 'Dhoraji',
-    'vīrappanchathiram': 'Vīrappanchathiram',
-    'bālāghāt': 'Bālāghāt',
-    'udhampur': 'Udhampur',
-    'najībābād': 'Najībābād',
-    'idaiyarpālaiyam': 'Idaiyarpālaiyam',
-    'harihar': 'Harihar',
-    'chilla soroda bāngar': 'Chilla Soroda Bāngar',
-    'sirsilla': 'Sirsilla',
-    'karauli': 'Karauli',
-    'mānsa': 'Mānsa',
-    'jangipur': 'Jangipur',
-    'gobindgarh': 'Gobindgarh',
-    'saunda': 'Saunda',
-    'maraimalainagar': 'Maraimalainagar',
-    'ashoknagar': 'Ashoknagar',
-    'phulwari sharif': 'Phulwari Sharif',
-    'mhow': 'Mhow',
-    'malout': 'Malout',
-    'kadi': 'Kadi',
-    'vijalpor': 'Vijalpor',
-    'palakollu': 'Palakollu',
-    'himatnagar': 'Himatnagar',
-    'dholka': 'Dholka',
-    'kotkapura': 'Kotkapura',
-    'bargarh': 'Bargarh',
-    'kharghar': 'Kharghar',
-    'kairāna': 'Kairāna',
-    'brajarajnagar': 'Brajarajnagar',
-    'kāmāreddi': 'Kāmāreddi',
-    'palwancha': 'Palwancha',
-    'manmād': 'Manmād',
-    'srikalahasti': 'Srikalahasti',
-    'kottagūdem': 'Kottagūdem',
-    'nawābganj': 'Nawābganj',
-    'gokak': 'Gokak',
-    'tīkamgarh': 'Tīkamgarh',
-    'arakkonam': 'Arakkonam',
-    'arāria': 'Arāria',
-    'koch bihār': 'Koch Bihār',
-    'kharakvasla': 'Kharakvasla',
-    'bhadohi': 'Bhadohi',
-    'kātoya': 'Kātoya',
-    'medininagar': 'Medininagar',
-    'wāshīm': 'Wāshīm',
-    'bagbera': 'Bagbera',
-    'savarkundla': 'Savarkundla',
-    'basoda': 'Basoda',
-    'tanuku': 'Tanuku',
-    'gurdaspur': 'Gurdaspur',
-    'edattala': 'Edattala',
-    'bodhan': 'Bodhan',
-    'balrāmpur': 'Balrāmpur',
-    'bāramūla': 'Bāramūla',
-    'karwar': 'Karwar',
-    'dhuliān': 'Dhuliān',
-    'rabkavi-banhatti': 'Rabkavi-Banhatti',
-    'mawāna': 'Mawāna',
-    'shirpur': 'Shirpur',
-    'budge budge': 'Budge Budge',
-    'kundla': 'Kundla',
-    'visnagar': 'Visnagar',
-    'kannauj': 'Kannauj',
-    'khajoori khas': 'Khajoori Khas',
-    'neelankarai': 'Neelankarai',
-    'nagīna': 'Nagīna',
-    'badagara': 'Badagara',
-    'fazilka': 'Fazilka',
-    'ratnagiri': 'Ratnagiri',
-    'keshod': 'Keshod',
-    'konnagar': 'Konnagar',
-    'chintamani': 'Chintamani',
-    'pammal': 'Pammal',
-    'sindhnūr': 'Sindhnūr',
-    'madhubani': 'Madhubani',
-    'bodināyakkanūr': 'Bodināyakkanūr',
-    'khadki': 'Khadki',
-    'dhrāngadhra': 'Dhrāngadhra',
-    'tezpur': 'Tezpur',
-    'srivilliputhur': 'Srivilliputhur',
-    'benipur': 'Benipur',
-    'pāloncha': 'Pāloncha',
-    'jaora': 'Jaora',
-    'tura': 'Tura',
-    'gūdūr': 'Gūdūr',
-    'narnaul': 'Narnaul',
-    'balotra': 'Balotra',
-    'kharar': 'Kharar',
-    'yadgir': 'Yadgir',
-    'harda': 'Harda',
-    'pilkhua': 'Pilkhua',
-    'ambājogāi': 'Ambājogāi',
-    'kāpas herd': 'Kāpas Herd',
-    'bela': 'Bela',
-    'rabkavi': 'Rabkavi',
-    'bawāna': 'Bawāna',
-    'shāhābād': 'Shāhābād',
-    'virudhachalam': 'Virudhachalam',
-    'chāndpur': 'Chāndpur',
-    'kāsipālaiyam': 'Kāsipālaiyam',
-    'sikandarābād': 'Sikandarābād',
-    'virudunagar': 'Virudunagar',
-    'pattukkottai': 'Pattukkottai',
-    'pusad': 'Pusad',
-    'tindivanam': 'Tindivanam',
-    'chopda': 'Chopda',
-    'taliparamba': 'Taliparamba',
-    'sangāreddi': 'Sangāreddi',
-    'pālghar': 'Pālghar',
-    'dharapuram': 'Dharapuram',
-    'payyanur': 'Payyanur',
-    'sheopur': 'Sheopur',
-    'channapatna': 'Channapatna',
-    'koyilandy': 'Koyilandy',
-    'farīdpur': 'Farīdpur',
-    'barauni': 'Barauni',
-    'krishnagiri': 'Krishnagiri',
-    'sopur': 'Sopur',
-    'rāyagada': 'Rāyagada',
-    'zahirābād': 'Zahirābād',
-    'khopoli': 'Khopoli',
-    'ratangarh': 'Ratangarh',
-    'mārkāpur': 'Mārkāpur',
-    'kalamassery': 'Kalamassery',
-    'bolpur': 'Bolpur',
-    'panjim': 'Panjim',
-    'rānāghāt': 'Rānāghāt',
-    'fatehābād': 'Fatehābād',
-    'bāpatla': 'Bāpatla',
-    'beypore': 'Beypore',
-    'koppal': 'Koppal',
-    'badvel': 'Badvel',
-    'dādri': 'Dādri',
-    'thenkasi': 'Thenkasi',
-    'suratgarh': 'Suratgarh',
-    'auraiya': 'Auraiya',
-    'palani': 'Palani',
-    'nallūr': 'Nallūr',
-    'chamrajnagar': 'Chamrajnagar',
-    'mīthepur': 'Mīthepur',
-    'māngrol': 'Māngrol',
-    'basavakalyan': 'Basavakalyan',
-    'pul pehlad': 'Pul Pehlad',
-    'chāībāsa': 'Chāībāsa',
-    'tripunittura': 'Tripunittura',
-    'shājāpur': 'Shājāpur',
-    'mettupalayam': 'Mettupalayam',
-    'sunām': 'Sunām',
-    'bhawānipatna': 'Bhawānipatna',
-    'ziauddin pur': 'Ziauddin Pur',
-    'jamkhandi': 'Jamkhandi',
-    'basmat': 'Basmat',
-    'taj pul': 'Taj Pul',
-    'kayamkulam': 'Kayamkulam',
-    'dharmapuri': 'Dharmapuri',
-    'bīsalpur': 'Bīsalpur',
-    'attili': 'Attili',
-    'cumbum': 'Cumbum',
-    'munnar': 'Munnar',
-    'panipat taraf makhdum zadgan': 'Panipat Taraf Makhdum Zadgan',
-    'nābha': 'Nābha',
-    'bihāt': 'Bihāt',
-    'samāstipur': 'Samāstipur',
-    'kāranja': 'Kāranja',
-    'sītāmarhi': 'Sītāmarhi',
-    'rājsamand': 'Rājsamand',
-    'malkāpur': 'Malkāpur',
-    'modāsa': 'Modāsa',
-    'jaisalmer': 'Jaisalmer',
-    'buldāna': 'Buldāna',
-    'dhenkānāl': 'Dhenkānāl',
-    'urun-islāmpur': 'Urun-Islāmpur',
-    'gopālganj': 'Gopālganj',
-    'bongaigaon': 'Bongaigaon',
-    'sangamner': 'Sangamner',
-    'hāveri': 'Hāveri',
-    'mannargudi': 'Mannargudi',
-    'jhālāwār': 'Jhālāwār',
-    'tarn taran': 'Tarn Taran',
-    'siddipet': 'Siddipet',
-    'bellampalli': 'Bellampalli',
-    'barbil': 'Barbil',
-    'koratla': 'Koratla',
-    'rishīkesh': 'Rishīkesh',
-    'goyerkāta': 'Goyerkāta',
-    'mandamarri': 'Mandamarri',
-    'puliyankudi': 'Puliyankudi',
-    'palāsa': 'Palāsa',
-    'gohāna': 'Gohāna',
-    'pulivendla': 'Pulivendla',
-    'chengalpattu': 'Chengalpattu',
-    'wadgaon kolhati': 'Wadgaon Kolhati',
-    'lādnūn': 'Lādnūn',
-    'supaul': 'Supaul',
-    'gangārāmpur': 'Gangārāmpur',
-    'ramanathapuram': 'Ramanathapuram',
-    'jagraon': 'Jagraon',
-    'sinnar': 'Sinnar',
-    'kopargaon': 'Kopargaon',
-    'alīpur duār': 'Alīpur Duār',
-    'tandur': 'Tandur',
-    'khatauli': 'Khatauli',
-    'vīrarāghavapuram': 'Vīrarāghavapuram',
-    'siuri': 'Siuri',
-    'bīna': 'Bīna',
-    'pālitāna': 'Pālitāna',
-    'chaumu': 'Chaumu',
-    'hālol': 'Hālol',
-    'kodār': 'Kodār',
-    'bāngarda chhota': 'Bāngarda Chhota',
-    'tādepalle': 'Tādepalle',
-    'tirupattur': 'Tirupattur',
-    'chinnachowk': 'Chinnachowk',
-    'bishnupur': 'Bishnupur',
-    'āmūr': 'Āmūr',
-    'baheri': 'Baheri',
-    'nawalgarh': 'Nawalgarh',
-    'ānaiyūr': 'Ānaiyūr',
-    'kunnamkulam': 'Kunnamkulam',
-    'rāghogarh': 'Rāghogarh',
-    'tohāna': 'Tohāna',
-    'jatani': 'Jatani',
-    'arni': 'Arni',
-    'chik ballāpur': 'Chik Ballāpur',
-    'dhubri': 'Dhubri',
-    'borsad': 'Borsad',
-    'gadwāl': 'Gadwāl',
-    'pidugurālla': 'Pidugurālla',
-    'sheikhpura': 'Sheikhpura',
-    'sirsi': 'Sirsi',
-    'nipāni': 'Nipāni',
-    'kannur': 'Kannur',
-    'bāri': 'Bāri',
-    'nokha': 'Nokha',
-    'vinukonda': 'Vinukonda',
-    'renukūt': 'Renukūt',
-    'nagari': 'Nagari',
-    'chidambaram': 'Chidambaram',
-    'dabwāli': 'Dabwāli',
-    'sibsāgar': 'Sibsāgar',
-    'narwāna': 'Narwāna',
-    'okha': 'Okha',
-    'kuchāman': 'Kuchāman',
-    'nīmbāhera': 'Nīmbāhera',
-    'siddhapur': 'Siddhapur',
-    'diphu': 'Diphu',
-    'attur': 'Attur',
-    'rāyadrug': 'Rāyadrug',
-    'rāth': 'Rāth',
-    'cheruvannur': 'Cheruvannur',
-    'vriddhāchalam': 'Vriddhāchalam',
-    'bārh': 'Bārh',
-    'shāhāda': 'Shāhāda',
-    'dabra': 'Dabra',
-    'udumalaippettai': 'Udumalaippettai',
-    'tiptūr': 'Tiptūr',
-    'sahaswān': 'Sahaswān',
-    'wanparti': 'Wanparti',
-    'sirhind': 'Sirhind',
-    'bārdoli': 'Bārdoli',
-    'mokameh': 'Mokameh',
-    'arāmbāgh': 'Arāmbāgh',
-    'poonamalle': 'Poonamalle',
-    'keonjhargarh': 'Keonjhargarh',
-    'panruti': 'Panruti',
-    'ilkal': 'Ilkal',
-    'kīratpur': 'Kīratpur',
-    'vrindāvan': 'Vrindāvan',
-    'kodungallūr': 'Kodungallūr',
-    'nedumangād': 'Nedumangād',
-    'narsimhapur': 'Narsimhapur',
-    'ponnur': 'Ponnur',
-    'kathua': 'Kathua',
-    'north lakhimpur': 'North Lakhimpur',
-    'masaurhi buzurg': 'Masaurhi Buzurg',
-    'nerkunram': 'Nerkunram',
-    'shegaon': 'Shegaon',
-    'mandideep': 'Mandideep',
-    'pāchora': 'Pāchora',
-    'gobichettipalayam': 'Gobichettipalayam',
-    'gangoh': 'Gangoh',
-    'itanagar': 'Itanagar',
-    'jaitpur': 'Jaitpur',
-    'narasapur': 'Narasapur',
-    'dhone': 'Dhone',
-    'rājgarh': 'Rājgarh',
-    'ullal': 'Ullal',
-    'panna': 'Panna',
-    'gola gokarannāth': 'Gola Gokarannāth',
-    'gohad': 'Gohad',
-    'wani': 'Wani',
-    'thiruvarur': 'Thiruvarur',
-    'upleta': 'Upleta',
-    'nūzvīd': 'Nūzvīd',
-    'lonavla': 'Lonavla',
-    'una': 'Una',
-    'sillod': 'Sillod',
-    'sīra': 'Sīra',
-    'chikhli': 'Chikhli',
-    'jhārgrām': 'Jhārgrām',
-    'kagaznāgār': 'Kagaznāgār',
-    'bhātāpāra': 'Bhātāpāra',
-    'kāsībugga': 'Kāsībugga',
-    'hasanpur': 'Hasanpur',
-    'lohārdagā': 'Lohārdagā',
-    'jahāngīrābād': 'Jahāngīrābād',
-    'sherkot': 'Sherkot',
-    'kātrās': 'Kātrās',
-    'mācherla': 'Mācherla',
-    'naksalbāri': 'Naksalbāri',
-    'sankarankovil': 'Sankarankovil',
-    'mulbāgal': 'Mulbāgal',
-    'kandukūr': 'Kandukūr',
-    'tiruvalla': 'Tiruvalla',
-    'roshanpura': 'Roshanpura',
-    'ponnūru': 'Ponnūru',
-    'kollegāl': 'Kollegāl',
-    'mukandpur': 'Mukandpur',
-    'unjha': 'Unjha',
-    'chhibrāmau': 'Chhibrāmau',
-    'tilhar': 'Tilhar',
-    'lunglei': 'Lunglei',
-    'hoskote': 'Hoskote',
-    'byasanagar': 'Byasanagar',
-    'bada barabīl': 'Bada Barabīl',
-    'sāmalkot': 'Sāmalkot',
-    'karīmganj': 'Karīmganj',
-    'bobbili': 'Bobbili',
-    'mettur': 'Mettur',
-    'sattenapalle': 'Sattenapalle',
-    'tirūrangādi': 'Tirūrangādi',
-    'tennala': 'Tennala',
-    'chakradharpur': 'Chakradharpur',
-    'sendhwa': 'Sendhwa',
-    'talegaon dābhāde': 'Talegaon Dābhāde',
-    'hiriyūr': 'Hiriyūr',
-    'anjangaon': 'Anjangaon',
-    'charkhi dādri': 'Charkhi Dādri',
-    'ujhāni': 'Ujhāni',
-    'bankra': 'Bankra',
-    'dabhoi': 'Dabhoi',
-    'teghra': 'Teghra',
-    'obra': 'Obra',
-    'tiruvallur': 'Tiruvallur',
-    'mandapeta': 'Mandapeta',
-    'tirur': 'Tirur',
-    'ropar': 'Ropar',
-    'nāmakkal': 'Nāmakkal',
-    'arcot': 'Arcot',
-    'lāharpur': 'Lāharpur',
-    'viramgām': 'Viramgām',
-    'islāmpur': 'Islāmpur',
-    'karād': 'Karād',
-    'yanam': 'Yanam',
-    'ābu road': 'Ābu Road',
-    'raxaul': 'Raxaul',
-    'moonniyur': 'Moonniyur',
-    'barwāni': 'Barwāni',
-    'kottayam': 'Kottayam',
-    'tiruttangal': 'Tiruttangal',
-    'petlād': 'Petlād',
-    'jālaun': 'Jālaun',
-    'periya semūr': 'Periya Semūr',
-    'madhupur': 'Madhupur',
-    'dhūri': 'Dhūri',
-    'challakere': 'Challakere',
-    'etāwa': 'Etāwa',
-    'chiplūn': 'Chiplūn',
-    'mandlā': 'Mandlā',
-    'bhīmunipatnam': 'Bhīmunipatnam',
-    'mawlai-mawïong': 'Mawlai-Mawïong',
-    'kavanur': 'Kavanur',
-    'pithāpuram': 'Pithāpuram',
-    'kāndi': 'Kāndi',
-    'idappadi': 'Idappadi',
-    'sāhibābād daulotpur': 'Sāhibābād Daulotpur',
-    'punganūru': 'Punganūru',
-    'ghātāl': 'Ghātāl',
-    'jāfarābād': 'Jāfarābād',
-    'sāgar': 'Sāgar',
-    'sihor': 'Sihor',
-    'mūndka': 'Mūndka',
-    'deglur': 'Deglur',
-    'madhepura': 'Madhepura',
-    'bārāmati': 'Bārāmati',
-    'mahāsamund': 'Mahāsamund',
-    'sidhi': 'Sidhi',
-    'kāsaragod': 'Kāsaragod',
-    'garhchiroli': 'Garhchiroli',
-    'puttūr': 'Puttūr',
-    'jalor': 'Jalor',
-    'samāna': 'Samāna',
-    'rāzampeta': 'Rāzampeta',
-    'wāri': 'Wāri',
-    'palmaner': 'Palmaner',
-    'deolāli': 'Deolāli',
-    'kanakapura': 'Kanakapura',
-    'wokha': 'Wokha',
-    'umred': 'Umred',
-    'kālna': 'Kālna',
-    'pallichal': 'Pallichal',
-    'tāndoni': 'Tāndoni',
-    'pārvatipuram': 'Pārvatipuram',
-    'kotharia': 'Kotharia',
-    'ottapalam': 'Ottapalam',
-    'dīdwāna': 'Dīdwāna',
-    'begampur': 'Begampur',
-    'gaddi annaram': 'Gaddi Annaram',
-    'dumraon': 'Dumraon',
-    'nerupperichchal': 'Nerupperichchal',
-    'jaggaiahpet': 'Jaggaiahpet',
-    'rampur hat': 'Rampur Hat',
-    'khanapuram haveli': 'Khanapuram Haveli',
-    'goālpāra': 'Goālpāra',
-    'tuni': 'Tuni',
-    'laxmangarh': 'Laxmangarh',
-    'shāhpur': 'Shāhpur',
-    'bhongīr': 'Bhongīr',
-    'ullagaram': 'Ullagaram',
-    'sri dūngargarh': 'Sri Dūngargarh',
-    'ayodhya': 'Ayodhya',
-    'mubarakpur': 'Mubarakpur',
-    'amalāpuram': 'Amalāpuram',
-    'arsikere': 'Arsikere',
-    'phaltan': 'Phaltan',
-    'ashta': 'Ashta',
-    'sandīla': 'Sandīla',
-    'vikārābād': 'Vikārābād',
-    'baruipur': 'Baruipur',
-    'choudwar': 'Choudwar',
-    'sultānganj': 'Sultānganj',
-    'mandi dabwāli': 'Mandi Dabwāli',
-    'konch': 'Konch',
-    'bāprola': 'Bāprola',
-    'venkatagiri': 'Venkatagiri',
-    'dabhel': 'Dabhel',
-    'biswān': 'Biswān',
-    'siruguppa': 'Siruguppa',
-    'kosi': 'Kosi',
-    'sironj': 'Sironj',
-    'jangaon': 'Jangaon',
-    'daudnagar': 'Daudnagar',
-    'ramapuram': 'Ramapuram',
-    'dandeli': 'Dandeli',
-    'mudhol': 'Mudhol',
-    'thodupuzha': 'Thodupuzha',
-    'devakottai': 'Devakottai',
-    'arwal': 'Arwal',
-    'kāliyāganj': 'Kāliyāganj',
-    'nasīrābād': 'Nasīrābād',
-    'khagaul': 'Khagaul',
-    'changanācheri': 'Changanācheri',
-    'shorāpur': 'Shorāpur',
-    'māndvi': 'Māndvi',
-    'rajgangpur': 'Rajgangpur',
-    'ozar': 'Ozar',
-    'peranāmpattu': 'Peranāmpattu',
-    'gumlā': 'Gumlā',
-    'rāmnagar': 'Rāmnagar',
-    'vazhakkala': 'Vazhakkala',
-    'shujālpur': 'Shujālpur',
-    'tirumangalam': 'Tirumangalam',
-    'sidlaghatta': 'Sidlaghatta',
-    'khurai': 'Khurai',
-    'hilsa': 'Hilsa',
-    'rampura phul': 'Rampura Phul',
-    'fatwa': 'Fatwa',
-    'tūndla': 'Tūndla',
-    'mannārakkāt': 'Mannārakkāt',
-    'metpalle': 'Metpalle',
-    'naya gaon': 'Naya Gaon',
-    'repalle': 'Repalle',
-    'hunsūr': 'Hunsūr',
-    'nanjangūd': 'Nanjangūd',
-    'forbesganj': 'Forbesganj',
-    'nithari': 'Nithari',
-    'sunabeda': 'Sunabeda',
-    'gajraula': 'Gajraula',
-    'vīrapāndi': 'Vīrapāndi',
-    'dāhānu': 'Dāhānu',
-    'rasipuram': 'Rasipuram',
-    'sālūr': 'Sālūr',
-    'bhabhua': 'Bhabhua',
-    'hodal': 'Hodal',
-    'bhadrāchalam': 'Bhadrāchalam',
-    'aonla': 'Aonla',
-    'tirupparangunram': 'Tirupparangunram',
-    'chatrā': 'Chatrā',
-    'khagaria': 'Khagaria',
-    'dhāmpur': 'Dhāmpur',
-    'nagarukhra city': 'Nagarukhra City',
-    'phalodi': 'Phalodi',
-    'gangākher': 'Gangākher',
-    'sardhana': 'Sardhana',
-    'nohar': 'Nohar',
-    'yeola': 'Yeola',
-    'bhaisa': 'Bhaisa',
-    'perintalmanna': 'Perintalmanna',
-    'jugsālai': 'Jugsālai',
-    'perambalur': 'Perambalur',
-    'badūria': 'Badūria',
-    'gudalur': 'Gudalur',
-    'kizhake chālakudi': 'Kizhake Chālakudi',
-    'narkatiāganj': 'Narkatiāganj',
-    'peddāpuram': 'Peddāpuram',
-    'majalgaon': 'Majalgaon',
-    'daund': 'Daund',
-    'kapadvanj': 'Kapadvanj',
-    'kotputli': 'Kotputli',
-    'dyāne': 'Dyāne',
-    'bail-hongal': 'Bail-Hongal',
-    'biaora': 'Biaora',
-    'naugachhia': 'Naugachhia',
-    'kānūru': 'Kānūru',
-    'dehu road': 'Dehu Road',
-    'pipariā': 'Pipariā',
-    'barpeta': 'Barpeta',
-    'gooty': 'Gooty',
-    'tamlūk': 'Tamlūk',
-    'vengara': 'Vengara',
-    'jaisingpur': 'Jaisingpur',
-    'nangal': 'Nangal',
-    'jasdan': 'Jasdan',
-    'godda': 'Godda',
-    'bikramganj': 'Bikramganj',
-    'morār': 'Morār',
-    'jhajjar': 'Jhajjar',
-    'nihtaur': 'Nihtaur',
-    'mahnar bazar': 'Mahnar Bazar',
-    'vite': 'Vite',
-    'gumia': 'Gumia',
-    'anakaputhur': 'Anakaputhur',
-    'tānālūr': 'Tānālūr',
-    'bhīnmāl': 'Bhīnmāl',
-    'sadasivpet': 'Sadasivpet',
-    'bakhtiarpur': 'Bakhtiarpur',
-    'jalandhar cantonment': 'Jalandhar Cantonment',
-    'athani': 'Athani',
-    'warud': 'Warud',
-    'wānkāner': 'Wānkāner',
-    'churāchāndpur': 'Churāchāndpur',
-    'dūngarpur': 'Dūngarpur',
-    'chhaya': 'Chhaya',
-    'dumka': 'Dumka',
-    'gādarwāra': 'Gādarwāra',
-    'pithorāgarh': 'Pithorāgarh',
-    'ballia': 'Ballia',
-    'bihtā': 'Bihtā',
-    'atraulī': 'Atraulī',
-    'walajapet': 'Walajapet',
-    'koraput': 'Koraput',
-    'umarkhed': 'Umarkhed',
-    'kunnamangalam': 'Kunnamangalam',
-    'valasaravakkam': 'Valasaravakkam',
-    'alangad': 'Alangad',
-    'alengād': 'Alengād',
-    'punalūr': 'Punalūr',
-    'vikramasingapuram': 'Vikramasingapuram',
-    'vattiyūrkāvu': 'Vattiyūrkāvu',
-    'padrauna': 'Padrauna',
-    'ambāh': 'Ambāh',
-    'komalapuram': 'Komalapuram',
-    'mattanur': 'Mattanur',
-    'harpanahalli': 'Harpanahalli',
-    'kendrāparha': 'Kendrāparha',
-    'tighri': 'Tighri',
-    'pallikal': 'Pallikal',
-    'selu': 'Selu',
-    'medak': 'Medak',
-    'patancheru': 'Patancheru',
-    'dondaicha': 'Dondaicha',
-    'jāmner': 'Jāmner',
-    'burla': 'Burla',
-    'porur': 'Porur',
-    'nellikkuppam': 'Nellikkuppam',
-    'padra': 'Padra',
-    'kawardha': 'Kawardha',
-    'gulāothi': 'Gulāothi',
-    'joda': 'Joda',
-    'seohāra': 'Seohāra',
-    'warora': 'Warora',
-    'mānvi': 'Mānvi',
-    'kurseong': 'Kurseong',
-    'manglaur': 'Manglaur',
-    'nilambūr': 'Nilambūr',
-    'ganj dundwāra': 'Ganj Dundwāra',
-    'nānpāra': 'Nānpāra',
-    'khordha': 'Khordha',
-    'atarra': 'Atarra',
-    'barbigha': 'Barbigha',
-    'merta': 'Merta',
-    'jammalamadugu': 'Jammalamadugu',
-    'garhwa': 'Garhwa',
-    'nawanshahr': 'Nawanshahr',
-    'rānāvāv': 'Rānāvāv',
-    'bānka': 'Bānka',
-    'thoubāl': 'Thoubāl',
-    'mahmudābād': 'Mahmudābād',
-    'milavittan': 'Milavittan',
-    'pakur': 'Pakur',
-    'cherthala': 'Cherthala',
-    'nāyudupet': 'Nāyudupet',
-    'farrukhnagar': 'Farrukhnagar',
-    'rāmpura': 'Rāmpura',
-    'chirakkal': 'Chirakkal',
-    'chirkunda': 'Chirkunda',
-    'coonoor': 'Coonoor',
-    'pāndhurnā': 'Pāndhurnā',
-    'shertallai': 'Shertallai',
-    'kodur': 'Kodur',
-    'giddarbāha': 'Giddarbāha',
-    'meddappakkam': 'Meddappakkam',
-    'nandikotkūr': 'Nandikotkūr',
-    'khalīlābād': 'Khalīlābād',
-    'chittaranjan': 'Chittaranjan',
-    'pāthardih': 'Pāthardih',
-    'chāmpa': 'Chāmpa',
-    'mehkar': 'Mehkar',
-    'dhanpuri': 'Dhanpuri',
-    'sundergarh': 'Sundergarh',
-    'dīg': 'Dīg',
-    'tumsar': 'Tumsar',
-    'rameswaram': 'Rameswaram',
-    'bangarapet': 'Bangarapet',
-    'vishāram': 'Vishāram',
-    'thiruthani': 'Thiruthani',
-    'digras': 'Digras',
-    'maradu': 'Maradu',
-    'bāndīkūi': 'Bāndīkūi',
-    'dowleswaram': 'Dowleswaram',
-    'bālāpur': 'Bālāpur',
-    'tondalam': 'Tondalam',
-    'jawaharnagar': 'Jawaharnagar',
-    'homnābād': 'Homnābād',
-    'memāri': 'Memāri',
-    'nāndūra': 'Nāndūra',
-    'kottangara': 'Kottangara',
-    'angul': 'Angul',
-    'kōttakkal': 'Kōttakkal',
-    'libāspur': 'Libāspur',
-    'dalli rājhara': 'Dalli Rājhara',
-    'kālpi': 'Kālpi',
-    'jintūr': 'Jintūr',
-    'daman': 'Daman',
-    'anekal': 'Anekal',
-    'akkarampalle': 'Akkarampalle',
-    'nidadavole': 'Nidadavole',
-    'raisen': 'Raisen',
-    'gūduvāncheri': 'Gūduvāncheri',
-    'varangaon': 'Varangaon',
-    'sihorā': 'Sihorā',
-    'chidawa': 'Chidawa',
-    'ahmadpur': 'Ahmadpur',
-    'olavanna': 'Olavanna',
-    'gobārdānga': 'Gobārdānga',
-    'melmadai': 'Melmadai',
-    'saint thomas mount': 'Saint Thomas Mount',
-    'yellandu': 'Yellandu',
-    'hāflong': 'Hāflong',
-    'polavaram': 'Polavaram',
-    'bodupāl': 'Bodupāl',
-    'rāmachandrapuram': 'Rāmachandrapuram',
-    'panachikkad': 'Panachikkad',
-    'shōranūr': 'Shōranūr',
-    'pallikaranai': 'Pallikaranai',
-    'kāndhla': 'Kāndhla',
-    'barwāla': 'Barwāla',
-    'nilithi': 'Nilithi',
-    'jambusar': 'Jambusar',
-    'varkala': 'Varkala',
-    'kātol': 'Kātol',
-    'kopali': 'Kopali',
-    'sainthia': 'Sainthia',
-    'choornikkara': 'Choornikkara',
-    'perungudi': 'Perungudi',
-    'kamal pur majra burari': 'Kamal Pur Majra Burari',
-    'jīwanpur': 'Jīwanpur',
-    'barhiya': 'Barhiya',
-    'sojat': 'Sojat',
-    'kālimpong': 'Kālimpong',
-    'periyakulam': 'Periyakulam',
-    'simdega': 'Simdega',
-    'bishrāmpur': 'Bishrāmpur',
-    'kottuvalli': 'Kottuvalli',
-    'bairāgnia': 'Bairāgnia',
-    'diglipur': 'Diglipur',
-    'panipat taraf ansar': 'Panipat Taraf Ansar',
-    'ranjangaon s': 'Ranjangaon S',
-    'kakkodi': 'Kakkodi',
-    'mahbūbābād': 'Mahbūbābād',
-    'perumbaikad': 'Perumbaikad',
-    'ārvi': 'Ārvi',
-    'parāsia': 'Parāsia',
-    'sivaganga': 'Sivaganga',
-    'limbdi': 'Limbdi',
-    'chavara': 'Chavara',
-    'dahegām': 'Dahegām',
-    'jaspur': 'Jaspur',
-    'thān': 'Thān',
-    'bāola': 'Bāola',
-    'khekra': 'Khekra',
-    'bhupalpally': 'Bhupalpally',
-    'dīnhāta': 'Dīnhāta',
-    'aland': 'Aland',
-    'kumbalangy': 'Kumbalangy',
-    'naini tāl': 'Naini Tāl',
-    'idar': 'Idar',
-    'chinnamanūr': 'Chinnamanūr',
-    'bhawāni mandi': 'Bhawāni Mandi',
-    'kyathampalle': 'Kyathampalle',
-    'sikandra rao': 'Sikandra Rao',
-    'palladam': 'Palladam',
-    'rāzām': 'Rāzām',
-    'jājpur': 'Jājpur',
-    'jora': 'Jora',
-    'canning': 'Canning',
-    'khairābād': 'Khairābād',
-    'pratāpgarh': 'Pratāpgarh',
-    'dhāka': 'Dhāka',
-    'kannad': 'Kannad',
-    'nāthdwāra': 'Nāthdwāra',
-    'abdu rahiman nagar': 'Abdu Rahiman Nagar',
-    'golāghāt': 'Golāghāt',
-    'kekri': 'Kekri',
-    'barauli': 'Barauli',
-    'mahē': 'Mahē',
-    'diamond harbour': 'Diamond Harbour',
-    'sūrampatti': 'Sūrampatti',
-    'bāghpat': 'Bāghpat',
-    'bar bigha': 'Bar Bigha',
-    'nārāyanpet': 'Nārāyanpet',
-    'khambhāliya': 'Khambhāliya',
-    'bilāra': 'Bilāra',
-    'trikonavattam': 'Trikonavattam',
-    'rājgīr': 'Rājgīr',
-    'kudappanakkunnu': 'Kudappanakkunnu',
-    'paithan': 'Paithan',
-    'kodīnar': 'Kodīnar',
-    'pīleru': 'Pīleru',
-    'pirāyiri': 'Pirāyiri',
-    'rāmganj mandi': 'Rāmganj Mandi',
-    'vaijāpur': 'Vaijāpur',
-    'kannamangalam': 'Kannamangalam',
-    'saundatti': 'Saundatti',
-    'jaggayyapeta': 'Jaggayyapeta',
-    'peddapalli': 'Peddapalli',
-    'dhupgāri': 'Dhupgāri',
-    'triprangod': 'Triprangod',
-    'chākan': 'Chākan',
-    'bharthana': 'Bharthana',
-    'patti': 'Patti',
-    'jalārpet': 'Jalārpet',
-    'vadgaon': 'Vadgaon',
-    'tālcher': 'Tālcher',
-    'thottada': 'Thottada',
-    'kalliyoor': 'Kalliyoor',
-    'arantāngi': 'Arantāngi',
-    'athiyannur': 'Athiyannur',
-    'icchannūr': 'Icchannūr',
-    'sherghāti': 'Sherghāti',
-    'bhādra': 'Bhādra',
-    'jhajha': 'Jhajha',
-    'ghātsīla': 'Ghātsīla',
-    'dharmanagar': 'Dharmanagar',
-    'kayalpattinam': 'Kayalpattinam',
-    'nowgong': 'Nowgong',
-    'savanūr': 'Savanūr',
-    'nailā': 'Nailā',
-    'nannambra': 'Nannambra',
-    'manapparai': 'Manapparai',
-    'boyampālaiyam': 'Boyampālaiyam',
-    'kallakkurichchi': 'Kallakkurichchi',
-    'kulathummal': 'Kulathummal',
-    'ettumānūr': 'Ettumānūr',
-    'ghātampur': 'Ghātampur',
-    'channarāyapatna': 'Channarāyapatna',
-    'akivīdu': 'Akivīdu',
-    'kovvūr': 'Kovvūr',
-    'vellakkovil': 'Vellakkovil',
-    'sabalgarh': 'Sabalgarh',
-    'bhālki': 'Bhālki',
-    'kāttipparutti': 'Kāttipparutti',
-    'murtajāpur': 'Murtajāpur',
-    'peringathur': 'Peringathur',
-    'solan': 'Solan',
-    'nādāpuram': 'Nādāpuram',
-    'gursahāiganj': 'Gursahāiganj',
-    'maihar': 'Maihar',
-    'bantvāl': 'Bantvāl',
-    'pallipalayam': 'Pallipalayam',
-    'mapusa': 'Mapusa',
-    'tāki': 'Tāki',
-    'akalkot': 'Akalkot',
-    'maner': 'Maner',
-    'mālūr': 'Mālūr',
-    'bakhri': 'Bakhri',
-    'mayyanād': 'Mayyanād',
-    'mappilaiurani': 'Mappilaiurani',
-    'melur': 'Melur',
-    'hāsimāra': 'Hāsimāra',
-    'sathupalli': 'Sathupalli',
-    'pūranpur': 'Pūranpur',
-    'aklūj': 'Aklūj',
-    'bānsi': 'Bānsi',
-    'vadavalli': 'Vadavalli',
-    'thakurdwara': 'Thakurdwara',
-    'amudālavalasa': 'Amudālavalasa',
-    'vyāra': 'Vyāra',
-    'bhavāni': 'Bhavāni',
-    'samālkha': 'Samālkha',
-    'lakkanahalli': 'Lakkanahalli',
-    'porsa': 'Porsa',
-    'kadungalūr': 'Kadungalūr',
-    'kālappatti': 'Kālappatti',
-    'anandpur': 'Anandpur',
-    'chaklāsi': 'Chaklāsi',
-    'rādhanpur': 'Rādhanpur',
-    'murshidābād': 'Murshidābād',
-    'manakunnam': 'Manakunnam',
-    'bhachāu': 'Bhachāu',
-    'jalālābād': 'Jalālābād',
-    'kurinjippādi': 'Kurinjippādi',
-    'sedam': 'Sedam',
-    'vādāsinor': 'Vādāsinor',
-    'kampli': 'Kampli',
-    'kāro': 'Kāro',
-    'tirkadavūr': 'Tirkadavūr',
-    'jogbani': 'Jogbani',
-    'mūkondapalli': 'Mūkondapalli',
-    'sirohi': 'Sirohi',
-    'aroor': 'Aroor',
-    'othukkungal': 'Othukkungal',
-    'ghosī': 'Ghosī',
-    'pehowa': 'Pehowa',
-    'kārakkād': 'Kārakkād',
-    'nūrpur': 'Nūrpur',
-    'revelganj': 'Revelganj',
-    'betamcherla': 'Betamcherla',
-    'belpahar': 'Belpahar',
-    'chīka': 'Chīka',
-    'paravūr tekkumbhāgam': 'Paravūr Tekkumbhāgam',
-    'tuvāgudi': 'Tuvāgudi',
-    'dwārka': 'Dwārka',
-    'kotamangalam': 'Kotamangalam',
-    'kātpādi': 'Kātpādi',
-    'sagauli': 'Sagauli',
-    'rāhuri': 'Rāhuri',
-    'sanāwad': 'Sanāwad',
-    'kondapalle': 'Kondapalle',
-    'vetapālem': 'Vetapālem',
-    'sangariā': 'Sangariā',
-    'jalesar': 'Jalesar',
-    'nattakam': 'Nattakam',
-    'paliā kalān': 'Paliā Kalān',
-    'bayāna': 'Bayāna',
-    'rājula': 'Rājula',
-    'bodh gaya': 'Bodh Gaya',
-    'keru': 'Keru',
-    'kollancode': 'Kollancode',
-    'kilakarai': 'Kilakarai',
-    'kumhāri': 'Kumhāri',
-    'chikodi': 'Chikodi',
-    'khairtal': 'Khairtal',
-    'pathanāmthitta': 'Pathanāmthitta',
-    'chōrōd': 'Chōrōd',
-    'nandigāma': 'Nandigāma',
-    'indi': 'Indi',
-    'kondli': 'Kondli',
-    'nildoh': 'Nildoh',
-    'kabnur': 'Kabnur',
-    'malavalli': 'Malavalli',
-    'sūlūru': 'Sūlūru',
-    'kāman': 'Kāman',
-    'chetwayi': 'Chetwayi',
-    'nongthymmai': 'Nongthymmai',
-    'shahbazpur': 'Shahbazpur',
-    'wādi': 'Wādi',
-    'tirupati nma': 'Tirupati NMA',
-    'gauribidanur': 'Gauribidanur',
-    'tāsgaon': 'Tāsgaon',
-    'agar': 'Agar',
-    'rajakilpakkam': 'Rajakilpakkam',
-    'gharonda neemka bangar': 'Gharonda Neemka Bangar',
-    'dibai': 'Dibai',
-    'robertsganj': 'Robertsganj',
-    'pen': 'Pen',
-    'tarikere': 'Tarikere',
-    'maudaha': 'Maudaha',
-    'sathyamangalam': 'Sathyamangalam',
-    'gharaunda': 'Gharaunda',
-    'cheyyar': 'Cheyyar',
-    'sonepur': 'Sonepur',
-    'niwai': 'Niwai',
-    'gogri jamālpur': 'Gogri Jamālpur',
-    'bilāsipāra': 'Bilāsipāra',
-    'nangli sakrawat': 'Nangli Sakrawat',
-    'satānā': 'Satānā',
-    'rāwatbhāta': 'Rāwatbhāta',
-    'ellenabad': 'Ellenabad',
-    'wānādongri': 'Wānādongri',
-    'parola': 'Parola',
-    'pāthri': 'Pāthri',
-    'bopal': 'Bopal',
-    'chettipālaiyam': 'Chettipālaiyam',
-    'talattala': 'Talattala',
-    'jhālrapātan': 'Jhālrapātan',
-    'zira': 'Zira',
-    'leh': 'Leh',
-    'kānker': 'Kānker',
-    'sārangpur': 'Sārangpur',
-    'sandūr': 'Sandūr',
-    'bāngarmau': 'Bāngarmau',
-    'kanigiri u': 'Kanigiri U',
-    'jaito': 'Jaito',
-    'dongargarh': 'Dongargarh',
-    'phulbāni': 'Phulbāni',
-    'malayinkeezhu': 'Malayinkeezhu',
-    'attingal': 'Attingal',
-    'perunkalattu': 'Perunkalattu',
-    'morsi': 'Morsi',
-    'pilibangan': 'Pilibangan',
-    'nelamangala': 'Nelamangala',
-    'sindgi': 'Sindgi',
-    'vettūr': 'Vettūr',
-    'bhadgaon': 'Bhadgaon',
-    'ratia': 'Ratia',
-    'sirūr': 'Sirūr',
-    'lālganj': 'Lālganj',
-    'tinnanūr': 'Tinnanūr',
-    'sumerpur': 'Sumerpur',
-    'bandipura': 'Bandipura',
-    'bābarpur': 'Bābarpur',
-    'pujali': 'Pujali',
-    'garhmuktesar': 'Garhmuktesar',
-    'bahādurganj': 'Bahādurganj',
-    'nakodar': 'Nakodar',
-    'lūnāvāda': 'Lūnāvāda',
-    'vazhayur': 'Vazhayur',
-    'hojāi': 'Hojāi',
-    'akbarpur': 'Akbarpur',
-    'pīpār': 'Pīpār',
-    'lanka': 'Lanka',
-    'tuensang': 'Tuensang',
-    'vuyyūru': 'Vuyyūru',
-    'lakshmeshwar': 'Lakshmeshwar',
-    'kumta': 'Kumta',
-    'yāval': 'Yāval',
-    'tilda newra': 'Tilda Newra',
-    'kattivākkam': 'Kattivākkam',
-    'peringottupulam': 'Peringottupulam',
-    'sohna': 'Sohna',
-    'patāmundai': 'Patāmundai',
-    'kodaikānāl': 'Kodaikānāl',
-    'ichchāpuram': 'Ichchāpuram',
-    'daryāpur': 'Daryāpur',
-    'chunār': 'Chunār',
-    'amīnpur': 'Amīnpur',
-    'mungeli': 'Mungeli',
-    'barnagar': 'Barnagar',
-    'pūrna': 'Pūrna',
-    'khunti': 'Khunti',
-    'nargund': 'Nargund',
-    'parappur': 'Parappur',
-    'neem ka thana': 'Neem ka Thana',
-    'vilappil': 'Vilappil',
-    'nilanga': 'Nilanga',
-    'naharlagun': 'Naharlagun',
-    'boisar': 'Boisar',
-    'ausa': 'Ausa',
-    'sadābād': 'Sadābād',
-    'bindki': 'Bindki',
-    'mahālingpur': 'Mahālingpur',
-    'rāvu': 'Rāvu',
-    'mālpura': 'Mālpura',
-    'wai': 'Wai',
-    'bramhapuri': 'Bramhapuri',
-    'shikaripura': 'Shikaripura',
-    'shirdi': 'Shirdi',
-    'neduva': 'Neduva',
-    'venganoor': 'Venganoor',
-    'ramanattukara': 'Ramanattukara',
-    'mokokchūng': 'Mokokchūng',
-    'pinjaur': 'Pinjaur',
-    'mādāyi': 'Mādāyi',
-    'partūr': 'Partūr',
-    'dīndārpur': 'Dīndārpur',
-    'talakkād': 'Talakkād',
-    'krishnarājāsāgara': 'Krishnarājāsāgara',
-    'jhābua': 'Jhābua',
-    'madipakkam': 'Madipakkam',
-    'karāla': 'Karāla',
-    'gariadhar': 'Gariadhar',
-    'kakrāla': 'Kakrāla',
-    'bīdāsar': 'Bīdāsar',
-    'lahār': 'Lahār',
-    'ambasamudram': 'Ambasamudram',
-    'kaipamangalam': 'Kaipamangalam',
-    'medchal': 'Medchal',
-    'ganaur': 'Ganaur',
-    'sholinganallur': 'Sholinganallur',
-    'kovūr': 'Kovūr',
-    'tuljāpur': 'Tuljāpur',
-    'barpeta road': 'Barpeta Road',
-    'uravakonda': 'Uravakonda',
-    'babīna': 'Babīna',
-    'rafiganj': 'Rafiganj',
-    'umarga': 'Umarga',
-    'igatpuri': 'Igatpuri',
-    'perumanna': 'Perumanna',
-    'budhāna': 'Budhāna',
-    'lingsugūr': 'Lingsugūr',
-    'rājpīpla': 'Rājpīpla',
-    'dharangaon': 'Dharangaon',
-    'mahemdāvād': 'Mahemdāvād',
-    'karamsad': 'Karamsad',
-    'sūrandai': 'Sūrandai',
-    'manali': 'Manali',
-    'wāris alīganj': 'Wāris Alīganj',
-    'pulgaon': 'Pulgaon',
-    'usilampatti': 'Usilampatti',
-    'puzhathi': 'Puzhathi',
-    'perunād': 'Perunād',
-    'kāramadai': 'Kāramadai',
-    'giddalūr': 'Giddalūr',
-    'atmakūr': 'Atmakūr',
-    'pāppinisshēri': 'Pāppinisshēri',
-    'vijāpur': 'Vijāpur',
-    'rāwatsār': 'Rāwatsār',
-    'dubrājpur': 'Dubrājpur',
-    'karumattampatti': 'Karumattampatti',
-    'māranchēri': 'Māranchēri',
-    'podaturpet': 'Podaturpet',
-    'peruvallur': 'Peruvallur',
-    'rairangpur': 'Rairangpur',
-    'sīrkāzhi': 'Sīrkāzhi',
-    'kichha': 'Kichha',
-    'hebbagodi': 'Hebbagodi',
-    'chēmanchēri': 'Chēmanchēri',
-    'erāttupetta': 'Erāttupetta',
-    'rāmdurg': 'Rāmdurg',
-    'jāmadoba': 'Jāmadoba',
-    'safidon': 'Safidon',
-    'bolārum': 'Bolārum',
-    'bareli': 'Bareli',
-    'erāmala': 'Erāmala',
-    'shikārpūr': 'Shikārpūr',
-    'sankeshwar': 'Sankeshwar',
-    'karjat': 'Karjat',
-    'bakhtiyārpur': 'Bakhtiyārpur',
-    'bagasra': 'Bagasra',
-    'villiappally': 'Villiappally',
-    'aymanam': 'Aymanam',
-    'angamāli': 'Angamāli',
-    'villianur': 'Villianur',
-    'manipal': 'Manipal',
-    'lālsot': 'Lālsot',
-    'mehidpur': 'Mehidpur',
-    'soyāgaon': 'Soyāgaon',
-    'sāngola': 'Sāngola',
-    'vedaraniyam': 'Vedaraniyam',
-    'kuruvattūr': 'Kuruvattūr',
-    'muddebihāl': 'Muddebihāl',
-    'navāpur': 'Navāpur',
-    'khāchrod': 'Khāchrod',
-    'yanamalakuduru': 'Yanamalakuduru',
-    'malajkhand': 'Malajkhand',
-    'vapi ina': 'Vapi INA',
-    'kunigal': 'Kunigal',
-    'kadūr': 'Kadūr',
-    'chelambra': 'Chelambra',
-    'hamīrpur': 'Hamīrpur',
-    'risod': 'Risod',
-    'kokrajhar': 'Kokrajhar',
-    'kālka': 'Kālka',
-    'kāgal': 'Kāgal',
-    'pārassāla': 'Pārassāla',
-    'titlāgarh': 'Titlāgarh',
-    'begamganj': 'Begamganj',
-    'nagalapuram': 'Nagalapuram',
-    'jāmkhed': 'Jāmkhed',
-    'elampalloor': 'Elampalloor',
-    'jayamkondacholapuram': 'Jayamkondacholapuram',
-    'tudiyalūr': 'Tudiyalūr',
-    'ālankōd': 'Ālankōd',
-    'shāhpura': 'Shāhpura',
-    'elayavur': 'Elayavur',
-    'guledagudda': 'Guledagudda',
-    'iramallūr': 'Iramallūr',
-    'piro': 'Piro',
-    'guskhara': 'Guskhara',
-    'umreth': 'Umreth',
-    'narsīpatnam': 'Narsīpatnam',
-    'bahjoi': 'Bahjoi',
-    'dharmābād': 'Dharmābād',
-    'chockli': 'Chockli',
-    'vemalwāda': 'Vemalwāda',
-    'colgong': 'Colgong',
-    'bāsudebpur': 'Bāsudebpur',
-    'rājākhera': 'Rājākhera',
-    'hailākāndi': 'Hailākāndi',
-    'jagatsinghapur': 'Jagatsinghapur',
-    'gevrai': 'Gevrai',
-    'madikeri': 'Madikeri',
-    'kopāganj': 'Kopāganj',
-    'thāna bhawan': 'Thāna Bhawan',
-    'pūndri': 'Pūndri',
-    'vagholi': 'Vagholi',
-    'birmitrapur': 'Birmitrapur',
-    'chaksu': 'Chaksu',
-    'darsi': 'Darsi',
-    'zaidpur': 'Zaidpur',
-    'remuna': 'Remuna',
-    'puthenvelikara': 'Puthenvelikara',
-    'āmli': 'Āmli',
-    'anūpgarh': 'Anūpgarh',
-    'salāya': 'Salāya',
-    'idangansālai': 'Idangansālai',
-    'kosamba': 'Kosamba',
-    'basavana bāgevādi': 'Basavana Bāgevādi',
-    'muhammadābād': 'Muhammadābād',
-    'lakhyabad': 'Lakhyabad',
-    'aya nagar': 'Aya Nagar',
-    'umaria': 'Umaria',
-    'chanderi': 'Chanderi',
-    'ajānūr': 'Ajānūr',
-    'manendragarh': 'Manendragarh',
-    'bhādāsar': 'Bhādāsar',
-    'srvanampatti': 'Srvanampatti',
-    'patrātu': 'Patrātu',
-    'bhokar': 'Bhokar',
-    'sānchor': 'Sānchor',
-    'kurumbapet': 'Kurumbapet',
-    'kaimganj': 'Kaimganj',
-    'bāmaur': 'Bāmaur',
-    'jānjgīr': 'Jānjgīr',
-    'egra': 'Egra',
-    'bihārīganj': 'Bihārīganj',
-    'mushābani': 'Mushābani',
-    'dighwāra': 'Dighwāra',
-    'ngūr': 'Ngūr',
-    'garhākota': 'Garhākota',
-    'vengola kizhakkumbāgam': 'Vengola Kizhakkumbāgam',
-    'mamun': 'Mamun',
-    'nānjikkottai': 'Nānjikkottai',
-    'bijuri': 'Bijuri',
-    'ghugus': 'Ghugus',
-    'tārānagar': 'Tārānagar',
-    'nepānagar': 'Nepānagar',
-    'bādepalli': 'Bādepalli',
-    'nautanwa': 'Nautanwa',
-    'pīrzādagūda': 'Pīrzādagūda',
-    'hisua': 'Hisua',
-    'shamshabad': 'Shamshabad',
-    'vallabh vidyanagar': 'Vallabh Vidyanagar',
-    'erraguntla': 'Erraguntla',
-    'edappāl': 'Edappāl',
-    'manuguru': 'Manuguru',
-    'soro': 'Soro',
-    'ulliyeri': 'Ulliyeri',
-    'saoner': 'Saoner',
-    'muttayyāpuram': 'Muttayyāpuram',
-    'manwath': 'Manwath',
-    'dhandhuka': 'Dhandhuka',
-    'jūjūvādi': 'Jūjūvādi',
-    'hatta': 'Hatta',
-    'jagdīspur': 'Jagdīspur',
-    'almora': 'Almora',
-    'thuraiyur': 'Thuraiyur',
-    'saknepalli': 'Saknepalli',
-    'anta': 'Anta',
-    'gajendragarh': 'Gajendragarh',
-    'narsinghgarh': 'Narsinghgarh',
-    'kalyandurg': 'Kalyandurg',
-    'chittūr': 'Chittūr',
-    'madhapar': 'Madhapar',
-    'chhabra': 'Chhabra',
-    'manamadurai': 'Manamadurai',
-    'tiruchchendur': 'Tiruchchendur',
-    'bisauli': 'Bisauli',
-    'kangayam': 'Kangayam',
-    'mannanchōri': 'Mannanchōri',
-    'kakching': 'Kakching',
-    'turaiyūr': 'Turaiyūr',
-    'bijaynagar': 'Bijaynagar',
-    'ferokh': 'Ferokh',
-    'dhāmnod': 'Dhāmnod',
-    'jora khurd': 'Jora Khurd',
-    'pāvugada': 'Pāvugada',
-    'thenhippalam': 'Thenhippalam',
-    'halvad': 'Halvad',
-    'mīrpeta': 'Mīrpeta',
-    'zamānia': 'Zamānia',
-    'bhatkal': 'Bhatkal',
-    'makhdumpur': 'Makhdumpur',
-    'shafi pur ranhola': 'Shafi Pur Ranhola',
-    'jāridih': 'Jāridih',
-    'rasrā': 'Rasrā',
-    'sādpalli': 'Sādpalli',
-    'sattur': 'Sattur',
-    'maur': 'Maur',
-    'chhota gobindpur': 'Chhota Gobindpur',
-    'sāsvad': 'Sāsvad',
-    'vilavoorkkal': 'Vilavoorkkal',
-    'kotma': 'Kotma',
-    'kottaikuppam': 'Kottaikuppam',
-    'khaira': 'Khaira',
-    'tālīkota': 'Tālīkota',
-    'puzhal': 'Puzhal',
-    'kalpatta': 'Kalpatta',
-    'ambad': 'Ambad',
-    'sijua': 'Sijua',
-    'rāhatgarh': 'Rāhatgarh',
-    'vandavāsi': 'Vandavāsi',
-    'tirumuruganpūndi': 'Tirumuruganpūndi',
-    'thanneermukkom': 'Thanneermukkom',
-    'parūr': 'Parūr',
-    'gomoh': 'Gomoh',
-    'elūr': 'Elūr',
-    'chemmumiahpet': 'Chemmumiahpet',
-    'jalālpur': 'Jalālpur',
-    'sri mādhopur': 'Sri Mādhopur',
-    'lumding railway colony': 'Lumding Railway Colony',
-    'ahmedgarh': 'Ahmedgarh',
-    'chītāpur': 'Chītāpur',
-    'jhanjhārpur': 'Jhanjhārpur',
-    'nāspur': 'Nāspur',
-    'singānallūr': 'Singānallūr',
-    'unchagao': 'Unchagao',
-    'bagru': 'Bagru',
-    'cheriyamundam': 'Cheriyamundam',
-    'allapuram': 'Allapuram',
-    'rosera': 'Rosera',
-    'podili': 'Podili',
-    'shrīgonda': 'Shrīgonda',
-    'kalliyasshēri': 'Kalliyasshēri',
-    'kannānendal': 'Kannānendal',
-    'pāndharkawada': 'Pāndharkawada',
-    'mankāchar': 'Mankāchar',
-    'katirur': 'Katirur',
-    'erandol': 'Erandol',
-    'adirampattinam': 'Adirampattinam',
-    'kūrāli': 'Kūrāli',
-    'jagdīshpur': 'Jagdīshpur',
-    'ponneri': 'Ponneri',
-    'shamsābād': 'Shamsābād',
-    'malakanagiri': 'Malakanagiri',
-    'mangrūl pīr': 'Mangrūl Pīr',
-    'narsampet': 'Narsampet',
-    'berasia': 'Berasia',
-    'bādāmi': 'Bādāmi',
-    'pasān': 'Pasān',
-    'kondagaon': 'Kondagaon',
-    'kalakkādu': 'Kalakkādu',
-    'puthuppariyāram': 'Puthuppariyāram',
-    'vilāngudi': 'Vilāngudi',
-    'rūdarpur': 'Rūdarpur',
-    'sholinghur': 'Sholinghur',
-    'mānāvadar': 'Mānāvadar',
-    'purāini': 'Purāini',
-    'deūlgaon rāja': 'Deūlgaon Rāja',
-    'dharmadam': 'Dharmadam',
-    'madurāntakam': 'Madurāntakam',
-    'kizhuvalam-koonthalloor': 'Kizhuvalam-Koonthalloor',
-    'dharamsala': 'Dharamsala',
-    'pedana': 'Pedana',
-    'kaij': 'Kaij',
-    'kallamchavadi': 'Kallamchavadi',
-    'un': 'Un',
-    'vadanappally': 'Vadanappally',
-    'irimbiliyam': 'Irimbiliyam',
-    'mūdbidri': 'Mūdbidri',
-    'pallappatti': 'Pallappatti',
-    'cheranellūr': 'Cheranellūr',
-    'mahārāganj': 'Mahārāganj',
-    'nāgāvaram': 'Nāgāvaram',
-    'tarakeswar': 'Tarakeswar',
-    'tifrā': 'Tifrā',
-    'siraspur': 'Siraspur',
-    'kundapura': 'Kundapura',
-    'uran': 'Uran',
-    'kasba': 'Kasba',
-    'karjan': 'Karjan',
-    'muvattupuzha': 'Muvattupuzha',
-    'manāwar': 'Manāwar',
-    'pihānī': 'Pihānī',
-    'madukkarai': 'Madukkarai',
-    'amlai': 'Amlai',
-    'dhāruhera': 'Dhāruhera',
-    'sarkhej': 'Sarkhej',
-    'banmankhi bazar': 'Banmankhi Bazar',
-    'rehli': 'Rehli',
-    'tāramangalam': 'Tāramangalam',
-    'amla': 'Amla',
-    'tirukkoyilur': 'Tirukkoyilur',
-    'musiri': 'Musiri',
-    'hīrākud': 'Hīrākud',
-    'khair': 'Khair',
-    'rajauli': 'Rajauli',
-    'kakkalapalle': 'Kakkalapalle',
-    'cherukavu': 'Cherukavu',
-    'seoni mālwa': 'Seoni Mālwa',
-    'oddanchathiram': 'Oddanchathiram',
-    'fatehpur sīkri': 'Fatehpur Sīkri',
-    'azhiyūr': 'Azhiyūr',
-    'byādgi': 'Byādgi',
-    'birpara': 'Birpara',
-    'cherpulassery': 'Cherpulassery',
-    'multai': 'Multai',
-    'holenarasipura': 'Holenarasipura',
-    'talāja': 'Talāja',
-    'marhaura': 'Marhaura',
-    'kareli': 'Kareli',
-    'bhongaon': 'Bhongaon',
-    'baddi': 'Baddi',
-    'pānakkudi': 'Pānakkudi',
-    'gadhada': 'Gadhada',
-    'pūlakkōd': 'Pūlakkōd',
-    'mukeriān': 'Mukeriān',
-    'ariyānkuppam': 'Ariyānkuppam',
-    'karumālūr': 'Karumālūr',
-    'kottārakara': 'Kottārakara',
-    'mavoor': 'Mavoor',
-    'pilāni': 'Pilāni',
-    'devarkonda': 'Devarkonda',
-    'mīnād': 'Mīnād',
-    'nedumbassery': 'Nedumbassery',
-    'rājūra': 'Rājūra',
-    'bilāri': 'Bilāri',
-    'mūvattupula': 'Mūvattupula',
-    'adūr': 'Adūr',
-    'walwadi': 'Walwadi',
-    'puthuppally': 'Puthuppally',
-    'rāisinghnagar': 'Rāisinghnagar',
-    'mīrānpur katra': 'Mīrānpur Katra',
-    'kidarakulam': 'Kidarakulam',
-    'kuttuparamba': 'Kuttuparamba',
-    'ārangaon': 'Ārangaon',
-    'pakridayal': 'Pakridayal',
-    'dhanera': 'Dhanera',
-    'chengamanād': 'Chengamanād',
-    'lākheri': 'Lākheri',
-    'kalavoor': 'Kalavoor',
-    'behror': 'Behror',
-    'reddipālaiyam': 'Reddipālaiyam',
-    'zunheboto': 'Zunheboto',
-    'rajaori': 'Rajaori',
-    'sankagiri': 'Sankagiri',
-    'mharal bk': 'Mharal Bk',
-    'maināguri': 'Maināguri',
-    'nedumpana': 'Nedumpana',
-    'puttankulam': 'Puttankulam',
-    'sāgwāra': 'Sāgwāra',
-    'nāgar karnūl': 'Nāgar Karnūl',
-    'ibrāhīmpatnam': 'Ibrāhīmpatnam',
-    'vadakku valliyūr': 'Vadakku Valliyūr',
-    'jāmtāra': 'Jāmtāra',
-    'khedbrahma': 'Khedbrahma',
-    'tirukkalikkunram': 'Tirukkalikkunram',
-    'talakkolattur': 'Talakkolattur',
-    'pālkonda': 'Pālkonda',
-    'cheruthazham': 'Cheruthazham',
-    'dhāri': 'Dhāri',
-    'amballūr': 'Amballūr',
-    'koovappady': 'Koovappady',
-    'chendamangalam': 'Chendamangalam',
-    'jewar': 'Jewar',
-    'nawāpāra': 'Nawāpāra',
-    'tarsadi': 'Tarsadi',
-    'ner': 'Ner',
-    'vijayapuram': 'Vijayapuram',
-    'husainābād': 'Husainābād',
-    'udaipurwati': 'Udaipurwati',
-    'jandiāla gurū': 'Jandiāla Gurū',
-    'bachhraon': 'Bachhraon',
-    'irinjālakuda': 'Irinjālakuda',
-    'renwāl': 'Renwāl',
-    'kumbalam': 'Kumbalam',
-    'basni': 'Basni',
-    'morigaon': 'Morigaon',
-    'madhugiri': 'Madhugiri',
-    'urakam': 'Urakam',
-    'islāmnagar': 'Islāmnagar',
-    'ariyalūr': 'Ariyalūr',
-    'ponmana': 'Ponmana',
-    'mahendragarh': 'Mahendragarh',
-    'mudalgi': 'Mudalgi',
-    'nakrekal': 'Nakrekal',
-    'unamaucheri': 'Unamaucheri',
-    'gorai': 'Gorai',
-    'uttamapālaiyam': 'Uttamapālaiyam',
-    'khandela': 'Khandela',
-    'sirsāganj': 'Sirsāganj',
-    'chodavaram': 'Chodavaram',
-    'umarkot': 'Umarkot',
-    'hupari': 'Hupari',
-    'suār': 'Suār',
-    'devadurga': 'Devadurga',
-    'manoharpur': 'Manoharpur',
-    'nāhan': 'Nāhan',
-    'lādwa': 'Lādwa',
-    'gil': 'Gil',
-    'gunupur': 'Gunupur',
-    'avinashi': 'Avinashi',
-    'kotagiri': 'Kotagiri',
-    'sikka': 'Sikka',
-    'panipat taraf rajputan': 'Panipat Taraf Rajputan',
-    'kondotty': 'Kondotty',
-    'rusera': 'Rusera',
-    'desāīganj': 'Desāīganj',
-    'maddūr': 'Maddūr',
-    'nongstoin': 'Nongstoin',
-    'rāikot': 'Rāikot',
-    'dinapur cantonment': 'Dinapur Cantonment',
-    'jhālod': 'Jhālod',
-    'karera': 'Karera',
-    'murlīganj': 'Murlīganj',
-    'soron': 'Soron',
-    'mukher': 'Mukher',
-    'vandiyūr': 'Vandiyūr',
-    'alandi': 'Alandi',
-    'pattāmbi': 'Pattāmbi',
-    'tekkali': 'Tekkali',
-    'duliajan': 'Duliajan',
-    'duliajan oil town': 'Duliajan Oil Town',
-    'kāraippudūr': 'Kāraippudūr',
-    'ambikāpuram': 'Ambikāpuram',
-    'sūryampālaiyam': 'Sūryampālaiyam',
-    'motipur': 'Motipur',
-    'ālangulam': 'Ālangulam',
-    'addanki': 'Addanki',
-    'bemetāra': 'Bemetāra',
-    'milak': 'Milak',
-    'losal': 'Losal',
-    'alirajpur': 'Alirajpur',
-    'pārdi': 'Pārdi',
-    'kinwat': 'Kinwat',
-    'lālgola': 'Lālgola',
-    'utraula': 'Utraula',
-    'baikunthpur': 'Baikunthpur',
-    'jowai': 'Jowai',
-    'ochira': 'Ochira',
-    'rāpar': 'Rāpar',
-    'jammu cantonment': 'Jammu Cantonment',
-    'bānswāda': 'Bānswāda',
-    'hosadurga': 'Hosadurga',
-    'ramanayyapeta': 'Ramanayyapeta',
-    'mīnjūr': 'Mīnjūr',
-    'sonāmukhi': 'Sonāmukhi',
-    'kukshi': 'Kukshi',
-    'kansad': 'Kansad',
-    'kālāvad': 'Kālāvad',
-    'jashpur nagar': 'Jashpur Nagar',
-    'māvelikara': 'Māvelikara',
-    'dhanaura': 'Dhanaura',
-    'jalgaon jamod': 'Jalgaon Jamod',
-    'pallipuram': 'Pallipuram',
-    'sujānpur': 'Sujānpur',
-    'annigeri': 'Annigeri',
-    'piravam': 'Piravam',
-    'ganderbal': 'Ganderbal',
-    'uliyazhathura': 'Uliyazhathura',
-    'mandi': 'Mandi',
-    'atholi': 'Atholi',
-    'shiggaon': 'Shiggaon',
-    'pandua': 'Pandua',
-    'pūnch': 'Pūnch',
-    'kottaikādu': 'Kottaikādu',
-    'hāngal': 'Hāngal',
-    'jhadeshwar': 'Jhadeshwar',
-    'polūr': 'Polūr',
-    'sheohar': 'Sheohar',
-    'perumbavoor': 'Perumbavoor',
-    'gundlupēt': 'Gundlupēt',
-    'sachīn': 'Sachīn',
-    'koynanagar': 'Koynanagar',
-    'gotegaon': 'Gotegaon',
-    'kalwākurti': 'Kalwākurti',
-    'sheoganj': 'Sheoganj',
-    'devanahalli': 'Devanahalli',
-    'āron': 'Āron',
-    'hadagalli': 'Hadagalli',
-    'patran': 'Patran',
-    'tharād': 'Tharād',
-    'panāgar': 'Panāgar',
-    'dāsna': 'Dāsna',
-    'kulittalai': 'Kulittalai',
-    'sulur': 'Sulur',
-    'rangia': 'Rangia',
-    'bāmor kalān': 'Bāmor Kalān',
-    'umargām': 'Umargām',
-    'nalbāri': 'Nalbāri',
-    'pallikunnu': 'Pallikunnu',
-    'trittāla': 'Trittāla',
-    'vadnagar': 'Vadnagar',
-    'jaswantnagar': 'Jaswantnagar',
-    'afzalgarh': 'Afzalgarh',
-    'mahna': 'Mahna',
-    'mathur': 'Mathur',
-    'tehri': 'Tehri',
-    'māgadi': 'Māgadi',
-    'pūvātūparamba': 'Pūvātūparamba',
-    'bāspalli': 'Bāspalli',
-    'mahād': 'Mahād',
-    'ezhupunna': 'Ezhupunna',
-    'sānkrāil': 'Sānkrāil',
-    'wārāseonī': 'Wārāseonī',
-    'beldānga': 'Beldānga',
-    'jilādiguda': 'Jilādiguda',
-    'sausar': 'Sausar',
-    'moothakunnam': 'Moothakunnam',
-    'pathirappally': 'Pathirappally',
-    'hadgāon': 'Hadgāon',
-    'chandrapura': 'Chandrapura',
-    'rājaldesar': 'Rājaldesar',
-    'pachor': 'Pachor',
-    'sādri': 'Sādri',
-    'mīrānpur': 'Mīrānpur',
-    'azhoor': 'Azhoor',
-    'kullattūr': 'Kullattūr',
-    'balussheri': 'Balussheri',
-    'kālānwāli': 'Kālānwāli',
-    'kadodara': 'Kadodara',
-    'chakapara': 'Chakapara',
-    'nanminda': 'Nanminda',
-    'kattumannarkoil': 'Kattumannarkoil',
-    'kalamb': 'Kalamb',
-    'āndippatti': 'Āndippatti',
-    'arumuganeri': 'Arumuganeri',
-    'elamanchili': 'Elamanchili',
-    'adichānallūr': 'Adichānallūr',
-    'laitumkhrah': 'Laitumkhrah',
-    'gulābpura': 'Gulābpura',
-    'pāthardi': 'Pāthardi',
-    'kundarkhi': 'Kundarkhi',
-    'ukhrul': 'Ukhrul',
-    'gadhinglaj': 'Gadhinglaj',
-    'bilgrām': 'Bilgrām',
-    'ali': 'Ali',
-    'bidhūna': 'Bidhūna',
-    'bhelai': 'Bhelai',
-    'ayakudi': 'Ayakudi',
-    'vettanād': 'Vettanād',
-    'āsandh': 'Āsandh',
-    'perumpāvūr': 'Perumpāvūr',
-    'chanpatia': 'Chanpatia',
-    'afzalpur': 'Afzalpur',
-    'gobindpur': 'Gobindpur',
-    'tikkotti': 'Tikkotti',
-    'gingee': 'Gingee',
-    'rāver': 'Rāver',
-    'bāgepalli': 'Bāgepalli',
-    'kotdwāra': 'Kotdwāra',
-    'payakaraopeta': 'Payakaraopeta',
-    'bhawanipur': 'Bhawanipur',
-    'elamkunnapuzha': 'Elamkunnapuzha',
-    'ettumanoor': 'Ettumanoor',
-    'lātehār': 'Lātehār',
-    'chengam': 'Chengam',
-    'kumārapuram': 'Kumārapuram',
-    'margherita': 'Margherita',
-    'kulasēkarapuram': 'Kulasēkarapuram',
-    'sāmba': 'Sāmba',
-    'pirthīpur': 'Pirthīpur',
-    'vepagunta': 'Vepagunta',
-    'vadipatti': 'Vadipatti',
-    'shenkottai': 'Shenkottai',
-    'edacchēri': 'Edacchēri',
-    'banmankhi': 'Banmankhi',
-    'srīnivāspur': 'Srīnivāspur',
-    'palavakkam': 'Palavakkam',
-    'chāndur': 'Chāndur',
-    'indāpur': 'Indāpur',
-    'varappuzha': 'Varappuzha',
-    'kemrī': 'Kemrī',
-    'alattūr': 'Alattūr',
-    'krishnāpuram': 'Krishnāpuram',
-    'kartārpur': 'Kartārpur',
-    'māmidālapādu': 'Māmidālapādu',
-    'karhal': 'Karhal',
-    'lar': 'Lar',
-    'kūdligi': 'Kūdligi',
-    'alīganj': 'Alīganj',
-    'baloda bāzār': 'Baloda Bāzār',
-    'manihāri': 'Manihāri',
-    'kottur': 'Kottur',
-    'faizpur': 'Faizpur',
-    'manāsa': 'Manāsa',
-    'sankarapatti': 'Sankarapatti',
-    'songadh': 'Songadh',
-    'pauri': 'Pauri',
-    'shāhganj': 'Shāhganj',
-    'dhrol': 'Dhrol',
-    'pallippatti': 'Pallippatti',
-    'barwāh': 'Barwāh',
-    'mauganj': 'Mauganj',
-    'bablāi': 'Bablāi',
-    'terdāl': 'Terdāl',
-    'nādbai': 'Nādbai',
-    'kallidaikurichi': 'Kallidaikurichi',
-    'taloda': 'Taloda',
-    'murugampālaiyam': 'Murugampālaiyam',
-    'mon': 'Mon',
-    'kheri': 'Kheri',
-    'bilsi': 'Bilsi',
-    'basi': 'Basi',
-    'āyanchēri': 'Āyanchēri',
-    'kottūru': 'Kottūru',
-    'anjad': 'Anjad',
-    'chinnalapatti': 'Chinnalapatti',
-    'narasannapeta': 'Narasannapeta',
-    'ongallur-ii': 'Ongallur-II',
-    'mirganj': 'Mirganj',
-    'aklera': 'Aklera',
-    'kūdlu': 'Kūdlu',
-    'tekkalakote': 'Tekkalakote',
-    'mungaoli': 'Mungaoli',
-    'budhlāda': 'Budhlāda',
-    'anuppānadi': 'Anuppānadi',
-    'reengus': 'Reengus',
-    'sutrāpāra': 'Sutrāpāra',
-    'kodoli': 'Kodoli',
-    'phulera': 'Phulera',
-    'renigunta': 'Renigunta',
-    'khoni': 'Khoni',
-    'areraj': 'Areraj',
-    'muttanampālaiyam': 'Muttanampālaiyam',
-    'junnar': 'Junnar',
-    'mehsi': 'Mehsi',
-    'mangaldai': 'Mangaldai',
-    'naduvannūr': 'Naduvannūr',
-    'krishnarājpet': 'Krishnarājpet',
-    'tirāwari': 'Tirāwari',
-    'mannachanallur': 'Mannachanallur',
-    'periyanayakkanpalaiyam': 'Periyanayakkanpalaiyam',
-    'kuttikkāttūr': 'Kuttikkāttūr',
-    'jaynagar majilpur': 'Jaynagar Majilpur',
-    'kailāras': 'Kailāras',
-    'chīpurupalle': 'Chīpurupalle',
-    'iringal': 'Iringal',
-    'jamjodhpur': 'Jamjodhpur',
-    'chumukedima': 'Chumukedima',
-    'thodiyoor': 'Thodiyoor',
-    'nalhāti': 'Nalhāti',
-    'jāmul': 'Jāmul',
-    'kāladi': 'Kāladi',
-    'muhamma': 'Muhamma',
-    'ponmundam': 'Ponmundam',
-    'mulamthuruthy': 'Mulamthuruthy',
-    'gokarna': 'Gokarna',
-    'ganguwa': 'Ganguwa',
-    'koregaon': 'Koregaon',
-    'kāndla': 'Kāndla',
-    'erannoli': 'Erannoli',
-    'kārkala': 'Kārkala',
-    'dārwha': 'Dārwha',
-    'chhota udepur': 'Chhota Udepur',
-    'avanigadda': 'Avanigadda',
-    'mussoorie': 'Mussoorie',
-    'kuttippuram': 'Kuttippuram',
-    'jaleshwar': 'Jaleshwar',
-    'jais': 'Jais',
-    'kallam': 'Kallam',
-    'pawāyan': 'Pawāyan',
-    'irugūr': 'Irugūr',
-    'jevargi': 'Jevargi',
-    'mechcheri': 'Mechcheri',
-    'silao': 'Silao',
-    'khajuraho group of monuments': 'Khajuraho Group of Monuments',
-    'silapathar': 'Silapathar',
-    'dākor': 'Dākor',
-    'wadgaon': 'Wadgaon',
-    'deori khās': 'Deori Khās',
-    'jandiāla': 'Jandiāla',
-    'balakrishnapuram': 'Balakrishnapuram',
-    'panayāttur vadakkumbhāgam': 'Panayāttur Vadakkumbhāgam',
-    'pāsighāt': 'Pāsighāt',
-    'kheda': 'Kheda',
-    'nagar': 'Nagar',
-    'viswanatham': 'Viswanatham',
-    'kamalāpuram': 'Kamalāpuram',
-    'poranki': 'Poranki',
-    'parangipettai': 'Parangipettai',
-    'andipalayam': 'Andipalayam',
-    'adampur': 'Adampur',
-    'kakkanad': 'Kakkanad',
-    'talikkulam': 'Talikkulam',
-    'colonelganj': 'Colonelganj',
-    'mehndāwal': 'Mehndāwal',
-    'koelwār': 'Koelwār',
-    'harūr': 'Harūr',
-    'bannūr': 'Bannūr',
-    'mūl': 'Mūl',
-    'kuttampuzha': 'Kuttampuzha',
-    'karuva': 'Karuva',
-    'dorāha': 'Dorāha',
-    'koothanallur': 'Koothanallur',
-    'khātegaon': 'Khātegaon',
-    'nīlēshwar': 'Nīlēshwar',
-    'edaicode': 'Edaicode',
-    'kadakkavoor': 'Kadakkavoor',
-    'haludbani': 'Haludbani',
-    'chāndor': 'Chāndor',
-    'sundarnagar': 'Sundarnagar',
-    'karungappalli': 'Karungappalli',
-    'amarpur': 'Amarpur',
-    'gadkhol': 'Gadkhol',
-    'banganapalle': 'Banganapalle',
-    'anūpshahr': 'Anūpshahr',
-    'chitaguppa': 'Chitaguppa',
-    'bābra': 'Bābra',
-    'kithor': 'Kithor',
-    'kallūr vadakummuri': 'Kallūr Vadakummuri',
-    'machhlīshahr': 'Machhlīshahr',
-    'bagha purana': 'Bagha Purana',
-    'bhānder': 'Bhānder',
-    'azhikkōd': 'Azhikkōd',
-    'uttiramerūr': 'Uttiramerūr',
-    'dasūya': 'Dasūya',
-    'gursarāi': 'Gursarāi',
-    'pāonta sāhib': 'Pāonta Sāhib',
-    'tirorā': 'Tirorā',
-    'rājgurunagar': 'Rājgurunagar',
-    'pottaneri nallakavundanpatti': 'Pottaneri Nallakavundanpatti',
-    'kamaruddinnagar': 'Kamaruddinnagar',
-    'gauripur': 'Gauripur',
-    'rānia': 'Rānia',
-    'mugalivakkam': 'Mugalivakkam',
-    'thazhecode': 'Thazhecode',
-    'saiha': 'Saiha',
-    'chinna salem': 'Chinna Salem',
-    'vayalār': 'Vayalār',
-    'ahraura': 'Ahraura',
-    'rampachodavaram': 'Rampachodavaram',
-    'shrīrangapattana': 'Shrīrangapattana',
-    'kharkhauda': 'Kharkhauda',
-    'kantai': 'Kantai',
-    'kanigiri': 'Kanigiri',
-    'chengannūr': 'Chengannūr',
-    'sohāgpur': 'Sohāgpur',
-    'chandauli': 'Chandauli',
-    'velur': 'Velur',
-    'paramathi velur': 'Paramathi Velur',
-    'naubatpur': 'Naubatpur',
-    'sāndi': 'Sāndi',
-    'padam': 'Padam',
-    'marayur': 'Marayur',
-    'kolasib': 'Kolasib',
-    'shiraguppi': 'Shiraguppi',
-    'ābu': 'Ābu',
-    'sadulshahar': 'Sadulshahar',
-    'borāwar': 'Borāwar',
-    'marutharōd': 'Marutharōd',
-    'gajwel': 'Gajwel',
-    'devarshola': 'Devarshola',
-    'kunda': 'Kunda',
-    'sakleshpur': 'Sakleshpur',
-    'perundurai': 'Perundurai',
-    'mundargi': 'Mundargi',
-    'māchhīwāra': 'Māchhīwāra',
-    'nainpur': 'Nainpur',
-    'tarāna': 'Tarāna',
-    'keirao bitra': 'Keirao Bitra',
-    'kānth': 'Kānth',
-    'charkhāri': 'Charkhāri',
-    'kushtagi': 'Kushtagi',
-    'churi': 'Churi',
-    'vellalūr': 'Vellalūr',
-    'srīperumbūdūr': 'Srīperumbūdūr',
-    'muthutala': 'Muthutala',
-    'mahwa': 'Mahwa',
-    'kandahār': 'Kandahār',
-    'fālna': 'Fālna',
-    'avilala': 'Avilala',
-    'ghoti budrukh': 'Ghoti Budrukh',
-    'safīpur': 'Safīpur',
-    'brāhmana periya agrahāram': 'Brāhmana Periya Agrahāram',
-    'thirunavaya': 'Thirunavaya',
-    'anklesvar ina': 'Anklesvar INA',
-    'kalamnūri': 'Kalamnūri',
-    'kabrāi': 'Kabrāi',
-    'ilaiyankudi': 'Ilaiyankudi',
-    'talwāra': 'Talwāra',
-    'fīrozpur jhirka': 'Fīrozpur Jhirka',
-    'tijāra': 'Tijāra',
-    'pūnāhāna': 'Pūnāhāna',
-    'tattānkuttai': 'Tattānkuttai',
-    'phillaur': 'Phillaur',
-    'pākāla': 'Pākāla',
-    'hinjilicut': 'Hinjilicut',
-    'damua': 'Damua',
-    'ezhudesam': 'Ezhudesam',
-    'andol': 'Andol',
-    'shāmgarh': 'Shāmgarh',
-    'ratanpur': 'Ratanpur',
-    'kodarma': 'Kodarma',
-    'keshorai pātan': 'Keshorai Pātan',
-    'navalgund': 'Navalgund',
-    'bholav': 'Bholav',
-    'williamnagar': 'Williamnagar',
-    'bijbehara': 'Bijbehara',
-    'gorantla': 'Gorantla',
-    'dātāganj': 'Dātāganj',
-    'tiruppuvanam': 'Tiruppuvanam',
-    'beohāri': 'Beohāri',
-    'pantheeramkavu': 'Pantheeramkavu',
-    'chharra': 'Chharra',
-    'hudkeshwar buzurg': 'Hudkeshwar Buzurg',
-    'pindwāra': 'Pindwāra',
-    'singāpur': 'Singāpur',
-    'sahaspur': 'Sahaspur',
-    'ugrākheri': 'Ugrākheri',
-    'kānt': 'Kānt',
-    'bhokardan': 'Bhokardan',
-    'maheshwar': 'Maheshwar',
-    'thiruthuraipoondi': 'Thiruthuraipoondi',
-    'meenambakkam': 'Meenambakkam',
-    'chiknāyakanhalli': 'Chiknāyakanhalli',
-    'mahārājgani': 'Mahārājgani',
-    'ayanavelikulangara vadakku': 'Ayanavelikulangara Vadakku',
-    'kaithoon': 'Kaithoon',
-    'denkanikota': 'Denkanikota',
-    'chekkiād': 'Chekkiād',
-    'mayāng imphāl': 'Mayāng Imphāl',
-    'haliyal': 'Haliyal',
-    'vilankurichi': 'Vilankurichi',
-    'rajākheri': 'Rajākheri',
-    'sitārganj': 'Sitārganj',
-    'nāndgaon': 'Nāndgaon',
-    'siuliban': 'Siuliban',
-    'dharampur': 'Dharampur',
-    'sikandarpur': 'Sikandarpur',
-    'srīsailain': 'Srīsailain',
-    'barki saria': 'Barki Saria',
-    'loha': 'Loha',
-    'mhaswad': 'Mhaswad',
-    'alot': 'Alot',
-    'suryaraopeta': 'Suryaraopeta',
-    'aluva': 'Aluva',
-    'hastināpur': 'Hastināpur',
-    'sōmēshvara': 'Sōmēshvara',
-    'pacode': 'Pacode',
-    'pāppākurichchi': 'Pāppākurichchi',
-    'morinda': 'Morinda',
-    'diu': 'Diu',
-    'nabīnagar': 'Nabīnagar',
-    'dīnānagar': 'Dīnānagar',
-    'kaikalapettai': 'Kaikalapettai',
-    'bāzpur': 'Bāzpur',
-    'karumāndi chellipālaiyam': 'Karumāndi Chellipālaiyam',
-    'dalsingh sarai': 'Dalsingh Sarai',
-    'makronia': 'Makronia',
-    'sāvantvādi': 'Sāvantvādi',
-    'longowal': 'Longowal',
-    'vīrakeralam': 'Vīrakeralam',
-    'reoti': 'Reoti',
-    'pādiyanallūr': 'Pādiyanallūr',
-    'nāsriganj': 'Nāsriganj',
-    'fatehganj west': 'Fatehganj West',
-    'sadalgi': 'Sadalgi',
-    'nasrullāhganj': 'Nasrullāhganj',
-    'sarjamda': 'Sarjamda',
-    'narakal': 'Narakal',
-    'lalgudi': 'Lalgudi',
-    'ulundurpet': 'Ulundurpet',
-    'malakpur kohi rangpur': 'Malakpur Kohi Rangpur',
-    'nivāri': 'Nivāri',
-    'vypīn': 'Vypīn',
-    'muluppilagadu': 'Muluppilagadu',
-    'alwaye': 'Alwaye',
-    'tisaiyanvilai': 'Tisaiyanvilai',
-    'srīkandamangalam': 'Srīkandamangalam',
-    'kutiatodu': 'Kutiatodu',
-    'pipri': 'Pipri',
-    'natham': 'Natham',
-    'unnamalaikadai': 'Unnamalaikadai',
-    'penugonda': 'Penugonda',
-    'balod': 'Balod',
-    'mariāni': 'Mariāni',
-    'qadian': 'Qadian',
-    'painkulam': 'Painkulam',
-    'prāntij': 'Prāntij',
-    'kulgam': 'Kulgam',
-    'chinnūr': 'Chinnūr',
-    'katheru': 'Katheru',
-    'mairwa': 'Mairwa',
-    'todaraisingh': 'Todaraisingh',
-    'pokaran': 'Pokaran',
-    'kūmher': 'Kūmher',
-    'sreekaryam': 'Sreekaryam',
-    'pānchla': 'Pānchla',
-    'mudkhed': 'Mudkhed',
-    'shivpur charcha': 'Shivpur Charcha',
-    'jhīnjhak': 'Jhīnjhak',
-    'pethāpur': 'Pethāpur',
-    'malpe': 'Malpe',
-    'birūr': 'Birūr',
-    'māndal': 'Māndal',
-    'shīshgarh': 'Shīshgarh',
-    'kuchera': 'Kuchera',
-    'pattiyūrgrāmam': 'Pattiyūrgrāmam',
-    'sevilimedu': 'Sevilimedu',
-    'pawni': 'Pawni',
-    'mānesar': 'Mānesar',
-    'chhātāpur': 'Chhātāpur',
-    'tūnēri': 'Tūnēri',
-    'urmar': 'Urmar',
-    'lonar': 'Lonar',
-    'pugalūr': 'Pugalūr',
-    'rāmtek': 'Rāmtek',
-    'monoharpur': 'Monoharpur',
-    'injambakkam': 'Injambakkam',
-    'mandāwa': 'Mandāwa',
-    'mahārājpur': 'Mahārājpur',
-    'soygaon': 'Soygaon',
-    'kalānaur': 'Kalānaur',
-    'chitrakoot dham': 'Chitrakoot Dham',
-    'ron': 'Ron',
-    'vengattūr': 'Vengattūr',
-    'nāyanakulam': 'Nāyanakulam',
-    'bewar': 'Bewar',
-    'marampilly': 'Marampilly',
-    'od': 'Od',
-    'tapa': 'Tapa',
-    'vaikam': 'Vaikam',
-    'kērkandi': 'Kērkandi',
-    'colachel': 'Colachel',
-    'bissāu': 'Bissāu',
-    'karmāla': 'Karmāla',
-    'tharangambadi': 'Tharangambadi',
-    'hinakallu': 'Hinakallu',
-    'thiruvankulam': 'Thiruvankulam',
-    'tiruverumbūr': 'Tiruverumbūr',
-    'kudachi': 'Kudachi',
-    'seondha': 'Seondha',
-    'kurduvādi': 'Kurduvādi',
-    'mattigiri': 'Mattigiri',
-    'polasara': 'Polasara',
-    'iroopara': 'Iroopara',
-    'narasingapuram': 'Narasingapuram',
-    'nakūr': 'Nakūr',
-    'palwal rural': 'Palwal Rural',
-    'pallikonda': 'Pallikonda',
-    'asifābād': 'Asifābād',
-    'indargarh': 'Indargarh',
-    'sivagiri': 'Sivagiri',
-    'vadakkanandal': 'Vadakkanandal',
-    'ancharakandy': 'Ancharakandy',
-    'trikarpūr south': 'Trikarpūr South',
-    'hukeri': 'Hukeri',
-    'todabhim': 'Todabhim',
-    'pehlādpur bāngar': 'Pehlādpur Bāngar',
-    'dooru verinag': 'Dooru Verinag',
-    'tiruchanur': 'Tiruchanur',
-    'kanhān': 'Kanhān',
-    'gopavaram': 'Gopavaram',
-    'vattalkundu': 'Vattalkundu',
-    'dhamanagar': 'Dhamanagar',
-    'saidpur': 'Saidpur',
-    'tittagudi': 'Tittagudi',
-    'phulpur': 'Phulpur',
-    'kunnatnād': 'Kunnatnād',
-    'jharoda mazra burāri': 'Jharoda Mazra Burāri',
-    'karanjiā': 'Karanjiā',
-    'balarāmpur': 'Balarāmpur',
-    'aramboli': 'Aramboli',
-    'ubaidullāhganj': 'Ubaidullāhganj',
-    'chitarpur': 'Chitarpur',
-    'naraingarh': 'Naraingarh',
-    'sāmbhar': 'Sāmbhar',
-    'vellūr': 'Vellūr',
-    'fatehnagar': 'Fatehnagar',
-    'raghunathpur': 'Raghunathpur',
-    'pariyāpuram': 'Pariyāpuram',
-    'kasrāwad': 'Kasrāwad',
-    'lāthi': 'Lāthi',
-    'dugda': 'Dugda',
-    'khirkiya': 'Khirkiya',
-    'mudgal': 'Mudgal',
-    'curchorem': 'Curchorem',
-    'chorwād': 'Chorwād',
-    'madhira': 'Madhira',
-    'kādiganpalli': 'Kādiganpalli',
-    'akaltara': 'Akaltara',
-    'etmadpur': 'Etmadpur',
-    'katghora': 'Katghora',
-    'ponda': 'Ponda',
-    'lohāra': 'Lohāra',
-    'mātābhānga': 'Mātābhānga',
-    'jaitāran': 'Jaitāran',
-    'tāoru': 'Tāoru',
-    'lehragaga': 'Lehragaga',
-    'jāmai': 'Jāmai',
-    'sholavandan': 'Sholavandan',
-    'nāgod': 'Nāgod',
-    'khairāgarh': 'Khairāgarh',
-    'kurikuppi': 'Kurikuppi',
-    'ariyallur': 'Ariyallur',
-    'pukhrāyān': 'Pukhrāyān',
-    'rāman': 'Rāman',
-    'bankāpur': 'Bankāpur',
-    'godoli': 'Godoli',
-    'baswa': 'Baswa',
-    'rājmahal': 'Rājmahal',
-    'nambol': 'Nambol',
-    'tulsīpur': 'Tulsīpur',
-    'bikram': 'Bikram',
-    'belūr': 'Belūr',
-    'sānehwāl': 'Sānehwāl',
-    'sisauli': 'Sisauli',
-    'kanniyākumāri': 'Kanniyākumāri',
-    'senapparetti': 'Senapparetti',
-    'naraura': 'Naraura',
-    'kailāshahar': 'Kailāshahar',
-    'triparappu': 'Triparappu',
-    'deogarh': 'Deogarh',
-    'rātu': 'Rātu',
-    'puthencruz': 'Puthencruz',
-    'kurandvād': 'Kurandvād',
-    'timurni': 'Timurni',
-    'pachgaon': 'Pachgaon',
-    'rahata': 'Rahata',
-    'bhawānīgarh': 'Bhawānīgarh',
-    'suket': 'Suket',
-    'panniyannūr': 'Panniyannūr',
-    'ādanāttutekkumuri kizhakku': 'Ādanāttutekkumuri Kizhakku',
-    'ankola': 'Ankola',
-    'mariāhu': 'Mariāhu',
-    'kilapavoor': 'Kilapavoor',
-    'rāmavarappādu': 'Rāmavarappādu',
-    'purwā': 'Purwā',
-    'attimarappatti': 'Attimarappatti',
-    'dasnapur': 'Dasnapur',
-    'badāmibāgh': 'Badāmibāgh',
-    'lingiādīh': 'Lingiādīh',
-    'sahāwar': 'Sahāwar',
-    'bhuban': 'Bhuban',
-    'nilakottai': 'Nilakottai',
-    'sidhaulī': 'Sidhaulī',
-    'palavansathu': 'Palavansathu',
-    'adra': 'Adra',
-    'sarapāka': 'Sarapāka',
-    'bhānvad': 'Bhānvad',
-    'someshwar': 'Someshwar',
-    'nārāinpur': 'Nārāinpur',
-    'nāmagiripettai': 'Nāmagiripettai',
-    'nāwa': 'Nāwa',
-    'peravurani': 'Peravurani',
-    'kathhāra': 'Kathhāra',
-    'kathlāl': 'Kathlāl',
-    'siwāna': 'Siwāna',
-    'kizhuparamba': 'Kizhuparamba',
-    'palai': 'Palai',
-    'chhanerā': 'Chhanerā',
-    'marakkanam': 'Marakkanam',
-    'chhatrapur': 'Chhatrapur',
-    'bhinga': 'Bhinga',
-    'lauri': 'Lauri',
-    'nalambūr': 'Nalambūr',
-    'kuppam': 'Kuppam',
-    'kīl bhuvanagiri': 'Kīl Bhuvanagiri',
-    'saktī': 'Saktī',
-    'karuvanthuruthy': 'Karuvanthuruthy',
-    'kollivāyal': 'Kollivāyal',
-    'sancoale': 'Sancoale',
-    'polichalur': 'Polichalur',
-    'bhābhar': 'Bhābhar',
-    'nowrozabad': 'Nowrozabad',
-    'laungowāl': 'Laungowāl',
-    'chāchaura': 'Chāchaura',
-    'ghulewadi': 'Ghulewadi',
-    'chandrakona': 'Chandrakona',
-    'sangod': 'Sangod',
-    'kherālu': 'Kherālu',
-    'farakka': 'Farakka',
-    'mulavukad': 'Mulavukad',
-    'mangalvedha': 'Mangalvedha',
-    'māniyūr': 'Māniyūr',
-    'kantābānji': 'Kantābānji',
-    'chalthan': 'Chalthan',
-    'jainagar': 'Jainagar',
-    'kopawor': 'Kopawor',
-    'sakri': 'Sakri',
-    'dattāpur': 'Dattāpur',
-    'umarsera': 'Umarsera',
-    'napāsar': 'Napāsar',
-    'shendurjana': 'Shendurjana',
-    'pātūr': 'Pātūr',
-    'digboi': 'Digboi',
-    'jirapur': 'Jirapur',
-    'kalleribhāgam': 'Kalleribhāgam',
-    'muthupet': 'Muthupet',
-    'dum duma': 'Dum Duma',
-    'pāmpur': 'Pāmpur',
-    'munderi': 'Munderi',
-    'sūrajgarh': 'Sūrajgarh',
-    'kadayal': 'Kadayal',
-    'kundli': 'Kundli',
-    'bālāchor': 'Bālāchor',
-    'pushkar': 'Pushkar',
-    'doda': 'Doda',
-    'karanpur': 'Karanpur',
-    'samthar': 'Samthar',
-    'banat': 'Banat',
-    'dhekiajuli': 'Dhekiajuli',
-    'māndalgarh': 'Māndalgarh',
-    'barāra': 'Barāra',
-    'tammampatti': 'Tammampatti',
-    'chamba': 'Chamba',
-    'murādābād pahāri': 'Murādābād Pahāri',
-    'mahādula': 'Mahādula',
-    'bānsdīh': 'Bānsdīh',
-    'srisailam project rfc township': 'Srisailam Project RFC Township',
-    'bacheli': 'Bacheli',
-    'āsika': 'Āsika',
-    'guruvāyūr': 'Guruvāyūr',
-    'lālru': 'Lālru',
-    'virugambakkam': 'Virugambakkam',
-    'chotila': 'Chotila',
-    'vāsudevanallūr': 'Vāsudevanallūr',
-    'kuju': 'Kuju',
-    'padmanābhapuram': 'Padmanābhapuram',
-    'mandāwar': 'Mandāwar',
-    'paippad': 'Paippad',
-    'mahgawān': 'Mahgawān',
-    'kondasamudram': 'Kondasamudram',
-    'bedi': 'Bedi',
-    'tekāri': 'Tekāri',
-    'dindori': 'Dindori',
-    'channagiri': 'Channagiri',
-    'kuzhithurai': 'Kuzhithurai',
-    'kodamthuruth': 'Kodamthuruth',
-    'ghātanji': 'Ghātanji',
-    'naduvattam': 'Naduvattam',
-    'chhāta': 'Chhāta',
-    'sanaur': 'Sanaur',
-    'reethapuram': 'Reethapuram',
-    'kottappally': 'Kottappally',
-    'serchhīp': 'Serchhīp',
-    'pudupattanam': 'Pudupattanam',
-    'telhāra': 'Telhāra',
-    'narkher': 'Narkher',
-    'ajnāla': 'Ajnāla',
-    'anthiyur': 'Anthiyur',
-    'bisālgarh': 'Bisālgarh',
-    'dhulagari': 'Dhulagari',
-    'talala': 'Talala',
-    'būndu': 'Būndu',
-    'teliamura': 'Teliamura',
-    'devgadh bāriya': 'Devgadh Bāriya',
-    'patharia': 'Patharia',
-    'patnāgarh': 'Patnāgarh',
-    'kiraoli': 'Kiraoli',
-    'bhānpura': 'Bhānpura',
-    'perinjanam': 'Perinjanam',
-    'anklav': 'Anklav',
-    'abrama': 'Abrama',
-    'bagulā': 'Bagulā',
-    'gunnaur': 'Gunnaur',
-    'pālakkodu': 'Pālakkodu',
-    'sindi': 'Sindi',
-    'chelora': 'Chelora',
-    'rajpur': 'Rajpur',
-    'nāravārikuppam': 'Nāravārikuppam',
-    'marthandam': 'Marthandam',
-    'vinnamāla': 'Vinnamāla',
-    'sarauli': 'Sarauli',
-    'badnāwar': 'Badnāwar',
-    'banga': 'Banga',
-    'heli mandi': 'Heli Mandi',
-    'chincholi': 'Chincholi',
-    'hungund': 'Hungund',
-    'thaikkattussery': 'Thaikkattussery',
-    'bangawan': 'Bangawan',
-    'kapasan': 'Kapasan',
-    'sālamedu': 'Sālamedu',
-    'barpāli': 'Barpāli',
-    'gormi': 'Gormi',
-    'begūn': 'Begūn',
-    'lawngtlai': 'Lawngtlai',
-    'nandri': 'Nandri',
-    'dhing': 'Dhing',
-    'vadakarai kīl pidāgai': 'Vadakarai Kīl Pidāgai',
-    'clement town': 'Clement Town',
-    'kaikalūr': 'Kaikalūr',
-    'akhnūr': 'Akhnūr',
-    'alībāg': 'Alībāg',
-    'kāpren': 'Kāpren',
-    'muthukulam': 'Muthukulam',
-    'bhadauni': 'Bhadauni',
-    'alīpur': 'Alīpur',
-    'achampet': 'Achampet',
-    'ghorabandha': 'Ghorabandha',
-    'koduvayur': 'Koduvayur',
-    'sāmalāpuram': 'Sāmalāpuram',
-    'chākia': 'Chākia',
-    'jining': 'Jining',
-    'bhanjanagar': 'Bhanjanagar',
-    'vadāli': 'Vadāli',
-    'koppana agrahara': 'koppana Agrahara',
-    'madattukkulam': 'Madattukkulam',
-    'gurmatkāl': 'Gurmatkāl',
-    'dhāriwāl': 'Dhāriwāl',
-    'patuvilāyi': 'Patuvilāyi',
-    'talwandi sābo': 'Talwandi Sābo',
-    'dayal pur': 'Dayal Pur',
-    'jahāzpur': 'Jahāzpur',
-    'sāvda': 'Sāvda',
-    'vadakakarai': 'Vadakakarai',
-    'viratnagar': 'Viratnagar',
-    'belsand': 'Belsand',
-    'sāmpla': 'Sāmpla',
-    'vasind': 'Vasind',
-    'kishtwār': 'Kishtwār',
-    'attibele': 'Attibele',
-    'achhnera': 'Achhnera',
-    'bhikkiwind uttār': 'Bhikkiwind Uttār',
-    'chillupār': 'Chillupār',
-    'tilpat': 'Tilpat',
-    'bijāwar': 'Bijāwar',
-    'nellimarla': 'Nellimarla',
-    'maham': 'Maham',
-    'maniar': 'Maniar',
-    'yellāpur': 'Yellāpur',
-    'keevallur': 'Keevallur',
-    'nangli': 'Nangli',
-    'nīmāj': 'Nīmāj',
-    'baud': 'Baud',
-    'tufānganj': 'Tufānganj',
-    'korochi': 'Korochi',
-    'pataudi': 'Pataudi',
-    'dhārūr': 'Dhārūr',
-    'pariyāram': 'Pariyāram',
-    'french rocks': 'French Rocks',
-    'ahīwāra': 'Ahīwāra',
-    'bāda': 'Bāda',
-    'sarwar': 'Sarwar',
-    'edavilangu': 'Edavilangu',
-    'jhālu': 'Jhālu',
-    'killannur': 'Killannur',
-    'mundra': 'Mundra',
-    'byndoor': 'Byndoor',
-    'chāpar': 'Chāpar',
-    'kondalampatti': 'Kondalampatti',
-    'bawāni khera': 'Bawāni Khera',
-    'ālampālaiyam': 'Ālampālaiyam',
-    'umbri': 'Umbri',
-    'wellington': 'Wellington',
-    'hārij': 'Hārij',
-    'raipur domana': 'Raipur Domana',
-    'settūr': 'Settūr',
-    'waluj buzurg': 'Waluj Buzurg',
-    'penukonda': 'Penukonda',
-    'kotivakkam': 'Kotivakkam',
-    'kataiya': 'Kataiya',
-    'surajpur': 'Surajpur',
-    'nirmāli': 'Nirmāli',
-    'puliyankannu': 'Puliyankannu',
-    'morwa': 'Morwa',
-    'pāttyam': 'Pāttyam',
-    'kaimori': 'Kaimori',
-    'pudussery west': 'Pudussery West',
-    'mau aimma': 'Mau Aimma',
-    'chinnavādampatti': 'Chinnavādampatti',
-    'fālākāta': 'Fālākāta',
-    'sūleswaranpatti': 'Sūleswaranpatti',
-    'dhaurahra': 'Dhaurahra',
-    'maksi': 'Maksi',
-    'annur': 'Annur',
-    'pulwama': 'Pulwama',
-    'sirumugai': 'Sirumugai',
-    'singānuram': 'Singānuram',
-    'dergaon': 'Dergaon',
-    'cheppad': 'Cheppad',
-    'khowai': 'Khowai',
-    'govardhan': 'Govardhan',
-    'saraipali': 'Saraipali',
-    'paravai': 'Paravai',
-    'khalāri': 'Khalāri',
-    'rāya': 'Rāya',
-    'sawar': 'Sawar',
-    'pāmūru': 'Pāmūru',
-    'powai': 'Powai',
-    'belonia': 'Belonia',
-    'takhatpur': 'Takhatpur',
-    'sullya': 'Sullya',
-    'bhusawar': 'Bhusawar',
-    'chunchupally': 'Chunchupally',
-    'charthāwal': 'Charthāwal',
-    'siswā bāzār': 'Siswā Bāzār',
-    'bīrpur': 'Bīrpur',
-    'kandalloor': 'Kandalloor',
-    'dhanaula': 'Dhanaula',
-    'l.a.sagaram': 'L.A.Sagaram',
-    'sarigam ina': 'Sarigam INA',
-    'kanjiramkulam': 'Kanjiramkulam',
-    'anūppur': 'Anūppur',
-    'moirāng': 'Moirāng',
-    'nattappettai': 'Nattappettai',
-    'bokajān': 'Bokajān',
-    'rānikhet': 'Rānikhet',
-    'sirka': 'Sirka',
-    'boriavi': 'Boriavi',
-    'aurād': 'Aurād',
-    'sankaraperi': 'Sankaraperi',
-    'kulu': 'Kulu',
-    'kalinjur': 'Kalinjur',
-    'chetput': 'Chetput',
-    'kolavallúr': 'Kolavallúr',
-    'sonāri': 'Sonāri',
-    'deoraniān': 'Deoraniān',
-    'kolāras': 'Kolāras',
-    'chinna āndānkovil': 'Chinna Āndānkovil',
-    'raval': 'Raval',
-    'kannānkurichchi': 'Kannānkurichchi',
-    'kattanam': 'Kattanam',
-    'ghatkesar': 'Ghatkesar',
-    'borgaon': 'Borgaon',
-    'sendamangalam': 'Sendamangalam',
-    'chhāpar': 'Chhāpar',
-    'udangudi': 'Udangudi',
-    'tirumeshi': 'Tirumeshi',
-    'kerūr': 'Kerūr',
-    'verukulambu': 'Verukulambu',
-    'jhinjhāna': 'Jhinjhāna',
-    'kumbhrāj': 'Kumbhrāj',
-    'bareja': 'Bareja',
-    'vadakku viravanallur': 'Vadakku Viravanallur',
-    'mokēri': 'Mokēri',
-    'samrāla': 'Samrāla',
-    'jūnāgarh': 'Jūnāgarh',
-    'nalco': 'Nalco',
-    'badi': 'Badi',
-    'charipara': 'Charipara',
-    'resubelpara': 'Resubelpara',
-    'kalmeshwar': 'Kalmeshwar',
-    'jharoda kalān': 'Jharoda Kalān',
-    'lāwar khās': 'Lāwar Khās',
-    'srīrāmnagar': 'Srīrāmnagar',
-    'pattan': 'Pattan',
-    'mulakumūd': 'Mulakumūd',
-    'bāgbahra': 'Bāgbahra',
-    'vīsāvadar': 'Vīsāvadar',
-    'pināhat': 'Pināhat',
-    'pennādam': 'Pennādam',
-    'nainwa': 'Nainwa',
-    'jānsath': 'Jānsath',
-    'santrampur': 'Santrampur',
-    'richha': 'Richha',
-    'bhāyāvadar': 'Bhāyāvadar',
-    'aistala': 'Aistala',
-    'methukummal': 'Methukummal',
-    'gannavaram': 'Gannavaram',
-    'amarpātan': 'Amarpātan',
-    'sojītra': 'Sojītra',
-    'singur': 'Singur',
-    'singarāyakonda': 'Singarāyakonda',
-    'punnayūr': 'Punnayūr',
-    'konnūr': 'Konnūr',
-    'weir': 'Weir',
-    'narwar': 'Narwar',
-    'wazīrganj': 'Wazīrganj',
-    'kakdwip': 'Kakdwip',
-    'tamenglong': 'Tamenglong',
-    'jalochi': 'Jalochi',
-    'maholi': 'Maholi',
-    'kaimur': 'Kaimur',
-    'bilhaur': 'Bilhaur',
-    'mangalam': 'Mangalam',
-    'raja pur khurd': 'Raja Pur Khurd',
-    'khānāpur': 'Khānāpur',
-    'tiruppālai': 'Tiruppālai',
-    'nimāparha': 'Nimāparha',
-    'burhar': 'Burhar',
-    'devadanapatti': 'Devadanapatti',
-    'laksar': 'Laksar',
-    'vakkam': 'Vakkam',
-}
 
 def get_all_display_cities_sorted() -> list[str]:
     return sorted(DISPLAY_NAMES.values())
-
@@ -14,6 +14,10 @@ class Config:
     MONGODB_POOL_SIZE = int(os.getenv('MONGODB_POOL_SIZE', 10))
     # When true, the app will NOT read/write JSON fallbacks and will rely solely on MongoDB
     DISABLE_JSON_FALLBACK = os.getenv('DISABLE_JSON_FALLBACK', 'False').lower() == 'true'
+    # Create missing indexes from backend/indexes.py when connecting (else run scripts/ensure_indexes.py)
+    ENSURE_INDEXES_ON_STARTUP = os.getenv('ENSURE_INDEXES_ON_STARTUP', 'True').lower() == 'true'
+    # Seconds database calls fail fast after the cluster is seen down, before one probe is let through
+    DB_CIRCUIT_RESET_SECONDS = float(os.getenv('DB_CIRCUIT_RESET_SECONDS', 30))
     
     # Flask
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
@@ -32,6 +36,14 @@ class Config:
     
     # Performance
     CACHE_TIMEOUT = int(os.getenv('CACHE_TIMEOUT', 300))
+    # Max memoized (candidate_skill, internship_skill, threshold) fuzzy match results
+    SKILL_MATCH_CACHE_SIZE = int(os.getenv('SKILL_MATCH_CACHE_SIZE', 200000))
+    # Max distinct skills held in the precomputed skill match matrix
+    SKILL_MATRIX_MAX_SIZE = int(os.getenv('SKILL_MATRIX_MAX_SIZE', 50000))
+    # Catalogs with at least this many postings are scored by a process pool (0 disables)
+    PARALLEL_SCORING_MIN_POSTINGS = int(os.getenv('PARALLEL_SCORING_MIN_POSTINGS', 100000))
+    # Scoring worker processes (0 = one per CPU; parallel scoring needs at least 2)
+    PARALLEL_SCORING_WORKERS = int(os.getenv('PARALLEL_SCORING_WORKERS', 0))
     API_RATE_LIMIT = int(os.getenv('API_RATE_LIMIT', 100))
     
     # Logging
@@ -41,6 +53,8 @@ class Config:
     # Paths
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
     DATA_DIR = os.path.join(BASE_DIR, "..", "data")
+    # Prebuilt city-to-city distance table (scripts/build_distance_table.py)
+    CITY_DISTANCE_TABLE = os.getenv('CITY_DISTANCE_TABLE', os.path.join(DATA_DIR, "city_distances.npy"))
 
 class DevelopmentConfig(Config):
     """Development configuration."""
@@ -13,6 +13,7 @@ try:
     DB_NAME = config.DB_NAME
     DATA_DIR = config.DATA_DIR
     POOL_SIZE = config.MONGODB_POOL_SIZE
+    ENSURE_INDEXES_ON_STARTUP = getattr(config, 'ENSURE_INDEXES_ON_STARTUP', True)
     DISABLE_JSON_FALLBACK = getattr(config, 'DISABLE_JSON_FALLBACK', False)
 except ImportError:
     import os
@@ -21,6 +22,7 @@ except ImportError:
     BASE_DIR = os.path.dirname(os.path.dirname(__file__))
     DATA_DIR = os.path.join(BASE_DIR, "data")
     POOL_SIZE = int(os.getenv('MONGODB_POOL_SIZE', 10))
+    ENSURE_INDEXES_ON_STARTUP = os.getenv('ENSURE_INDEXES_ON_STARTUP', 'True').lower() == 'true'
     DISABLE_JSON_FALLBACK = os.getenv('DISABLE_JSON_FALLBACK', 'False').lower() == 'true'
 
 # Try to import logger, fallback to print
@@ -34,6 +36,21 @@ except ImportError:
     log_error = print
     log_warning = print
 
+try:
+    from backend.bulk_sync import sync_collection
+except ImportError:
+    from bulk_sync import sync_collection
+
+try:
+    from backend.db_health import ConnectionHealth
+except ImportError:
+    from db_health import ConnectionHealth
+
+try:
+    from backend.indexes import ensure_indexes, log_report
+except ImportError:
+    from indexes import ensure_indexes, log_report
+
 class DatabaseManager:
     """Singleton database manager with connection pooling and health checks."""
     
@@ -49,45 +66,67 @@ class DatabaseManager:
     
     def _initialize(self):
         """Initialize database connection."""
+        if getattr(self, '_health', None) is None:
+            self._health = ConnectionHealth()
         try:
             self._client = MongoClient(
                 MONGO_URI,
                 maxPoolSize=POOL_SIZE,
                 serverSelectionTimeoutMS=5000,
                 socketTimeoutMS=10000,
-                connectTimeoutMS=10000
+                connectTimeoutMS=10000,
+                event_listeners=[self._health]
             )
             self._db = self._client[DB_NAME]
             
             # Test connection
             self._client.admin.command('ping')
+            self._health.record_success()
             log(f"Successfully connected to MongoDB: {DB_NAME}")
+            if ENSURE_INDEXES_ON_STARTUP:
+                self._ensure_indexes()
             
-        except errors.ServerSelectionTimeoutError:
+        except errors.ServerSelectionTimeoutError as e:
             log_error("MongoDB connection timeout. Is MongoDB running?")
-            self._client = None
-            self._db = None
+            self._discard_client(e)
         except Exception as e:
             log_error(f"❌ MongoDB connection failed: {e}")
-            self._client = None
-            self._db = None
+            self._discard_client(e)
+    
+    def _ensure_indexes(self):
+        """Apply the declarative index specs once per connection."""
+        try:
+            log_report(ensure_indexes(self._db), info=log, warning=log_warning)
+        except Exception as e:
+            log_warning(f"Index setup failed: {e}")
+    
+    def _discard_client(self, error):
+        """Drop a client that could not connect and open the circuit breaker."""
+        if self._client is not None:
+            self._client.close()
+        self._client = None
+        self._db = None
+        self._health.record_failure(error)
     
     def get_db(self):
-        """Get database instance with health check."""
+        """Get database instance, or None while the circuit breaker is open."""
+        if not self._health.available():
+            return None
         if self._db is None:
             self._initialize()
         return self._db
     
     def health_check(self):
-        """Check database health."""
-        try:
-            if self._client is None:
-                return False
-            self._client.admin.command('ping')
-            return True
-        except Exception as e:
-            log_error(f"Database health check failed: {e}")
-            return False
+        """Check database health from the driver's heartbeats (no round trip).
+
+        A pure read: unlike get_db() it never connects and never takes the
+        circuit breaker's half-open probe.
+        """
+        return self._db is not None and self._health.state() == "closed"
+    
+    def circuit_state(self):
+        """Circuit breaker state: closed, open, half-open or unknown."""
+        return self._health.state()
     
     def close_connection(self):
         """Close database connection."""
@@ -127,18 +166,11 @@ def load_data(collection_name, use_cache=True):
     
     try:
         # Try MongoDB first
-        if db_manager.health_check():
-            db = get_database()
+        # None while the circuit breaker is open: fail fast
+        db = get_database()
+        if db is not None:
             collection = db[collection_name]
             
-            # Add basic indexing for common queries
-            if collection_name == "profiles":
-                collection.create_index("candidate_id")
-                collection.create_index("name")
-            elif collection_name == "internships":
-                collection.create_index("internship_id")
-                collection.create_index("skills_required")
-            
             data = list(collection.find())
             log(f"[DB] Fetched '{collection_name}' from MongoDB ({len(data)} records) in {time.time() - start_time:.3f}s")
             return convert_object_ids(data)
@@ -175,29 +207,17 @@ def save_data(collection_name, data):
     
     # Save to MongoDB
     try:
-        if db_manager.health_check():
-            db = get_database()
+        # None while the circuit breaker is open: fail fast
+        db = get_database()
+        if db is not None:
             collection = db[collection_name]
             
-            # Clear and insert new data
-            collection.delete_many({})
-            if data:
-                # Convert string IDs back to ObjectId for MongoDB
-                mongo_data = []
-                for item in data:
-                    mongo_item = item.copy()
-                    if '_id' in mongo_item and isinstance(mongo_item['_id'], str):
-                        try:
-                            mongo_item['_id'] = ObjectId(mongo_item['_id'])
-                        except:
-                            # Remove invalid ObjectId
-                            del mongo_item['_id']
-                    mongo_data.append(mongo_item)
-                
-                collection.insert_many(mongo_data)
+            # Write only what changed, keyed on the collection's natural id
+            counts = sync_collection(collection, data or [])
             
             mongo_success = True
-            log(f"[DB] Saved '{collection_name}' to MongoDB ({len(data)} records) in {time.time() - start_time:.3f}s")
+            log(f"[DB] Saved '{collection_name}' to MongoDB ({len(data)} records: {counts['upserts']} upserted, "
+                f"{counts['deletes']} deleted, {counts['unchanged']} unchanged) in {time.time() - start_time:.3f}s")
             
     except Exception as e:
         log_error(f"[DB] MongoDB save failed for '{collection_name}': {e}")
@@ -0,0 +1,105 @@
+# backend/db_health.py
+"""
+MongoDB liveness tracking without a ping per operation.
+
+ConnectionHealth is registered as a pymongo heartbeat and topology listener,
+so the driver's background monitor keeps it current: the cluster is up while
+the topology has a writable server and down once a heartbeat has failed and
+none is left. DatabaseManager.health_check() is then an in-memory read.
+
+It doubles as a circuit breaker. While the cluster is down, callers are
+refused immediately instead of each waiting serverSelectionTimeoutMS. Once
+every DB_CIRCUIT_RESET_SECONDS a single caller is let through as a probe;
+a heartbeat showing the server back closes the breaker for everyone.
+"""
+
+import threading
+import time
+
+from pymongo import monitoring
+
+# Try to import config, fallback to environment variables
+try:
+    from backend.config import get_config
+    DB_CIRCUIT_RESET_SECONDS = get_config().DB_CIRCUIT_RESET_SECONDS
+except Exception:
+    import os
+    DB_CIRCUIT_RESET_SECONDS = float(os.getenv('DB_CIRCUIT_RESET_SECONDS', 30))
+
+
+class ConnectionHealth(monitoring.ServerHeartbeatListener, monitoring.TopologyListener):
+    """Cluster liveness from driver events, plus the circuit breaker built on it."""
+
+    def __init__(self, reset_timeout=DB_CIRCUIT_RESET_SECONDS, clock=time.monotonic):
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        # None until the first server check; True/False afterwards
+        self._up = None
+        self._open_until = 0.0
+        self.last_heartbeat = None
+        self.last_error = None
+
+    # ----------------- Breaker -----------------
+    def available(self) -> bool:
+        """Whether a caller may use the database now.
+
+        True while the cluster is up or not yet checked. While it is down,
+        False except for one probe per reset window.
+        """
+        with self._lock:
+            if self._up is not False:
+                return True
+            now = self._clock()
+            if now < self._open_until:
+                return False
+            self._open_until = now + self.reset_timeout
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._up = True
+            self.last_error = None
+
+    def record_failure(self, error=None):
+        with self._lock:
+            self._up = False
+            self._open_until = self._clock() + self.reset_timeout
+            if error is not None:
+                self.last_error = str(error)
+
+    def state(self) -> str:
+        """"closed" (up), "open" (down, refusing callers), "half-open" (next caller probes) or "unknown"."""
+        with self._lock:
+            if self._up is None:
+                return "unknown"
+            if self._up:
+                return "closed"
+            return "open" if self._clock() < self._open_until else "half-open"
+
+    # ----------------- Topology events -----------------
+    def opened(self, event):
+        pass
+
+    def description_changed(self, event):
+        description = event.new_description
+        if description.has_writable_server():
+            self.record_success()
+            return
+        errors = [s.error for s in description.server_descriptions().values() if s.error is not None]
+        if errors:
+            self.record_failure(errors[0])
+
+    def closed(self, event):
+        # Delivered asynchronously, possibly after a failed client was replaced
+        pass
+
+    # ----------------- Heartbeat events -----------------
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self.last_heartbeat = time.time()
+
+    def failed(self, event):
+        self.last_error = str(event.reply)
@@ -2,12 +2,56 @@
 """
 Distance calculation using a static hardcoded city coordinates dictionary.
 This module imports CITY_COORDINATES from backend.city_coords.
+
+Pairwise distances between CITY_COORDINATES keys are read from a dense
+float32 table (build it with scripts/build_distance_table.py), memory-mapped
+on first use. Without the table, or if it was built for other coordinates,
+distances fall back to the Haversine formula; both give identical results.
+One-to-many queries (get_distances) take a table row, or one vectorized
+Haversine call over the coordinate arrays. Radius queries (get_nearby_cities,
+locations_within) go through a k-d tree over the cities
+(backend/spatial_index.py), built on first use.
 """
 
+import functools
+import hashlib
+import json
+import os
+import re
+import unicodedata
+
+import numpy as np
+
+from backend import city_coords
 from backend.city_coords import CITY_COORDINATES
+from backend.spatial_index import SpatialIndex
+from backend.trigram_index import TrigramIndex
 
 from math import radians, sin, cos, sqrt, atan2
 
+# Try to import config, fallback to environment variables
+try:
+	from backend.config import get_config
+	CITY_DISTANCE_TABLE = get_config().CITY_DISTANCE_TABLE
+except Exception:
+	CITY_DISTANCE_TABLE = os.getenv(
+		'CITY_DISTANCE_TABLE',
+		os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'city_distances.npy'),
+	)
+
+EARTH_RADIUS_KM = 6371
+# Row/column of each CITY_COORDINATES key in the distance table
+CITY_INDEX = {city: i for i, city in enumerate(CITY_COORDINATES)}
+# Rows computed per block while building the table
+_BUILD_CHUNK = 256
+# Extra radius for spatial-index candidates: covers rounding to 0.1 km and
+# the chord/Haversine float error, so exact re-measuring never misses a city
+_RADIUS_PAD_KM = 0.1
+
+# Coordinate arrays (radians) in CITY_INDEX order, for vectorized Haversine
+_CITY_NAMES = list(CITY_COORDINATES)
+_CITY_LAT, _CITY_LON = (np.radians(a) for a in CITY_COORDINATES.arrays())
+
 # Common city name mappings for better matching
 CITY_ALIASES = {
 	# Must map to keys that exist in CITY_COORDINATES
@@ -37,6 +81,64 @@ CITY_ALIASES = {
 	"kalyan-dombivli": ["kalyan-dombivli", "kalyan dombivli"],
 }
 
+# Aliases emitted by scripts/build_city_coords.py (normalized alias -> city key);
+# older generated modules do not have them
+GENERATED_ALIASES = getattr(city_coords, "ALIAS_KEYS", {})
+
+def fold_city_key(name: str) -> str:
+	"""
+	Accent-folded, punctuation-free form of a city name, e.g. 'Thāne' -> 'thane',
+	'Pimpri-Chinchwad' -> 'pimpri chinchwad'.
+	"""
+	decomposed = unicodedata.normalize("NFKD", name or "")
+	stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+	return " ".join(re.sub(r"[^\w\s]|_", " ", stripped.lower()).split())
+
+def _build_folded_index(coordinates) -> dict:
+	"""Folded name -> CITY_COORDINATES key (first key wins on a collision)."""
+	folded = {}
+	for key in coordinates:
+		folded.setdefault(fold_city_key(key), key)
+	return folded
+
+# Secondary key index so plain-ASCII input ('Thane') finds accented keys ('thāne')
+FOLDED_CITY_KEYS = _build_folded_index(CITY_COORDINATES)
+
+def _build_alias_table(city_aliases, generated_aliases, coordinates, folded_keys=None) -> dict:
+	"""
+	Flat alias -> standard name dict. Hand-written CITY_ALIASES win (first
+	standard name listing an alias, as the old scan did); generated aliases
+	only fill gaps and never redirect a name that is itself a city key.
+	A group whose standard name is not a coordinates key is pointed at the
+	first of its aliases that is one, or at the key its folded name matches.
+	"""
+	folded_keys = _build_folded_index(coordinates) if folded_keys is None else folded_keys
+	table = {}
+	for standard_name, aliases in city_aliases.items():
+		target = standard_name
+		if target not in coordinates:
+			target = next((a for a in aliases if a in coordinates), None) \
+				or folded_keys.get(fold_city_key(standard_name), standard_name)
+		for alias in aliases:
+			table.setdefault(alias, target)
+	for alias, city in generated_aliases.items():
+		if alias not in table and alias not in coordinates:
+			table[alias] = city
+	return table
+
+ALIAS_TO_CITY = _build_alias_table(CITY_ALIASES, GENERATED_ALIASES, CITY_COORDINATES, FOLDED_CITY_KEYS)
+# Distinct free-text city inputs whose normalized form is memoized
+_NORMALIZE_CACHE_SIZE = 8192
+
+_key_trigrams = None
+
+def _get_key_trigrams() -> TrigramIndex:
+	"""Trigram index over the folded CITY_COORDINATES keys, built on first use."""
+	global _key_trigrams
+	if _key_trigrams is None:
+		_key_trigrams = TrigramIndex(fold_city_key(k) for k in CITY_COORDINATES)
+	return _key_trigrams
+
 def _basic_normalize(city: str) -> str:
     if not city:
         return ""
@@ -45,6 +147,7 @@ def _basic_normalize(city: str) -> str:
     s = " ".join(s.split())
     return s
 
+@functools.lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_city_name(city: str) -> str:
 	"""
 	Normalize city name to standard form for distance lookup.
@@ -52,10 +155,205 @@ def normalize_city_name(city: str) -> str:
 	if not city:
 		return ""
 	city_lower = _basic_normalize(city)
-	for standard_name, aliases in CITY_ALIASES.items():
-		if city_lower in aliases:
-			return standard_name
-	return city_lower
+	name = ALIAS_TO_CITY.get(city_lower, city_lower)
+	if name in CITY_COORDINATES:
+		return name
+	# Second chance before giving up: accent/punctuation-folded match
+	folded = fold_city_key(name)
+	folded = ALIAS_TO_CITY.get(folded, folded)
+	if folded in CITY_COORDINATES:
+		return folded
+	return FOLDED_CITY_KEYS.get(fold_city_key(folded), name)
+
+def _haversine_km(coord1, coord2) -> float:
+	"""Unrounded great-circle distance in km between two (lat, lon) pairs."""
+	lat1, lon1 = radians(coord1[0]), radians(coord1[1])
+	lat2, lon2 = radians(coord2[0]), radians(coord2[1])
+	dlat = lat2 - lat1
+	dlon = lon2 - lon1
+	a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
+	c = 2 * atan2(sqrt(a), sqrt(1-a))
+	return EARTH_RADIUS_KM * c
+
+def haversine_many(coord, lat=None, lon=None) -> np.ndarray:
+	"""
+	Unrounded great-circle distances in km from one (lat, lon) pair to many
+	points, given as radian arrays (every CITY_COORDINATES key by default).
+	"""
+	lat = _CITY_LAT if lat is None else lat
+	lon = _CITY_LON if lon is None else lon
+	lat1, lon1 = radians(coord[0]), radians(coord[1])
+	dlat = lat - lat1
+	dlon = lon - lon1
+	a = np.sin(dlat/2)**2 + cos(lat1) * np.cos(lat) * np.sin(dlon/2)**2
+	return EARTH_RADIUS_KM * (2 * np.arctan2(np.sqrt(a), np.sqrt(1-a)))
+
+def _round_km(km: np.ndarray, exact) -> np.ndarray:
+	"""
+	Round distances to 0.1 km exactly like round(_haversine_km(...), 1).
+	NumPy's trig may differ from math's in the last bit; that only matters
+	next to a rounding boundary, so those entries are recomputed with
+	exact(index), which returns the scalar _haversine_km value.
+	"""
+	rounded = np.round(km, 1)
+	scaled = km * 10
+	for index in zip(*np.nonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)):
+		rounded[index] = round(exact(index), 1)
+	return rounded
+
+@functools.lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def resolve_city(city: str, cutoff: float = 80):
+	"""
+	CITY_COORDINATES key for free text, tolerating typos: the normalized name
+	if it is a key, else the closest folded key by trigram shortlist and
+	fuzz.ratio >= cutoff. None if nothing is close enough.
+	"""
+	if not city:
+		return None
+	name = normalize_city_name(city)
+	if name in CITY_COORDINATES:
+		return name
+	match = _get_key_trigrams().best_match(fold_city_key(name), cutoff)
+	return _CITY_NAMES[match[0]] if match is not None else None
+
+def coordinates_fingerprint(coordinates=None) -> str:
+	"""Digest of the (ordered) coordinates a distance table is built from."""
+	coordinates = CITY_COORDINATES if coordinates is None else coordinates
+	return hashlib.blake2b(repr(list(coordinates.items())).encode("utf-8"), digest_size=16).hexdigest()
+
+def build_distance_table(coordinates=None) -> np.ndarray:
+	"""
+	Dense float32 matrix of rounded (0.1 km) distances between all cities,
+	in the iteration order of `coordinates` (CITY_COORDINATES by default).
+	Every entry equals round(_haversine_km(a, b), 1) once read back with
+	round(float(value), 1).
+	"""
+	coordinates = CITY_COORDINATES if coordinates is None else coordinates
+	coords = list(coordinates.values())
+	lat = np.radians(np.array([c[0] for c in coords], dtype=np.float64))
+	lon = np.radians(np.array([c[1] for c in coords], dtype=np.float64))
+	n = len(coords)
+	table = np.empty((n, n), dtype=np.float32)
+	for start in range(0, n, _BUILD_CHUNK):
+		rows = slice(start, min(start + _BUILD_CHUNK, n))
+		dlat = lat[None, :] - lat[rows, None]
+		dlon = lon[None, :] - lon[rows, None]
+		a = np.sin(dlat/2)**2 + np.cos(lat[rows, None]) * np.cos(lat[None, :]) * np.sin(dlon/2)**2
+		km = EARTH_RADIUS_KM * (2 * np.arctan2(np.sqrt(a), np.sqrt(1-a)))
+		table[rows] = _round_km(km, lambda ij, start=start: _haversine_km(coords[start + ij[0]], coords[ij[1]]))
+	return table
+
+def save_distance_table(path: str = CITY_DISTANCE_TABLE, coordinates=None) -> str:
+	"""Build the table and write it to `path` (.npy) plus a .json sidecar with its fingerprint."""
+	coordinates = CITY_COORDINATES if coordinates is None else coordinates
+	table = build_distance_table(coordinates)
+	os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+	np.save(path, table)
+	with open(os.path.splitext(path)[0] + ".json", "w", encoding="utf-8") as f:
+		json.dump({"cities": len(coordinates), "fingerprint": coordinates_fingerprint(coordinates)}, f)
+	return path
+
+def load_distance_table(path: str = CITY_DISTANCE_TABLE, coordinates=None):
+	"""
+	Memory-map a table written by save_distance_table. Returns None if it is
+	missing, unreadable, or was built for different coordinates.
+	"""
+	coordinates = CITY_COORDINATES if coordinates is None else coordinates
+	try:
+		with open(os.path.splitext(path)[0] + ".json", "r", encoding="utf-8") as f:
+			meta = json.load(f)
+		if meta.get("fingerprint") != coordinates_fingerprint(coordinates):
+			return None
+		table = np.load(path, mmap_mode="r")
+	except (OSError, ValueError):
+		return None
+	if table.dtype != np.float32 or table.shape != (len(coordinates), len(coordinates)):
+		return None
+	return table
+
+_distance_table = None
+_distance_table_loaded = False
+
+def _get_distance_table():
+	"""The process-wide distance table (loaded on first use), or None."""
+	global _distance_table, _distance_table_loaded
+	if not _distance_table_loaded:
+		_distance_table = load_distance_table()
+		_distance_table_loaded = True
+	return _distance_table
+
+def distance_row(index: int, columns=None) -> np.ndarray:
+	"""
+	Rounded km (float64) from the city at CITY_INDEX position `index` to every
+	CITY_COORDINATES key in CITY_INDEX order, or only to the given positions.
+	"""
+	table = _get_distance_table()
+	if table is not None:
+		row = table[index] if columns is None else table[index, columns]
+		# float32 -> float64 then 0.1 rounding gives back the exact rounded value
+		return np.round(row.astype(np.float64), 1)
+	columns = np.arange(len(_CITY_NAMES)) if columns is None else np.asarray(columns, dtype=np.int64)
+	origin = CITY_COORDINATES[_CITY_NAMES[index]]
+	km = haversine_many(origin, _CITY_LAT[columns], _CITY_LON[columns])
+	return _round_km(km, lambda j: _haversine_km(origin, CITY_COORDINATES[_CITY_NAMES[columns[j[0]]]]))
+
+def _resolve_targets(target_norms):
+	"""CITY_INDEX positions (-1 if unknown) of already-normalized target names."""
+	return np.array([CITY_INDEX.get(t, -1) for t in target_norms], dtype=np.int64)
+
+_key_targets = None
+
+def _get_key_targets():
+	"""Normalized name and resolved position of every CITY_COORDINATES key, computed once."""
+	global _key_targets
+	if _key_targets is None:
+		norms = [normalize_city_name(k) for k in _CITY_NAMES]
+		_key_targets = (norms, _resolve_targets(norms))
+	return _key_targets
+
+_key_tree = None
+
+def _get_key_tree():
+	"""
+	Spatial index over CITY_COORDINATES keys, each placed at the coordinates
+	it resolves to (so aliases sit on their standard city), plus the key
+	position of every tree point. Keys that resolve to no city are left out.
+	"""
+	global _key_tree
+	if _key_tree is None:
+		_, positions = _get_key_targets()
+		keys = np.flatnonzero(positions >= 0)
+		resolved = positions[keys]
+		lat = np.degrees(_CITY_LAT[resolved])
+		lon = np.degrees(_CITY_LON[resolved])
+		_key_tree = (SpatialIndex(lat, lon), keys)
+	return _key_tree
+
+def _distances_to_normalized(city_norm: str, target_norms, positions) -> np.ndarray:
+	"""get_distance semantics for a normalized origin and normalized, resolved targets."""
+	out = np.full(len(target_norms), 1000.0)
+	same = np.array([t == city_norm for t in target_norms], dtype=bool)
+	origin = CITY_INDEX.get(city_norm)
+	if origin is not None:
+		known = ~same & (positions >= 0)
+		if known.any():
+			out[known] = distance_row(origin, positions[known])
+	out[same] = 0.0
+	return out
+
+def get_distances(city: str, targets) -> np.ndarray:
+	"""
+	Vectorized get_distance(city, target) for every target name: one table row
+	(or one Haversine call) instead of a lookup per target.
+	"""
+	targets = list(targets)
+	out = np.full(len(targets), float('inf'))
+	given = [i for i, t in enumerate(targets) if t]
+	if not city or not given:
+		return out
+	target_norms = [normalize_city_name(targets[i]) for i in given]
+	out[given] = _distances_to_normalized(normalize_city_name(city), target_norms, _resolve_targets(target_norms))
+	return out
 
 def get_distance(city1: str, city2: str) -> float:
 	"""
@@ -68,19 +366,14 @@ def get_distance(city1: str, city2: str) -> float:
 	city2_norm = normalize_city_name(city2)
 	if city1_norm == city2_norm:
 		return 0.0
-	coord1 = CITY_COORDINATES.get(city1_norm)
-	coord2 = CITY_COORDINATES.get(city2_norm)
-	if not coord1 or not coord2:
+	i = CITY_INDEX.get(city1_norm)
+	j = CITY_INDEX.get(city2_norm)
+	if i is None or j is None:
 		return 1000.0
-	# Haversine formula
-	lat1, lon1 = radians(coord1[0]), radians(coord1[1])
-	lat2, lon2 = radians(coord2[0]), radians(coord2[1])
-	dlat = lat2 - lat1
-	dlon = lon2 - lon1
-	a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-	c = 2 * atan2(sqrt(a), sqrt(1-a))
-	R = 6371  # Earth radius in km
-	return round(R * c, 1)
+	table = _get_distance_table()
+	if table is not None:
+		return round(float(table[i, j]), 1)
+	return round(_haversine_km(CITY_COORDINATES[city1_norm], CITY_COORDINATES[city2_norm]), 1)
 
 def get_nearby_cities(city: str, max_distance: float = 100.0) -> list:
 	"""
@@ -91,11 +384,41 @@ def get_nearby_cities(city: str, max_distance: float = 100.0) -> list:
 	city_norm = normalize_city_name(city)
 	if city_norm not in CITY_COORDINATES:
 		return []
-	nearby = []
-	for other_city, coord in CITY_COORDINATES.items():
-		if other_city == city_norm:
-			continue
-		dist = get_distance(city_norm, other_city)
-		if dist <= max_distance:
-			nearby.append((other_city, dist))
-	return sorted(nearby, key=lambda x: x[1])
+	norms, positions = _get_key_targets()
+	tree, keys = _get_key_tree()
+	lat, lon = CITY_COORDINATES[city_norm]
+	# Tree candidates (padded radius), then exact distances as get_distance rounds them
+	candidates = keys[tree.within(lat, lon, max_distance + _RADIUS_PAD_KM)]
+	if max_distance >= 1000.0:
+		# keys that resolve to no city are reported at get_distance's 1000 km
+		candidates = np.union1d(candidates, np.flatnonzero(positions < 0))
+	candidates = np.sort(candidates[candidates != CITY_INDEX[city_norm]])
+	dists = _distances_to_normalized(city_norm, [norms[j] for j in candidates.tolist()], positions[candidates])
+	hits = np.flatnonzero(dists <= max_distance)
+	order = hits[np.argsort(dists[hits], kind="stable")]
+	return [(_CITY_NAMES[candidates[i]], float(dists[i])) for i in order.tolist()]
+
+def locations_within(city: str, locations, max_distance: float) -> list:
+	"""
+	The location strings within max_distance km of city, in input order; the
+	same as filtering on get_distances(city, locations) <= max_distance for
+	any max_distance below the 1000 km reported for unknown cities. Only
+	locations near a k-d tree candidate are measured.
+	"""
+	locations = list(locations)
+	if not city or not locations:
+		return []
+	city_norm = normalize_city_name(city)
+	norms = [normalize_city_name(loc) if loc else None for loc in locations]
+	nearby = set()
+	if city_norm in CITY_COORDINATES:
+		_, positions = _get_key_targets()
+		tree, keys = _get_key_tree()
+		lat, lon = CITY_COORDINATES[city_norm]
+		nearby = set(positions[keys[tree.within(lat, lon, max_distance + _RADIUS_PAD_KM)]].tolist())
+	rows = [i for i, norm in enumerate(norms) if norm is not None and (norm == city_norm or CITY_INDEX.get(norm) in nearby)]
+	if not rows:
+		return []
+	target_norms = [norms[i] for i in rows]
+	dists = _distances_to_normalized(city_norm, target_norms, _resolve_targets(target_norms))
+	return [locations[i] for i, km in zip(rows, dists.tolist()) if km <= max_distance]
@@ -0,0 +1,122 @@
+# backend/indexes.py
+"""
+Declarative MongoDB index specs for every collection the app queries.
+
+Indexes are applied once when a DatabaseManager connects (unless
+ENSURE_INDEXES_ON_STARTUP is off), or explicitly with
+scripts/ensure_indexes.py, instead of on every load_data read.
+verify_indexes() reports specs that are missing or differ from what the
+server has; /health surfaces it.
+
+An existing index with the same keys but other options (e.g. the old
+non-unique candidate_id_1) cannot be changed in place. ensure_indexes()
+reports it as a conflict; `scripts/ensure_indexes.py --rebuild` drops and
+recreates it.
+"""
+
+from pymongo import ASCENDING, DESCENDING, errors
+
+# collection -> list of (keys, options); options are passed to create_index
+INDEX_SPECS = {
+    "profiles": [
+        ([("candidate_id", ASCENDING)], {"unique": True}),
+        ([("username", ASCENDING)], {}),
+    ],
+    "internships": [
+        ([("internship_id", ASCENDING)], {"unique": True}),
+        # Catalog version token (app/core/catalog.py)
+        ([("updated_at", DESCENDING)], {}),
+        # Listing filters, each followed by the internship_id pagination key
+        ([("sector", ASCENDING), ("internship_id", ASCENDING)], {}),
+        ([("location", ASCENDING), ("internship_id", ASCENDING)], {}),
+        ([("skills_required", ASCENDING), ("internship_id", ASCENDING)], {}),
+    ],
+    "login_info": [
+        ([("username", ASCENDING)], {"unique": True}),
+    ],
+    "skills_synonyms": [
+        ([("alias", ASCENDING)], {"unique": True}),
+        ([("canonical", ASCENDING)], {}),
+    ],
+}
+
+# Server error codes for "an index with these keys already exists with other options/name"
+_CONFLICT_CODES = {85, 86}
+
+
+def _describe(collection_name, keys, options) -> str:
+    fields = ", ".join(f"{field} {direction}" for field, direction in keys)
+    return f"{collection_name}({fields}){' unique' if options.get('unique') else ''}"
+
+
+def _find_existing(info: dict, keys):
+    """(name, info) of the server index over exactly these keys, or (None, None)."""
+    for name, spec in info.items():
+        if [tuple(k) for k in spec.get("key", [])] == [tuple(k) for k in keys]:
+            return name, spec
+    return None, None
+
+
+def _matches(spec: dict, options) -> bool:
+    return bool(spec.get("unique", False)) == bool(options.get("unique", False))
+
+
+def ensure_indexes(db, rebuild=False, specs=None) -> dict:
+    """Create every index in specs (default INDEX_SPECS) that the server lacks.
+
+    With rebuild=True an existing index over the same keys but with other
+    options is dropped and recreated. Returns {"created": [...], "ok": [...],
+    "conflicts": [...], "failed": [...]} of index descriptions.
+    """
+    report = {"created": [], "ok": [], "conflicts": [], "failed": []}
+    for collection_name, indexes in (specs or INDEX_SPECS).items():
+        collection = db[collection_name]
+        try:
+            info = collection.index_information()
+        except Exception as e:
+            report["failed"].extend(f"{_describe(collection_name, k, o)}: {e}" for k, o in indexes)
+            continue
+        for keys, options in indexes:
+            label = _describe(collection_name, keys, options)
+            name, existing = _find_existing(info, keys)
+            if existing is not None and _matches(existing, options):
+                report["ok"].append(label)
+                continue
+            try:
+                if existing is not None:
+                    if not rebuild:
+                        report["conflicts"].append(label)
+                        continue
+                    collection.drop_index(name)
+                collection.create_index(keys, **options)
+                report["created"].append(label)
+            except errors.OperationFailure as e:
+                if e.code in _CONFLICT_CODES:
+                    report["conflicts"].append(label)
+                else:
+                    report["failed"].append(f"{label}: {e}")
+            except Exception as e:
+                report["failed"].append(f"{label}: {e}")
+    return report
+
+
+def verify_indexes(db, specs=None) -> list:
+    """Descriptions of the specs the server does not have (empty when all are in place)."""
+    missing = []
+    for collection_name, indexes in (specs or INDEX_SPECS).items():
+        info = db[collection_name].index_information()
+        for keys, options in indexes:
+            _, existing = _find_existing(info, keys)
+            if existing is None or not _matches(existing, options):
+                missing.append(_describe(collection_name, keys, options))
+    return missing
+
+
+def log_report(report: dict, info=print, warning=print):
+    if report["created"]:
+        info(f"[DB] Created indexes: {', '.join(report['created'])}")
+    if report["conflicts"]:
+        warning(f"[DB] Indexes exist with other options (run scripts/ensure_indexes.py --rebuild): "
+                f"{', '.join(report['conflicts'])}")
+    for failure in report["failed"]:
+        warning(f"[DB] Index creation failed: {failure}")
@@ -0,0 +1,412 @@
+# backend/internship_index.py
+"""
+Precompiled internship feature index.
+
+An InternshipIndex holds everything the scorer needs about each posting
+(interned skill ids, sector, title, organization, resolved city key) plus the array-backed feature matrices used by
+backend/scoring_engine.py. It is built once per catalog version and reused by
+every request until the internships collection changes.
+"""
+
+import hashlib
+import threading
+from array import array
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+try:
+    from .ml_model import _intern_skill_list, _skill_text, _tokenize, _jaccard, location_similarities
+    from .distance_matrix import normalize_city_name
+    from .match_cache import LRUCache
+    from .skill_matrix import SKILL_MATRIX
+    from .skill_vocab import SKILL_INTERNER
+except Exception:
+    from ml_model import _intern_skill_list, _skill_text, _tokenize, _jaccard, location_similarities
+    from distance_matrix import normalize_city_name
+    from match_cache import LRUCache
+    from skill_matrix import SKILL_MATRIX
+    from skill_vocab import SKILL_INTERNER
+
+DEFAULT_FUZZY_THRESHOLD = 85
+TOKEN_JACCARD_THRESHOLD = 0.5
+# Distinct location preferences whose per-location scores are kept per index
+_LOCATION_CACHE_SIZE = 512
+# Distinct candidate skills whose vocab matches are kept per index
+_SKILL_MATCH_ROWS = 8192
+# Upper bound on the per-posting skill bitsets (rows x ceil(skill ids / 64) x 8 bytes);
+# above it skill scoring counts matches through the inverted index instead
+_BITSET_MAX_BYTES = 64 * 1024 * 1024
+# Scanning one bitset block costs well under a tenth of a posting-list entry
+# per row, so bitsets win once the postings to walk exceed rows x blocks / 8
+_BITSET_COST_RATIO = 8
+
+# Fields that feed scoring and result building; a change to any of them
+# requires a rebuild. Other fields (description, ...) are read from the
+# current documents, which are re-bound on every cache hit.
+_FINGERPRINT_FIELDS = (
+    "internship_id", "id", "skills_required", "sector", "location",
+    "title", "organization", "is_beginner_friendly",
+)
+
+
+def _code(value, codes: dict, values: list) -> int:
+    """Return the dense integer code for value, assigning a new one if unseen."""
+    code = codes.get(value)
+    if code is None:
+        code = len(values)
+        codes[value] = code
+        values.append(value)
+    return code
+
+
+def catalog_fingerprint(internships) -> str:
+    """Stable digest of the scoring-relevant fields of a catalog, in order."""
+    digest = hashlib.blake2b(digest_size=16)
+    for internship in internships or []:
+        digest.update(repr([internship.get(f) for f in _FINGERPRINT_FIELDS]).encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+class InternshipIndex:
+    """Normalized per-posting features and array-backed matrices for one catalog.
+
+    Skills are stored in CSR form as interned ids (see backend/skill_vocab.py):
+    the sorted skill ids of row i are ``skill_ids[skill_ptr[i]:skill_ptr[i + 1]]``.
+    ``vocab`` lists the distinct skills of this catalog, with their interned
+    ids in ``vocab_skill_ids``. Sector, location and
+    title are stored as codes into small lists of distinct values so the
+    per-value work (string matching, distance lookups) runs once per distinct
+    value instead of once per posting, and their combinations (with the
+    beginner flag) as ``profile_code``.
+    """
+
+    def __init__(self, internships, version=None):
+        # Snapshots (tuples) are immutable already; anything else is copied
+        self.internships = internships if isinstance(internships, tuple) else list(internships or [])
+        self.version = version if version is not None else catalog_fingerprint(self.internships)
+        n = len(self.internships)
+
+        self.row_by_id: dict = {}
+        self.sectors: list[str] = []
+        self.locations: list[str] = []
+        self.titles: list[str] = []
+        sector_codes, location_codes, title_codes = {}, {}, {}
+        org_codes, orgs = {}, []
+
+        skill_ptr = np.zeros(n + 1, dtype=np.int64)
+        skill_ids = []
+        self.sector_code = np.empty(n, dtype=np.int32)
+        self.location_code = np.empty(n, dtype=np.int32)
+        self.title_code = np.empty(n, dtype=np.int32)
+        # org code -1 means "no organization" and is exempt from the diversity filter
+        self.org_code = np.empty(n, dtype=np.int32)
+        self.beginner = np.zeros(n, dtype=bool)
+        ids = []
+
+        for row, internship in enumerate(self.internships):
+            skill_ids.extend(_intern_skill_list(internship.get("skills_required", [])))
+            skill_ptr[row + 1] = len(skill_ids)
+
+            sector = (internship.get("sector") or "").strip().lower()
+            self.sector_code[row] = _code(sector, sector_codes, self.sectors)
+            location = internship.get("location", "")
+            location = location if isinstance(location, str) else ""
+            self.location_code[row] = _code(location, location_codes, self.locations)
+            title = (internship.get("title") or "").lower()
+            self.title_code[row] = _code(title, title_codes, self.titles)
+            org = (internship.get("organization") or "").strip().lower()
+            self.org_code[row] = _code(org, org_codes, orgs) if org else -1
+            self.beginner[row] = bool(internship.get("is_beginner_friendly"))
+            ids.append(str(internship.get("internship_id") or ""))
+            self.row_by_id.setdefault(internship.get("internship_id"), row)
+
+        # Distinct (location, sector, title, beginner) combinations. Every
+        # non-skill score term depends only on these, so scoring evaluates
+        # them once per profile; row i has profile profile_code[i]
+        combined = ((self.location_code.astype(np.int64) * max(1, len(self.sectors)) + self.sector_code)
+                    * max(1, len(self.titles)) + self.title_code) * 2 + self.beginner
+        profiles, profile_code = np.unique(combined, return_inverse=True)
+        self.profile_code = profile_code.reshape(-1).astype(np.int32)
+        self.profile_beginner = (profiles % 2).astype(bool)
+        profiles //= 2
+        self.profile_title = (profiles % max(1, len(self.titles))).astype(np.int32)
+        profiles //= max(1, len(self.titles))
+        self.profile_sector = (profiles % max(1, len(self.sectors))).astype(np.int32)
+        self.profile_location = (profiles // max(1, len(self.sectors))).astype(np.int32)
+
+        # Resolved city key per distinct location (normalized, alias-mapped)
+        self.city_keys = [normalize_city_name(loc) for loc in self.locations]
+
+        self.skill_ptr = skill_ptr
+        self.skill_ids = np.frombuffer(array("I", skill_ids), dtype=np.uint32)
+        self.skill_count = np.diff(skill_ptr)
+        # skill_similarity's max(1, len(internship_skills)) denominator
+        self.skill_denominator = np.maximum(1, self.skill_count).astype(np.float64)
+        # Row owning each entry of skill_ids, used to scatter per-skill hits back to postings
+        self.skill_row = np.repeat(np.arange(n, dtype=np.int32), self.skill_count)
+
+        # Rank of each internship_id in string order; ties share a rank so the
+        # stable sort keeps the original catalog order, exactly like list.sort()
+        ordered = {value: rank for rank, value in enumerate(sorted(set(ids)))}
+        self.id_rank = np.fromiter((ordered[i] for i in ids), dtype=np.int64, count=n)
+
+        # Distinct skills of this catalog; local vocab positions are only used
+        # by the direct-matching fallback
+        self.vocab_skill_ids = np.unique(self.skill_ids)
+        self.vocab = SKILL_INTERNER.skills(self.vocab_skill_ids.tolist())
+        self.vocab_ids: dict[str, int] = {skill: i for i, skill in enumerate(self.vocab)}
+
+        # Inverted index (CSC form) over interned ids: rows posting skill id v
+        # are posting_rows[posting_ptr[v]:posting_ptr[v + 1]], in ascending order
+        self.skill_id_space = int(self.vocab_skill_ids[-1]) + 1 if self.vocab else 0
+        by_skill = np.argsort(self.skill_ids, kind="stable")
+        self.posting_rows = self.skill_row[by_skill]
+        self.posting_ptr = np.zeros(self.skill_id_space + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.skill_ids, minlength=self.skill_id_space), out=self.posting_ptr[1:])
+
+        # Fixed-width skill bitsets in uint64 blocks: bit v of skill_bits[i] is
+        # set when posting i lists skill id v. Stored column-major so one block
+        # across all postings is contiguous. None when they would be too large.
+        self.bitset_blocks = (self.skill_id_space + 63) // 64
+        self.skill_bits = None
+        if n * self.bitset_blocks * 8 <= _BITSET_MAX_BYTES:
+            self.skill_bits = np.zeros((n, self.bitset_blocks), dtype=np.uint64, order="F")
+            np.bitwise_or.at(
+                self.skill_bits,
+                (self.skill_row, self.skill_ids >> 6),
+                np.left_shift(np.uint64(1), (self.skill_ids & 63).astype(np.uint64)),
+            )
+
+        # Make sure the shared skill matrix has rows (and so columns) for every
+        # catalog skill; matrix lookups are only used if all of them fit, i.e.
+        # if it covers the largest id (rows are contiguous from 0)
+        SKILL_MATRIX.grow()
+        self.use_matrix = SKILL_MATRIX.covers(self.skill_id_space - 1)
+
+        # Token -> vocab positions, so Jaccard is only evaluated for skills sharing a token
+        self.vocab_tokens = [_tokenize(s) for s in self.vocab]
+        self.token_vocab: dict[str, list[int]] = {}
+        for vid, tokens in enumerate(self.vocab_tokens):
+            for token in tokens:
+                self.token_vocab.setdefault(token, []).append(vid)
+
+        # education_level -> per-title match flags; a handful of levels exist
+        self._edu_values: dict[str, np.ndarray] = {}
+        # location_preference -> location_similarity per distinct location
+        # (shared by request threads and the similar-internships builder)
+        self._location_scores = LRUCache(_LOCATION_CACHE_SIZE)
+        # (candidate skill key, fuzzy threshold) -> matched skill ids
+        self._skill_matches = LRUCache(_SKILL_MATCH_ROWS)
+
+    def __len__(self):
+        return len(self.internships)
+
+    def rebind(self, internships):
+        """Point at a fresh copy of the same catalog (same fingerprint, same order)."""
+        self.internships = internships if isinstance(internships, tuple) else list(internships or [])
+
+    def skill_set(self, row) -> np.ndarray:
+        """Sorted interned skill ids of one posting (a view into the CSR arrays)."""
+        return self.skill_ids[self.skill_ptr[row]:self.skill_ptr[row + 1]]
+
+    def get(self, internship_id):
+        """Return the document for internship_id (first occurrence), or None."""
+        row = self.row_by_id.get(internship_id)
+        return self.internships[row] if row is not None else None
+
+    def edu_values(self, education_level: str) -> np.ndarray:
+        """1.0/0.0 per distinct title: whether education_level occurs in it."""
+        values = self._edu_values.get(education_level)
+        if values is None:
+            values = np.array(
+                [1.0 if education_level and education_level in t else 0.0 for t in self.titles],
+                dtype=np.float64,
+            )
+            self._edu_values[education_level] = values
+        return values
+
+    def location_scores(self, location_pref: str):
+        """location_similarity(location_pref, loc) for every distinct location.
+
+        Returns (scores array indexed by location code, list of reasons).
+        Memoized per preference since candidates share a small set of cities.
+        """
+        cached = self._location_scores.get(location_pref)
+        if cached is None:
+            cached = location_similarities(location_pref, self.locations)
+            self._location_scores.put(location_pref, cached)
+        return cached
+
+    def rows_for_skills(self, skill_ids) -> np.ndarray:
+        """Sorted unique rows whose postings list any of the given interned skill ids."""
+        skill_ids = np.asarray(skill_ids, dtype=np.int64)
+        skill_ids = skill_ids[skill_ids < self.skill_id_space]
+        if skill_ids.size == 0:
+            return np.zeros(0, dtype=np.int32)
+        starts = self.posting_ptr[skill_ids]
+        lengths = self.posting_ptr[skill_ids + 1] - starts
+        if skill_ids.size == 1:
+            return self.posting_rows[starts[0]:starts[0] + lengths[0]]
+        offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        return np.unique(self.posting_rows[offsets + np.arange(offsets.size)])
+
+    def skill_mask(self, skill_ids) -> np.ndarray:
+        """Bitset (uint64 blocks, same layout as skill_bits) of the given interned ids."""
+        skill_ids = np.asarray(skill_ids, dtype=np.int64)
+        skill_ids = skill_ids[skill_ids < self.skill_id_space]
+        mask = np.zeros(self.bitset_blocks, dtype=np.uint64)
+        np.bitwise_or.at(mask, skill_ids >> 6, np.left_shift(np.uint64(1), (skill_ids & 63).astype(np.uint64)))
+        return mask
+
+    def exact_matches(self, candidate_ids) -> np.ndarray:
+        """popcount(candidate_bits & posting_bits) for every row.
+
+        Only the blocks holding a candidate bit are read, so the cost is
+        rows x (number of candidate skills) at most.
+        """
+        mask = self.skill_mask(candidate_ids)
+        blocks = np.flatnonzero(mask)
+        shared = np.zeros(len(self), dtype=np.int64)
+        for block in blocks.tolist():
+            shared += np.bitwise_count(self.skill_bits[:, block] & mask[block])
+        return shared
+
+    def any_matches(self, skill_ids) -> np.ndarray:
+        """Per row, whether the posting lists any of skill_ids (bitset test)."""
+        mask = self.skill_mask(skill_ids)
+        hit = np.zeros(len(self), dtype=bool)
+        for block in np.flatnonzero(mask).tolist():
+            hit |= (self.skill_bits[:, block] & mask[block]) != 0
+        return hit
+
+    def _bitsets_cheaper(self, skill_ids) -> bool:
+        """Whether scanning the bitset blocks of skill_ids beats walking their posting lists."""
+        if self.skill_bits is None:
+            return False
+        postings = int((self.posting_ptr[skill_ids + 1] - self.posting_ptr[skill_ids]).sum())
+        return len(self) * np.unique(skill_ids >> 6).size <= _BITSET_COST_RATIO * postings
+
+    def exact_coverage(self, candidate_ids) -> np.ndarray:
+        """popcount(candidate & posting) / popcount(posting) for every row.
+
+        The exact-match part of skill_similarity; rows without skills score 0.0.
+        """
+        return self.exact_matches(candidate_ids) / self.skill_denominator
+
+    def skill_match_mask(self, skill: str, fuzzy_threshold=DEFAULT_FUZZY_THRESHOLD, fuzzy_scores=None):
+        """Boolean mask over the vocabulary of internship skills that `skill` matches.
+
+        Mirrors skill_similarity: exact match, fuzzy partial_ratio, or token Jaccard.
+        """
+        mask = np.zeros(len(self.vocab), dtype=bool)
+        if not self.vocab:
+            return mask
+        vid = self.vocab_ids.get(skill)
+        if vid is not None:
+            mask[vid] = True
+        if fuzzy_scores is None:
+            fuzzy_scores = process.cdist([skill], self.vocab, scorer=fuzz.partial_ratio, dtype=np.float64)[0]
+        mask |= fuzzy_scores >= fuzzy_threshold
+        tokens = _tokenize(skill)
+        for token in tokens:
+            for vid in self.token_vocab.get(token, ()):
+                if not mask[vid] and _jaccard(tokens, self.vocab_tokens[vid]) >= TOKEN_JACCARD_THRESHOLD:
+                    mask[vid] = True
+        return mask
+
+    def matched_skill_ids(self, candidate_ids, fuzzy_threshold=DEFAULT_FUZZY_THRESHOLD):
+        """Map each candidate skill key to the catalog skill ids it matches.
+
+        Keys are interned ids, or strings for skills that were never interned
+        (see ml_model._candidate_skill_keys); those are always fuzzy-matched.
+
+        At the default threshold this is a lookup in the shared SKILL_MATRIX
+        (new skills are added to it). Otherwise, or once the matrix is full,
+        skills are fuzzy-matched against the vocabulary in a single cdist call
+        and memoized per index.
+        """
+        matches = {}
+        missing = []
+        candidate_ids = list(candidate_ids)
+        if self.use_matrix and fuzzy_threshold == SKILL_MATRIX.fuzzy_threshold:
+            # Precomputed path: matrix rows are already in interned ids
+            SKILL_MATRIX.grow()
+            unknown = []
+            for skill_id in candidate_ids:
+                if not isinstance(skill_id, str) and SKILL_MATRIX.covers(skill_id):
+                    matches[skill_id] = SKILL_MATRIX.matches(skill_id)
+                else:
+                    unknown.append(skill_id)
+            candidate_ids = unknown
+        for skill_id in candidate_ids:
+            skill_ids = self._skill_matches.get((skill_id, fuzzy_threshold))
+            if skill_ids is None:
+                missing.append(skill_id)
+            else:
+                matches[skill_id] = skill_ids
+        if missing and self.vocab:
+            skills = [_skill_text(skill_id) for skill_id in missing]
+            fuzzy = process.cdist(skills, self.vocab, scorer=fuzz.partial_ratio, dtype=np.float64)
+            for i, (skill_id, skill) in enumerate(zip(missing, skills)):
+                skill_ids = self.vocab_skill_ids[self.skill_match_mask(skill, fuzzy_threshold, fuzzy[i])]
+                self._skill_matches.put((skill_id, fuzzy_threshold), skill_ids)
+                matches[skill_id] = skill_ids
+        return matches
+
+    def skill_scores(self, candidate_ids, fuzzy_threshold=DEFAULT_FUZZY_THRESHOLD):
+        """Vectorized skill_similarity(candidate_skills, internship_skills) for every row.
+
+        candidate_ids are the candidate's distinct skill keys (see
+        ml_model._candidate_skill_keys). Per candidate skill, the postings that
+        list a matched skill are found with the skill bitsets (a popcount for
+        skills that only match themselves) or the inverted index, whichever
+        touches less data.
+        """
+        n = len(self)
+        if not len(candidate_ids) or not self.vocab:
+            return np.zeros(n, dtype=np.float64)
+        matched = np.zeros(n, dtype=np.int64)
+        exact_only = []
+        for skill_id, skill_ids in self.matched_skill_ids(candidate_ids, fuzzy_threshold).items():
+            skill_ids = skill_ids[skill_ids < self.skill_id_space]
+            if skill_ids.size == 0:
+                continue
+            if not self._bitsets_cheaper(skill_ids):
+                # rows are unique per candidate skill, so each skill counts once per posting
+                matched[self.rows_for_skills(skill_ids)] += 1
+            elif skill_ids.size == 1 and not isinstance(skill_id, str) and skill_ids[0] == skill_id:
+                exact_only.append(skill_id)
+            else:
+                matched += self.any_matches(skill_ids)
+        if exact_only:
+            # popcount(candidate_bits & posting_bits): one per exact skill listed
+            matched += self.exact_matches(exact_only)
+        return np.minimum(1.0, matched / self.skill_denominator)
+
+
+# ----------------- Process-wide cache (one catalog version at a time) -----------------
+_index_lock = threading.Lock()
+_current_index = None
+
+
+def get_internship_index(internships, version=None) -> InternshipIndex:
+    """Return the shared InternshipIndex for this catalog, rebuilding only on change.
+
+    Callers that track a catalog version (e.g. a snapshot counter) should pass
+    it; otherwise the scoring-relevant fields are fingerprinted.
+    """
+    global _current_index
+    if version is None:
+        version = catalog_fingerprint(internships)
+    index = _current_index
+    if index is not None and index.version == version:
+        if internships is not index.internships:
+            index.rebind(internships)
+        return index
+    with _index_lock:
+        index = _current_index
+        if index is None or index.version != version:
+            index = InternshipIndex(internships, version=version)
+            _current_index = index
+    return index
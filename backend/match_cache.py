@@ -0,0 +1,99 @@
+# backend/match_cache.py
+"""
+Bounded, thread-safe LRU caches for skill matching.
+
+SKILL_MATCH_CACHE memoizes the boolean fuzzy/token match of a
+(candidate_skill, internship_skill, threshold) pair. The skill vocabulary is
+small and repetitive, so the same pairs come up on almost every request.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+# Try to import config, fallback to environment variables
+try:
+    from backend.config import get_config
+    SKILL_MATCH_CACHE_SIZE = get_config().SKILL_MATCH_CACHE_SIZE
+except Exception:
+    SKILL_MATCH_CACHE_SIZE = int(os.getenv('SKILL_MATCH_CACHE_SIZE', 200000))
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Least-recently-used mapping with a fixed capacity and hit/miss counters."""
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = max(0, int(maxsize))
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the cached value (refreshing its recency) or default."""
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store value, evicting the least recently used entry when full."""
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard(self, key):
+        """Drop key if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def remove_where(self, predicate):
+        """Drop every entry whose key satisfies predicate; returns how many were dropped."""
+        with self._lock:
+            doomed = [key for key in self._data if predicate(key)]
+            for key in doomed:
+                del self._data[key]
+            return len(doomed)
+
+    def resize(self, maxsize):
+        """Change the capacity, evicting old entries if it shrinks."""
+        with self._lock:
+            self.maxsize = max(0, int(maxsize))
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Return size, capacity, hits, misses and hit rate."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+    def __len__(self):
+        return len(self._data)
+
+
+# (candidate_skill, internship_skill, fuzzy_threshold) -> bool
+SKILL_MATCH_CACHE = LRUCache(SKILL_MATCH_CACHE_SIZE)
@@ -1,15 +1,17 @@
 # backend/ml_model.py
 from rapidfuzz import fuzz
-import difflib
+import functools
 import math
 import re
 
+import numpy as np
+
 # ----------------- distance imports (robust) -----------------
 try:
-    from .distance_matrix import get_distance, normalize_city_name
+    from .distance_matrix import get_distance, get_distances, normalize_city_name, resolve_city
 except Exception:
     try:
-        from distance_matrix import get_distance, normalize_city_name
+        from distance_matrix import get_distance, get_distances, normalize_city_name, resolve_city
     except Exception:
         # If distance_matrix missing, provide safe fallbacks
         def normalize_city_name(x):
@@ -19,6 +21,21 @@ except Exception:
             # fallback: unknown distance
             return float('inf')
 
+        def get_distances(a, targets):
+            return np.array([get_distance(a, b) for b in targets], dtype=np.float64)
+
+        def resolve_city(x):
+            return None
+
+try:
+    from .match_cache import SKILL_MATCH_CACHE
+    from .skill_vocab import SKILL_INTERNER
+    from .trigram_index import TrigramIndex
+except Exception:
+    from match_cache import SKILL_MATCH_CACHE
+    from skill_vocab import SKILL_INTERNER
+    from trigram_index import TrigramIndex
+
 # ----------------- City Helpers (kept from original) -----------------
 def _normalize_city(name: str) -> str:
     return (name or "").strip().lower()
@@ -37,6 +54,11 @@ def _get_distance_between_cities(city1: str, city2: str) -> float:
     except Exception:
         return float('inf')
 
+@functools.lru_cache(maxsize=8)
+def _city_name_index(names: tuple) -> TrigramIndex:
+    """Trigram index over a list of normalized city names, reused while the list is unchanged."""
+    return TrigramIndex(names)
+
 def find_nearest_city(input_city: str, cities: list[dict]):
     """
     Given input city string and list of cities from internships.json,
@@ -58,28 +80,23 @@ def find_nearest_city(input_city: str, cities: list[dict]):
         idx = norm_db.index(input_norm)
         return db_city_names[idx], 0.0
 
-    # Try fuzzy (difflib, cutoff=0.8)
-    match = difflib.get_close_matches(input_norm, norm_db, n=1, cutoff=0.8)
-    if match:
-        idx = norm_db.index(match[0])
-        return db_city_names[idx], 0.0
-
-    # --- Step 2: Distance-based using hardcoded distances ---
-    nearest_city = None
-    min_dist = float("inf")
-
-    for city in db_city_names:
-        try:
-            dist = _get_distance_between_cities(input_city, city)
-            if dist < min_dist:
-                min_dist = dist
-                nearest_city = city
-        except Exception as e:
-            print(f"❌ Error calculating distance to {city}: {e}")
-            continue
+    # Try fuzzy: trigram shortlist scored with rapidfuzz ratio (cutoff 80)
+    match = _city_name_index(tuple(norm_db)).best_match(input_norm, cutoff=80)
+    if match is not None:
+        return db_city_names[match[0]], 0.0
 
-    if nearest_city:
-        return nearest_city, round(min_dist, 2)
+    # --- Step 2: Distance-based, one vectorized lookup for all cities ---
+    # The input is resolved to a known city first (typos included); names are
+    # normalized as _get_distance_between_cities does
+    origin = resolve_city(input_city) or normalize_city_name(input_city)
+    try:
+        dists = get_distances(origin, [normalize_city_name(c) for c in db_city_names])
+    except Exception as e:
+        print(f"❌ Error calculating distances: {e}")
+        return None, None
+    best = int(np.argmin(dists))
+    if math.isfinite(dists[best]):
+        return db_city_names[best], round(float(dists[best]), 2)
     return None, None
 
 # ----------------- Skill Helpers (from your original file) -----------------
@@ -137,6 +154,36 @@ def _normalize_skill_list(skills):
             out.append(norm)
     return out
 
+def _intern_skill_list(skills):
+    """Normalize skills and return their interned ids as a sorted array('I')."""
+    return SKILL_INTERNER.skill_set(_normalize_skill_list(skills))
+
+def _skill_ids(skills):
+    """Interned ids for already-normalized skills; ints are taken as ids."""
+    return [s if isinstance(s, int) else SKILL_INTERNER.intern(s) for s in skills]
+
+def _skill_keys(skills):
+    """Lookup keys for already-normalized candidate skills, without interning them.
+
+    Known skills map to their id; free-text skills nobody has interned stay
+    strings, so arbitrary profile input cannot grow the interner.
+    """
+    keys = []
+    for s in skills:
+        if not isinstance(s, int):
+            skill_id = SKILL_INTERNER.get_id(s)
+            s = s if skill_id is None else skill_id
+        keys.append(s)
+    return keys
+
+def _candidate_skill_keys(skills):
+    """Normalize candidate skills and return their distinct lookup keys (see _skill_keys)."""
+    return list(dict.fromkeys(_skill_keys(_normalize_skill_list(skills))))
+
+def _skill_text(key) -> str:
+    """The skill string for an interned id or an uninterned skill key."""
+    return key if isinstance(key, str) else SKILL_INTERNER.skill(key)
+
 # ----------------- New similarity helpers (improved) -----------------
 def _tokenize(s: str):
     if not s:
@@ -151,6 +198,19 @@ def _jaccard(a_tokens: set, b_tokens: set):
     uni = a_tokens | b_tokens
     return len(inter) / len(uni)
 
+def _skill_pair_matches(cs, s: int, fuzzy_threshold=85) -> bool:
+    """Fuzzy (partial_ratio) or token-overlap (Jaccard) match of one skill pair, memoized.
+
+    s is an interned id; cs is an id or, for a skill outside the catalog, its string.
+    """
+    key = (cs, s, fuzzy_threshold)
+    hit = SKILL_MATCH_CACHE.get(key)
+    if hit is None:
+        a, b = _skill_text(cs), SKILL_INTERNER.skill(s)
+        hit = fuzz.partial_ratio(a, b) >= fuzzy_threshold or _jaccard(_tokenize(a), _tokenize(b)) >= 0.5
+        SKILL_MATCH_CACHE.put(key, hit)
+    return hit
+
 def skill_similarity(candidate_skills, internship_skills, fuzzy_threshold=85):
     """
     Returns a normalized score 0..1 combining:
@@ -160,32 +220,36 @@ def skill_similarity(candidate_skills, internship_skills, fuzzy_threshold=85):
     """
     if not internship_skills:
         return 0.0
-    # candidate_skills expected as iterable of normalized strings
-    cand = list(candidate_skills)
-    intern = list(internship_skills)
-    matched = set()
+    # Skills are expected normalized, either as strings or interned ids
+    # (see _intern_skill_list); matching runs on the ids. Internship skills are
+    # interned first, so a candidate skill equal to one of them has an id too
+    intern = _skill_ids(internship_skills)
+    cand = _skill_keys(candidate_skills)
+    intern_set = set(intern)
 
     # exact / synonyms
-    for cs in cand:
-        if cs in intern:
-            matched.add(cs)
+    matched = {cs for cs in cand if cs in intern_set}
 
     # fuzzy + token overlap for remaining
     for cs in cand:
         if cs in matched:
             continue
-        # fuzzy against any internship skill
-        if any(fuzz.partial_ratio(cs, s) >= fuzzy_threshold for s in intern):
-            matched.add(cs)
-            continue
-        # token overlap with any internship skill
-        cs_tokens = _tokenize(cs)
-        if any(_jaccard(cs_tokens, _tokenize(s)) >= 0.5 for s in intern):
+        if any(_skill_pair_matches(cs, s, fuzzy_threshold) for s in intern):
             matched.add(cs)
 
     coverage = min(1.0, len(matched) / max(1, len(intern)))
     return coverage
 
+def _location_tier(dist):
+    """(score, distance_km or None, reason) for a distance between two different cities."""
+    if dist <= 0:
+        return 1.0, 0.0, "same place"
+    if dist <= 50:
+        return 0.9, dist, f"{int(dist)} km away"
+    if dist <= 200:
+        return 0.6, dist, f"{int(dist)} km away"
+    return 0.0, dist if math.isfinite(dist) else None, f"{int(dist)} km away" if math.isfinite(dist) else "far"
+
 def location_similarity(candidate_loc, intern_loc):
     """
     Return (score 0..1, distance_km or None, reason_str)
@@ -210,104 +274,125 @@ def location_similarity(candidate_loc, intern_loc):
     except Exception:
         dist = float('inf')
 
-    if dist <= 0:
-        return 1.0, 0.0, "same place"
-    if dist <= 50:
-        return 0.9, dist, f"{int(dist)} km away"
-    if dist <= 200:
-        return 0.6, dist, f"{int(dist)} km away"
-    return 0.0, dist if math.isfinite(dist) else None, f"{int(dist)} km away" if math.isfinite(dist) else "far"
+    return _location_tier(dist)
+
+def location_similarities(candidate_loc, intern_locs):
+    """
+    Vectorized location_similarity(candidate_loc, loc) for many locations.
+    Returns (scores array, list of reasons); all distances come from a single
+    get_distances call.
+    """
+    intern_locs = list(intern_locs)
+    scores = np.zeros(len(intern_locs), dtype=np.float64)
+    reasons = ["no location info"] * len(intern_locs)
+    given = [i for i, loc in enumerate(intern_locs) if loc]
+    if not candidate_loc or not given:
+        return scores, reasons
+    c_norm = normalize_city_name(candidate_loc)
+    i_norms = [normalize_city_name(intern_locs[i]) for i in given]
+    dists = get_distances(c_norm, i_norms).tolist()
+    for i, i_norm, dist in zip(given, i_norms, dists):
+        if c_norm == i_norm:
+            scores[i], reasons[i] = 1.0, "same city"
+        else:
+            scores[i], _, reasons[i] = _location_tier(dist)
+    return scores, reasons
 
 # ----------------- Recommendations (keeps the original function name) -----------------
 def get_recommendations(candidate, internships, top_n=10,
                         skill_weight=0.5, loc_weight=0.25,
-                        sector_weight=0.15, misc_weight=0.10):
+                        sector_weight=0.15, misc_weight=0.10,
+                        index=None, exclude_ids=None):
     """
     Lightweight, explainable recommendation function that is compatible with
     existing callers in your codebase.
     Returns a list of up to top_n internship dicts with match_score and reason.
+
+    Scoring is vectorized over the whole catalog (see backend/scoring_engine.py)
+    and matches the per-internship skill_similarity/location_similarity formula.
+    Pass a prebuilt InternshipIndex as `index` to skip re-normalizing the
+    catalog; `internships` is then ignored. Internships whose internship_id is
+    in `exclude_ids` are never returned.
+    """
+    try:
+        from .scoring_engine import score_candidate, rank_rows, build_result
+        from .internship_index import get_internship_index
+        from .parallel_scoring import parallel_enabled, recommend_parallel
+    except Exception:
+        from scoring_engine import score_candidate, rank_rows, build_result
+        from internship_index import get_internship_index
+        from parallel_scoring import parallel_enabled, recommend_parallel
+
+    if index is None:
+        index = get_internship_index(internships)
+    if not len(index):
+        return []
+    if parallel_enabled(len(index)):
+        # Large catalogs: shard across worker processes (None while they warm up)
+        weights = dict(skill_weight=skill_weight, loc_weight=loc_weight,
+                       sector_weight=sector_weight, misc_weight=misc_weight)
+        results = recommend_parallel(index, candidate, top_n, weights, exclude_ids)
+        if results is not None:
+            return results
+    scores = score_candidate(
+        candidate, index,
+        skill_weight=skill_weight, loc_weight=loc_weight,
+        sector_weight=sector_weight, misc_weight=misc_weight,
+    )
+    rows = rank_rows(index, scores["score"], top_n, exclude_ids=exclude_ids)
+    return [build_result(index, scores, row) for row in rows]
+
+# Candidates scored per matrix operation; bounds the (candidates x postings) arrays
+BATCH_CHUNK_SIZE = 32
+
+def iter_recommendations_batch(candidates, internships, top_n=10,
+                               skill_weight=0.5, loc_weight=0.25,
+                               sector_weight=0.15, misc_weight=0.10,
+                               index=None, exclude_ids=None, chunk_size=BATCH_CHUNK_SIZE):
+    """
+    Yield get_recommendations() results for each candidate, in order, as soon
+    as its chunk of candidates has been scored.
+    Candidates are scored chunk_size at a time with one matrix operation per
+    chunk (see scoring_engine.score_candidates) against a single shared index.
     """
-    cand_skills = _normalize_skill_list(candidate.get("skills_possessed", []))
-    cand_skill_set = set(cand_skills)
-    sector_interests = [s.lower() for s in candidate.get("sector_interests", []) or []]
-    location_pref = (candidate.get("location_preference") or "").strip().lower()
-    field_of_study = (candidate.get("field_of_study") or "").strip().lower()
-    education_level = (candidate.get("education_level") or "").strip().lower()
-    is_first_gen = bool(candidate.get("first_generation") or candidate.get("no_experience"))
-
-    scored = []
-    for internship in internships or []:
-        internship_skills = _normalize_skill_list(internship.get("skills_required", []))
-
-        skill_sim = skill_similarity(cand_skill_set, internship_skills)
-        loc_sim, dist_km, loc_reason = location_similarity(location_pref, internship.get("location", ""))
-        sector = (internship.get("sector") or "").strip().lower()
-        sector_sim = 1.0 if sector in sector_interests else 0.0
-        field_sim = 1.0 if field_of_study and field_of_study in sector else 0.0
-        edu_sim = 1.0 if education_level and education_level in (internship.get("title") or "").lower() else 0.0
-        fg_boost = 0.08 if is_first_gen and internship.get("is_beginner_friendly") else 0.0
-
-        base_score = (
-            skill_weight * skill_sim +
-            loc_weight * loc_sim +
-            sector_weight * sector_sim +
-            misc_weight * (0.5 * field_sim + 0.5 * edu_sim)
+    try:
+        from .scoring_engine import score_candidates, rank_rows, build_result
+        from .internship_index import get_internship_index
+    except Exception:
+        from scoring_engine import score_candidates, rank_rows, build_result
+        from internship_index import get_internship_index
+
+    candidates = list(candidates)
+    if index is None:
+        index = get_internship_index(internships)
+    if not len(index):
+        for _ in candidates:
+            yield []
+        return
+    for start in range(0, len(candidates), max(1, chunk_size)):
+        batch = score_candidates(
+            candidates[start:start + chunk_size], index,
+            skill_weight=skill_weight, loc_weight=loc_weight,
+            sector_weight=sector_weight, misc_weight=misc_weight,
         )
-        score = min(1.0, base_score + fg_boost)
-        score_pct = round(score * 100, 1)
-
-        scored.append({
-            "internship": internship,
-            "score": score_pct,
-            "components": {
-                "skill_sim": round(skill_sim, 2),
-                "loc_sim": round(loc_sim, 2),
-                "loc_reason": loc_reason,
-                "sector_sim": sector_sim,
-                "field_sim": field_sim,
-                "edu_sim": edu_sim,
-                "fg_boost": fg_boost
-            }
-        })
-
-    scored.sort(key=lambda x: (-x["score"], x["internship"].get("internship_id") or ""))
-    results = []
-    seen_orgs = set()
-    for item in scored:
-        org = (item["internship"].get("organization") or "").strip().lower()
-        if org and org in seen_orgs:
-            continue
-        comps = item["components"]
-        reason = []
-        if comps["skill_sim"] >= 0.6:
-            reason.append(f"Strong skill fit ({int(comps['skill_sim']*100)}%)")
-        elif comps["skill_sim"] > 0:
-            reason.append(f"Some skill match ({int(comps['skill_sim']*100)}%)")
-        if comps["loc_sim"] >= 0.9:
-            reason.append("Close to you")
-        elif comps["loc_sim"] >= 0.6:
-            reason.append("Within reasonable distance")
-        if comps["sector_sim"]:
-            reason.append("Sector match")
-        if comps["fg_boost"]:
-            reason.append("Good for beginners")
-
-        results.append({
-            "internship_id": item["internship"].get("internship_id") or item["internship"].get("id"),
-            "title": item["internship"].get("title"),
-            "organization": item["internship"].get("organization"),
-            "location": item["internship"].get("location"),
-            "sector": item["internship"].get("sector"),
-            "match_score": item["score"],
-            "reason": ", ".join(reason) if reason else "Relevant",
-            "components": comps
-        })
-        if org:
-            seen_orgs.add(org)
-        if len(results) >= top_n:
-            break
-
-    return results
+        for scores in batch:
+            rows = rank_rows(index, scores["score"], top_n, exclude_ids=exclude_ids)
+            yield [build_result(index, scores, row) for row in rows]
+
+def get_recommendations_batch(candidates, internships, top_n=10,
+                              skill_weight=0.5, loc_weight=0.25,
+                              sector_weight=0.15, misc_weight=0.10,
+                              index=None, exclude_ids=None):
+    """
+    get_recommendations() for many candidates at once; returns one result
+    list per candidate, in order. See iter_recommendations_batch.
+    """
+    return list(iter_recommendations_batch(
+        candidates, internships, top_n=top_n,
+        skill_weight=skill_weight, loc_weight=loc_weight,
+        sector_weight=sector_weight, misc_weight=misc_weight,
+        index=index, exclude_ids=exclude_ids,
+    ))
 
 # compatibility aliases (if other files import old helpers directly)
 location_tier_score = location_similarity
@@ -0,0 +1,221 @@
+# backend/parallel_scoring.py
+"""
+Optional multi-process scoring for large catalogs.
+
+Scoring holds the GIL, so in a threaded worker one large request stalls the
+others. Above PARALLEL_SCORING_MIN_POSTINGS postings the catalog is split
+into contiguous shards, one per worker process. Each shard is pinned to its
+own single-process executor, so it keeps its shard index across requests.
+
+The scoring fields of every posting are pickled once per catalog version
+into a multiprocessing.shared_memory block. Workers attach to it and build
+their shard's InternshipIndex the first time they see a version. A request
+then only sends the candidate to each worker and gets back that shard's
+one-per-organization top-K.
+
+The merge is exact. An organization in the global top K has its best
+posting in some shard. That posting is also in the shard's top K, because
+otherwise K better organizations would exist globally.
+"""
+
+import atexit
+import heapq
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+# Try to import config, fallback to environment variables
+try:
+    from backend.config import get_config
+    _config = get_config()
+    PARALLEL_SCORING_MIN_POSTINGS = _config.PARALLEL_SCORING_MIN_POSTINGS
+    PARALLEL_SCORING_WORKERS = _config.PARALLEL_SCORING_WORKERS
+except Exception:
+    PARALLEL_SCORING_MIN_POSTINGS = int(os.getenv('PARALLEL_SCORING_MIN_POSTINGS', 100000))
+    PARALLEL_SCORING_WORKERS = int(os.getenv('PARALLEL_SCORING_WORKERS', 0))
+
+# Fields the workers need to score postings and build result dicts
+SHARD_FIELDS = (
+    "internship_id", "id", "title", "organization", "location", "sector",
+    "skills_required", "is_beginner_friendly",
+)
+# Seconds a request waits for the shards before scoring in-process instead
+_SHARD_TIMEOUT = 30
+
+
+def _worker_count() -> int:
+    return PARALLEL_SCORING_WORKERS or (os.cpu_count() or 1)
+
+
+def parallel_enabled(n_postings: int) -> bool:
+    """Whether a catalog of n_postings should be scored by the process pool."""
+    return 0 < PARALLEL_SCORING_MIN_POSTINGS <= n_postings and _worker_count() > 1
+
+
+# ----------------- Worker side -----------------
+# (shm name, shard start, shard end) -> InternshipIndex of that shard
+_worker_shard = {}
+
+
+def _load_shard(shm_name, start, end):
+    key = (shm_name, start, end)
+    index = _worker_shard.get(key)
+    if index is None:
+        try:
+            from backend.internship_index import InternshipIndex
+        except Exception:
+            from internship_index import InternshipIndex
+        shm = shared_memory.SharedMemory(name=shm_name)
+        try:
+            rows = pickle.loads(shm.buf)[start:end]
+        finally:
+            shm.close()
+        index = InternshipIndex(rows)
+        # One catalog version per worker at a time
+        _worker_shard.clear()
+        _worker_shard[key] = index
+    return index
+
+
+def _warm_shard(shm_name, start, end):
+    """Build the shard index ahead of the first request; returns its size."""
+    return len(_load_shard(shm_name, start, end))
+
+
+def _score_shard(shm_name, start, end, candidate, top_n, weights, exclude_ids):
+    """Top-K of one shard as (merge key, organization key, result) triples."""
+    try:
+        from backend.scoring_engine import score_candidate, rank_rows, build_result
+    except Exception:
+        from scoring_engine import score_candidate, rank_rows, build_result
+    index = _load_shard(shm_name, start, end)
+    scores = score_candidate(candidate, index, **weights)
+    out = []
+    for row in rank_rows(index, scores["score"], top_n, exclude_ids=exclude_ids):
+        internship = index.internships[row]
+        key = (-float(scores["score"][row]), str(internship.get("internship_id") or ""), start + row)
+        org = (internship.get("organization") or "").strip().lower()
+        out.append((key, org, build_result(index, scores, row)))
+    return out
+
+
+# ----------------- Parent side -----------------
+class ShardedScorer:
+    """Persistent per-shard worker processes plus the shared catalog block."""
+
+    def __init__(self, workers=None):
+        self.workers = workers or _worker_count()
+        self._executors = None
+        self._lock = threading.Lock()
+        self._version = None
+        self._shm = None
+        self._shards = []
+        self._ready = []
+        # Catalog version whose shards failed to build; scored in-process
+        self.failed_version = None
+
+    def _ensure_executors(self):
+        if self._executors is None:
+            # spawn: forking a threaded web worker is unsafe
+            context = multiprocessing.get_context("spawn")
+            self._executors = [ProcessPoolExecutor(max_workers=1, mp_context=context) for _ in range(self.workers)]
+
+    def publish(self, index):
+        """Share index's catalog with the workers and start building the shard indexes."""
+        with self._lock:
+            if self._version == index.version and self._shm is not None:
+                return
+            self._ensure_executors()
+            rows = [{f: i.get(f) for f in SHARD_FIELDS if f in i} for i in index.internships]
+            blob = pickle.dumps(rows, protocol=pickle.HIGHEST_PROTOCOL)
+            shm = shared_memory.SharedMemory(create=True, size=max(1, len(blob)))
+            shm.buf[:len(blob)] = blob
+            n = len(rows)
+            bounds = [n * k // self.workers for k in range(self.workers + 1)]
+            self._shards = [(shm.name, bounds[k], bounds[k + 1]) for k in range(self.workers)]
+            self._ready = [ex.submit(_warm_shard, *shard) for ex, shard in zip(self._executors, self._shards)]
+            old, self._shm, self._version = self._shm, shm, index.version
+        if old is not None:
+            # Workers keep their own copy of the old shards; the block itself can go
+            old.close()
+            old.unlink()
+
+    def ready(self, index) -> bool:
+        """Whether every worker has built its shard of index's catalog.
+
+        Raises the worker's exception if building a shard failed.
+        """
+        if self._version != index.version:
+            return False
+        for future in self._ready:
+            if not future.done():
+                return False
+            if future.exception() is not None:
+                raise future.exception()
+        return True
+
+    def recommend(self, index, candidate, top_n=10, weights=None, exclude_ids=None):
+        """Merged one-per-organization top_n of the shards, as get_recommendations returns."""
+        with self._lock:
+            shards, executors = list(self._shards), list(self._executors)
+        futures = [
+            ex.submit(_score_shard, *shard, candidate, top_n, dict(weights or {}), set(exclude_ids or ()))
+            for ex, shard in zip(executors, shards)
+        ]
+        best_by_org, unaffiliated = {}, []
+        for future in futures:
+            for key, org, result in future.result(timeout=_SHARD_TIMEOUT):
+                if not org:
+                    unaffiliated.append((key, result))
+                elif org not in best_by_org or key < best_by_org[org][0]:
+                    best_by_org[org] = (key, result)
+        winners = heapq.nsmallest(top_n, list(best_by_org.values()) + unaffiliated, key=lambda item: item[0])
+        return [result for _, result in winners]
+
+    def shutdown(self):
+        with self._lock:
+            for ex in self._executors or ():
+                ex.shutdown(wait=False, cancel_futures=True)
+            self._executors = None
+            if self._shm is not None:
+                self._shm.close()
+                self._shm.unlink()
+            self._shm, self._version, self._shards, self._ready = None, None, [], []
+
+
+_scorer = None
+_scorer_lock = threading.Lock()
+
+
+def get_scorer() -> ShardedScorer:
+    global _scorer
+    if _scorer is None:
+        with _scorer_lock:
+            if _scorer is None:
+                _scorer = ShardedScorer()
+                atexit.register(_scorer.shutdown)
+    return _scorer
+
+
+def recommend_parallel(index, candidate, top_n=10, weights=None, exclude_ids=None):
+    """Score with the process pool, or return None to let the caller score in-process.
+
+    None is returned while the shards for this catalog version are still
+    being built, or if a worker fails.
+    """
+    scorer = get_scorer()
+    if scorer.failed_version == index.version:
+        return None
+    try:
+        scorer.publish(index)
+        if not scorer.ready(index):
+            return None
+        return scorer.recommend(index, candidate, top_n, weights, exclude_ids)
+    except Exception as e:
+        # Logged once per catalog version; later requests go straight in-process
+        scorer.failed_version = index.version
+        print(f"⚠️ Parallel scoring unavailable, scoring in-process: {e}")
+        return None
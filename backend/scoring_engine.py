@@ -0,0 +1,251 @@
+# backend/scoring_engine.py
+"""
+Vectorized scoring engine for get_recommendations.
+
+Scores a candidate against every posting of an InternshipIndex (see
+backend/internship_index.py) with a handful of array operations.
+Scores are bit-for-bit identical to the original per-internship loop.
+"""
+
+import heapq
+import itertools
+
+import numpy as np
+
+try:
+    from .ml_model import _candidate_skill_keys
+    from .internship_index import InternshipIndex
+except Exception:
+    from ml_model import _candidate_skill_keys
+    from internship_index import InternshipIndex
+
+
+def _python_round(values, ndigits):
+    """Apply the builtin round() element-wise.
+
+    np.round and round() agree except when the scaled value sits on a .5
+    boundary (e.g. 12.35), where round() looks at the exact binary value.
+    Those near-ties are re-rounded with round(), once per distinct value.
+    """
+    scale = 10.0 ** ndigits
+    scaled = values * scale
+    rounded = np.rint(scaled) / scale
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        uniq, inverse = np.unique(values[near_tie], return_inverse=True)
+        fixed = np.array([round(v, ndigits) for v in uniq.tolist()], dtype=np.float64)
+        rounded[near_tie] = fixed[inverse.reshape(-1)]
+    return rounded
+
+
+def score_candidate(candidate, index: InternshipIndex,
+                    skill_weight=0.5, loc_weight=0.25,
+                    sector_weight=0.15, misc_weight=0.10, skill_sim=None):
+    """Score a candidate against every row of `index`.
+
+    Returns ``score`` (0..100, rounded like the original) and ``skill_sim``
+    per row, the other component arrays per profile (see
+    InternshipIndex.profile_code) and ``loc_reasons`` indexed by location code.
+    ``skill_sim`` may be passed in when it was computed for a whole batch.
+    """
+    sector_interests = [s.lower() for s in candidate.get("sector_interests", []) or []]
+    location_pref = (candidate.get("location_preference") or "").strip().lower()
+    field_of_study = (candidate.get("field_of_study") or "").strip().lower()
+    education_level = (candidate.get("education_level") or "").strip().lower()
+    is_first_gen = bool(candidate.get("first_generation") or candidate.get("no_experience"))
+
+    # Skill scoring only visits postings found through the inverted skill index;
+    # the location/sector/misc terms below are cheap per-code gathers
+    if skill_sim is None:
+        skill_sim = index.skill_scores(_candidate_skill_keys(candidate.get("skills_possessed", [])))
+
+    loc_values, loc_reasons = index.location_scores(location_pref)
+    sector_values = np.array([1.0 if s in sector_interests else 0.0 for s in index.sectors], dtype=np.float64)
+    field_values = np.array([1.0 if field_of_study and field_of_study in s else 0.0 for s in index.sectors], dtype=np.float64)
+    edu_values = index.edu_values(education_level)
+
+    # The other terms depend only on a row's profile (location, sector, title,
+    # beginner flag), of which a catalog has a few hundred: evaluate them per
+    # profile, not per row
+    loc_sim = loc_values[index.profile_location]
+    sector_sim = sector_values[index.profile_sector]
+    field_sim = field_values[index.profile_sector]
+    edu_sim = edu_values[index.profile_title]
+    fg_boost = np.where(index.profile_beginner, 0.08, 0.0) if is_first_gen else np.zeros(len(index.profile_beginner))
+
+    def combine(skill, p):
+        # Same operation order as the scalar formula so float results match exactly
+        base_score = (
+            skill_weight * skill +
+            loc_weight * loc_sim[p] +
+            sector_weight * sector_sim[p] +
+            misc_weight * (0.5 * field_sim[p] + 0.5 * edu_sim[p])
+        )
+        return _python_round(np.minimum(1.0, base_score + fg_boost[p]) * 100, 1)
+
+    # Rows without a skill match score their profile's skill-free total
+    # (0.0 + x is exact); only matched rows are combined one by one
+    score = combine(np.zeros(len(loc_sim)), slice(None))[index.profile_code]
+    hits = np.flatnonzero(skill_sim)
+    if hits.size:
+        score[hits] = combine(skill_sim[hits], index.profile_code[hits])
+
+    return {
+        "score": score,
+        "skill_sim": skill_sim,
+        "loc_reasons": loc_reasons,
+        # Indexed by profile code (index.profile_code[row])
+        "loc_sim": loc_sim,
+        "sector_sim": sector_sim,
+        "field_sim": field_sim,
+        "edu_sim": edu_sim,
+        "fg_boost": fg_boost,
+    }
+
+
+def batch_skill_scores(candidates, index: InternshipIndex):
+    """skill_scores() for several candidates: a (candidates x rows) array.
+
+    Postings hit by each distinct candidate skill are looked up once for the
+    whole batch, then a sparse (candidates x skills) @ (skills x postings)
+    product counts, per candidate and posting, the candidate skills that
+    matched one of the posting's skills.
+    """
+    from scipy import sparse  # only batch scoring needs it
+
+    n, c = len(index), len(candidates)
+    if not index.vocab:
+        return np.zeros((c, n), dtype=np.float64)
+    cand_skill_lists = [_candidate_skill_keys(cand.get("skills_possessed", [])) for cand in candidates]
+    distinct = list(dict.fromkeys(skill_id for skills in cand_skill_lists for skill_id in skills))
+    columns, hit_rows = {}, []
+    for skill_id, skill_ids in index.matched_skill_ids(distinct).items():
+        columns[skill_id] = len(hit_rows)
+        hit_rows.append(index.rows_for_skills(skill_ids))
+    sizes = np.array([r.size for r in hit_rows], dtype=np.int64)
+    hits = sparse.csr_matrix(
+        (
+            np.ones(int(sizes.sum()), dtype=np.int64),
+            np.concatenate(hit_rows) if hit_rows else np.zeros(0, dtype=np.int64),
+            np.concatenate(([0], np.cumsum(sizes))),
+        ),
+        shape=(len(hit_rows), n),
+    )
+    pairs = [(i, columns[skill_id]) for i, skills in enumerate(cand_skill_lists) for skill_id in skills if skill_id in columns]
+    uses = sparse.csr_matrix(
+        (np.ones(len(pairs), dtype=np.int64), ([i for i, _ in pairs], [j for _, j in pairs])),
+        shape=(c, len(hit_rows)),
+    )
+    matched = (uses @ hits).toarray()
+    return np.minimum(1.0, matched / index.skill_denominator)
+
+
+def score_candidates(candidates, index: InternshipIndex,
+                     skill_weight=0.5, loc_weight=0.25,
+                     sector_weight=0.15, misc_weight=0.10):
+    """score_candidate() for several candidates; returns one scores dict per candidate.
+
+    The skill term of the whole batch comes from one sparse matrix product
+    (batch_skill_scores); the cheap per-code terms are then combined per
+    candidate exactly as score_candidate does.
+    """
+    skill_sims = batch_skill_scores(candidates, index)
+    return [
+        score_candidate(
+            cand, index,
+            skill_weight=skill_weight, loc_weight=loc_weight,
+            sector_weight=sector_weight, misc_weight=misc_weight,
+            skill_sim=skill_sims[i],
+        )
+        for i, cand in enumerate(candidates)
+    ]
+
+
+def _select_diverse(index: InternshipIndex, score, candidates, top_n, exclude_ids=None):
+    """Stream candidate rows into per-organization bests, then keep the top_n.
+
+    Keys are (-score, internship_id rank, row), so the smallest key is the
+    row the original sort would list first. Rows without an organization are
+    never deduplicated.
+    """
+    best_by_org = {}
+    unaffiliated = []
+    org_codes = index.org_code[candidates].tolist()
+    keys = zip((-score[candidates]).tolist(), index.id_rank[candidates].tolist(), candidates.tolist())
+    for org, key in zip(org_codes, keys):
+        if exclude_ids and index.internships[key[2]].get("internship_id") in exclude_ids:
+            continue
+        if org < 0:
+            unaffiliated.append(key)
+            continue
+        current = best_by_org.get(org)
+        if current is None or key < current:
+            best_by_org[org] = key
+    winners = heapq.nsmallest(top_n, itertools.chain(best_by_org.values(), unaffiliated))
+    return [row for _, _, row in winners]
+
+
+def rank_rows(index: InternshipIndex, score, top_n, exclude_ids=None):
+    """Row indices of the top_n results, one per organization.
+
+    Ordering is (-score, internship_id) as in the original sort. Postings whose
+    internship_id is in exclude_ids are skipped.
+
+    Only a prefix of the ranking is examined: every row scoring at least the
+    `window`-th best score (ties included). If that prefix yields fewer than
+    top_n distinct organizations the window grows, so the result always equals
+    a full sort followed by the one-per-organization walk.
+    """
+    n = len(score)
+    if top_n <= 0 or n == 0:
+        return []
+    window = max(4 * top_n, 32)
+    while True:
+        if window >= n:
+            candidates = np.arange(n)
+        else:
+            threshold = np.partition(score, n - window)[n - window]
+            candidates = np.flatnonzero(score >= threshold)
+        rows = _select_diverse(index, score, candidates, top_n, exclude_ids)
+        if len(rows) >= top_n or candidates.size >= n:
+            return rows
+        window *= 4
+
+
+def build_result(index: InternshipIndex, scores, row):
+    """Build the public result dict (with components and reason) for one row."""
+    internship = index.internships[row]
+    profile = index.profile_code[row]
+    comps = {
+        "skill_sim": round(float(scores["skill_sim"][row]), 2),
+        "loc_sim": round(float(scores["loc_sim"][profile]), 2),
+        "loc_reason": scores["loc_reasons"][index.location_code[row]],
+        "sector_sim": float(scores["sector_sim"][profile]),
+        "field_sim": float(scores["field_sim"][profile]),
+        "edu_sim": float(scores["edu_sim"][profile]),
+        "fg_boost": float(scores["fg_boost"][profile]),
+    }
+    reason = []
+    if comps["skill_sim"] >= 0.6:
+        reason.append(f"Strong skill fit ({int(comps['skill_sim']*100)}%)")
+    elif comps["skill_sim"] > 0:
+        reason.append(f"Some skill match ({int(comps['skill_sim']*100)}%)")
+    if comps["loc_sim"] >= 0.9:
+        reason.append("Close to you")
+    elif comps["loc_sim"] >= 0.6:
+        reason.append("Within reasonable distance")
+    if comps["sector_sim"]:
+        reason.append("Sector match")
+    if comps["fg_boost"]:
+        reason.append("Good for beginners")
+
+    return {
+        "internship_id": internship.get("internship_id") or internship.get("id"),
+        "title": internship.get("title"),
+        "organization": internship.get("organization"),
+        "location": internship.get("location"),
+        "sector": internship.get("sector"),
+        "match_score": float(scores["score"][row]),
+        "reason": ", ".join(reason) if reason else "Relevant",
+        "components": comps
+    }
@@ -0,0 +1,198 @@
+# backend/similar_internships.py
+"""
+Precomputed "similar internships" neighbour lists.
+
+For every posting we store the top-N results of get_recommendations for a
+pseudo-candidate built from that posting (its skills, sector and location)
+with the similarity weights 0.6/0.15/0.2/0.05, so serving
+/recommendations/by_internship/<id> is a dict lookup.
+
+When the catalog changes only the lists that can differ are recomputed:
+lists of new or edited postings, lists that contain a removed or edited
+posting, and lists that a new or edited posting would enter (it scores at
+least as well as the list's last entry). The check for that last case scores
+each posting against a small index of just the new and edited postings.
+Every list is therefore identical to a full rebuild.
+
+Nothing is computed at import or start-up: the first by_internship request
+that misses schedules the build in the background (and is answered by
+neighbors() meanwhile), and later catalog versions are caught up the same
+way. Worker processes that never serve the endpoint never build the table.
+"""
+
+import hashlib
+import threading
+
+import numpy as np
+
+try:
+    from .internship_index import InternshipIndex, _FINGERPRINT_FIELDS
+    from .ml_model import get_recommendations
+    from .scoring_engine import score_candidate
+except Exception:
+    from internship_index import InternshipIndex, _FINGERPRINT_FIELDS
+    from ml_model import get_recommendations
+    from scoring_engine import score_candidate
+
+# Try to import logger, fallback to print
+try:
+    from backend.utils.logger import ml_logger
+    log_error = ml_logger.error
+except ImportError:
+    log_error = print
+
+SIMILAR_WEIGHTS = {
+    "skill_weight": 0.6,
+    "loc_weight": 0.15,
+    "sector_weight": 0.2,
+    "misc_weight": 0.05,
+}
+SIMILAR_TOP_N = 10
+
+
+def similar_candidate(internship) -> dict:
+    """Pseudo-candidate describing a posting; other fields stay empty."""
+    return {
+        "skills_possessed": internship.get("skills_required", []),
+        "sector_interests": [str(internship.get("sector", "")).lower()] if internship.get("sector") else [],
+        "location_preference": internship.get("location", ""),
+    }
+
+
+def _group_rows(index: InternshipIndex) -> dict:
+    """internship_id -> rows carrying it, in catalog order."""
+    groups = {}
+    for row, internship in enumerate(index.internships):
+        groups.setdefault(internship.get("internship_id"), []).append(row)
+    return groups
+
+
+def _signature(index: InternshipIndex, rows) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for row in rows:
+        internship = index.internships[row]
+        digest.update(repr([internship.get(f) for f in _FINGERPRINT_FIELDS]).encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+class SimilarInternshipTable:
+    """internship_id -> precomputed similar-internship results for one catalog version."""
+
+    def __init__(self, top_n=SIMILAR_TOP_N, weights=None):
+        self.top_n = top_n
+        self.weights = dict(weights or SIMILAR_WEIGHTS)
+        self.version = None
+        self._lists: dict = {}
+        self._signatures: dict = {}
+        self._lock = threading.Lock()
+        self._pending = None
+        self._worker = None
+
+    def __len__(self):
+        return len(self._lists)
+
+    def get(self, internship_id, version=None):
+        """Stored results for internship_id, or None if unknown or built for another version."""
+        if version is not None and version != self.version:
+            return None
+        return self._lists.get(internship_id)
+
+    def neighbors(self, index: InternshipIndex, internship_id):
+        """Compute the similar-internship list of one posting from scratch."""
+        base = index.get(internship_id)
+        return get_recommendations(
+            similar_candidate(base), None, top_n=self.top_n, index=index,
+            exclude_ids={internship_id}, **self.weights,
+        )
+
+    def build(self, index: InternshipIndex):
+        """Recompute every list for this index."""
+        groups = _group_rows(index)
+        lists = {iid: self.neighbors(index, iid) for iid in groups if iid is not None}
+        signatures = {iid: _signature(index, rows) for iid, rows in groups.items()}
+        with self._lock:
+            self._lists, self._signatures, self.version = lists, signatures, index.version
+        return len(lists)
+
+    def update(self, index: InternshipIndex):
+        """Bring the table up to date with index, recomputing only lists that can change.
+
+        Returns the number of lists recomputed.
+        """
+        if self.version is None:
+            return self.build(index)
+        if index.version == self.version:
+            return 0
+        groups = _group_rows(index)
+        signatures = {iid: _signature(index, rows) for iid, rows in groups.items()}
+        old = self._signatures
+        removed = old.keys() - signatures.keys()
+        delta = {iid for iid, sig in signatures.items() if old.get(iid) != sig}
+        touched = removed | (delta & old.keys())
+
+        delta_index = delta_keys = None
+        if delta:
+            delta_rows = [row for iid in delta for row in groups[iid]]
+            delta_index = InternshipIndex([index.internships[row] for row in delta_rows])
+            delta_keys = np.array([str(i.get("internship_id") or "") for i in delta_index.internships], dtype=object)
+
+        lists = {}
+        recomputed = 0
+        for iid in groups:
+            if iid is None:
+                continue
+            current = self._lists.get(iid)
+            if current is None or iid in delta or any(r.get("internship_id") in touched for r in current):
+                stale = True
+            elif delta_index is None:
+                stale = False
+            elif len(current) < self.top_n:
+                # Not full: any new posting from a new organization would enter
+                stale = True
+            else:
+                stale = self._would_enter(index, iid, current[-1], delta_index, delta_keys)
+            if stale:
+                lists[iid] = self.neighbors(index, iid)
+                recomputed += 1
+            else:
+                lists[iid] = current
+        with self._lock:
+            self._lists, self._signatures, self.version = lists, signatures, index.version
+        return recomputed
+
+    def _would_enter(self, index, iid, last, delta_index, delta_keys) -> bool:
+        """Whether a delta posting other than iid ranks at or above the list's last entry."""
+        score = score_candidate(similar_candidate(index.get(iid)), delta_index, **self.weights)["score"]
+        last_score, last_key = last["match_score"], str(last.get("internship_id") or "")
+        beats = (score > last_score) | ((score == last_score) & (delta_keys <= last_key))
+        beats &= delta_keys != str(iid or "")
+        return bool(beats.any())
+
+    # ----------------- Background refresh -----------------
+    def schedule(self, load_index):
+        """Update in a background thread to the index returned by load_index().
+
+        A newer request supersedes one that has not started yet.
+        """
+        with self._lock:
+            self._pending = load_index
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._drain, name="similar-internships", daemon=True)
+            self._worker.start()
+
+    def _drain(self):
+        while True:
+            with self._lock:
+                load_index, self._pending = self._pending, None
+                if load_index is None:
+                    self._worker = None
+                    return
+            try:
+                self.update(load_index())
+            except Exception as e:
+                log_error(f"Similar internships refresh failed: {e}")
+
+
+# Process-wide table
+SIMILAR_TABLE = SimilarInternshipTable()
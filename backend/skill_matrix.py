@@ -0,0 +1,155 @@
+# backend/skill_matrix.py
+"""
+Precomputed skill-vocabulary match matrix.
+
+Rows and columns are the skill ids assigned by the shared SkillInterner
+(backend/skill_vocab.py). For each id we store the ids of the skills it
+matches under skill_similarity's rules (exact, fuzz.partial_ratio >=
+threshold, or token Jaccard >= 0.5). The bulk build runs
+rapidfuzz.process.cdist on all cores; afterwards request-time skill matching
+is an id lookup. Newly interned skills are added incrementally: only their
+rows and columns are computed.
+
+Matches are sparse, so each row is kept as a sorted array of matched ids
+rather than a dense vocab x vocab block.
+"""
+
+import os
+import threading
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+try:
+    from .ml_model import _tokenize, _jaccard, _normalize_skill_list
+    from .skill_vocab import SKILL_INTERNER
+except Exception:
+    from ml_model import _tokenize, _jaccard, _normalize_skill_list
+    from skill_vocab import SKILL_INTERNER
+
+# Try to import config, fallback to environment variables
+try:
+    from backend.config import get_config
+    SKILL_MATRIX_MAX_SIZE = get_config().SKILL_MATRIX_MAX_SIZE
+except Exception:
+    SKILL_MATRIX_MAX_SIZE = int(os.getenv('SKILL_MATRIX_MAX_SIZE', 50000))
+
+TOKEN_JACCARD_THRESHOLD = 0.5
+# Rows scored per cdist call, bounding the temporary score block to chunk x vocab bytes
+_CDIST_CHUNK = 1024
+
+
+class SkillMatchMatrix:
+    """Sparse boolean matrix M where M[a, b] means candidate skill a matches internship skill b.
+
+    Rows exist for interned ids 0..len(self)-1. The interner may run ahead of
+    the matrix; grow() catches up, up to max_size rows.
+    """
+
+    def __init__(self, fuzzy_threshold=85, max_size=SKILL_MATRIX_MAX_SIZE, workers=-1, interner=SKILL_INTERNER):
+        self.fuzzy_threshold = fuzzy_threshold
+        self.max_size = max_size
+        self.workers = workers
+        self.interner = interner
+        self._tokens: list[set] = []
+        self._token_ids: dict[str, list[int]] = {}
+        self._rows: list[np.ndarray] = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._rows)
+
+    def covers(self, skill_id: int) -> bool:
+        """Whether skill_id has a row (and is a column of every row)."""
+        return skill_id < len(self._rows)
+
+    def ids(self, skills) -> list:
+        """Intern skills and return their ids, growing the matrix first.
+
+        Once the matrix is full, skills without a row map to None; callers
+        should fall back to direct matching for those.
+        """
+        skill_ids = self.interner.intern_all(skills)
+        self.grow()
+        return [skill_id if self.covers(skill_id) else None for skill_id in skill_ids]
+
+    def matches(self, skill_id: int) -> np.ndarray:
+        """Sorted ids of the skills matched by skill_id."""
+        return self._rows[skill_id]
+
+    def add(self, skills):
+        """Intern skills and compute the rows they (and any other new ids) need."""
+        self.interner.intern_all(skills)
+        self.grow()
+
+    def grow(self):
+        """Compute rows for every interned id that lacks one, up to max_size.
+
+        Only the new rows and the new columns of old rows are computed.
+        Readers do not take the lock, so old rows gain their new columns
+        before the new rows are published.
+        """
+        if len(self._rows) >= min(len(self.interner), self.max_size):
+            return
+        with self._lock:
+            old_count = len(self._rows)
+            new_count = min(len(self.interner), self.max_size)
+            if new_count <= old_count:
+                return
+            choices = self.interner.skills(range(new_count))
+            old, new = choices[:old_count], choices[old_count:]
+            new_tokens = [_tokenize(skill) for skill in new]
+            new_token_ids: dict[str, list[int]] = {}
+            for i, tokens in enumerate(new_tokens):
+                for token in tokens:
+                    new_token_ids.setdefault(token, []).append(old_count + i)
+
+            # New rows against every column (old and new skills)
+            new_rows = [{old_count + i} for i in range(len(new))]
+            for start in range(0, len(new), _CDIST_CHUNK):
+                block = self._fuzzy_block(new[start:start + _CDIST_CHUNK], choices)
+                for offset, cols in enumerate(block):
+                    new_rows[start + offset].update(cols.tolist())
+            # Old rows against the new columns
+            extra = {}
+            for start in range(0, old_count, _CDIST_CHUNK):
+                block = self._fuzzy_block(old[start:start + _CDIST_CHUNK], new)
+                for offset, cols in enumerate(block):
+                    if cols.size:
+                        extra.setdefault(start + offset, set()).update((cols + old_count).tolist())
+            # Token overlap only needs pairs that share a token; Jaccard is symmetric
+            for i, tokens in enumerate(new_tokens):
+                for token in tokens:
+                    for other in self._token_ids.get(token, ()):
+                        if _jaccard(tokens, self._tokens[other]) >= TOKEN_JACCARD_THRESHOLD:
+                            new_rows[i].add(other)
+                            extra.setdefault(other, set()).add(old_count + i)
+                    for other in new_token_ids.get(token, ()):
+                        if _jaccard(tokens, new_tokens[other - old_count]) >= TOKEN_JACCARD_THRESHOLD:
+                            new_rows[i].add(other)
+
+            for skill_id, cols in extra.items():
+                self._rows[skill_id] = np.union1d(self._rows[skill_id], np.fromiter(cols, dtype=np.int64))
+            self._tokens.extend(new_tokens)
+            for token, token_ids in new_token_ids.items():
+                self._token_ids.setdefault(token, []).extend(token_ids)
+            self._rows.extend(np.array(sorted(row), dtype=np.int64) for row in new_rows)
+
+    def _fuzzy_block(self, queries, choices):
+        """Per query, the indices of choices with partial_ratio >= threshold."""
+        # With score_cutoff every score below the threshold comes back as 0 and
+        # every kept score is >= threshold, so uint8 rounding cannot flip a match
+        scores = process.cdist(
+            queries, choices, scorer=fuzz.partial_ratio,
+            score_cutoff=self.fuzzy_threshold, dtype=np.uint8, workers=self.workers,
+        )
+        return [np.flatnonzero(row) for row in scores]
+
+
+# Process-wide matrix shared by every InternshipIndex
+SKILL_MATRIX = SkillMatchMatrix()
+
+
+def warm_up(skills):
+    """Normalize raw skills (e.g. every profile's skills_possessed) and add them in one bulk build."""
+    SKILL_MATRIX.add(_normalize_skill_list(list(skills or [])))
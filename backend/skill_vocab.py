@@ -0,0 +1,65 @@
+# backend/skill_vocab.py
+"""
+Process-wide skill interner.
+
+Every canonical skill string (lowercased and synonym-mapped by
+ml_model._normalize_skill) gets a dense integer id that never changes for the
+life of the process. The skill matrix, every InternshipIndex and
+skill_similarity share these ids, so skill sets can be stored as compact
+sorted integer arrays and compared without touching the strings.
+
+Only catalog skills (and profile skills bulk-loaded by skill_matrix.warm_up)
+are interned. Skills read from a request are looked up with get_id() and
+stay strings when unknown, so ids are never assigned to arbitrary input.
+"""
+
+import threading
+from array import array
+
+
+class SkillInterner:
+    """Bidirectional canonical skill <-> dense int id mapping (ids start at 0)."""
+
+    def __init__(self):
+        self._ids: dict[str, int] = {}
+        self._skills: list[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._skills)
+
+    def get_id(self, skill: str):
+        """Return the id of an already-interned skill, or None."""
+        return self._ids.get(skill)
+
+    def intern(self, skill: str) -> int:
+        """Return the id of skill, assigning the next free id if it is new."""
+        skill_id = self._ids.get(skill)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._ids.get(skill)
+                if skill_id is None:
+                    # Readers do not lock: the string is in place before its id is visible
+                    skill_id = len(self._skills)
+                    self._skills.append(skill)
+                    self._ids[skill] = skill_id
+        return skill_id
+
+    def intern_all(self, skills) -> list:
+        """Ids for an iterable of skills, in order."""
+        return [self.intern(skill) for skill in skills]
+
+    def skill(self, skill_id: int) -> str:
+        """The skill string for an id."""
+        return self._skills[skill_id]
+
+    def skills(self, skill_ids) -> list:
+        """Skill strings for an iterable of ids, in order."""
+        return [self._skills[skill_id] for skill_id in skill_ids]
+
+    def skill_set(self, skills) -> array:
+        """Sorted, de-duplicated ids of skills as a compact array('I')."""
+        return array("I", sorted(set(self.intern_all(skills))))
+
+
+SKILL_INTERNER = SkillInterner()
@@ -0,0 +1,52 @@
+# backend/spatial_index.py
+"""
+Spatial index over (lat, lon) points for radius queries.
+
+Points are placed on the unit sphere as (x, y, z). Straight-line (chord)
+distance there grows monotonically with great-circle distance, so a
+scipy.spatial.cKDTree over the xyz points answers "all points within R km"
+in logarithmic time. Radii are converted to chords, so callers that need
+get_distance's exact rounded values should treat results as candidates and
+re-measure them.
+"""
+
+import math
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371
+
+
+def to_unit_xyz(lat_deg, lon_deg) -> np.ndarray:
+    """(n, 3) unit-sphere coordinates for arrays of latitudes/longitudes in degrees."""
+    lat = np.radians(np.asarray(lat_deg, dtype=np.float64))
+    lon = np.radians(np.asarray(lon_deg, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+def km_to_chord(km: float) -> float:
+    """Chord length on the unit sphere for a great-circle distance in km."""
+    angle = min(max(km, 0.0) / EARTH_RADIUS_KM, math.pi)
+    return 2 * math.sin(angle / 2)
+
+
+class SpatialIndex:
+    """k-d tree over unit-sphere points; ids are positions in the input arrays."""
+
+    def __init__(self, lat_deg, lon_deg):
+        # scipy.spatial is slow to import; only pay for it when a tree is built
+        from scipy.spatial import cKDTree
+
+        self.size = len(lat_deg)
+        self.tree = cKDTree(to_unit_xyz(lat_deg, lon_deg)) if self.size else None
+
+    def __len__(self):
+        return self.size
+
+    def within(self, lat: float, lon: float, radius_km: float) -> np.ndarray:
+        """Sorted ids of the points within radius_km (great-circle) of (lat, lon)."""
+        if self.tree is None or radius_km < 0:
+            return np.zeros(0, dtype=np.int64)
+        ids = self.tree.query_ball_point(to_unit_xyz([lat], [lon])[0], km_to_chord(radius_km))
+        return np.sort(np.asarray(ids, dtype=np.int64))
@@ -0,0 +1,67 @@
+# backend/trigram_index.py
+"""
+Character-trigram inverted index for typo-tolerant name lookup.
+
+Each name is split into padded character trigrams ("  pune " -> "  p",
+" pu", "pun", "une", "ne "). A query only scores the names sharing the most
+trigrams with it (the shortlist) with rapidfuzz, instead of every name, so
+lookups stay fast with tens of thousands of place names. The shortlist makes
+this approximate: a name sharing almost no trigrams with the query is never
+considered, which in practice only drops matches far below any useful cutoff.
+"""
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+# Names scored with rapidfuzz per query
+DEFAULT_SHORTLIST = 64
+
+
+def trigrams(text: str) -> set:
+    """Padded character trigrams of text (two leading spaces, one trailing)."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """Inverted index trigram -> ids of the names containing it."""
+
+    def __init__(self, names):
+        self.names = list(names)
+        postings: dict[str, list[int]] = {}
+        for i, name in enumerate(self.names):
+            for gram in trigrams(name):
+                postings.setdefault(gram, []).append(i)
+        self._postings = {gram: np.asarray(ids, dtype=np.int32) for gram, ids in postings.items()}
+
+    def __len__(self):
+        return len(self.names)
+
+    def shortlist(self, query: str, limit: int = DEFAULT_SHORTLIST) -> np.ndarray:
+        """Ids (ascending) of up to `limit` names sharing the most trigrams with query."""
+        lists = [self._postings[g] for g in trigrams(query) if g in self._postings]
+        if not lists:
+            return np.zeros(0, dtype=np.int64)
+        counts = np.bincount(np.concatenate(lists), minlength=len(self.names))
+        hits = np.flatnonzero(counts)
+        if hits.size > limit:
+            # Highest counts first; ties go to the earlier name
+            order = np.lexsort((hits, -counts[hits]))
+            hits = np.sort(hits[order[:limit]])
+        return hits
+
+    def best_match(self, query: str, cutoff: float = 80, limit: int = DEFAULT_SHORTLIST):
+        """(id, score) of the shortlisted name with the best fuzz.ratio >= cutoff, or None.
+
+        Ties go to the earlier name.
+        """
+        ids = self.shortlist(query, limit)
+        if not ids.size:
+            return None
+        match = process.extractOne(
+            query, [self.names[i] for i in ids.tolist()], scorer=fuzz.ratio, score_cutoff=cutoff,
+        )
+        if match is None:
+            return None
+        _, score, position = match
+        return int(ids[position]), score
@@ -64,16 +64,15 @@ const API_BASE = `${window.location.origin}/api`;
 document.getElementById('apiBaseDisplay').textContent = API_BASE;
 
 // STATE
-let allInternships = [];
-let normalRecsLimit = 10;
+let knownInternships = new Map(); // internship_id -> internship, from the pages loaded so far
+let normalRecsLimit = 10;          // Page size of /internships searches
+let normalRecsCursor = null;       // next_cursor of the last page, null when there is no more
+let normalResults = [];            // Results of the current search, across "Show more" pages
+let searchSeq = 0;                 // Ignore responses of superseded searches
 let selectedInternshipIdForAI = null;
-let isLoadingData = false; // Prevent multiple simultaneous requests
-let hasTriedInitialLoad = false; // Prevent infinite loading loops
 let isInitialized = false; // Prevent multiple script executions
 
 // One-shot guards to prevent repeated API calls
-let hasLoadedInternships = false;       // True after first successful /internships load
-let internshipsLoadInFlight = false;    // True while /internships fetch is running
 let hasLoadedPersonalized = false;      // True after first successful personalized recs
 let personalizedLoadInFlight = false;   // True while personalized recs fetch is running
 let personalizedRetryAttempted = false; // One-time retry guard when initial result is empty
@@ -111,117 +110,83 @@ function escapeHtml(s) {
     })[ch]);
 }
 
-// INITIAL LOAD: Fetch all internship data
-async function loadAllData() {
-    // Strong guard to avoid loops
-    if (internshipsLoadInFlight || hasLoadedInternships) {
-        console.log('⛔ Skipping loadAllData: in-flight or already loaded', { internshipsLoadInFlight, hasLoadedInternships });
-        return Promise.resolve();
-    }
-    if (isLoadingData) {
-        console.log('Load already in progress, ignoring request');
-        return Promise.resolve(); // Return resolved promise to avoid breaking .then() chains
-    }
-    internshipsLoadInFlight = true;
-    
-    isLoadingData = true;
-    // Clear AI panel at the start only when in Similar mode, to avoid wiping out freshly rendered personalized content later
-    try {
-        if (rightPanelMode === 'similar') {
-            clearAiRecommendations();
-        }
-    } catch (e) {
-        console.warn('Failed to clear AI panel at start:', e);
-    }
-    
-    setLoading(true, document.querySelector('.panel')); // Load only left panel initially
-    try {
-        const res = await fetch(`${API_BASE}/internships`);
-        if (!res.ok) throw new Error('Failed to load internship data');
-        const json = await res.json();
-        
-        // Handle both response formats: direct array or wrapped in internships key
-        if (Array.isArray(json)) {
-            allInternships = json;
-        } else if (Array.isArray(json.internships)) {
-            allInternships = json.internships;
-        } else if (Array.isArray(json.data)) {
-            allInternships = json.data;
-        } else {
-            console.error('Unexpected API response format:', json);
-            allInternships = [];
-        }
-        
-        console.log(`Successfully loaded ${allInternships.length} internships`);
-        console.log('Sample internship skills:', allInternships[0]?.skills_required); // Debug log
-        if (allInternships.length > 0) {
-            hasLoadedInternships = true;
-        }
-        
-        // Clear the normal search results, and reset AI state on fresh load
-        normalRecsCount.textContent = 'No search yet';
-        normalRecsList.innerHTML = '<div class="empty"><h3>Find Opportunities</h3><p>Search for titles, companies, skills, or locations!</p></div>';
-        
-        // Clear search inputs
-        recSearchInput.value = '';
-        recLocationInput.value = '';
-        // Do not clear the AI panel here—this would overwrite personalized results rendered right after login
-    } catch (err) {
-        console.error('Error loading data:', err);
-        alert('Error loading data: ' + err.message);
-    } finally {
-        setLoading(false, document.querySelector('.panel'));
-        isLoadingData = false;
-        internshipsLoadInFlight = false;
-    }
+function findInternship(internshipId) {
+    return knownInternships.get(internshipId) || null;
 }
 
-// FILTERING LOGIC for Normal Recommendations
-function getFilteredNormalRecommendations() {
-    const qRaw = (recSearchInput.value || '').trim().toLowerCase();
-    const locQ = (recLocationInput.value || '').trim().toLowerCase();
-
-    if (!qRaw && !locQ) return []; // Only show results after a search
+// SEARCH PARAMS for Normal Recommendations: one term searches title/company/skills,
+// several comma-separated terms must all be skills; location is a city filter
+function buildSearchParams() {
+    const qRaw = (recSearchInput.value || '').trim();
+    const locQ = (recLocationInput.value || '').trim();
+    if (!qRaw && !locQ) return null; // Only show results after a search
 
-    // Split by comma, trim, filter out empty
+    const params = new URLSearchParams({ limit: String(normalRecsLimit) });
     const qList = qRaw.split(',').map(s => s.trim()).filter(Boolean);
+    if (qList.length === 1) {
+        params.set('q', qList[0]);
+    } else {
+        qList.forEach(skill => params.append('skill', skill));
+    }
+    if (locQ) params.set('city', locQ);
+    return params;
+}
 
-    const filtered = allInternships.filter(it => {
-        const searchCorpus = `${it.title || ''} ${it.organization || ''}`.toLowerCase();
-        const skills = (it.skills_required || []).map(s => s.toLowerCase());
+// SEARCH: fetch one page from the server (append=true loads the next page)
+async function searchInternships(append = false) {
+    const params = buildSearchParams();
+    const seq = ++searchSeq;
+    if (!params) {
+        normalResults = [];
+        normalRecsCursor = null;
+        document.querySelector('.panel').classList.remove('loading');
+        renderNormalRecommendations(false);
+        return;
+    }
+    if (append && normalRecsCursor) params.set('cursor', normalRecsCursor);
 
-        // If only one search term, keep old behavior (title/org or skill)
-        if (qList.length === 1) {
-            const q = qList[0];
-            let titleOk = q ? searchCorpus.includes(q) : true;
-            if (!titleOk) {
-                if (!skills.some(s => s.includes(q))) return false;
-            }
-        } else if (qList.length > 1) {
-            // For multiple skills, require ALL to be present in skills_required
-            if (!qList.every(skillQ => skills.some(s => s.includes(skillQ)))) return false;
+    // Only the loading style: setLoading would disable the search box being typed in
+    const panel = document.querySelector('.panel');
+    panel.classList.add('loading');
+    try {
+        const res = await fetch(`${API_BASE}/internships?${params}`);
+        const json = await res.json();
+        if (!res.ok) throw new Error(json.error || 'Failed to load internships');
+        if (seq !== searchSeq) return; // A newer search is in flight
+
+        const page = Array.isArray(json.data) ? json.data : [];
+        page.forEach(it => knownInternships.set(it.internship_id, it));
+        normalResults = append ? normalResults.concat(page) : page;
+        normalRecsCursor = json.meta?.pagination?.next_cursor || null;
+        renderNormalRecommendations(true);
+    } catch (err) {
+        console.error('Error searching internships:', err);
+        if (seq === searchSeq) {
+            normalRecsCount.textContent = 'Search failed';
+            normalRecsList.innerHTML = `<div class="empty"><h3>Oops! Something went wrong</h3><p>${escapeHtml(err.message)}</p></div>`;
         }
-        if (locQ && !((it.location || '').toLowerCase().includes(locQ))) return false;
-        return true;
-    });
-    
-    return filtered;
+    } finally {
+        if (seq === searchSeq) panel.classList.remove('loading');
+    }
 }
 
 // RENDER Normal Recommendations results (left panel)
-function renderNormalRecommendations() {
-    const filtered = getFilteredNormalRecommendations();
+function renderNormalRecommendations(searched) {
     normalRecsList.innerHTML = '';
-    if (!filtered.length) {
+    if (!searched) {
+        normalRecsCount.textContent = 'No search yet';
+        normalRecsList.innerHTML = '<div class="empty"><h3>Find Opportunities</h3><p>Search for titles, companies, skills, or locations!</p></div>';
+        return;
+    }
+    if (!normalResults.length) {
         normalRecsCount.textContent = '0 results';
         normalRecsList.innerHTML = '<div class="empty"><h3>No opportunities found</h3><p>Try different search terms or locations!</p></div>';
-        // normalRecsShowMore.style.display = 'none'; // Commented out - button doesn't exist
         return;
     }
-    normalRecsCount.textContent = `${filtered.length} result${filtered.length === 1 ? '' : 's'}`;
-    const toShow = filtered.slice(0, normalRecsLimit);
+    const n = normalResults.length;
+    normalRecsCount.textContent = `${n}${normalRecsCursor ? '+' : ''} result${n === 1 && !normalRecsCursor ? '' : 's'}`;
 
-    for (const it of toShow) {
+    for (const it of normalResults) {
         const card = document.createElement('div');
         card.className = 'card';
         card.innerHTML = `
@@ -246,18 +211,18 @@ function renderNormalRecommendations() {
     // Event listeners are now handled via delegation at the document level
     // No need to attach individual listeners to each button
 
-    // Show more button removed
+    if (normalRecsCursor) {
+        const more = document.createElement('div');
+        more.style.textAlign = 'center';
+        more.innerHTML = '<button class="btn ghost btn-sm" id="normalRecsShowMore">Show more</button>';
+        more.querySelector('button').addEventListener('click', () => searchInternships(true));
+        normalRecsList.appendChild(more);
+    }
 }
 
 function handleAiTriggerClick(e) {
-    // Safeguard: Don't proceed if data isn't loaded
-    if (!allInternships || allInternships.length === 0) {
-        console.log('AI trigger clicked but no internships data loaded');
-        return;
-    }
-    
     const internshipId = e.target.getAttribute('data-internship-id');
-    const internship = allInternships.find(i => i.internship_id === internshipId);
+    const internship = findInternship(internshipId);
     if (internship) {
         document.querySelectorAll('#normalRecommendationsList .card').forEach(c => c.classList.remove('selected'));
         e.target.closest('.card').classList.add('selected');
@@ -307,7 +272,7 @@ function renderAiRecommendations(recs, baseInternship) {
     const baseSkills = (baseInternship.skills_required || []).map(s => s.toLowerCase());
 
     for (const r of recs) {
-        const it = allInternships.find(i => i.internship_id === r.internship_id) || r;
+        const it = findInternship(r.internship_id) || r;
         const internSkills = (it.skills_required || []).map(s => s.toLowerCase());
         const matched = internSkills.filter(s => baseSkills.includes(s));
         const matchedHtml = matched.length ? matched.map(m => `<span class="tag">${escapeHtml(m)}</span>`).join(' ') : '<span class="small" style="color:var(--text-dim)">⚡ Unique skill set</span>';
@@ -347,8 +312,11 @@ function clearAiRecommendations() {
 function clearNormalRecFilters() {
     recSearchInput.value = '';
     recLocationInput.value = '';
-    normalRecsLimit = 10;
-    renderNormalRecommendations();
+    searchSeq++; // Drop any search still in flight
+    document.querySelector('.panel').classList.remove('loading');
+    normalResults = [];
+    normalRecsCursor = null;
+    renderNormalRecommendations(false);
     // Note: AI recommendations are preserved and not cleared
 }
 
@@ -357,8 +325,7 @@ function clearNormalRecFilters() {
 // HOOK INPUT EVENTS (debounced)
 const debouncedRender = debounce(() => {
     console.log('Search triggered:', recSearchInput.value, recLocationInput.value); // Debug log
-    normalRecsLimit = 10;
-    renderNormalRecommendations();
+    searchInternships();
 });
 
 
@@ -461,7 +428,7 @@ function displayPersonalizedRecommendations(recommendations, candidateName) {
         const block = document.createElement('div');
         block.className = 'recommendation';
         // Get the full internship data to show skills
-        const fullInternship = allInternships.find(i => i.internship_id === rec.internship_id) || rec;
+        const fullInternship = findInternship(rec.internship_id) || rec;
         
         // Try multiple sources for skills data
         let displaySkills = [];
@@ -543,7 +510,7 @@ function setRightPanelMode(mode) {
     } else {
         // Similar mode
         if (selectedInternshipIdForAI) {
-            const base = allInternships.find(i => i.internship_id === selectedInternshipIdForAI);
+            const base = findInternship(selectedInternshipIdForAI);
             if (base) {
                 if (lastSimilar && lastSimilar.baseInternship && lastSimilar.baseInternship.internship_id === base.internship_id) {
                     setRightPanelHeaderForSimilar(base);
@@ -574,7 +541,6 @@ document.addEventListener('DOMContentLoaded', function() {
     console.log('🚀 Starting app initialization...');
     
     // Setup event listeners
-    const debouncedLoadAllData = debounce(loadAllData, 1000); // Debounce to 1 second
     document.getElementById('normalRecsClear').addEventListener('click', clearNormalRecFilters);
 
     // Event delegation for AI trigger buttons (prevents multiple listeners)
@@ -599,12 +565,8 @@ document.addEventListener('DOMContentLoaded', function() {
     // Ensure login controls reflect current state immediately
     checkLoginStatus();
 
-    // INITIAL FETCH of data - only if not already loaded recently
-    const lastDataLoad = localStorage.getItem('lastDataLoad');
-    const now = Date.now();
-    const tenMinutes = 10 * 60 * 1000; // 10 minutes in milliseconds
-
-    // Function to load personalized recommendations after internships data is ready
+    // Internships are searched page by page on the server; nothing to preload
+    // Function to load personalized recommendations once a candidate_id is available
     function loadPersonalizedRecsWhenReady() {
         if (localStorage.getItem('isLoggedIn') === 'true') {
             console.log('📊 Loading personalized recommendations...');
@@ -630,18 +592,7 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
-    const shouldLoadFreshData = !lastDataLoad || (now - parseInt(lastDataLoad)) > tenMinutes;
-    const needsDataLoad = allInternships.length === 0 && !hasTriedInitialLoad;
-
-    console.log('🔍 Initialization check:', {
-        isInitialized,
-        shouldLoadFreshData,
-        needsDataLoad,
-        lastDataLoad: lastDataLoad ? new Date(parseInt(lastDataLoad)).toLocaleTimeString() : 'none',
-        internshipsLoaded: allInternships.length
-    });
-
-    // Decide initial right-panel mode BEFORE loading data to ensure correct clear behavior
+    // Decide initial right-panel mode before loading recommendations
     const initiallyLoggedIn = localStorage.getItem('isLoggedIn') === 'true';
     rightPanelMode = initiallyLoggedIn ? 'personalized' : 'similar';
     // Reflect initial mode in UI immediately
@@ -651,26 +602,8 @@ document.addEventListener('DOMContentLoaded', function() {
         loadPersonalizedRecommendations();
     }
 
-    if (!isInitialized && (shouldLoadFreshData || needsDataLoad)) {
-        // Load general data first, then personalized recommendations
-        console.log('📥 Loading fresh data...', {shouldLoadFreshData, needsDataLoad}); 
+    if (!isInitialized) {
         isInitialized = true; // Mark as initialized to prevent re-execution
-        hasTriedInitialLoad = true; // Prevent infinite loops
-        loadAllData().then(() => {
-            loadPersonalizedRecsWhenReady();
-        });
-        localStorage.setItem('lastDataLoad', now.toString());
-    } else if (!isInitialized) {
-        console.log('Data was loaded recently and available, skipping auto-load');
-        isInitialized = true; // Mark as initialized
-        
-        // Check if AI state exists but data is missing - clear AI state if so
-        if (selectedInternshipIdForAI && allInternships.length === 0) {
-            console.log('🧹 AI state exists but no data loaded, clearing AI recommendations');
-            clearAiRecommendations();
-        }
-        
-        // Data is available, just load personalized recommendations
         loadPersonalizedRecsWhenReady();
     } else {
         console.log('Script already initialized, skipping data load');
@@ -694,7 +627,7 @@ document.addEventListener('DOMContentLoaded', function() {
             const cid = localStorage.getItem('candidate_id');
             if (cid) loadPersonalizedRecommendations();
         } else {
-            setRightPanelHeaderForSimilar(selectedInternshipIdForAI ? allInternships.find(i => i.internship_id === selectedInternshipIdForAI) : null);
+            setRightPanelHeaderForSimilar(selectedInternshipIdForAI ? findInternship(selectedInternshipIdForAI) : null);
             // Keep default empty similar state
         }
     }
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Build backend/city_coords.py from data/cities.in.json
+Build backend/city_coords.bin from data/cities.in.json
 
 Input JSON format (array of objects):
 [
@@ -8,15 +8,27 @@ Input JSON format (array of objects):
   {"city": "Navi Mumbai", "lat": 19.0330, "lon": 73.0297}
 ]
 
-Output: backend/city_coords.py module with CITY_COORDINATES and DISPLAY_NAMES.
+Output: backend/city_coords.bin, the packed artifact behind the
+CITY_COORDINATES, DISPLAY_NAMES and ALIAS_KEYS (normalized alias -> city key)
+mappings in backend/city_coords.py. Rebuild the distance table afterwards
+(scripts/build_distance_table.py).
+
+Usage:
+    python scripts/build_city_coords.py
+    python scripts/build_city_coords.py --from-module old_city_coords.py   # convert a legacy generated module
 """
 import json
 import os
-from typing import Dict, Tuple, List
+import sys
+from typing import Dict, List
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backend import city_coords  # noqa: E402
+
 DATA_PATH = os.path.join(ROOT, 'data', 'cities.in.json')
-OUT_PATH = os.path.join(ROOT, 'backend', 'city_coords.py')
+OUT_PATH = city_coords.ARTIFACT_PATH
 
 
 def normalize_key(name: str) -> str:
@@ -49,41 +61,48 @@ def load_cities() -> List[dict]:
     return cleaned
 
 
-def write_module(rows: List[dict]) -> None:
-    header = (
-        '"""\n'
-        'Static coordinates for Indian cities and display names.\n\n'
-        'This file is generated by scripts/build_city_coords.py from data/cities.in.json\n'
-        '"""\n\n'
-    )
-    # CITY_COORDINATES
-    coord_lines = ["CITY_COORDINATES: dict[str, tuple[float, float]] = {"]
+def alias_keys_for(rows: List[dict]) -> Dict[str, str]:
+    """Normalized alias -> key; an alias that is itself a city key, or already
+    claimed by an earlier city, is skipped."""
+    keys = {r['key'] for r in rows}
+    alias_keys = {}
     for r in rows:
-        coord_lines.append(f"    {r['key']!r}: ({r['lat']:.6f}, {r['lon']:.6f}),")
-    coord_lines.append("}\n")
+        for alias in r.get('aliases') or []:
+            alias_key = normalize_key(alias)
+            if alias_key and alias_key not in keys:
+                alias_keys.setdefault(alias_key, r['key'])
+    return alias_keys
+
 
-    # DISPLAY_NAMES maps key -> original display city
-    disp_lines = ["DISPLAY_NAMES: dict[str, str] = {"]
+def write_artifact(rows: List[dict]) -> None:
+    # Coordinates keep the 6-decimal precision the generated module used
     for r in rows:
-        disp_lines.append(f"    {r['key']!r}: {r['city']!r},")
-    disp_lines.append("}\n")
+        r['lat'] = float(f"{r['lat']:.6f}")
+        r['lon'] = float(f"{r['lon']:.6f}")
+    city_coords.write_artifact(OUT_PATH, rows, alias_keys_for(rows))
 
-    util = (
-        "def get_all_display_cities_sorted() -> list[str]:\n"
-        "    return sorted(DISPLAY_NAMES.values())\n"
-    )
 
-    content = header + "\n".join(coord_lines) + "\n" + "\n".join(disp_lines) + "\n" + util + "\n"
-    os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
-    with open(OUT_PATH, 'w', encoding='utf-8') as f:
-        f.write(content)
+def load_legacy_module(path: str) -> List[dict]:
+    """Rows from an old generated city_coords.py (CITY_COORDINATES/DISPLAY_NAMES literals)."""
+    namespace: dict = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        exec(compile(f.read(), path, 'exec'), namespace)
+    coords = namespace['CITY_COORDINATES']
+    display = namespace.get('DISPLAY_NAMES', {})
+    return [
+        {'key': key, 'city': display.get(key, key), 'lat': lat, 'lon': lon, 'aliases': []}
+        for key, (lat, lon) in coords.items()
+    ]
 
 
 def main():
-    rows = load_cities()
+    if len(sys.argv) == 3 and sys.argv[1] == '--from-module':
+        rows = load_legacy_module(sys.argv[2])
+    else:
+        rows = load_cities()
     if not rows:
         raise SystemExit('No valid cities found in data/cities.in.json')
-    write_module(rows)
+    write_artifact(rows)
     print(f"Wrote {len(rows)} cities to {OUT_PATH}")
 
 
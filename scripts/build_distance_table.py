@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Build the city-to-city distance table used by backend/distance_matrix.py.
+
+Writes a dense float32 matrix over the CITY_COORDINATES keys (in their
+module order) to data/city_distances.npy, or to CITY_DISTANCE_TABLE if set,
+plus a .json sidecar with the coordinates fingerprint. Re-run it whenever
+backend/city_coords.py is regenerated; a stale table is ignored at runtime.
+
+Usage:
+    python scripts/build_distance_table.py [output.npy]
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backend.distance_matrix import CITY_COORDINATES, CITY_DISTANCE_TABLE, save_distance_table  # noqa: E402
+
+
+def main():
+    out_path = sys.argv[1] if len(sys.argv) > 1 else CITY_DISTANCE_TABLE
+    save_distance_table(out_path)
+    n = len(CITY_COORDINATES)
+    print(f"Wrote {n}x{n} distance table to {os.path.normpath(out_path)}")
+
+
+if __name__ == '__main__':
+    main()
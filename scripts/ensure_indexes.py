@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Create the MongoDB indexes declared in backend/indexes.py.
+
+Run it as a deployment step when ENSURE_INDEXES_ON_STARTUP is off, or with
+--rebuild once to replace indexes created with other options (e.g. the
+non-unique candidate_id/internship_id indexes older versions built on every
+read). Uses MONGO_URI and DB_NAME from the environment/.env.
+
+Usage:
+    python scripts/ensure_indexes.py [--check] [--rebuild]
+"""
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pymongo import MongoClient  # noqa: E402
+
+from backend.config import get_config  # noqa: E402
+from backend.indexes import ensure_indexes, verify_indexes  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="only report missing indexes")
+    parser.add_argument("--rebuild", action="store_true", help="drop and recreate conflicting indexes")
+    args = parser.parse_args()
+
+    config = get_config()
+    client = MongoClient(config.MONGO_URI, serverSelectionTimeoutMS=10000)
+    db = client[config.DB_NAME]
+    try:
+        if not args.check:
+            report = ensure_indexes(db, rebuild=args.rebuild)
+            for kind in ("created", "ok", "conflicts", "failed"):
+                for label in report[kind]:
+                    print(f"[{kind}] {label}")
+        missing = verify_indexes(db)
+    finally:
+        client.close()
+
+    if missing:
+        print(f"Missing {len(missing)} index(es): {', '.join(missing)}")
+        sys.exit(1)
+    print("All indexes in place")
+
+
+if __name__ == '__main__':
+    main()
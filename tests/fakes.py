@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Shared test fixtures: a synthetic catalog and in-memory MongoDB fakes."""
+import random
+import re
+
+SKILLS = ["python", "sql", "data analysis", "excel", "machine learning", "java",
+          "javascript", "react", "social media", "writing", "research", "c++",
+          "public speaking", "ms excel", "deep learning", "node.js", "tableau"]
+CITIES = ["Mumbai", "Pune", "Bengaluru", "Mysore", "Delhi", "Gurgaon", "Jaipur",
+          "Hyderabad", "Chennai", "Nowhere Town", ""]
+SECTORS = ["Data", "Technology", "Governance", "Marketing", "Finance", "Computer Science Research"]
+
+
+def make_catalog(seed, n=300):
+    """n random postings; internship_ids repeat and some fields are empty on purpose."""
+    rng = random.Random(seed)
+    return [
+        {
+            "internship_id": f"I{rng.randint(1, n // 2):04d}",
+            "title": rng.choice(["Data Intern", "Undergraduate Research Intern", "Marketing Intern", "Dev Intern"]),
+            "organization": rng.choice(["OrgA", "OrgB", "OrgC", "", None] + [f"Org{i}" for i in range(40)]),
+            "location": rng.choice(CITIES),
+            "sector": rng.choice(SECTORS),
+            "skills_required": rng.sample(SKILLS, rng.randint(0, 4)),
+            "is_beginner_friendly": rng.random() < 0.3,
+        }
+        for _ in range(n)
+    ]
+
+
+def matches(doc, query):
+    """Whether doc satisfies query ($and, $or, $in, $gt, $regex and $exists only)."""
+    for field, cond in query.items():
+        if field == "$and":
+            if not all(matches(doc, q) for q in cond):
+                return False
+        elif field == "$or":
+            if not any(matches(doc, q) for q in cond):
+                return False
+        elif not isinstance(cond, dict):
+            if doc.get(field) != cond:
+                return False
+        else:
+            value = doc.get(field)
+            values = value if isinstance(value, list) else [value]
+            if "$exists" in cond and (field in doc) != cond["$exists"]:
+                return False
+            if "$in" in cond and not any(v in cond["$in"] for v in values):
+                return False
+            if "$gt" in cond and not (isinstance(value, str) and value > cond["$gt"]):
+                return False
+            if "$regex" in cond and not any(
+                isinstance(v, str) and re.search(cond["$regex"], v, re.I) for v in values
+            ):
+                return False
+    return True
+
+
+def _project(doc, projection):
+    if projection is None:
+        return dict(doc)
+    return {k: v for k, v in doc.items() if k in projection or (k == "_id" and projection.get("_id", 1))}
+
+
+class FakeCursor(list):
+    def sort(self, field, direction):
+        return FakeCursor(sorted(self, key=lambda d: d[field], reverse=direction < 0))
+
+    def limit(self, n):
+        return FakeCursor(self[:n])
+
+
+class FakeCollection:
+    """Collection over a list of dicts; every find() is recorded as (query, projection)."""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.queries = []
+
+    @property
+    def finds(self):
+        return len(self.queries)
+
+    def find(self, query, projection=None):
+        self.queries.append((query, projection))
+        return FakeCursor(_project(d, projection) for d in self.docs if matches(d, query))
+
+    def find_one(self, query, projection=None, sort=None):
+        docs = [d for d in self.docs if matches(d, query)]
+        if sort:
+            field, direction = sort[0]
+            docs = sorted((d for d in docs if field in d), key=lambda d: d[field], reverse=direction < 0)
+        return _project(docs[0], projection) if docs else None
+
+    def estimated_document_count(self):
+        return len(self.docs)
+
+
+class FakeDB:
+    def __init__(self, internships=(), profiles=()):
+        self.internships = FakeCollection(list(internships))
+        self.profiles = FakeCollection(list(profiles))
+
+    def __getitem__(self, name):
+        return getattr(self, name)
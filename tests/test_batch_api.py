@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+import json
+
+from flask import Flask
+
+from app.api import api_bp, recommendations
+from app.core.catalog import CatalogSnapshot
+from backend.ml_model import get_recommendations
+from fakes import FakeDB, make_catalog
+
+
+def test_batch_endpoint_streams_one_line_per_candidate(monkeypatch):
+    internships = make_catalog(5, n=120)
+    snapshot = CatalogSnapshot(internships, version="batch-test")
+    profiles = [
+        {"candidate_id": "C1", "skills_possessed": ["python", "sql"], "location_preference": "Pune"},
+        {"candidate_id": "C2", "skills_possessed": ["writing"], "sector_interests": ["marketing"]},
+    ]
+    monkeypatch.setattr(recommendations.CATALOG, "get", lambda: snapshot)
+    db = FakeDB([dict(i, description=f"About {i['internship_id']}") for i in internships], profiles)
+    monkeypatch.setattr(recommendations.db_manager, "get_db", lambda: db)
+    app = Flask(__name__)
+    app.register_blueprint(api_bp)
+    client = app.test_client()
+
+    response = client.post("/api/recommendations/batch", json={"candidate_ids": ["C2", "missing", "C1"], "top_n": 3})
+    assert response.status_code == 200 and response.mimetype == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [line["candidate_id"] for line in lines] == ["C2", "missing", "C1"]
+    assert lines[1] == {"candidate_id": "missing", "error": "Candidate not found"}
+    expected = get_recommendations(profiles[0], internships, top_n=3)
+    assert [r["internship_id"] for r in lines[2]["recommendations"]] == [r["internship_id"] for r in expected]
+    assert all(r["description"] == f"About {r['internship_id']}" for r in lines[2]["recommendations"])
+    # Profiles are read with the scoring projection; descriptions in one query for the chunk
+    assert "skills_possessed" in db.profiles.queries[0][1] and "description" not in db.profiles.queries[0][1]
+    assert len(db.internships.queries) == 1 and "description" in db.internships.queries[0][1]
+
+    # A repeat is served from the cached ranking but still shows edited descriptions
+    for doc in db.internships.docs:
+        doc["description"] = "Edited"
+    again = client.post("/api/recommendations/batch", json={"candidate_ids": ["C1"], "top_n": 3})
+    repeat = json.loads(again.get_data(as_text=True))["recommendations"]
+    assert [r["internship_id"] for r in repeat] == [r["internship_id"] for r in expected]
+    assert all(r["description"] == "Edited" for r in repeat)
+
+    assert client.post("/api/recommendations/batch", json={"candidate_ids": "C1"}).status_code == 400
+    assert client.post("/api/recommendations/batch", json={"candidate_ids": [], "top_n": 0}).status_code == 400
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+from bson import ObjectId
+from pymongo import DeleteMany, InsertOne, ReplaceOne
+
+from backend.bulk_sync import plan_sync
+
+
+def test_only_changed_documents_are_written():
+    oid = ObjectId()
+    existing = [
+        {"_id": oid, "candidate_id": "C1", "skills_possessed": ["python"]},
+        {"_id": ObjectId(), "candidate_id": "C2", "skills_possessed": ["sql"]},
+        {"_id": ObjectId(), "candidate_id": "C3", "skills_possessed": []},
+    ]
+    # As returned by load_data: string _ids
+    data = [
+        {"_id": str(oid), "candidate_id": "C1", "skills_possessed": ["python"]},
+        {"_id": str(existing[1]["_id"]), "candidate_id": "C2", "skills_possessed": ["sql", "excel"]},
+        {"candidate_id": "C4", "skills_possessed": ["java"]},
+    ]
+    operations, counts = plan_sync(existing, data, "candidate_id")
+    assert counts == {"upserts": 2, "deletes": 1, "unchanged": 1}
+    assert operations == [
+        ReplaceOne({"candidate_id": "C2"}, {"candidate_id": "C2", "skills_possessed": ["sql", "excel"]}, upsert=True),
+        ReplaceOne({"candidate_id": "C4"}, {"candidate_id": "C4", "skills_possessed": ["java"]}, upsert=True),
+        DeleteMany({"candidate_id": {"$in": ["C3"]}}),
+    ]
+
+
+def test_documents_without_natural_id_fall_back_to_object_id():
+    kept, dropped, new = ObjectId(), ObjectId(), ObjectId()
+    existing = [{"_id": kept, "note": "a"}, {"_id": dropped, "note": "b"}]
+    data = [{"_id": str(kept), "note": "a2"}, {"_id": str(new), "note": "c"}, {"note": "d"}]
+    operations, counts = plan_sync(existing, data, "username")
+    assert counts == {"upserts": 3, "deletes": 1, "unchanged": 0}
+    assert operations == [
+        InsertOne({"note": "d"}),
+        ReplaceOne({"_id": kept}, {"note": "a2"}, upsert=True),
+        ReplaceOne({"_id": new}, {"note": "c"}, upsert=True),
+        DeleteMany({"_id": {"$in": [dropped]}}),
+    ]
+
+
+def test_duplicates_are_deleted_and_submitted_ids_kept():
+    first, second, third, new = ObjectId(), ObjectId(), ObjectId(), ObjectId()
+    existing = [
+        {"_id": first, "candidate_id": "C1", "name": "old"},
+        {"_id": second, "candidate_id": "C1", "name": "older"},
+        {"_id": third, "candidate_id": "C2", "name": "same"},
+        {"_id": ObjectId(), "candidate_id": "C2", "name": "same"},
+    ]
+    data = [
+        {"_id": str(second), "candidate_id": "C1", "name": "new"},
+        {"_id": str(third), "candidate_id": "C2", "name": "same"},
+        {"_id": str(new), "candidate_id": "C3", "name": "fresh"},
+    ]
+    operations, counts = plan_sync(existing, data, "candidate_id")
+    assert counts == {"upserts": 2, "deletes": 2, "unchanged": 1}
+    assert operations == [
+        # With duplicates present the kept copy is addressed by _id
+        ReplaceOne({"_id": second}, {"candidate_id": "C1", "name": "new"}, upsert=True),
+        ReplaceOne({"candidate_id": "C3"}, {"_id": new, "candidate_id": "C3", "name": "fresh"}, upsert=True),
+        DeleteMany({"_id": {"$in": [first, existing[3]["_id"]]}}),
+    ]
+
+
+def test_renamed_document_is_replaced_by_its_id():
+    kept, copy = ObjectId(), ObjectId()
+    existing = [
+        {"_id": kept, "candidate_id": "C1", "name": "Ann"},
+        {"_id": copy, "candidate_id": "C1", "name": "Ann"},
+    ]
+    # Same _id, new natural id: an upsert on C9 would collide with the stored _id
+    data = [{"_id": str(kept), "candidate_id": "C9", "name": "Ann"}]
+    operations, counts = plan_sync(existing, data, "candidate_id")
+    assert counts == {"upserts": 1, "deletes": 1, "unchanged": 0}
+    assert operations == [
+        ReplaceOne({"_id": kept}, {"candidate_id": "C9", "name": "Ann"}, upsert=True),
+        DeleteMany({"_id": {"$in": [copy]}}),
+    ]
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+from app.core.catalog import CatalogCache
+from fakes import FakeDB
+
+
+def test_snapshot_is_reused_until_invalidated():
+    db = FakeDB([{"_id": 1, "internship_id": "A", "skills_required": ["python"]}])
+    cache = CatalogCache(ttl=300, get_db=lambda: db)
+
+    first = cache.get()
+    assert cache.get() is first and db.internships.finds == 1
+    assert first.internships[0]["_id"] == "1"
+
+    # Same content reloads to the same version, so the index is not rebuilt
+    cache.invalidate()
+    again = cache.get()
+    assert again is not first and again.version == first.version and db.internships.finds == 2
+
+    db.internships.docs.append({"_id": 2, "internship_id": "B", "skills_required": ["sql"]})
+    cache.invalidate()
+    changed = cache.get()
+    assert len(changed) == 2 and changed.version != first.version
+
+
+def test_snapshot_expires_and_survives_failed_reload():
+    db = FakeDB([{"_id": 1, "internship_id": "A"}])
+    state = {"up": True}
+    cache = CatalogCache(ttl=0, get_db=lambda: db if state["up"] else None)
+
+    first = cache.get()
+    assert cache.get() is not first  # ttl=0: every read reloads
+    state["up"] = False
+    assert cache.get().internships == first.internships
+    assert CatalogCache(get_db=lambda: None).internships() == ()
+
+
+def test_catalog_change_notifies_listeners():
+    db = FakeDB([{"_id": 1, "internship_id": "A"}])
+    cache = CatalogCache(ttl=300, get_db=lambda: db)
+    seen = []
+    cache.subscribe(lambda snapshot: seen.append(snapshot.version))
+    cache.get()
+    cache.invalidate()
+    cache.get()
+    assert seen == []
+    db.internships.docs.append({"_id": 2, "internship_id": "B"})
+    cache.invalidate()
+    assert seen == [cache.get().version]
+
+
+def test_concurrent_readers_share_one_reload():
+    import threading
+    import time
+
+    db = FakeDB([{"_id": 1, "internship_id": "A"}])
+    find = db.internships.find
+
+    def slow_find(query, projection=None):
+        time.sleep(0.05)
+        return find(query, projection)
+
+    db.internships.find = slow_find
+    cache = CatalogCache(ttl=300, get_db=lambda: db)
+    cache.get()
+    cache.invalidate()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert db.internships.finds == 2
+    assert len({id(snapshot) for snapshot in results}) == 1
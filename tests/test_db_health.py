@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+from types import SimpleNamespace
+
+from backend.db_health import ConnectionHealth
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _topology_event(writable, error=None):
+    servers = {("db", 27017): SimpleNamespace(error=error)}
+    description = SimpleNamespace(
+        has_writable_server=lambda: writable,
+        server_descriptions=lambda: servers,
+    )
+    return SimpleNamespace(new_description=description)
+
+
+def test_breaker_fails_fast_and_lets_one_probe_through():
+    clock = Clock()
+    health = ConnectionHealth(reset_timeout=30, clock=clock)
+    assert health.available() and health.state() == "unknown"
+
+    # Topology still being discovered: no verdict yet
+    health.description_changed(_topology_event(False))
+    assert health.available()
+
+    health.description_changed(_topology_event(False, error="connection refused"))
+    assert health.state() == "open" and not health.available()
+
+    clock.now = 31
+    assert health.state() == "half-open"
+    assert health.available()       # the probe
+    assert not health.available()   # everyone else keeps failing fast
+
+    health.description_changed(_topology_event(True))
+    assert health.state() == "closed" and health.available()
+
+
+def test_failed_connect_opens_breaker():
+    clock = Clock()
+    health = ConnectionHealth(reset_timeout=5, clock=clock)
+    health.record_failure(TimeoutError("server selection timed out"))
+    assert not health.available() and health.last_error == "server selection timed out"
+    clock.now = 5
+    assert health.available()
+
+
+def test_health_check_is_a_side_effect_free_read(monkeypatch):
+    from app.core.database import DatabaseManager
+
+    manager = object.__new__(DatabaseManager)
+    monkeypatch.setattr(manager, "_initialize", lambda: (_ for _ in ()).throw(AssertionError("connected")))
+    clock = Clock()
+    manager._health = ConnectionHealth(reset_timeout=30, clock=clock)
+    manager._db = None
+    assert not manager.health_check()
+
+    manager._health.record_failure("down")
+    clock.now = 31
+    assert not manager.health_check()
+    # The half-open probe is still there for the next real caller
+    assert manager._health.state() == "half-open" and manager._health.available()
+
+    manager._db = object()
+    manager._health.record_success()
+    assert manager.health_check() and manager._health.state() == "closed"
@@ -23,4 +23,169 @@ def test_distance_sanity_delhi_jaipur():
 
 
 def test_normalization_aliases():
-    assert normalize_city_name("Bombay") in ("mumbai",)
\ No newline at end of file
+    assert normalize_city_name("Bombay") in ("mumbai",)
+
+def test_distance_table_matches_haversine(tmp_path):
+    import numpy as np
+    from backend import distance_matrix
+    from backend.distance_matrix import _haversine_km, load_distance_table, save_distance_table
+
+    coords = dict(list(CITY_COORDINATES.items())[:400])
+    path = str(tmp_path / "distances.npy")
+    save_distance_table(path, coords)
+    table = load_distance_table(path, coords)
+    assert isinstance(table, np.memmap)
+    values = list(coords.values())
+    for i in range(0, len(values), 7):
+        for j in range(len(values)):
+            assert round(float(table[i, j]), 1) == round(_haversine_km(values[i], values[j]), 1)
+
+    # A table built for other coordinates is ignored
+    assert load_distance_table(path, dict(list(CITY_COORDINATES.items())[:401])) is None
+
+    # get_distance reads the table when one is loaded
+    full = str(tmp_path / "full.npy")
+    save_distance_table(full)
+    before = get_distance("Mumbai", "Pune")
+    loaded = distance_matrix._distance_table, distance_matrix._distance_table_loaded
+    distance_matrix._distance_table, distance_matrix._distance_table_loaded = load_distance_table(full), True
+    try:
+        assert distance_matrix._get_distance_table() is not None
+        assert get_distance("Mumbai", "Pune") == before
+        assert get_distance("Bombay", "nowhere") == 1000.0
+    finally:
+        distance_matrix._distance_table, distance_matrix._distance_table_loaded = loaded
+
+
+def test_one_to_many_distances_match_scalar():
+    from backend.distance_matrix import get_distances, get_nearby_cities
+
+    names = list(CITY_COORDINATES)[:150] + ["Bombay", "New Delhi", "Gurugram", "nowhere", "", None, "  "]
+    for city in ["Mumbai", "New Delhi", "Bangalore", "nowhere", "", "  ", "jaipur"]:
+        assert get_distances(city, names).tolist() == [get_distance(city, t) for t in names]
+
+    nearby = get_nearby_cities("Delhi", 150)
+    assert nearby == sorted(nearby, key=lambda x: x[1])
+    assert ("new delhi", 0.0) in nearby     # alias of the origin counts as 0 km
+    assert all(d == get_distance("delhi", c) <= 150 for c, d in nearby)
+    assert "delhi" not in [c for c, _ in nearby]
+
+
+def test_location_similarities_match_scalar():
+    from backend.ml_model import location_similarity, location_similarities
+
+    locs = ["Mumbai", "Thane", "Pune", "Nashik", "Delhi", "Bombay", "", "  ", "Nowhere"]
+    for pref in ["Mumbai", "bombay", "Nowhere", "", "  "]:
+        scores, reasons = location_similarities(pref, locs)
+        expected = [location_similarity(pref, loc) for loc in locs]
+        assert scores.tolist() == [e[0] for e in expected]
+        assert reasons == [e[2] for e in expected]
+
+
+def test_spatial_queries_match_brute_force():
+    from backend.distance_matrix import get_distances, get_nearby_cities, locations_within
+
+    for city in ["Pune", "Delhi", "Bangalore"]:
+        for radius in [0, 25, 120, 1000]:
+            norm = normalize_city_name(city)
+            expected = sorted(
+                ((other, get_distance(norm, other)) for other in CITY_COORDINATES if other != norm),
+                key=lambda x: x[1],
+            )
+            assert get_nearby_cities(city, radius) == [(c, d) for c, d in expected if d <= radius]
+
+    locations = ["Mumbai", "Pune", "Thane", "Navi Mumbai", "Bangalore", "Bengaluru", "Delhi",
+                 "Gurgaon", "Remote", "", "Nowhere Town", "pune", "Mysore"]
+    for city in ["Pune", "Bangalore", "Delhi", "Nowhere Town"]:
+        for radius in [0, 25, 150, 500]:
+            dists = get_distances(city, locations)
+            assert locations_within(city, locations, radius) == [
+                loc for loc, km in zip(locations, dists.tolist()) if km <= radius
+            ]
+
+
+def test_alias_table_matches_alias_scan():
+    from backend.distance_matrix import CITY_ALIASES, _build_alias_table
+
+    def scan(city):
+        city_lower = " ".join(city.strip().lower().split())
+        for standard_name, aliases in CITY_ALIASES.items():
+            if city_lower in aliases:
+                return standard_name
+        return city_lower
+
+    inputs = [a for aliases in CITY_ALIASES.values() for a in aliases]
+    inputs += list(CITY_COORDINATES)[:500] + ["  Navi   Mumbai ", "BANGALORE", "Nowhere", "New  Delhi"]
+    for city in inputs:
+        # The scan could land on names missing from CITY_COORDINATES; those now
+        # resolve to a real key where one exists
+        if scan(city) in CITY_COORDINATES:
+            assert normalize_city_name(city) == scan(city)
+        else:
+            assert normalize_city_name(city) in CITY_COORDINATES or normalize_city_name(city) == scan(city)
+    assert normalize_city_name("") == normalize_city_name(None) == ""
+
+    # Generated aliases fill gaps but never override hand-written ones or city keys
+    table = _build_alias_table(
+        {"mumbai": ["bombay", "mumbai"]},
+        {"bombay": "thane", "bom": "mumbai", "pune": "mumbai"},
+        {"mumbai": (0, 0), "pune": (0, 0), "thane": (0, 0)},
+    )
+    assert table == {"bombay": "mumbai", "mumbai": "mumbai", "bom": "mumbai"}
+
+
+def test_accent_folded_city_keys():
+    assert "thāne" in CITY_COORDINATES and "thane" not in CITY_COORDINATES
+    assert normalize_city_name("Thane") == "thāne"
+    assert normalize_city_name("RAJKOT") == "rājkot"
+    assert normalize_city_name("Gurgaon") == normalize_city_name("gurugram") == "gurugram"
+    assert normalize_city_name("Trivandrum") == "thiruvananthapuram"
+    assert normalize_city_name("Nowhere Town") == "nowhere town"
+    assert get_distance("Mumbai", "Thane") < 50
+
+
+def test_city_artifact_round_trip(tmp_path):
+    from backend.city_coords import DISPLAY_NAMES, read_artifact, write_artifact
+
+    rows = [
+        {"key": "thāne", "city": "Thāne", "lat": 19.19704, "lon": 72.96355},
+        {"key": "mumbai", "city": "Mumbai", "lat": 19.07283, "lon": 72.88261},
+    ]
+    path = str(tmp_path / "cities.bin")
+    write_artifact(path, rows, {"bombay": "mumbai"})
+    data = read_artifact(path)
+    assert data.keys == ["thāne", "mumbai"]
+    assert data.display == ["Thāne", "Mumbai"]
+    assert data.aliases == {"bombay": "mumbai"}
+    assert (float(data.lat[0]), float(data.lon[0])) == (19.19704, 72.96355)
+
+    # The shipped mappings behave like the dicts they replace
+    assert CITY_COORDINATES["mumbai"] == CITY_COORDINATES.get("mumbai") == (19.07283, 72.88261)
+    assert CITY_COORDINATES.get("nowhere") is None and "nowhere" not in CITY_COORDINATES
+    assert len(CITY_COORDINATES) == len(DISPLAY_NAMES) == len(list(CITY_COORDINATES))
+    assert DISPLAY_NAMES["thāne"] == "Thāne"
+
+
+def test_typo_tolerant_city_lookup():
+    from rapidfuzz import fuzz, process
+
+    from backend.distance_matrix import resolve_city
+    from backend.ml_model import find_nearest_city
+    from backend.trigram_index import TrigramIndex
+
+    assert resolve_city("Thanne") == "thāne"
+    assert resolve_city("Mumbay") == "mumbai"
+    assert resolve_city("Bengaluroo") == "bengaluru"
+    assert resolve_city("zzzz") is None
+    assert find_nearest_city("Thanne", [{"name": "Mumbai"}, {"name": "Pune"}]) == ("Mumbai", 16.2)
+    assert find_nearest_city("Mumbay", [{"name": "Pune"}, {"name": "Mumbai"}]) == ("Mumbai", 0.0)
+
+    # The shortlist agrees with a full rapidfuzz scan on near misses
+    names = list(CITY_COORDINATES)
+    index = TrigramIndex(names)
+    for query in ["thanne", "mumbay", "jaipurr", "ahmedabd", "lucknw"]:
+        full = process.extractOne(query, names, scorer=fuzz.ratio, score_cutoff=80)
+        match = index.best_match(query, cutoff=80)
+        assert (match is None) == (full is None)
+        if full is not None:
+            assert match[1] == full[1]
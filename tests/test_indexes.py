@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+from backend.indexes import INDEX_SPECS, ensure_indexes, verify_indexes
+
+
+class FakeCollection:
+    def __init__(self):
+        self.indexes = {"_id_": {"key": [("_id", 1)]}}
+        self.created = 0
+
+    def index_information(self):
+        return {name: dict(spec) for name, spec in self.indexes.items()}
+
+    def create_index(self, keys, unique=False):
+        self.created += 1
+        name = "_".join(f"{field}_{direction}" for field, direction in keys)
+        self.indexes[name] = {"key": list(keys), **({"unique": True} if unique else {})}
+
+    def drop_index(self, name):
+        del self.indexes[name]
+
+
+class FakeDB(dict):
+    def __missing__(self, name):
+        self[name] = FakeCollection()
+        return self[name]
+
+
+def test_ensure_indexes_is_idempotent_and_verified():
+    db = FakeDB()
+    assert verify_indexes(db)
+    report = ensure_indexes(db)
+    assert len(report["created"]) == sum(len(v) for v in INDEX_SPECS.values())
+    assert verify_indexes(db) == []
+
+    again = ensure_indexes(db)
+    assert again["created"] == [] and len(again["ok"]) == len(report["created"])
+
+
+def test_conflicting_index_is_only_replaced_on_rebuild():
+    db = FakeDB()
+    # Non-unique index left behind by older versions
+    db["profiles"].create_index([("candidate_id", 1)])
+    report = ensure_indexes(db)
+    assert report["conflicts"] == ["profiles(candidate_id 1) unique"]
+    assert verify_indexes(db) == ["profiles(candidate_id 1) unique"]
+
+    report = ensure_indexes(db, rebuild=True)
+    assert report["created"] == ["profiles(candidate_id 1) unique"]
+    assert db["profiles"].indexes["candidate_id_1"]["unique"] is True
+    assert verify_indexes(db) == []
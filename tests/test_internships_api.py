@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+from flask import Flask
+
+from app.api import api_bp, internships
+from app.core.catalog import CatalogSnapshot
+from fakes import FakeDB, make_catalog
+
+
+def _client(monkeypatch, docs):
+    snapshot = CatalogSnapshot(docs, version="listing-test")
+    db = FakeDB([dict(d, description="long text") for d in docs])
+    monkeypatch.setattr(internships.CATALOG, "get", lambda: snapshot)
+    monkeypatch.setattr(internships.db_manager, "get_db", lambda: db)
+    app = Flask(__name__)
+    app.register_blueprint(api_bp)
+    return app.test_client(), db
+
+
+def _pages(client, url):
+    """Follow next_cursor to the end; returns the internship ids in order."""
+    ids, cursor = [], None
+    while True:
+        response = client.get(url + (f"&cursor={cursor}" if cursor else ""))
+        assert response.status_code == 200
+        body = response.get_json()
+        assert len(body["data"]) <= body["meta"]["pagination"]["limit"]
+        ids += [d["internship_id"] for d in body["data"]]
+        cursor = body["meta"]["pagination"]["next_cursor"]
+        if cursor is None:
+            return ids
+
+
+def test_keyset_pages_cover_filtered_catalog_once(monkeypatch):
+    docs = [dict(d, internship_id=f"I{k:04d}") for k, d in enumerate(make_catalog(21, n=150))]
+    client, db = _client(monkeypatch, docs)
+
+    assert _pages(client, "/api/internships?limit=7") == sorted(d["internship_id"] for d in docs)
+
+    expected = sorted(
+        d["internship_id"] for d in docs
+        if d["sector"] == "Data" and d["location"] in ("Pune", "Mumbai")
+        and any("excel" in s for s in d["skills_required"])
+    )
+    assert _pages(client, "/api/internships?limit=4&sector=data&city=pune&radius=150&skill=Excel") == expected
+    assert {"sector", "location", "skills_required"} <= {
+        key for cond in db.internships.queries[-1][0]["$and"] for key in cond
+    }
+
+
+def test_fields_and_invalid_parameters(monkeypatch):
+    docs = [dict(d, internship_id=f"I{k:04d}") for k, d in enumerate(make_catalog(22, n=20))]
+    client, _ = _client(monkeypatch, docs)
+
+    card = client.get("/api/internships?limit=1").get_json()["data"][0]
+    assert card["description"] == "long text"
+    slim = client.get("/api/internships?limit=1&fields=title").get_json()["data"][0]
+    assert set(slim) == {"internship_id", "title"}
+
+    # A filter value absent from the catalog needs no query
+    assert client.get("/api/internships?sector=astronomy").get_json()["data"] == []
+    for bad in ("limit=0", "limit=x", "cursor=%%%", "radius=10", "city=pune&radius=-1", "fields=a;b"):
+        assert client.get(f"/api/internships?{bad}").status_code == 400, bad
+
+    # Without radius the city box is a free-text substring, not a resolved city
+    partial = client.get("/api/internships?limit=50&city=mum").get_json()["data"]
+    assert partial and {d["location"] for d in partial} == {"Mumbai"}
+    town = client.get("/api/internships?limit=50&city=nowhere").get_json()["data"]
+    assert {d["location"] for d in town} == {"Nowhere Town"}
+
+    facets = client.get("/api/internships/facets").get_json()
+    assert facets["sectors"] == sorted({d["sector"] for d in docs})
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+from backend.match_cache import LRUCache, SKILL_MATCH_CACHE
+from backend.ml_model import skill_similarity
+from backend.skill_vocab import SKILL_INTERNER, SkillInterner
+
+
+def test_lru_eviction_and_counters():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", True)
+    cache.put("b", False)
+    assert cache.get("a") is True      # "a" becomes most recent
+    cache.put("c", True)               # evicts "b"
+    assert cache.get("b") is None
+    assert cache.get("c") is True
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+
+
+def test_skill_similarity_memoizes_pairs():
+    SKILL_MATCH_CACHE.clear()
+    first = skill_similarity({"machine learning", "excel"}, ["ml engineering", "ms excel"])
+    misses = SKILL_MATCH_CACHE.stats()["misses"]
+    assert misses > 0
+    assert skill_similarity({"machine learning", "excel"}, ["ml engineering", "ms excel"]) == first
+    stats = SKILL_MATCH_CACHE.stats()
+    assert stats["misses"] == misses
+    assert stats["hits"] > 0
+    # Candidate skills are keyed by id when interned, else by their text
+    key = (SKILL_INTERNER.get_id("excel") or "excel", SKILL_INTERNER.get_id("ms excel"), 85)
+    assert SKILL_MATCH_CACHE.get(key) is True
+
+
+def test_candidate_skills_are_not_interned():
+    from backend.internship_index import InternshipIndex
+    from backend.scoring_engine import score_candidate
+
+    index = InternshipIndex([{"internship_id": "A", "skills_required": ["ms excel", "sql"]}])
+    size = len(SKILL_INTERNER)
+    candidate = {"skills_possessed": ["Advanced MS Excel Macros", "sql"]}
+    # Free text still fuzzy-matches the catalog but gets no id
+    assert score_candidate(candidate, index, 1.0, 0.0, 0.0, 0.0)["skill_sim"][0] == 1.0
+    assert skill_similarity(["advanced ms excel macros"], ["ms excel"]) == 1.0
+    assert len(SKILL_INTERNER) == size and SKILL_INTERNER.get_id("advanced ms excel macros") is None
+
+
+def test_skill_matrix_grows_incrementally_and_matches_pairwise():
+    from rapidfuzz import fuzz
+    from backend.ml_model import _jaccard, _tokenize
+    from backend.skill_matrix import SkillMatchMatrix
+
+    skills = ["python", "python programming", "excel", "ms excel", "data analysis",
+              "data analytics", "java", "javascript", "machine learning", "react"]
+    matrix = SkillMatchMatrix(workers=1, interner=SkillInterner())
+    matrix.add(skills[:4])
+    matrix.add(skills[4:7])
+    ids = matrix.ids(skills)            # adds the remaining skills
+    assert len(matrix) == len(skills)
+    for a, a_id in zip(skills, ids):
+        expected = {
+            b_id for b, b_id in zip(skills, ids)
+            if a == b or fuzz.partial_ratio(a, b) >= 85 or _jaccard(_tokenize(a), _tokenize(b)) >= 0.5
+        }
+        assert set(matrix.matches(a_id).tolist()) == expected
+
+
+def test_interned_skill_sets_are_sorted_and_shared():
+    from backend.ml_model import _intern_skill_list
+
+    ids = _intern_skill_list(["Python", "SQL", "python", ["Excel"]])
+    assert ids.typecode == "I"
+    assert list(ids) == sorted(SKILL_INTERNER.get_id(s) for s in ("python", "sql", "excel"))
+    assert SKILL_INTERNER.skills(ids) == sorted(["python", "sql", "excel"], key=SKILL_INTERNER.get_id)
+    assert skill_similarity(ids, ["python", "sql"]) == skill_similarity(["python", "sql", "excel"], ids[:2]) == 1.0
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+import random
+import time
+
+from backend.internship_index import InternshipIndex
+from backend.parallel_scoring import ShardedScorer
+from backend.scoring_engine import score_candidate, rank_rows, build_result
+from fakes import CITIES, SKILLS, make_catalog
+
+
+def _in_process(index, candidate, exclude_ids=None):
+    scores = score_candidate(candidate, index)
+    return [build_result(index, scores, row) for row in rank_rows(index, scores["score"], 10, exclude_ids=exclude_ids)]
+
+
+def test_sharded_scoring_matches_in_process():
+    index = InternshipIndex(make_catalog(11, n=400))
+    scorer = ShardedScorer(workers=2)
+    try:
+        scorer.publish(index)
+        deadline = time.monotonic() + 120
+        while not scorer.ready(index):
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+
+        rng = random.Random(5)
+        for _ in range(5):
+            candidate = {
+                "skills_possessed": rng.sample(SKILLS, 3),
+                "sector_interests": ["data"],
+                "location_preference": rng.choice(CITIES),
+                "education_level": "undergraduate",
+            }
+            expected = _in_process(index, candidate)
+            assert scorer.recommend(index, candidate) == expected
+            exclude = {expected[0]["internship_id"]}
+            assert scorer.recommend(index, candidate, exclude_ids=exclude) == _in_process(index, candidate, exclude)
+    finally:
+        scorer.shutdown()
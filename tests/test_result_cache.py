@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+from app.core.cache import MemoryBackend, RecommendationCache
+
+
+def test_result_cache_keys_and_invalidation():
+    cache = RecommendationCache(MemoryBackend(maxsize=8))
+    alice = {"skills_possessed": ["python"], "location_preference": "Pune", "name": "Alice"}
+    key = cache.key("C1", alice, "v1")
+    cache.put(key, [{"internship_id": "A"}])
+    assert cache.get(key) == [{"internship_id": "A"}]
+
+    # Non-scoring fields do not change the key; scoring fields, version and top_n do
+    assert cache.key("C1", {**alice, "name": "Al"}, "v1") == key
+    assert cache.key("C1", {**alice, "location_preference": "Delhi"}, "v1") != key
+    assert cache.key("C1", alice, "v2") != key
+    assert cache.key("C1", alice, "v1", top_n=5) != key
+
+    other = cache.key("C2", alice, "v1")
+    cache.put(other, [])
+    cache.invalidate_candidate("C1")
+    assert cache.get(key) is None and cache.get(other) == []
+    cache.clear()
+    assert cache.get(other) is None
+
+
+
+def test_memory_backend_entries_expire():
+    now = [100.0]
+    backend = MemoryBackend(maxsize=8, ttl=60, clock=lambda: now[0])
+    backend.set("a", [1])
+    backend.set("b", [2], ttl=5)
+    now[0] += 10
+    assert backend.get("a") == [1] and backend.get("b") is None
+    now[0] += 50
+    assert backend.get("a") is None and backend.stats()["size"] == 0
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+import random
+
+from backend.ml_model import (
+    get_recommendations,
+    skill_similarity,
+    location_similarity,
+    _normalize_skill_list,
+)
+from fakes import CITIES, SKILLS, make_catalog
+
+
+def _reference_recommendations(candidate, internships, top_n=10,
+                               skill_weight=0.5, loc_weight=0.25,
+                               sector_weight=0.15, misc_weight=0.10):
+    """The original per-internship scoring loop, kept as the ground truth."""
+    cand_skill_set = set(_normalize_skill_list(candidate.get("skills_possessed", [])))
+    sector_interests = [s.lower() for s in candidate.get("sector_interests", []) or []]
+    location_pref = (candidate.get("location_preference") or "").strip().lower()
+    field_of_study = (candidate.get("field_of_study") or "").strip().lower()
+    education_level = (candidate.get("education_level") or "").strip().lower()
+    is_first_gen = bool(candidate.get("first_generation") or candidate.get("no_experience"))
+
+    scored = []
+    for internship in internships:
+        internship_skills = _normalize_skill_list(internship.get("skills_required", []))
+        skill_sim = skill_similarity(cand_skill_set, internship_skills)
+        loc_sim, _, _ = location_similarity(location_pref, internship.get("location", ""))
+        sector = (internship.get("sector") or "").strip().lower()
+        sector_sim = 1.0 if sector in sector_interests else 0.0
+        field_sim = 1.0 if field_of_study and field_of_study in sector else 0.0
+        edu_sim = 1.0 if education_level and education_level in (internship.get("title") or "").lower() else 0.0
+        fg_boost = 0.08 if is_first_gen and internship.get("is_beginner_friendly") else 0.0
+        base_score = (
+            skill_weight * skill_sim +
+            loc_weight * loc_sim +
+            sector_weight * sector_sim +
+            misc_weight * (0.5 * field_sim + 0.5 * edu_sim)
+        )
+        scored.append((round(min(1.0, base_score + fg_boost) * 100, 1), internship))
+
+    scored.sort(key=lambda x: (-x[0], x[1].get("internship_id") or ""))
+    results, seen_orgs = [], set()
+    for score, internship in scored:
+        org = (internship.get("organization") or "").strip().lower()
+        if org and org in seen_orgs:
+            continue
+        results.append((internship.get("internship_id"), score))
+        if org:
+            seen_orgs.add(org)
+        if len(results) >= top_n:
+            break
+    return results
+
+
+def test_engine_matches_reference_formula():
+    for seed in range(5):
+        internships = make_catalog(seed)
+        rng = random.Random(seed + 100)
+        candidate = {
+            "skills_possessed": rng.sample(SKILLS, 3) + ["Data Analytics"],
+            "sector_interests": rng.sample(["data", "governance", "finance"], 2),
+            "location_preference": rng.choice(CITIES),
+            "field_of_study": "computer science",
+            "education_level": "undergraduate",
+            "first_generation": seed % 2 == 0,
+        }
+        expected = _reference_recommendations(candidate, internships, top_n=15)
+        got = [(r["internship_id"], r["match_score"]) for r in get_recommendations(candidate, internships, top_n=15)]
+        assert got == expected
+
+
+def test_engine_matches_reference_with_similarity_weights():
+    internships = make_catalog(42)
+    pseudo = {"skills_possessed": ["python", "sql"], "sector_interests": ["data"], "location_preference": "Pune"}
+    weights = dict(skill_weight=0.6, loc_weight=0.15, sector_weight=0.2, misc_weight=0.05)
+    expected = _reference_recommendations(pseudo, internships, top_n=10, **weights)
+    got = [(r["internship_id"], r["match_score"]) for r in get_recommendations(pseudo, internships, top_n=10, **weights)]
+    assert got == expected
+
+
+def test_batch_matches_single_candidate_results():
+    from backend.internship_index import InternshipIndex
+    from backend.ml_model import get_recommendations_batch, iter_recommendations_batch
+
+    rng = random.Random(11)
+    index = InternshipIndex(make_catalog(9))
+    candidates = [
+        {
+            "skills_possessed": rng.sample(SKILLS + ["Data Analytics", "pythn"], rng.randint(0, 4)),
+            "sector_interests": rng.sample(["data", "governance", "finance"], rng.randint(0, 2)),
+            "location_preference": rng.choice(CITIES),
+            "education_level": rng.choice(["", "undergraduate"]),
+            "field_of_study": rng.choice(["", "data"]),
+            "first_generation": rng.random() < 0.5,
+        }
+        for _ in range(70)
+    ]
+    expected = [get_recommendations(c, None, top_n=7, index=index) for c in candidates]
+    assert get_recommendations_batch(candidates, None, top_n=7, index=index) == expected
+    assert list(iter_recommendations_batch(candidates, None, top_n=7, index=index, chunk_size=5)) == expected
+    assert get_recommendations_batch([], None, index=index) == []
+    assert get_recommendations_batch([{}], []) == [[]]
+
+
+def test_empty_inputs():
+    assert get_recommendations({"skills_possessed": ["python"]}, []) == []
+    # None fingerprints like [] and reuses that index
+    assert get_recommendations({"skills_possessed": ["python"]}, None) == []
+    results = get_recommendations({}, make_catalog(7, n=20), top_n=3)
+    assert len(results) <= 3
+    assert all(r["reason"] for r in results)
+
+
+def test_index_is_reused_until_catalog_changes():
+    from backend.internship_index import get_internship_index
+
+    internships = make_catalog(3, n=50)
+    index = get_internship_index(internships)
+    assert get_internship_index([dict(i) for i in internships]) is index
+
+    changed = [dict(i) for i in internships]
+    changed[0]["skills_required"] = ["rust"]
+    rebuilt = get_internship_index(changed)
+    assert rebuilt is not index
+    assert "rust" in rebuilt.vocab_ids
+
+
+def test_exclude_ids_matches_filtered_pool():
+    internships = make_catalog(11, n=200)
+    base_id = internships[0]["internship_id"]
+    pseudo = {"skills_possessed": internships[0]["skills_required"], "location_preference": "Mumbai"}
+    pool = [i for i in internships if i.get("internship_id") != base_id]
+    expected = get_recommendations(pseudo, pool, top_n=10)
+    got = get_recommendations(pseudo, internships, top_n=10, exclude_ids={base_id})
+    assert got == expected
+
+
+def test_top_k_diversity_when_one_org_dominates():
+    # The best-scoring postings all belong to one organization, so the
+    # selector has to look far past the first top_n rows
+    internships = make_catalog(5, n=1000)
+    for internship in internships[:800]:
+        internship.update(organization="MegaCorp", skills_required=["python", "sql"], location="Pune")
+    candidate = {"skills_possessed": ["python", "sql"], "location_preference": "Pune"}
+    expected = _reference_recommendations(candidate, internships, top_n=10)
+    got = [(r["internship_id"], r["match_score"]) for r in get_recommendations(candidate, internships, top_n=10)]
+    assert got == expected
+    assert sum(1 for r in get_recommendations(candidate, internships, top_n=10) if r["organization"] == "MegaCorp") == 1
+
+
+def test_bitset_exact_coverage_and_fallback_agree():
+    from backend import internship_index
+    from backend.ml_model import _intern_skill_list
+
+    internships = make_catalog(9, n=400)
+    index = internship_index.InternshipIndex(internships)
+    cand = _intern_skill_list(["python", "sql", "excel"])
+    coverage = index.exact_coverage(cand)
+    for row, internship in enumerate(internships):
+        skills = set(_normalize_skill_list(internship.get("skills_required", [])))
+        expected = len(skills & {"python", "sql", "excel"}) / max(1, len(skills))
+        assert coverage[row] == expected
+
+    cand = _intern_skill_list(["python", "ms excel", "data analytics", "writing"])
+    with_bits = index.skill_scores(cand)
+    original = internship_index._BITSET_MAX_BYTES
+    internship_index._BITSET_MAX_BYTES = 0
+    try:
+        without_bits = internship_index.InternshipIndex(internships)
+    finally:
+        internship_index._BITSET_MAX_BYTES = original
+    assert without_bits.skill_bits is None
+    assert with_bits.tolist() == without_bits.skill_scores(cand).tolist()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+import random
+
+from backend.internship_index import InternshipIndex
+from backend.similar_internships import SimilarInternshipTable
+from fakes import make_catalog
+
+
+def _lists(table, index):
+    ids = {i.get("internship_id") for i in index.internships}
+    return {iid: table.get(iid, version=index.version) for iid in ids}
+
+
+def test_incremental_update_matches_full_rebuild():
+    catalog = make_catalog(7, n=200)
+    table = SimilarInternshipTable()
+    table.build(InternshipIndex(catalog))
+
+    rng = random.Random(3)
+    for step in range(4):
+        catalog = list(catalog)
+        # Edit a few postings, drop one id and add a couple of new ones
+        for row in rng.sample(range(len(catalog)), 3):
+            catalog[row] = {**catalog[row], "skills_required": rng.sample(["python", "sql", "excel", "writing"], 2)}
+        dropped = catalog[rng.randrange(len(catalog))]["internship_id"]
+        catalog = [i for i in catalog if i["internship_id"] != dropped]
+        catalog += [{**c, "internship_id": f"N{step}{k}"} for k, c in enumerate(make_catalog(50 + step, n=2))]
+
+        index = InternshipIndex(catalog)
+        recomputed = table.update(index)
+        fresh = SimilarInternshipTable()
+        fresh.build(index)
+        assert _lists(table, index) == _lists(fresh, index)
+        assert 0 < recomputed < len(fresh)
+        assert table.get(dropped) is None
+
+
+def test_lookup_requires_matching_version():
+    index = InternshipIndex(make_catalog(1, n=40))
+    table = SimilarInternshipTable()
+    assert table.get("I0001", version=index.version) is None
+    table.build(index)
+    iid = index.internships[0]["internship_id"]
+    assert table.get(iid, version=index.version) == table.neighbors(index, iid)
+    assert table.get(iid, version="other") is None
+    assert table.update(index) == 0